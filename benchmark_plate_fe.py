@@ -0,0 +1,39 @@
+"""
+Benchmark: DKT plate analysis of an irregular L-shaped slab with an opening,
+a column and a wall, per phase, as the mesh is refined.
+
+    python benchmark_plate_fe.py [mesh_size ...]
+"""
+import sys
+import time
+import numpy as np
+from src.Backend.calculations.Slabs.plate_fe import PlateAnalysisRequest, analyse_plate
+
+
+def build(mesh_size):
+    return PlateAnalysisRequest(
+        outline=[(0, 0), (12, 0), (12, 6), (6, 6), (6, 10), (0, 10)],
+        openings=[[(2, 2), (3.5, 2), (3.5, 3), (2, 3)]],
+        edgeSupports=["simple", "simple", "free", "free", "simple", "fixed"],
+        columns=[(9, 3)], walls=[(6, 0, 6, 6)], thickness=200, meshSize=mesh_size,
+        loadCases=[dict(name="ULS", pressure=12.0), dict(name="Point", pointLoads=[(3, 8, 50.0)])],
+        includeFields=False,
+    )
+
+
+def time_analysis(request, repeats=3):
+    best, out = np.inf, None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        out = analyse_plate(request)
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+if __name__ == "__main__":
+    sizes = [float(h) for h in sys.argv[1:]] or [0.5, 0.3, 0.2, 0.1]
+    print(f"{'mesh [m]':>9} {'nodes':>7} {'dofs':>7} {'total [ms]':>11}  phases [ms]")
+    for h in sizes:
+        elapsed, out = time_analysis(build(h))
+        phases = " ".join(f"{k}={v * 1e3:.1f}" for k, v in out["timings"].items())
+        print(f"{h:>9.2f} {out['mesh']['nodes']:>7} {out['mesh']['dof']:>7} {elapsed * 1e3:>11.2f}  {phases}")
@@ -0,0 +1,38 @@
+"""
+Benchmark: flexible raft on a Winkler/Pasternak subgrade under a grid of
+columns, per phase, as the column grid grows.
+
+    python benchmark_raft_flexible.py [n_columns_per_side ...]
+"""
+import sys
+import time
+import numpy as np
+from src.Backend.calculations.Foundations.New_foundation import FlexibleRaftDesigner, FlexibleRaftInput, RaftColumn
+
+
+def build(n, spacing=6000, mesh_size=500):
+    columns = [RaftColumn(x=1500 + spacing * i, y=1500 + spacing * j, dead_load=900 + 20 * i, live_load=400)
+               for i in range(n) for j in range(n)]
+    side = spacing * (n - 1) + 3000
+    return FlexibleRaftInput(
+        foundation_length=side, foundation_width=side, foundation_depth=800, columns=columns,
+        subgrade_modulus=25000, subgrade_shear=1000, soil_bearing=200, mesh_size=mesh_size, include_fields=False,
+    )
+
+
+def time_design(inputs, repeats=3):
+    best, out = np.inf, None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        out = FlexibleRaftDesigner(inputs).design_flexible_raft()
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [3, 5, 10, 15]
+    print(f"{'columns':>8} {'dofs':>7} {'total [ms]':>11}  phases [ms]")
+    for n in sizes:
+        elapsed, out = time_design(build(n))
+        phases = " ".join(f"{k}={v * 1e3:.1f}" for k, v in out.calculations["timings"].items())
+        print(f"{n * n:>8} {out.calculations['mesh']['dof']:>7} {elapsed * 1e3:>11.2f}  {phases}")
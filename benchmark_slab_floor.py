@@ -0,0 +1,51 @@
+"""
+Benchmark: whole-floor slab design (one coefficient array pass) vs designing
+every panel with EnhancedSlabDesigner in turn (scaled from the two-way panels).
+
+    python benchmark_slab_floor.py [n_bays ...]
+"""
+import sys
+import time
+import numpy as np
+from src.Backend.calculations.Slabs.enhanced_slab_backend import (
+    EnhancedSlabDesigner, FloorDesignRequest, SlabDesignRequest, design_floor,
+)
+
+
+def build(n_bays, seed=2):
+    rng = np.random.default_rng(seed)
+    return FloorDesignRequest(xSpans=rng.uniform(3, 8, n_bays).tolist(), ySpans=rng.uniform(3, 8, n_bays).tolist(),
+                              deadLoad=6, liveLoad=5)
+
+
+def time_floor(request, repeats=3):
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        out = design_floor(request)
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def time_per_panel(request, out):
+    # Two-way panels only: the single-panel designer has no one-way edge conditions
+    schedule = out["schedule"]
+    panels = [(c, lx, ly) for c, lx, ly, one_way in
+              zip(schedule["edgeCondition"], schedule["lx"], schedule["ly"], schedule["oneWay"]) if not one_way]
+    start = time.perf_counter()
+    for condition, lx, ly in panels:
+        EnhancedSlabDesigner(SlabDesignRequest(
+            slabType="two-way", support="continuous", deadLoad=request.deadLoad, liveLoad=request.liveLoad,
+            lx=lx, ly=ly, edgeConditions=condition,
+        )).design()
+    return (time.perf_counter() - start) * len(schedule["panel"]) / max(len(panels), 1)
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [5, 10, 20, 40]
+    print(f"{'panels':>8} {'floor [ms]':>12} {'per-panel [ms]':>15} {'speed-up':>9}")
+    for n in sizes:
+        request = build(n)
+        t_floor, out = time_floor(request)
+        t_panels = time_per_panel(request, out)
+        print(f"{out['panels']:>8} {t_floor * 1e3:>12.2f} {t_panels * 1e3:>15.2f} {t_panels / t_floor:>8.1f}x")
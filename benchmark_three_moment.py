@@ -0,0 +1,51 @@
+"""
+Benchmark: banded vs dense three-moment solve for long continuous beams.
+
+    python benchmark_three_moment.py [n_spans ...]
+"""
+import sys
+import time
+import numpy as np
+from src.Backend.calculations.Beams.threemain import Span, Support, ThreeMomentSolver
+
+
+def build(n_spans, seed=0):
+    rng = np.random.default_rng(seed)
+    lengths = rng.uniform(20.0, 40.0, n_spans)
+    spans = [
+        Span(
+            length=L,
+            I=0.5,
+            loads=[
+                {"load_type": "Uniformly Distributed Load", "magnitude": 60.0, "length": L},
+                {"load_type": "Point Load", "magnitude": 400.0, "position": 0.4 * L},
+            ],
+        )
+        for L in lengths
+    ]
+    positions = np.concatenate([[0.0], np.cumsum(lengths)])
+    supports = [Support(support_type="Pinned", position=p) for p in positions]
+    return spans, supports
+
+
+def time_solve(spans, supports, method, repeats=3):
+    best = np.inf
+    for _ in range(repeats):
+        solver = ThreeMomentSolver(spans, supports)
+        start = time.perf_counter()
+        solver.solve(method)
+        best = min(best, time.perf_counter() - start)
+    return best, np.array(solver.support_moments)
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [10, 100, 1000, 3000]
+    print(f"{'spans':>8} {'banded [ms]':>12} {'dense [ms]':>12} {'speed-up':>9} {'max |dM|':>10}")
+    for n in sizes:
+        spans, supports = build(n)
+        t_banded, M_banded = time_solve(spans, supports, "banded")
+        t_dense, M_dense = time_solve(spans, supports, "dense")
+        print(
+            f"{n:>8} {t_banded * 1e3:>12.2f} {t_dense * 1e3:>12.2f} "
+            f"{t_dense / t_banded:>8.1f}x {np.abs(M_banded - M_dense).max():>10.2e}"
+        )
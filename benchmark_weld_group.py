@@ -0,0 +1,49 @@
+"""
+Benchmark: batch weld group checks (one vectorized line-method pass) vs the
+per-group scalar line method.
+
+    python benchmark_weld_group.py [n_welds ...]
+"""
+import sys
+import time
+import numpy as np
+from src.Backend.calculations.steel_design.welded_joints_backend import (
+    WeldGroupBatchRequest, calculate_design_strength_pw, check_weld_groups,
+)
+from test_weld_group import c_weld, scalar_check
+
+
+def build(n_welds, seed=6):
+    rng = np.random.default_rng(seed)
+    return [
+        dict(segments=c_weld(rng.uniform(50, 150), rng.uniform(100, 400)), throat_size=5.6,
+             load_cases=rng.uniform(-100, 100, (4, 3)).tolist())
+        for _ in range(n_welds)
+    ]
+
+
+def time_batch(welds, repeats=3):
+    request = WeldGroupBatchRequest(welds=welds)
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        check_weld_groups(request)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_scalar(welds):
+    pw = calculate_design_strength_pw("E35", "S275")
+    start = time.perf_counter()
+    for w in welds:
+        scalar_check(w["segments"], w["throat_size"], w["load_cases"], pw)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [100, 1000, 5000, 20000]
+    print(f"{'welds':>8} {'batch [ms]':>11} {'scalar [ms]':>12} {'speed-up':>9}")
+    for n in sizes:
+        welds = build(n)
+        t_batch, t_scalar = time_batch(welds), time_scalar(welds)
+        print(f"{n:>8} {t_batch * 1e3:>11.2f} {t_scalar * 1e3:>12.2f} {t_scalar / t_batch:>8.1f}x")
@@ -0,0 +1,162 @@
+"""
+Batch Beam Analysis
+Fans a list of beam models out across a process pool and streams each
+result back as one NDJSON line as soon as it finishes.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field
+
+
+class BatchMethod(str, Enum):
+    THREE_MOMENT = "three_moment"
+    MOMENT_DISTRIBUTION = "moment_distribution"
+    INTEGRATED_DESIGN = "integrated_design"
+
+
+class BatchBeamItem(BaseModel):
+    """One beam line: payload is the body the single-beam endpoint accepts"""
+
+    id: Optional[str] = None
+    method: BatchMethod
+    payload: Dict[str, Any]
+
+
+class BatchBeamRequest(BaseModel):
+    items: List[BatchBeamItem]
+    time_budget: float = Field(120.0, gt=0)  # seconds for the whole batch
+
+
+# ============================================================================
+# WORKER SIDE (runs in the pool processes)
+# ============================================================================
+
+
+def _analyze_item(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    from .threemain import BeamModel, analyze_beam
+    from .moment_distribution_backend import FrameMD, MomentDistributionSolver
+    from .rc_beam_design import integrate_analysis_design
+
+    if method == BatchMethod.THREE_MOMENT.value:
+        result = analyze_beam(BeamModel(**payload))
+    elif method == BatchMethod.MOMENT_DISTRIBUTION.value:
+        result = MomentDistributionSolver(FrameMD(**payload)).solve()
+    else:
+        result = integrate_analysis_design(payload)
+    return jsonable_encoder(result)
+
+
+def run_batch_item(index: int, method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyse one item; failures are returned, never raised, so one bad beam cannot sink the batch"""
+    start = time.perf_counter()
+    try:
+        result = _analyze_item(method, payload)
+        status, error = "ok", None
+    except Exception as e:
+        result = None
+        status = "error"
+        error = getattr(e, "detail", None) or f"{type(e).__name__}: {e}"
+    return {
+        "index": index,
+        "status": status,
+        "result": result,
+        "error": error,
+        "elapsed": round(time.perf_counter() - start, 4),
+    }
+
+
+# ============================================================================
+# POOL
+# ============================================================================
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Shared pool sized to the host cores, created on first use"""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _POOL
+
+
+def reset_pool():
+    """Drop a broken pool (a worker died) so the next batch gets a fresh one"""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
+
+def _ndjson(record: Dict[str, Any]) -> str:
+    return json.dumps(record, default=float) + "\n"
+
+
+async def stream_batch(request: BatchBeamRequest):
+    """
+    Yield one NDJSON line per item in completion order, then a summary line.
+    Items not finished when the time budget expires are reported with status
+    "timeout"; queued ones are cancelled, running ones finish in the background.
+    """
+    start = time.perf_counter()
+    deadline = start + request.time_budget
+    pool = get_pool()
+    loop = asyncio.get_running_loop()
+
+    pending = {}
+    for index, item in enumerate(request.items):
+        future = loop.run_in_executor(pool, run_batch_item, index, item.method.value, item.payload)
+        pending[future] = index
+
+    counts = {"ok": 0, "error": 0, "timeout": 0}
+    broken = False
+    while pending:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            break
+        done, _ = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            index = pending.pop(future)
+            try:
+                record = future.result()
+            except BrokenProcessPool as e:
+                broken = True
+                record = {"index": index, "status": "error", "result": None, "error": f"Worker crashed: {e}"}
+            counts[record["status"]] += 1
+            record["id"] = request.items[index].id
+            yield _ndjson(record)
+
+    for future, index in pending.items():
+        future.cancel()
+        counts["timeout"] += 1
+        yield _ndjson({
+            "index": index,
+            "id": request.items[index].id,
+            "status": "timeout",
+            "result": None,
+            "error": f"Time budget of {request.time_budget}s exceeded",
+        })
+
+    if broken:
+        reset_pool()
+
+    yield _ndjson({
+        "summary": True,
+        "total": len(request.items),
+        **counts,
+        "elapsed": round(time.perf_counter() - start, 4),
+        "workers": os.cpu_count() or 1,
+    })
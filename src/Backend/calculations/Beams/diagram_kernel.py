@@ -0,0 +1,123 @@
+"""
+Vectorized Beam Diagram Kernel
+Evaluates simply-supported shear and moment for every sample point of every
+member in one pass from flat load arrays, plus end-moment superposition and
+deflection by double integration. Shared by the moment distribution and
+three-moment solvers.
+
+Sign convention: loads act downward (positive magnitude), moments are
+sagging positive and shear is dM/dx.
+"""
+
+from typing import Tuple
+import numpy as np
+
+
+class LoadArrays:
+    """
+    Flat load table for a set of members.
+
+    Point loads: (member index, P, a)
+    Patch loads: (member index, w1, w2, a, c) - linearly varying from w1 at a
+    to w2 at a + c. A full-span UDL is the patch (w, w, 0, L).
+    """
+
+    def __init__(self):
+        self._points = []
+        self._patches = []
+
+    def add_point(self, member: int, P: float, a: float):
+        self._points.append((member, P, a))
+
+    def add_patch(self, member: int, w1: float, w2: float, a: float, c: float):
+        if c > 0:
+            self._patches.append((member, w1, w2, a, c))
+
+    def points(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        table = np.array(self._points, dtype=float).reshape(-1, 3)
+        return table[:, 0].astype(int), table[:, 1], table[:, 2]
+
+    def patches(self) -> Tuple[np.ndarray, ...]:
+        table = np.array(self._patches, dtype=float).reshape(-1, 5)
+        return (table[:, 0].astype(int),) + tuple(table[:, i] for i in range(1, 5))
+
+
+def sample_points(lengths: np.ndarray, n_points: int) -> np.ndarray:
+    """(n_members, n_points) stations from 0 to L on every member"""
+    lengths = np.asarray(lengths, dtype=float)
+    return lengths[:, None] * np.linspace(0.0, 1.0, n_points)[None, :]
+
+
+def simple_span_forces(
+    lengths: np.ndarray, x: np.ndarray, loads: LoadArrays
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Shear V0 and moment M0 of each member treated as simply supported.
+
+    lengths: (n_members,), x: (n_members, n_points)
+    Returns two (n_members, n_points) arrays.
+    """
+    L = np.asarray(lengths, dtype=float)
+    V0 = np.zeros_like(x)
+    M0 = np.zeros_like(x)
+
+    member, P, a = loads.points()
+    if len(member):
+        xl = x[member]
+        left = a[:, None] <= xl
+        R = P * (L[member] - a) / L[member]
+        np.add.at(V0, member, R[:, None] - P[:, None] * left)
+        np.add.at(M0, member, R[:, None] * xl - P[:, None] * np.maximum(xl - a[:, None], 0.0))
+
+    member, w1, w2, a, c = loads.patches()
+    if len(member):
+        xl = x[member]
+        k = ((w2 - w1) / c)[:, None]
+        w1c = w1[:, None]
+        # Loaded length to the left of each station
+        u = np.clip(xl - a[:, None], 0.0, c[:, None])
+        dx = xl - a[:, None]
+        force_left = w1c * u + k * u**2 / 2
+        moment_left = w1c * (u * dx - u**2 / 2) + k * (dx * u**2 / 2 - u**3 / 3)
+
+        W = w1 * c + (w2 - w1) * c / 2
+        first_moment = w1 * c**2 / 2 + (w2 - w1) * c**2 / 3  # about the patch start
+        R = (W * (L[member] - a) - first_moment) / L[member]
+
+        np.add.at(V0, member, R[:, None] - force_left)
+        np.add.at(M0, member, R[:, None] * xl - moment_left)
+
+    return V0, M0
+
+
+def end_moment_forces(
+    lengths: np.ndarray, x: np.ndarray, M_left: np.ndarray, M_right: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Shear and moment from sagging-positive end moments, linear along the member"""
+    L = np.asarray(lengths, dtype=float)[:, None]
+    M_left = np.asarray(M_left, dtype=float)[:, None]
+    M_right = np.asarray(M_right, dtype=float)[:, None]
+    M = M_left * (1 - x / L) + M_right * x / L
+    V = np.broadcast_to((M_right - M_left) / L, x.shape)
+    return V, M
+
+
+def deflection_from_moment(x: np.ndarray, M: np.ndarray, EI: np.ndarray) -> np.ndarray:
+    """
+    Deflection (upward positive) of members with no end translation,
+    integrating EI v'' = M twice along each row of stations with v(0) = v(L) = 0.
+    Units follow the inputs (M in N*m and EI in N*m^2 give metres).
+    """
+    curvature = M / np.asarray(EI, dtype=float)[:, None]
+    dx = np.diff(x, axis=1)
+    slope = np.zeros_like(x)
+    slope[:, 1:] = np.cumsum((curvature[:, 1:] + curvature[:, :-1]) / 2 * dx, axis=1)
+    v = np.zeros_like(x)
+    v[:, 1:] = np.cumsum((slope[:, 1:] + slope[:, :-1]) / 2 * dx, axis=1)
+    L = x[:, -1:]
+    return v - v[:, -1:] * np.divide(x, L, out=np.zeros_like(x), where=L > 0)
+
+
+def xy_series(x: np.ndarray, y: np.ndarray):
+    """[{x, y}] points for the frontend charts"""
+    return [{"x": xi, "y": yi} for xi, yi in zip(np.asarray(x).tolist(), np.asarray(y).tolist())]
@@ -0,0 +1,159 @@
+"""
+Influence Lines and Moving Loads
+Unit-load responses on a uniform grid of load positions (computed by the
+solvers from one factorization with a multi-column right-hand side) and a
+vectorized axle-train convolution over that grid for max/min envelopes.
+
+Sign convention as the diagram kernel: a unit load acts downward, moments
+are sagging positive and reactions are upward positive.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+import numpy as np
+from pydantic import BaseModel, Field, validator
+
+
+class AxleTrain(BaseModel):
+    """Vehicle as axle loads (kN) and the spacing between consecutive axles (m)"""
+
+    name: str = "Vehicle"
+    loads: List[float]
+    spacings: List[float] = Field(default_factory=list)
+
+    @validator("spacings")
+    def check_spacings(cls, v, values):
+        loads = values.get("loads") or []
+        if len(v) != max(len(loads) - 1, 0):
+            raise ValueError("spacings must have one entry fewer than loads")
+        if any(s < 0 for s in v):
+            raise ValueError("spacings must be non-negative")
+        return v
+
+    def offsets(self) -> np.ndarray:
+        """Distance of every axle behind the leading axle"""
+        return np.concatenate([[0.0], np.cumsum(self.spacings)])
+
+
+def train_response(
+    lines: np.ndarray,
+    positions: np.ndarray,
+    loads: Sequence[float],
+    offsets: Sequence[float],
+    both_directions: bool = True,
+):
+    """
+    Response of every row of `lines` (n_resp, n_pos) to an axle train at
+    every lead position. The lead axle steps by the grid spacing from fully
+    off one end to fully off the other; both_directions adds the train
+    running backwards.
+
+    On a uniform grid each axle sits a fixed fractional number of steps
+    behind the lead, so its contribution is a shifted, linearly blended pair
+    of slices of the zero-padded influence table: a discrete convolution
+    with no per-position gathers. Ordinates taper to zero over one grid step
+    beyond the ends.
+    Returns (lead positions (n_lead,), response (n_dir, n_lead, n_resp)).
+    """
+    loads = np.asarray(loads, dtype=float)
+    offsets = np.asarray(offsets, dtype=float)
+    n_resp, n_pos = lines.shape
+    dx = positions[1] - positions[0] if n_pos > 1 else 1.0
+    reach = offsets.max() if offsets.size else 0.0
+    n_lead = int(np.ceil(2 * reach / dx)) + n_pos
+    lead = positions[0] - reach + dx * np.arange(n_lead)
+
+    # Position-major table padded with zero rows so every shifted slice is in range
+    pad = int(np.ceil(2 * reach / dx)) + 2
+    table = np.zeros((n_pos + 2 * pad, n_resp))
+    table[pad:pad + n_pos] = lines.T
+
+    directions = (1.0, -1.0) if both_directions else (1.0,)
+    response = np.zeros((len(directions), n_lead, n_resp))
+    for d, sign in enumerate(directions):
+        # Forward: axles trail the lead (lead - offset); backward: they sit ahead of it
+        for P, offset in zip(loads, offsets):
+            shift = (-reach - sign * offset) / dx + pad
+            start = int(np.floor(shift + 1e-9))
+            w = min(max(shift - start, 0.0), 1.0)
+            response[d] += P * (1 - w) * table[start:start + n_lead]
+            if w > 0:
+                response[d] += P * w * table[start + 1:start + 1 + n_lead]
+    return lead, response
+
+
+@dataclass
+class MovingLoadEnvelope:
+    """Max/min of each response over every position of the axle train"""
+    vehicle: str
+    stations: np.ndarray
+    moment_max: np.ndarray
+    moment_min: np.ndarray
+    shear_max: np.ndarray
+    shear_min: np.ndarray
+    reaction_max: np.ndarray
+    reaction_min: np.ndarray
+    moment_max_at: np.ndarray  # lead axle position producing moment_max
+    moment_min_at: np.ndarray
+
+    def columns(self) -> Dict[str, list]:
+        return {
+            "x": self.stations.tolist(),
+            "moment_max": self.moment_max.tolist(),
+            "moment_min": self.moment_min.tolist(),
+            "shear_max": self.shear_max.tolist(),
+            "shear_min": self.shear_min.tolist(),
+            "moment_max_lead_position": self.moment_max_at.tolist(),
+            "moment_min_lead_position": self.moment_min_at.tolist(),
+        }
+
+
+@dataclass
+class InfluenceLines:
+    """
+    Unit-load responses, one column per load position.
+    positions: (n_pos,) uniform grid of load positions along the loaded path
+    stations: (n_st,) response stations along the same path
+    moment, shear: (n_st, n_pos); reactions: (n_sup, n_pos)
+    """
+    positions: np.ndarray
+    stations: np.ndarray
+    moment: np.ndarray
+    shear: np.ndarray
+    reactions: np.ndarray
+    support_labels: List
+
+    def envelope(self, train: AxleTrain, both_directions: bool = True) -> MovingLoadEnvelope:
+        """Envelopes for one axle train in a single vectorized pass over all responses"""
+        n_st = len(self.stations)
+        lines = np.vstack([self.moment, self.shear, self.reactions])
+        lead, response = train_response(lines, self.positions, train.loads, train.offsets(), both_directions)
+        flat = response.reshape(-1, lines.shape[0])
+        lead_all = np.tile(lead, response.shape[0])
+
+        high, low = flat.max(axis=0), flat.min(axis=0)
+        moment = flat[:, :n_st]
+        return MovingLoadEnvelope(
+            vehicle=train.name,
+            stations=self.stations,
+            moment_max=high[:n_st],
+            moment_min=low[:n_st],
+            shear_max=high[n_st:2 * n_st],
+            shear_min=low[n_st:2 * n_st],
+            reaction_max=high[2 * n_st:],
+            reaction_min=low[2 * n_st:],
+            moment_max_at=lead_all[moment.argmax(axis=0)],
+            moment_min_at=lead_all[moment.argmin(axis=0)],
+        )
+
+    def columns(self, stride: int = 1) -> Dict[str, list]:
+        """Influence ordinates for plotting, every `stride`-th load position"""
+        return {
+            "positions": self.positions[::stride].tolist(),
+            "stations": self.stations.tolist(),
+            "moment": self.moment[:, ::stride].tolist(),
+            "shear": self.shear[:, ::stride].tolist(),
+            "reactions": self.reactions[:, ::stride].tolist(),
+            "supports": list(self.support_labels),
+        }
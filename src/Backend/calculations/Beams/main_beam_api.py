@@ -7,7 +7,7 @@ Professional structural analysis and design platform
 from fastapi import FastAPI, HTTPException, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 import uvicorn
 
 # Import all analysis modules
@@ -48,6 +48,8 @@ from .moment_distribution_backend import (
     router as md_router
 )
 
+from .beam_batch import BatchBeamRequest, stream_batch
+
 # Create the main router for this module
 router = APIRouter()
 
@@ -115,6 +117,7 @@ async def root():
         },
         "capabilities": [
             "Continuous beam analysis with multiple spans",
+            "Influence lines and moving-load envelopes",
             "Frame analysis with beams and columns",
             "Reinforced concrete design with complete checks",
             "Professional diagram generation (SFD, BMD, deflection)",
@@ -124,6 +127,21 @@ async def root():
     }
 
 
+# ============================================================================
+# BATCH ANALYSIS
+# ============================================================================
+
+
+@router.post("/batch/analyze")
+async def batch_analyze(request: BatchBeamRequest):
+    """
+    Analyse many beam lines in one request across a process pool.
+    Streams NDJSON: one line per beam as it finishes ({index, id, status,
+    result, error, elapsed}), then a summary line.
+    """
+    return StreamingResponse(stream_batch(request), media_type="application/x-ndjson")
+
+
 # ============================================================================
 # UTILITY ENDPOINTS
 # ============================================================================
@@ -10,8 +10,18 @@ from pydantic import BaseModel, validator
 from typing import List, Dict, Optional, Union, Tuple
 from enum import Enum
 import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import spsolve
 import math
-import copy
+
+from .diagram_kernel import (
+    LoadArrays,
+    sample_points,
+    simple_span_forces,
+    end_moment_forces,
+    deflection_from_moment,
+    xy_series,
+)
 
 
 # Enums for Moment Distribution Method
@@ -81,6 +91,16 @@ class FrameMD(BaseModel):
     members: List[MemberMD]
     convergence_tolerance: float = 0.001
     max_iterations: int = 50
+    method: str = "hardy_cross"  # "hardy_cross" (iterative) or "direct" (one sparse solve)
+    include_history: bool = False
+    history_limit: int = 10  # iterations recorded after the initial FEM state
+    diagram_points: int = 50  # stations per member in the force diagrams
+
+    @validator("method")
+    def valid_method(cls, v):
+        if v not in ("hardy_cross", "direct"):
+            raise ValueError('method must be "hardy_cross" or "direct"')
+        return v
 
 
 class MomentDistributionResponse(BaseModel):
@@ -117,6 +137,8 @@ class MomentDistributionSolver:
         self.final_moments = {}
         self.support_reactions = {}
         self.iteration_history = []
+        self.iterations_performed = 0
+        self.converged = False
         self.analysis_summary = []
 
     def _build_connectivity(self) -> Dict[str, List[str]]:
@@ -135,7 +157,10 @@ class MomentDistributionSolver:
         """Main solving method using Hardy Cross procedure"""
 
         self.analysis_summary.append("=== MOMENT DISTRIBUTION METHOD ANALYSIS ===")
-        self.analysis_summary.append("Hardy Cross Iterative Procedure")
+        if self.frame.method == "direct":
+            self.analysis_summary.append("Direct Joint-Rotation Solution")
+        else:
+            self.analysis_summary.append("Hardy Cross Iterative Procedure")
         self.analysis_summary.append("")
 
         # Step 1: Calculate fixed-end moments
@@ -147,8 +172,11 @@ class MomentDistributionSolver:
         # Step 3: Calculate distribution factors
         self._calculate_distribution_factors()
 
-        # Step 4: Perform moment distribution iterations
-        self._perform_moment_distribution()
+        # Step 4: Distribute moments (iteratively, or in one solve)
+        if self.frame.method == "direct":
+            self._solve_joint_rotations()
+        else:
+            self._perform_moment_distribution()
 
         # Step 5: Calculate support reactions
         self._calculate_support_reactions()
@@ -165,9 +193,8 @@ class MomentDistributionSolver:
             shear_force_data=shear_data,
             moment_data=moment_data,
             deflection_data=deflection_data,
-            convergence_achieved=len(self.iteration_history)
-            < self.frame.max_iterations,
-            iterations_performed=len(self.iteration_history),
+            convergence_achieved=self.converged,
+            iterations_performed=self.iterations_performed,
             analysis_summary=self.analysis_summary,
         )
 
@@ -354,38 +381,61 @@ class MomentDistributionSolver:
 
         self.analysis_summary.append("")
 
-    def _perform_moment_distribution(self):
-        """Perform Hardy Cross moment distribution iterations"""
-
-        self.analysis_summary.append("STEP 4: MOMENT DISTRIBUTION ITERATIONS")
-        self.analysis_summary.append("-" * 50)
+    def _carry_over_factor(self, member: MemberMD) -> float:
+        """Carry-over factor is 0.5 for fixed-fixed members, 0 for pinned ends"""
+        if (
+            member.start_condition == EndCondition.PINNED
+            or member.end_condition == EndCondition.PINNED
+        ):
+            return 0.0
+        return 0.5
 
-        # Initialize moment arrays
-        # moments[joint_id][member_id] = moment at joint for member
+    def _initial_moments(self) -> Dict[str, Dict[str, float]]:
+        """moments[joint_id][member_id] = fixed-end moment at joint for member"""
         moments = {}
         for joint_id in self.joints.keys():
             moments[joint_id] = {}
             for member_id in self.member_connectivity[joint_id]:
                 moments[joint_id][member_id] = 0.0
 
-        # Add fixed-end moments to initial state
         for member_id, fem in self.fixed_end_moments.items():
             member = self.members[member_id]
-            start_joint = member.start_joint_id
-            end_joint = member.end_joint_id
-
-            moments[start_joint][member_id] = fem["start"]
-            moments[end_joint][member_id] = fem["end"]
-
-        # Store initial state
-        self.iteration_history.append(
-            {
-                "iteration": 0,
-                "type": "Initial FEM",
-                "moments": copy.deepcopy(moments),
-                "unbalanced_moments": self._calculate_unbalanced_moments(moments),
+            moments[member.start_joint_id][member_id] = fem["start"]
+            moments[member.end_joint_id][member_id] = fem["end"]
+
+        return moments
+
+    def _record_history(self, entry: Dict, moments: Dict):
+        """Append a snapshot while within the requested history window"""
+        if not self.frame.include_history:
+            return
+        if entry["iteration"] > self.frame.history_limit:
+            return
+        entry["moments"] = {j: dict(m) for j, m in moments.items()}
+        entry["unbalanced_moments"] = self._calculate_unbalanced_moments(moments)
+        self.iteration_history.append(entry)
+
+    def _store_final_moments(self, moments: Dict):
+        for member_id, member in self.members.items():
+            self.final_moments[member_id] = {
+                "start": moments[member.start_joint_id][member_id],
+                "end": moments[member.end_joint_id][member_id],
             }
-        )
+
+    def _perform_moment_distribution(self):
+        """Perform Hardy Cross moment distribution iterations"""
+
+        self.analysis_summary.append("STEP 4: MOMENT DISTRIBUTION ITERATIONS")
+        self.analysis_summary.append("-" * 50)
+
+        moments = self._initial_moments()
+        carry_over = {
+            member_id: self._carry_over_factor(member)
+            for member_id, member in self.members.items()
+        }
+        record = self.frame.include_history
+
+        self._record_history({"iteration": 0, "type": "Initial FEM"}, moments)
 
         # Iterative distribution process
         for iteration in range(1, self.frame.max_iterations + 1):
@@ -396,26 +446,22 @@ class MomentDistributionSolver:
             for joint_id, joint in self.joints.items():
                 if joint.joint_type == JointType.FIXED_JOINT:
                     # Calculate unbalanced moment at joint
-                    unbalanced_moment = 0.0
-                    for member_id in self.member_connectivity[joint_id]:
-                        unbalanced_moment += moments[joint_id][member_id]
-
+                    unbalanced_moment = sum(moments[joint_id].values())
                     max_unbalance = max(max_unbalance, abs(unbalanced_moment))
 
                     if abs(unbalanced_moment) > self.frame.convergence_tolerance:
                         # Distribute unbalanced moment
                         distributed_moments = {}
-                        for member_id in self.member_connectivity[joint_id]:
-                            if member_id in self.distribution_factors[joint_id]:
-                                df = self.distribution_factors[joint_id][member_id]
-                                distributed_moment = -unbalanced_moment * df
-                                moments[joint_id][member_id] += distributed_moment
-                                distributed_moments[member_id] = distributed_moment
-
-                        iteration_changes[joint_id] = {
-                            "unbalanced_moment": unbalanced_moment,
-                            "distributed_moments": distributed_moments,
-                        }
+                        for member_id, df in self.distribution_factors[joint_id].items():
+                            distributed_moment = -unbalanced_moment * df
+                            moments[joint_id][member_id] += distributed_moment
+                            distributed_moments[member_id] = distributed_moment
+
+                        if record:
+                            iteration_changes[joint_id] = {
+                                "unbalanced_moment": unbalanced_moment,
+                                "distributed_moments": distributed_moments,
+                            }
 
                         # Carry-over moments to far ends
                         for member_id, dist_moment in distributed_moments.items():
@@ -424,28 +470,17 @@ class MomentDistributionSolver:
                                 far_joint = member.end_joint_id
                             else:
                                 far_joint = member.start_joint_id
+                            moments[far_joint][member_id] += dist_moment * carry_over[member_id]
 
-                            # Carry-over factor is 0.5 for fixed-fixed members, 0 for pinned ends
-                            carry_over_factor = 0.5
-                            if (
-                                member.start_condition == EndCondition.PINNED
-                                or member.end_condition == EndCondition.PINNED
-                            ):
-                                carry_over_factor = 0.0
-
-                            carry_over_moment = dist_moment * carry_over_factor
-                            moments[far_joint][member_id] += carry_over_moment
-
-            # Store iteration results
-            self.iteration_history.append(
+            self.iterations_performed = iteration
+            self._record_history(
                 {
                     "iteration": iteration,
                     "type": "Distribution",
-                    "moments": copy.deepcopy(moments),
-                    "unbalanced_moments": self._calculate_unbalanced_moments(moments),
                     "max_unbalance": max_unbalance,
                     "changes": iteration_changes,
-                }
+                },
+                moments,
             )
 
             self.analysis_summary.append(
@@ -454,6 +489,7 @@ class MomentDistributionSolver:
 
             # Check convergence
             if max_unbalance < self.frame.convergence_tolerance:
+                self.converged = True
                 self.analysis_summary.append(
                     f"Convergence achieved in {iteration} iterations"
                 )
@@ -464,16 +500,90 @@ class MomentDistributionSolver:
                 f"Maximum iterations ({self.frame.max_iterations}) reached"
             )
 
-        # Store final moments
+        self._store_final_moments(moments)
+        self.analysis_summary.append("")
+
+    def _solve_joint_rotations(self):
+        """
+        Solve the converged state of the distribution directly.
+
+        With theta_j the (stiffness-scaled) rotation of each distributing joint,
+        the end moment of member m at joint j is
+            M = FEM + k_m * theta_j + COF_m * k_m * theta_far
+        and equilibrium sum(M) = 0 at every distributing joint gives a sparse
+        symmetric system, solved once. The result is the limit Hardy Cross
+        iterates towards, without the tolerance.
+        """
+
+        self.analysis_summary.append("STEP 4: JOINT ROTATION SOLUTION")
+        self.analysis_summary.append("-" * 50)
+
+        moments = self._initial_moments()
+        self._record_history({"iteration": 0, "type": "Initial FEM"}, moments)
+
+        # Joints that release moment, and have stiffness to do so
+        free_joints = [
+            joint_id
+            for joint_id, joint in self.joints.items()
+            if joint.joint_type == JointType.FIXED_JOINT
+            and sum(
+                self.stiffness_factors[m]["start"]
+                for m in self.distribution_factors[joint_id]
+            ) > 0
+        ]
+        index = {joint_id: i for i, joint_id in enumerate(free_joints)}
+        n = len(free_joints)
+
+        rows, cols, vals = [], [], []
+        rhs = np.zeros(n)
+        member_ends = []
         for member_id, member in self.members.items():
-            start_joint = member.start_joint_id
-            end_joint = member.end_joint_id
+            k_start = self.stiffness_factors[member_id]["start"]
+            k_end = self.stiffness_factors[member_id]["end"]
+            cof = self._carry_over_factor(member)
+            ends = (
+                (member.start_joint_id, member.end_joint_id, k_start, "start"),
+                (member.end_joint_id, member.start_joint_id, k_end, "end"),
+            )
+            for near, far, k, end in ends:
+                if near not in index:
+                    continue
+                i = index[near]
+                rows.append(i)
+                cols.append(i)
+                vals.append(k)
+                rhs[i] -= self.fixed_end_moments.get(member_id, {}).get(end, 0.0)
+                if far in index:
+                    rows.append(i)
+                    cols.append(index[far])
+                    vals.append(cof * k)
+            member_ends.append((member_id, ends, cof))
+
+        theta = np.zeros(n)
+        if n:
+            A = sp.csc_matrix(sp.coo_matrix((vals, (rows, cols)), shape=(n, n)))
+            theta = np.atleast_1d(spsolve(A, rhs))
+            if not np.all(np.isfinite(theta)):
+                raise HTTPException(
+                    status_code=400,
+                    detail="Joint rotation equations are singular - check supports",
+                )
 
-            self.final_moments[member_id] = {
-                "start": moments[start_joint][member_id],
-                "end": moments[end_joint][member_id],
-            }
+        for member_id, ends, cof in member_ends:
+            for near, far, k, _ in ends:
+                if near in index:
+                    t = theta[index[near]]
+                    moments[near][member_id] += k * t
+                    moments[far][member_id] += cof * k * t
 
+        self.iterations_performed = 1
+        self.converged = True
+        self._record_history({"iteration": 1, "type": "Direct solve"}, moments)
+
+        self.analysis_summary.append(
+            f"Solved {n} joint rotation equations in one sparse solve"
+        )
+        self._store_final_moments(moments)
         self.analysis_summary.append("")
 
     def _calculate_unbalanced_moments(self, moments: Dict) -> Dict[str, float]:
@@ -543,171 +653,81 @@ class MomentDistributionSolver:
         M_start = self.final_moments[member_id]["start"]
         M_end = self.final_moments[member_id]["end"]
 
-        # Calculate equivalent joint loads from applied loads
+        # Simply-supported end shears from applied loads
         V_loads = 0.0  # Shear from applied loads
         N_loads = 0.0  # Axial force from applied loads
 
-        for load in member.loads:
-            if load.load_type == "UDL" and member.member_type == MemberType.BEAM:
-                w = load.magnitude
-                V_loads += w * member.length / 2
-            elif load.load_type == "Point" and member.member_type == MemberType.BEAM:
-                P = load.magnitude
-                a = load.position
-                if is_start:
-                    V_loads += P * (member.length - a) / member.length
-                else:
-                    V_loads += P * a / member.length
+        if member.member_type == MemberType.BEAM:
+            L = np.array([member.length])
+            V0, _ = simple_span_forces(
+                L, np.array([[0.0, member.length]]), self._member_load_arrays([member_id])
+            )
+            V_loads = V0[0, 0] if is_start else -V0[0, 1]
 
-        # Add forces from moments
-        V_moments = (M_start - M_end) / member.length
+        # Add forces from moments (clockwise-positive end moments)
+        V_moments = (M_start + M_end) / member.length
 
         # Total end forces
         if is_start:
-            V_end = V_loads + V_moments
-        else:
             V_end = V_loads - V_moments
+        else:
+            V_end = V_loads + V_moments
 
         return V_end, N_loads
 
+    def _member_load_arrays(self, member_ids: List[str]) -> LoadArrays:
+        """Flatten member loads into the diagram kernel's load table"""
+        loads = LoadArrays()
+        for i, member_id in enumerate(member_ids):
+            member = self.members[member_id]
+            for load in member.loads:
+                if load.load_type == "Point":
+                    loads.add_point(i, load.magnitude, load.position)
+                elif load.load_type == "UDL":
+                    loads.add_patch(i, load.magnitude, load.magnitude, 0.0, member.length)
+                elif load.load_type == "Partial UDL":
+                    loads.add_patch(i, load.magnitude, load.magnitude, load.position, load.length)
+                elif load.load_type == "Triangular":
+                    loads.add_patch(i, 0.0, load.magnitude, load.position, load.length)
+                elif load.load_type == "Trapezoidal":
+                    loads.add_patch(i, load.magnitude, load.magnitude2, load.position, load.length)
+        return loads
+
     def _generate_member_diagrams(self) -> Tuple[Dict, Dict, Dict]:
-        """Generate shear, moment, and deflection diagrams for all members"""
+        """
+        Generate shear, moment, and deflection diagrams for all members.
+        All members are sampled at frame.diagram_points stations in one pass.
+        Final moments are clockwise-positive member end moments, so the
+        sagging moment is +M_start at the start and -M_end at the end.
+        Deflection (mm, downward positive) assumes no relative end translation.
+        """
+        member_ids = list(self.members.keys())
+        if not member_ids:
+            return {}, {}, {}
+
+        L = np.array([self.members[m].length for m in member_ids])
+        EI = np.array([self.members[m].E * self.members[m].I for m in member_ids])
+        M_start = np.array([self.final_moments[m]["start"] for m in member_ids])
+        M_end = np.array([self.final_moments[m]["end"] for m in member_ids])
+
+        x = sample_points(L, max(self.frame.diagram_points, 2))
+        V0, M0 = simple_span_forces(L, x, self._member_load_arrays(member_ids))
+        V_ends, M_ends = end_moment_forces(L, x, M_start, -M_end)
+        shear = V0 + V_ends
+        moment = M0 + M_ends
+        # kN*m / (Pa * m^4) -> x 1e3 for N*m, x 1e3 for mm
+        deflection = -deflection_from_moment(x, moment * 1e6, EI)
 
         shear_data = {}
         moment_data = {}
         deflection_data = {}
-
-        for member_id, member in self.members.items():
-            # Generate points along member
-            n_points = 50
-            x_points = np.linspace(0, member.length, n_points)
-
-            shear_values = []
-            moment_values = []
-            deflection_values = []
-
-            for x in x_points:
-                # Calculate shear force at x
-                V = self._calculate_member_shear(member_id, x)
-                shear_values.append(V)
-
-                # Calculate bending moment at x
-                M = self._calculate_member_moment(member_id, x)
-                moment_values.append(M)
-
-                # Calculate deflection at x (simplified)
-                delta = self._calculate_member_deflection(member_id, x)
-                deflection_values.append(delta)
-
-            # Format data for frontend
-            shear_data[member_id] = [
-                {"x": float(x), "y": float(V)} for x, V in zip(x_points, shear_values)
-            ]
-            moment_data[member_id] = [
-                {"x": float(x), "y": float(M)} for x, M in zip(x_points, moment_values)
-            ]
-            deflection_data[member_id] = [
-                {"x": float(x), "y": float(delta)}
-                for x, delta in zip(x_points, deflection_values)
-            ]
+        for i, member_id in enumerate(member_ids):
+            shear_data[member_id] = xy_series(x[i], shear[i])
+            moment_data[member_id] = xy_series(x[i], moment[i])
+            deflection_data[member_id] = xy_series(x[i], deflection[i])
 
         return shear_data, moment_data, deflection_data
 
-    def _calculate_member_shear(self, member_id: str, x: float) -> float:
-        """Calculate shear force at distance x from start of member"""
-        member = self.members[member_id]
-
-        # Start with end moments contribution
-        M_start = self.final_moments[member_id]["start"]
-        M_end = self.final_moments[member_id]["end"]
-
-        V_moments = (M_start - M_end) / member.length
-
-        # Add load contributions
-        V_loads = 0.0
-        for load in member.loads:
-            if load.load_type == "Point":
-                if load.position <= x:
-                    V_loads -= load.magnitude
-            elif load.load_type == "UDL":
-                V_loads -= load.magnitude * x
-            # Add other load types as needed
-
-        return V_moments + V_loads
-
-    def _calculate_member_moment(self, member_id: str, x: float) -> float:
-        """Calculate bending moment at distance x from start of member"""
-        member = self.members[member_id]
-
-        # Start with end moment and linear interpolation
-        M_start = self.final_moments[member_id]["start"]
-        M_end = self.final_moments[member_id]["end"]
-
-        # Linear moment from end moments
-        M_linear = M_start + (M_end - M_start) * x / member.length
-
-        # Add load-induced moments
-        M_loads = 0.0
-
-        # Calculate reaction at start due to loads
-        V_start_loads = 0.0
-        for load in member.loads:
-            if load.load_type == "Point":
-                P = load.magnitude
-                a = load.position
-                V_start_loads += P * (member.length - a) / member.length
-            elif load.load_type == "UDL":
-                w = load.magnitude
-                V_start_loads += w * member.length / 2
-
-        # Moment from start reaction
-        M_loads += V_start_loads * x
-
-        # Subtract moments from loads to the left of x
-        for load in member.loads:
-            if load.load_type == "Point":
-                if load.position <= x:
-                    M_loads -= load.magnitude * (x - load.position)
-            elif load.load_type == "UDL":
-                M_loads -= load.magnitude * x**2 / 2
-
-        return M_linear + M_loads
-
-    def _calculate_member_deflection(self, member_id: str, x: float) -> float:
-        """Calculate deflection at distance x from start of member (simplified)"""
-        member = self.members[member_id]
-
-        # This is a simplified deflection calculation
-        # For accurate deflection, numerical integration would be required
-
-        L = member.length
-        E = member.E
-        I = member.I
-
-        # Use simplified formula for uniformly loaded beam with end moments
-        # This is an approximation
-
-        total_load = sum(
-            load.magnitude * (load.length if load.load_type != "Point" else 1)
-            for load in member.loads
-        )
-
-        if total_load == 0:
-            return 0.0
-
-        # Simplified deflection formula
-        w_equiv = total_load / L if L > 0 else 0
-
-        # Maximum deflection approximation
-        delta_max = w_equiv * L**4 / (384 * E * I) if E * I > 0 else 0
-
-        # Parabolic distribution approximation
-        xi = x / L if L > 0 else 0
-        delta = delta_max * 4 * xi * (1 - xi) * (1 - xi**2)
-
-        return delta
-
-
 router = APIRouter()
 
 @router.post("/analyze", response_model=MomentDistributionResponse)
@@ -18,6 +18,7 @@ from .datasets import (
     table_3_25_min_reinforcement,
     get_number_of_bars
 )
+from .section_cache import SECTION_CACHE, ACTION_DECIMALS, LENGTH_DECIMALS, AREA_DECIMALS, quantize
 
 router = APIRouter()
 
@@ -416,6 +417,14 @@ class BS8110Designer:
         )
 
     def _design_section_flexure(self, M_kNm: float, b: float, d: float, fcu: int, fy: int, bf: float, hf: float, is_hogging: bool) -> Dict:
+        args = (
+            quantize(M_kNm, ACTION_DECIMALS), quantize(b, LENGTH_DECIMALS), quantize(d, LENGTH_DECIMALS),
+            quantize(fcu, LENGTH_DECIMALS), quantize(fy, LENGTH_DECIMALS),
+            quantize(bf, LENGTH_DECIMALS), quantize(hf, LENGTH_DECIMALS), bool(is_hogging),
+        )
+        return SECTION_CACHE.get_or_compute("flexure", args, lambda: self._flexure_kernel(*args))
+
+    def _flexure_kernel(self, M_kNm: float, b: float, d: float, fcu: float, fy: float, bf: float, hf: float, is_hogging: bool) -> Dict:
         # BS 8110-1:1997 Clause 3.4.4.4
         M = M_kNm * 1e6 # Nmm
         
@@ -470,6 +479,10 @@ class BS8110Designer:
         }
 
     def _select_bars(self, As_req: float, fy: int) -> Dict:
+        args = (quantize(As_req, AREA_DECIMALS), quantize(fy, LENGTH_DECIMALS))
+        return SECTION_CACHE.get_or_compute("bars", args, lambda: self._bars_kernel(*args))
+
+    def _bars_kernel(self, As_req: float, fy: float) -> Dict:
         # Select minimum 2 bars
         # Prefer diameters: 16, 20, 25, 12, 32, 10
         preferred = [16, 20, 25, 12, 32, 10] if fy >= 460 else [12, 16, 20, 25, 10]
@@ -496,6 +509,13 @@ class BS8110Designer:
         return best
 
     def _design_shear(self, V_kN: float, b: float, d: float, fcu: int, fyv: int, As_tension: float) -> Dict:
+        args = (
+            quantize(V_kN, ACTION_DECIMALS), quantize(b, LENGTH_DECIMALS), quantize(d, LENGTH_DECIMALS),
+            quantize(fcu, LENGTH_DECIMALS), quantize(fyv, LENGTH_DECIMALS), quantize(As_tension, AREA_DECIMALS),
+        )
+        return SECTION_CACHE.get_or_compute("shear", args, lambda: self._shear_kernel(*args))
+
+    def _shear_kernel(self, V_kN: float, b: float, d: float, fcu: float, fyv: float, As_tension: float) -> Dict:
         # User Rule: Asw/s bw >= 0.085% (0.00085)
         # Replacing BS 8110 Table 3.8 logic with this specific rule where applicable for minimums
         
@@ -572,6 +592,72 @@ class BS8110Designer:
 
         return {**best_link, "ok": ok, "warnings": warnings, "util": v/v_max if v_max > 0 else 0}
 
+    def design_moments(self, moments_kNm, b: float, d: float, fcu: float, fy: float,
+                       bf: Optional[float] = None, d_prime: float = 50.0) -> Dict[str, np.ndarray]:
+        """
+        Flexural design of an array of moments in one vectorized pass, same rules
+        as _design_section_flexure and _select_bars. Sagging (positive) moments
+        take the flange width bf, hogging (negative) moments the web width b.
+        Returns arrays aligned with moments_kNm.
+        """
+        moments = np.asarray(moments_kNm, dtype=float).ravel()
+        M = np.abs(moments) * 1e6
+        b_eff = np.where(moments < 0, b, b if bf is None else bf)
+        K = M / (fcu * b_eff * d**2)
+        K_prime = 0.156
+        comp_needed = K > K_prime
+
+        z = np.minimum(d * (0.5 + np.sqrt(np.clip(0.25 - K / 0.9, 0.0, None))), 0.95 * d)
+        As_single = M / (0.95 * fy * z)
+
+        z_bal = d * (0.5 + math.sqrt(0.25 - K_prime / 0.9))
+        As_comp = np.where(
+            comp_needed,
+            np.clip((K - K_prime) * fcu * b_eff * d**2 / (0.95 * fy * (d - d_prime)), 0.0, None),
+            0.0,
+        )
+        As_double = K_prime * fcu * b_eff * d**2 / (0.95 * fy * z_bal) + As_comp
+        As_req = np.where(comp_needed, As_double, As_single)
+
+        tension = self._select_bars_array(As_req, fy)
+        compression = self._select_bars_array(As_comp, fy)
+        return {
+            "moment": moments,
+            "K": K,
+            "util": K / K_prime,
+            "As_req": As_req,
+            "As_comp_req": As_comp,
+            "comp_needed": comp_needed,
+            "bar_count": tension["count"],
+            "bar_dia": tension["dia"],
+            "As_prov": tension["As_prov"],
+            "comp_bar_count": compression["count"],
+            "comp_bar_dia": compression["dia"],
+            "As_comp_prov": compression["As_prov"],
+        }
+
+    def _select_bars_array(self, As_req: np.ndarray, fy: float) -> Dict[str, np.ndarray]:
+        """_select_bars over an array: least area from the preferred diameters with 2-8 bars"""
+        preferred = np.array([16, 20, 25, 12, 32, 10] if fy >= 460 else [12, 16, 20, 25, 10])
+        area = math.pi * (preferred / 2) ** 2
+        As_req = np.asarray(As_req, dtype=float)
+        needed = np.maximum(2, np.ceil(As_req[:, None] / area[None, :]))
+        provided = np.where(needed <= 8, needed * area[None, :], np.inf)
+        # argmin keeps the first preferred diameter on ties, as the scalar loop does
+        best = provided.argmin(axis=1)
+        rows = np.arange(len(As_req))
+        fits = np.isfinite(provided[rows, best])
+
+        count = np.where(fits, needed[rows, best], 2).astype(int)
+        dia = np.where(fits, preferred[best], 25)
+        As_prov = np.where(fits, provided[rows, best], 99999.0)
+        none = As_req <= 0
+        return {
+            "count": np.where(none, 0, count),
+            "dia": np.where(none, 0, dia),
+            "As_prov": np.where(none, 0.0, As_prov),
+        }
+
     def _check_detailing(self, b, h, As_sag, As_hog, mat) -> Dict:
         # User Rule: Min Tension As = 0.0015 * b * d
         # User Rule: Min Compression Asc = 0.002 * Ac (b*h)
@@ -942,4 +1028,8 @@ def get_material_properties():
         "concrete_grades": {"C20":20, "C25":25, "C30":30, "C35":35, "C40":40, "C45":45, "C50":50},
         "steel_grades": {"Grade 250": 250, "Grade 460": 460}
     }
-        
\ No newline at end of file
+        
+@router.get("/design_cache")
+def get_design_cache_stats():
+    """Hit/miss counters of the shared section design memo"""
+    return SECTION_CACHE.stats()
@@ -0,0 +1,106 @@
+"""
+Section Design Memo
+Bounded LRU cache for the pure BS 8110 section kernels (flexure, shear and
+bar selection). Keys are the kernel name plus its inputs rounded to a fixed
+resolution, and the kernels compute from the same rounded values, so a
+cached result is exactly what a fresh call would return. The same beam type
+on many floors, or repeated stations along a span, then costs one dict lookup.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+# Rounding applied to every float input before it becomes part of a key:
+# 1e-3 kN / kNm on actions, 0.1 mm on dimensions and 0.01 mm2 on areas
+ACTION_DECIMALS = 3
+LENGTH_DECIMALS = 1
+AREA_DECIMALS = 2
+
+
+def quantize(value: float, decimals: int) -> float:
+    """Round to the key resolution; -0.0 is folded onto 0.0 so both share an entry"""
+    return round(float(value), decimals) + 0.0
+
+
+def _copy(value: Any) -> Any:
+    """Shallow copy of a kernel result so callers can annotate it freely"""
+    if isinstance(value, dict):
+        return {k: list(v) if isinstance(v, list) else v for k, v in value.items()}
+    return value
+
+
+class SectionDesignCache:
+    """
+    Process-level LRU memo of section design results, shared by every
+    BS8110Designer (design_beam and the integrated analysis endpoints).
+    Entries are evicted least-recently-used first beyond max_entries.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._kernel_hits: Dict[str, int] = {}
+        self._kernel_misses: Dict[str, int] = {}
+
+    def get_or_compute(self, kernel: str, key: Tuple[Hashable, ...], compute: Callable[[], Any]) -> Any:
+        """Cached result of kernel for key, computing and storing it on a miss"""
+        if not self.enabled:
+            return compute()
+        full_key = (kernel,) + key
+        with self._lock:
+            if full_key in self._entries:
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                self._kernel_hits[kernel] = self._kernel_hits.get(kernel, 0) + 1
+                return _copy(self._entries[full_key])
+            self.misses += 1
+            self._kernel_misses[kernel] = self._kernel_misses.get(kernel, 0) + 1
+
+        value = compute()
+        with self._lock:
+            self._entries[full_key] = _copy(value)
+            self._entries.move_to_end(full_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+            self._kernel_hits.clear()
+            self._kernel_misses.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            kernels = {}
+            for name in sorted(set(self._kernel_hits) | set(self._kernel_misses)):
+                hits = self._kernel_hits.get(name, 0)
+                total = hits + self._kernel_misses.get(name, 0)
+                kernels[name] = {
+                    "hits": hits,
+                    "misses": total - hits,
+                    "hit_rate": round(hits / total, 4) if total else 0.0,
+                }
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "kernels": kernels,
+            }
+
+
+# Shared by every BS 8110 beam designer in the process
+SECTION_CACHE = SectionDesignCache()
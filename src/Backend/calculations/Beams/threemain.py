@@ -9,6 +9,16 @@ from typing import List, Dict, Optional, Tuple
 from enum import Enum
 import numpy as np
 import math
+from scipy.linalg import solve_banded
+
+from .diagram_kernel import (
+    LoadArrays,
+    sample_points,
+    simple_span_forces,
+    end_moment_forces,
+    xy_series,
+)
+from .influence_lines import AxleTrain, InfluenceLines
 
 router = APIRouter()
 
@@ -54,6 +64,17 @@ class Span(BaseModel):
 class BeamModel(BaseModel):
     spans: List[Span]
     supports: List[Support]
+    diagram_points: int = 100  # stations per span
+
+
+class MovingLoadRequest(BaseModel):
+    spans: List[Span]
+    supports: List[Support]
+    vehicles: List[AxleTrain]
+    n_positions: int = Field(1001, ge=2)  # unit-load positions along the beam
+    diagram_points: int = Field(21, ge=2)  # response stations per span
+    both_directions: bool = True
+    include_influence_lines: bool = False
 
 
 # ============================================================================
@@ -95,194 +116,272 @@ class ThreeMomentSolver:
         internal_support.position = support.position
         return internal_support
 
-    def solve(self):
-        self._solve_three_moment_equations()
+    def solve(self, method: str = "banded"):
+        self._solve_three_moment_equations(method)
         self._calculate_reactions()
 
-    def _solve_three_moment_equations(self):
+    def _solve_three_moment_equations(self, method: str = "banded"):
         self.equations_used.append(
-            "Three-Moment Theorem: M_i*L_i + 2*M_{i+1}*(L_i + L_{i+1}) + M_{i+2}*L_{i+1} = -6*(A_i/L_i + A_{i+1}/L_{i+1})"
+            "Three-Moment Theorem: M_i*L_i/EI_i + 2*M_{i+1}*(L_i/EI_i + L_{i+1}/EI_{i+1}) + M_{i+2}*L_{i+1}/EI_{i+1} = -6*(A_i*a_i/(L_i*EI_i) + A_{i+1}*b_{i+1}/(L_{i+1}*EI_{i+1}))"
         )
 
-        for i, support in enumerate(self.supports):
-            if support.support_type in [SupportType.PINNED, SupportType.SIMPLY_SUPPORTED]:
-                self.support_moments[i] = 0.0
+        lower, diag, upper, rhs = self._assemble_tridiagonal()
+        try:
+            if method == "dense":
+                M = self._solve_dense(lower, diag, upper, rhs)
+            else:
+                M = self._solve_banded(lower, diag, upper, rhs)
+        except (np.linalg.LinAlgError, ValueError):
+            return
+
+        self.support_moments = M.tolist()
+
+    def _assemble_tridiagonal(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        One equation per support, unknowns are the support moments (sagging +).
+        Interior supports carry the three-moment equation. A fixed end adds the
+        equation of an imaginary zero-length span beyond it; any other end has M = 0.
+        lower[j] couples M_j to M_{j-1}, upper[j] couples M_j to M_{j+1}.
+        """
+        lower, diag, upper = self._bands()
+        rhs = self._load_vector(*self._area_terms())
+        if self.supports[0].support_type == SupportType.FIXED:
+            self.equations_used.append("Fixed left end: 2*M_0*L_1/EI_1 + M_1*L_1/EI_1 = -6*A_1*b_1/(L_1*EI_1)")
+        if self.supports[self.n_spans].support_type == SupportType.FIXED:
+            self.equations_used.append("Fixed right end: M_{n-1}*L_n/EI_n + 2*M_n*L_n/EI_n = -6*A_n*a_n/(L_n*EI_n)")
+        return lower, diag, upper, rhs
+
+    def _bands(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Coefficient bands of the support-moment equations (load independent)"""
+        n = self.n_spans
+        flexibility = np.array([span.length / span.EI for span in self.spans])
+
+        lower = np.zeros(n + 1)
+        diag = np.zeros(n + 1)
+        upper = np.zeros(n + 1)
+
+        # Interior supports j = 1..n-1 between spans j-1 and j
+        lower[1:n] = flexibility[:-1]
+        diag[1:n] = 2 * (flexibility[:-1] + flexibility[1:])
+        upper[1:n] = flexibility[1:]
+
+        if self.supports[0].support_type == SupportType.FIXED:
+            diag[0], upper[0] = 2 * flexibility[0], flexibility[0]
+        else:
+            diag[0] = 1.0
 
-        if self.n_spans == 1:
-            self._solve_single_span()
+        if self.supports[n].support_type == SupportType.FIXED:
+            lower[n], diag[n] = flexibility[-1], 2 * flexibility[-1]
         else:
-            self._solve_multi_span()
-
-    def _solve_single_span(self):
-        left_support = self.supports[0]
-        right_support = self.supports[1]
-
-        if left_support.support_type == SupportType.FIXED and right_support.support_type == SupportType.FIXED:
-            M_left, M_right = self._calculate_fixed_end_moments(self.spans[0])
-            self.support_moments[0] = M_left
-            self.support_moments[1] = M_right
-        elif left_support.support_type == SupportType.FIXED:
-            M_left, _ = self._calculate_fixed_end_moments(self.spans[0])
-            self.support_moments[0] = M_left / 2
-        elif right_support.support_type == SupportType.FIXED:
-            _, M_right = self._calculate_fixed_end_moments(self.spans[0])
-            self.support_moments[1] = M_right / 2
-
-    def _solve_multi_span(self):
-        unknowns = []
-        for i in range(1, self.n_spans):
-            if self.supports[i].support_type != SupportType.FIXED:
-                unknowns.append(i)
-
-        if not unknowns: return
-
-        n_eq = self.n_spans - 1
-        A_matrix = np.zeros((n_eq, len(unknowns)))
-        b_vector = np.zeros(n_eq)
-
-        for eq in range(n_eq):
-            i = eq
-            L_i = self.spans[i].length
-            L_i1 = self.spans[i + 1].length
-            A_i = self._calculate_area_term(self.spans[i])
-            A_i1 = self._calculate_area_term(self.spans[i + 1])
-
-            b_vector[eq] = -6 * (A_i + A_i1)
-
-            for j, unknown_idx in enumerate(unknowns):
-                if unknown_idx == i: A_matrix[eq, j] += L_i
-                elif unknown_idx == i + 1: A_matrix[eq, j] += 2 * (L_i + L_i1)
-                elif unknown_idx == i + 2: A_matrix[eq, j] += L_i1
+            diag[n] = 1.0
+
+        return lower, diag, upper
+
+    def _load_vector(self, left_terms: np.ndarray, right_terms: np.ndarray) -> np.ndarray:
+        """
+        Right-hand side (n + 1,) or (n + 1, m) from area terms of shape
+        (n_spans,) or (n_spans, m), one column per load case.
+        """
+        n = self.n_spans
+        rhs = np.zeros((n + 1,) + left_terms.shape[1:])
+        rhs[1:n] = -(left_terms[:-1] + right_terms[1:])
+        if self.supports[0].support_type == SupportType.FIXED:
+            rhs[0] = -right_terms[0]
+        if self.supports[n].support_type == SupportType.FIXED:
+            rhs[n] = -left_terms[-1]
+        return rhs
+
+    def _area_terms(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        6*A*x/(L*EI) for every span, with the centroid distance x of the free
+        moment diagram measured from the left end (left_terms, used at the
+        span's right support) or from the right end (right_terms).
+        """
+        L = np.array([span.length for span in self.spans])
+        EI = np.array([span.EI for span in self.spans])
+        left_terms = np.zeros(self.n_spans)
+        right_terms = np.zeros(self.n_spans)
+
+        loads = self._load_arrays(list(range(self.n_spans)))
+        span, P, a = loads.points()
+        if len(span):
+            Ls = L[span]
+            b = Ls - a
+            left_terms += np.bincount(span, P * a * (Ls**2 - a**2) / Ls, self.n_spans)
+            right_terms += np.bincount(span, P * b * (Ls**2 - b**2) / Ls, self.n_spans)
+
+        span, w, _, _, _ = loads.patches()
+        if len(span):
+            udl = np.bincount(span, w * L[span]**3 / 4, self.n_spans)
+            left_terms += udl
+            right_terms += udl
+
+        return left_terms / EI, right_terms / EI
+
+    @staticmethod
+    def _solve_banded(lower, diag, upper, rhs) -> np.ndarray:
+        """O(n) tridiagonal solve"""
+        ab = np.zeros((3, len(diag)))
+        ab[0, 1:] = upper[:-1]
+        ab[1] = diag
+        ab[2, :-1] = lower[1:]
+        return solve_banded((1, 1), ab, rhs)
+
+    @staticmethod
+    def _solve_dense(lower, diag, upper, rhs) -> np.ndarray:
+        """Reference path: the same equations as a dense matrix"""
+        A = np.diag(diag) + np.diag(upper[:-1], 1) + np.diag(lower[1:], -1)
+        return np.linalg.solve(A, rhs)
+
+    def influence_lines(self, n_positions: int = 1001, n_points: int = 21) -> InfluenceLines:
+        """
+        Influence lines of moment and shear at n_points stations per span and
+        of every support reaction, for a unit downward load at n_positions
+        evenly spaced points along the beam. The tridiagonal system is solved
+        once with one right-hand-side column per load position.
+        """
+        L = np.array([span.length for span in self.spans])
+        EI = np.array([span.EI for span in self.spans])
+        starts = np.concatenate([[0.0], np.cumsum(L)])
+        n_positions = max(n_positions, 2)
+
+        positions = np.linspace(0.0, starts[-1], n_positions)
+        load_span = np.clip(np.searchsorted(starts, positions, side="right") - 1, 0, self.n_spans - 1)
+        a = positions - starts[load_span]
+        b = L[load_span] - a
+
+        columns = np.arange(n_positions)
+        left_terms = np.zeros((self.n_spans, n_positions))
+        right_terms = np.zeros((self.n_spans, n_positions))
+        left_terms[load_span, columns] = a * (L[load_span]**2 - a**2) / L[load_span] / EI[load_span]
+        right_terms[load_span, columns] = b * (L[load_span]**2 - b**2) / L[load_span] / EI[load_span]
+
+        lower, diag, upper = self._bands()
+        M = self._solve_banded(lower, diag, upper, self._load_vector(left_terms, right_terms))
+
+        x_local = sample_points(L, max(n_points, 2))
+        station_span = np.repeat(np.arange(self.n_spans), x_local.shape[1])
+        V, moment = self._unit_load_response(station_span, x_local.ravel(), load_span, a, M)
+
+        # Reaction = shear just right of the support - shear just left of it
+        V_start, _ = self._unit_load_response(np.arange(self.n_spans), np.zeros(self.n_spans), load_span, a, M)
+        V_end, _ = self._unit_load_response(np.arange(self.n_spans), L, load_span, a, M, load_on_left=True)
+        reactions = np.zeros((self.n_spans + 1, n_positions))
+        reactions[:-1] += V_start
+        reactions[1:] -= V_end
+
+        return InfluenceLines(
+            positions=positions,
+            stations=(x_local + starts[:-1, None]).ravel(),
+            moment=moment,
+            shear=V,
+            reactions=reactions,
+            support_labels=[s.position for s in self.supports],
+        )
 
-        try:
-            if len(unknowns) > 0:
-                solution = np.linalg.solve(A_matrix, b_vector)
-                for j, unknown_idx in enumerate(unknowns):
-                    self.support_moments[unknown_idx] = solution[j]
-        except np.linalg.LinAlgError:
-            pass
-
-    def _calculate_fixed_end_moments(self, span) -> Tuple[float, float]:
-        M_left = 0.0
-        M_right = 0.0
-        L = span.length
-        for load in span.loads:
-            if load.load_type == LoadType.POINT:
-                P, a, b = load.magnitude, load.position, L - load.position
-                M_left += -P * a * b**2 / L**2
-                M_right += P * a**2 * b / L**2
-            elif load.load_type == LoadType.UDL:
-                w = load.magnitude
-                M_left += -w * L**2 / 12
-                M_right += w * L**2 / 12
-        return M_left, M_right
-
-    def _calculate_area_term(self, span) -> float:
-        A = 0.0
-        L = span.length
-        for load in span.loads:
-            if load.load_type == LoadType.POINT:
-                P, a, b = load.magnitude, load.position, L - load.position
-                A += P * a * b * (L**2 - a**2 - b**2) / (6 * L)
-            elif load.load_type == LoadType.UDL:
-                w = load.magnitude
-                A += w * L**4 / 24
-        return A / (span.EI * L)
+    def _unit_load_response(self, span, x, load_span, a, M, load_on_left: bool = False):
+        """
+        Shear and moment (n_stations, n_positions) at stations (span, x) for a
+        unit load at (load_span, a), given the support moments M (n + 1, n_positions).
+        A load exactly at a station is taken to the right of it unless load_on_left.
+        """
+        L = np.array([s.length for s in self.spans])[span][:, None]
+        x = np.asarray(x, dtype=float)[:, None]
+        a = a[None, :]
+        same = span[:, None] == load_span[None, :]
+
+        M_free = np.where(x <= a, x * (L - a), a * (L - x)) / L * same
+        before_load = x < a if load_on_left else x <= a
+        V_free = np.where(before_load, (L - a) / L, -a / L) * same
+        M_left, M_right = M[span], M[span + 1]
+        return V_free + (M_right - M_left) / L, M_free + M_left * (1 - x / L) + M_right * x / L
 
     def _calculate_reactions(self):
-        for i in range(len(self.supports)):
-            reaction = 0.0
-            if i > 0:
-                span = self.spans[i - 1]
-                L, M_left, M_right = span.length, self.support_moments[i - 1], self.support_moments[i]
-                reaction += (M_right - M_left) / L
-                for load in span.loads:
-                    if load.load_type == LoadType.POINT: reaction += load.magnitude * (L - load.position) / L
-                    elif load.load_type == LoadType.UDL: reaction += load.magnitude * L / 2
-            if i < len(self.spans):
-                span = self.spans[i]
-                L, M_left, M_right = span.length, self.support_moments[i], self.support_moments[i + 1]
-                reaction += (M_left - M_right) / L
-                for load in span.loads:
-                    if load.load_type == LoadType.POINT: reaction += load.magnitude * load.position / L
-                    elif load.load_type == LoadType.UDL: reaction += load.magnitude * L / 2
-            self.reactions[i] = reaction
+        """Support reaction = shear just right of the support - shear just left of it"""
+        L = np.array([span.length for span in self.spans])
+        V, _, _ = self.span_diagrams(np.column_stack([np.zeros_like(L), L]))
+        reactions = np.zeros(self.n_spans + 1)
+        reactions[:-1] += V[:, 0]
+        reactions[1:] -= V[:, 1]
+        self.reactions = reactions.tolist()
+
+    def _load_arrays(self, span_indices: List[int]) -> LoadArrays:
+        loads = LoadArrays()
+        for row, span_idx in enumerate(span_indices):
+            span = self.spans[span_idx]
+            for load in span.loads:
+                if load.load_type == LoadType.POINT:
+                    loads.add_point(row, load.magnitude, load.position)
+                elif load.load_type == LoadType.UDL:
+                    loads.add_patch(row, load.magnitude, load.magnitude, 0.0, span.length)
+        return loads
+
+    def span_diagrams(self, x: np.ndarray, span_indices: Optional[List[int]] = None):
+        """
+        Shear, moment due to loads and moment due to support moments at
+        stations x (one row per span) for all spans at once.
+        """
+        if span_indices is None:
+            span_indices = list(range(self.n_spans))
+        L = np.array([self.spans[i].length for i in span_indices])
+        M = np.asarray(self.support_moments, dtype=float)
+        idx = np.asarray(span_indices, dtype=int)
+
+        V_loads, M_loads = simple_span_forces(L, x, self._load_arrays(span_indices))
+        V_supports, M_supports = end_moment_forces(L, x, M[idx], M[idx + 1])
+        return V_loads + V_supports, M_loads, M_supports
+
+    def _at(self, span_idx: int, x):
+        x_row = np.atleast_1d(np.asarray(x, dtype=float))[None, :]
+        V, M_loads, M_supports = self.span_diagrams(x_row, [span_idx])
+        unpack = (lambda a: float(a[0, 0])) if np.ndim(x) == 0 else (lambda a: a[0])
+        return unpack(V), unpack(M_loads), unpack(M_supports)
 
     def calculate_shear_force(self, span_idx: int, x: float) -> float:
-        span = self.spans[span_idx]
-        V = self.reactions[span_idx]
-        for load in span.loads:
-            if load.load_type == LoadType.POINT:
-                if load.position <= x: V -= load.magnitude
-            elif load.load_type == LoadType.UDL:
-                if x > load.position:
-                    length_covered = min(x - load.position, span.length - load.position)
-                    V -= load.magnitude * length_covered
-        return V
+        return self._at(span_idx, x)[0]
 
     def calculate_moment_due_to_loads(self, span_idx: int, x: float) -> float:
-        span, L = self.spans[span_idx], self.spans[span_idx].length
-        total_load, moment_about_left = 0.0, 0.0
-        for load in span.loads:
-            if load.load_type == LoadType.POINT:
-                total_load += load.magnitude
-                moment_about_left += load.magnitude * load.position
-            elif load.load_type == LoadType.UDL:
-                total_load += load.magnitude * L
-                moment_about_left += load.magnitude * L * L / 2
-        R_left = (total_load * L - moment_about_left) / L if L > 0 else 0
-        M = R_left * x
-        for load in span.loads:
-            if load.load_type == LoadType.POINT and load.position <= x: M -= load.magnitude * (x - load.position)
-            elif load.load_type == LoadType.UDL and x > 0: M -= load.magnitude * x**2 / 2
-        return M
+        return self._at(span_idx, x)[1]
 
     def calculate_moment_due_to_supports(self, span_idx: int, x: float) -> float:
-        L = self.spans[span_idx].length
-        return self.support_moments[span_idx] * (1 - x / L) + self.support_moments[span_idx + 1] * (x / L)
+        return self._at(span_idx, x)[2]
 
     def calculate_total_moment(self, span_idx: int, x: float) -> float:
-        return self.calculate_moment_due_to_loads(span_idx, x) + self.calculate_moment_due_to_supports(span_idx, x)
-
-    def get_analysis_data(self) -> dict:
-        all_x, all_V, all_M_total, all_M_loads, all_M_supports = [], [], [], [], []
-        current_pos = 0
-
-        for span_idx, span in enumerate(self.spans):
-            n_points = 100
-            x_local = np.linspace(0, span.length, n_points)
-            x_global = x_local + current_pos
-            V_local = [self.calculate_shear_force(span_idx, x) for x in x_local]
-            M_total_local = [self.calculate_total_moment(span_idx, x) for x in x_local]
-            M_loads_local = [self.calculate_moment_due_to_loads(span_idx, x) for x in x_local]
-            M_supports_local = [self.calculate_moment_due_to_supports(span_idx, x) for x in x_local]
-
-            all_x.extend(x_global.tolist())
-            all_V.extend(V_local)
-            all_M_total.extend(M_total_local)
-            all_M_loads.extend(M_loads_local)
-            all_M_supports.extend(M_supports_local)
-            current_pos += span.length
+        _, M_loads, M_supports = self._at(span_idx, x)
+        return M_loads + M_supports
+
+    def get_analysis_data(self, n_points: int = 100) -> dict:
+        lengths = np.array([span.length for span in self.spans])
+        x_local = sample_points(lengths, max(n_points, 2))
+        offsets = np.concatenate([[0.0], np.cumsum(lengths)[:-1]])
+        V, M_loads, M_supports = self.span_diagrams(x_local)
+
+        all_x = (x_local + offsets[:, None]).ravel().tolist()
+        all_V = V.ravel()
+        all_M_total = (M_loads + M_supports).ravel()
+        all_M_loads = M_loads.ravel()
+        all_M_supports = M_supports.ravel()
+        has_points = all_V.size > 0
 
         return {
             "support_moments": self.support_moments,
             "support_reactions": self.reactions,
-            "shear_force_data": [{"x": x, "y": V} for x, V in zip(all_x, all_V)],
-            "moment_data": [{"x": x, "y": M} for x, M in zip(all_x, all_M_total)],
+            "shear_force_data": xy_series(all_x, all_V),
+            "moment_data": xy_series(all_x, all_M_total),
             "moment_positions": all_x,
             "shear_positions": all_x,
-            "moment_due_to_loads_data": [{"x": x, "y": M} for x, M in zip(all_x, all_M_loads)],
-            "moment_due_to_supports_data": [{"x": x, "y": M} for x, M in zip(all_x, all_M_supports)],
+            "moment_due_to_loads_data": xy_series(all_x, all_M_loads),
+            "moment_due_to_supports_data": xy_series(all_x, all_M_supports),
             "beam_configuration": {
                 "spans": [{"length": span.length, "loads": len(span.loads)} for span in self.spans],
                 "supports": [{"type": s.support_type.value, "position": s.position} for s in self.supports],
                 "total_length": sum(span.length for span in self.spans),
             },
             "critical_values": {
-                "max_moment": max(all_M_total) if all_M_total else 0,
-                "min_moment": min(all_M_total) if all_M_total else 0,
-                "max_shear": max(all_V) if all_V else 0,
-                "min_shear": min(all_V) if all_V else 0,
+                "max_moment": float(all_M_total.max()) if has_points else 0,
+                "min_moment": float(all_M_total.min()) if has_points else 0,
+                "max_shear": float(all_V.max()) if has_points else 0,
+                "min_shear": float(all_V.min()) if has_points else 0,
             },
             "equations_used": self.equations_used,
         }
@@ -297,10 +396,43 @@ def analyze_beam(model: BeamModel):
     try:
         solver = ThreeMomentSolver(model.spans, model.supports)
         solver.solve()
-        return solver.get_analysis_data()
+        return solver.get_analysis_data(model.diagram_points)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Analysis failed: {e}")
 
+@router.post("/moving-load", response_model=Optional[dict])
+def analyze_moving_load(request: MovingLoadRequest):
+    """Influence lines and moving axle-train envelopes of moment, shear and reactions."""
+    try:
+        solver = ThreeMomentSolver(request.spans, request.supports)
+        lines = solver.influence_lines(request.n_positions, request.diagram_points)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Analysis failed: {e}")
+
+    envelopes = [lines.envelope(vehicle, request.both_directions) for vehicle in request.vehicles]
+    result = {
+        "stations": lines.stations.tolist(),
+        "supports": lines.support_labels,
+        "vehicles": [
+            dict(env.columns(), vehicle=env.vehicle,
+                 reaction_max=env.reaction_max.tolist(), reaction_min=env.reaction_min.tolist())
+            for env in envelopes
+        ],
+    }
+    if envelopes:
+        result["envelope"] = {
+            "moment_max": np.max([env.moment_max for env in envelopes], axis=0).tolist(),
+            "moment_min": np.min([env.moment_min for env in envelopes], axis=0).tolist(),
+            "shear_max": np.max([env.shear_max for env in envelopes], axis=0).tolist(),
+            "shear_min": np.min([env.shear_min for env in envelopes], axis=0).tolist(),
+            "reaction_max": np.max([env.reaction_max for env in envelopes], axis=0).tolist(),
+            "reaction_min": np.min([env.reaction_min for env in envelopes], axis=0).tolist(),
+        }
+    if request.include_influence_lines:
+        # Thin the load positions to about 200 columns for plotting
+        result["influence_lines"] = lines.columns(stride=max(request.n_positions // 200, 1))
+    return result
+
 @router.get("/examples")
 def get_examples():
     return [
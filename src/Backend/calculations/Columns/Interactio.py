@@ -1,11 +1,21 @@
 import math
 import numpy as np
-from scipy.optimize import fsolve
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional, List, Any
 from ..Beams.datasets import table_3_27_anchorage
 from ..datasets import data_table_3_10
+from .interaction_surface import INTERACTION_CACHE, interaction_surface
+
+# Effective length factors (Tables 3.19 / 3.20) keyed by (top, bottom) end condition
+BETA_BRACED = {(1,1):0.75, (1,2):0.8, (1,3):0.9, (2,1):0.8, (2,2):0.85, (2,3):0.95, (3,1):0.9, (3,2):0.95, (3,3):1.0}
+BETA_UNBRACED = {(1,1):1.2, (1,2):1.3, (1,3):1.6, (1,4):2.2, (2,1):1.3, (2,2):1.5, (2,3):1.8, (2,4):2.2, (3,1):1.6, (3,2):1.8, (3,3):2.2, (3,4):2.2}
+# Additional moment factor beta_a against le/b (Table 3.22)
+BETA_A_TABLE = {12:0.07, 15:0.11, 20:0.2, 25:0.31, 30:0.46, 35:0.61, 40:0.8, 45:1.01, 50:1.25, 55:1.51, 60:1.8}
+# Biaxial enhancement beta against N/(fcu bh) (Table 3.24)
+BIAXIAL_BETA_TABLE = {0:1.0, 0.1:0.88, 0.2:0.77, 0.3:0.65, 0.4:0.53, 0.5:0.42, 0.6:0.3}
+# Nominal cover to all reinforcement for fire resistance, columns (Table 3.4), by period in hours
+FIRE_COVER = {0.5:20, 1:20, 1.5:20, 2:25, 3:25, 4:25}
 
 class ColumnDesignBS8110:
     def __init__(self, b, h, fcu=30, fy=460, cover=40, tie_dia=8, max_agg=20, N=1480e3, Mx=0, My=0, inclination=0, braced=True, end_top=1, end_bottom=1, lo=4750, shape='rectangular', fire_res=1.5, bar_dia_pref=16):
@@ -17,14 +27,15 @@ class ColumnDesignBS8110:
         self.bar_dia_pref = bar_dia_pref
         
         # 2. Lookup tables (initialized early because used in methods)
-        self.beta_braced = {(1,1):0.75, (1,2):0.8, (1,3):0.9, (2,1):0.8, (2,2):0.85, (2,3):0.95, (3,1):0.9, (3,2):0.95, (3,3):1.0}
-        self.beta_unbraced = {(1,1):1.2, (1,2):1.3, (1,3):1.6, (1,4):2.2, (2,1):1.3, (2,2):1.5, (2,3):1.8, (2,4):2.2, (3,1):1.6, (3,2):1.8, (3,3):2.2, (3,4):2.2}
-        self.beta_a_table = {12:0.07, 15:0.11, 20:0.2, 25:0.31, 30:0.46, 35:0.61, 40:0.8, 45:1.01, 50:1.25, 55:1.51, 60:1.8}
-        self.beta_table = {0:1.0, 0.1:0.88, 0.2:0.77, 0.3:0.65, 0.4:0.53, 0.5:0.42, 0.6:0.3}
+        self.beta_braced = BETA_BRACED
+        self.beta_unbraced = BETA_UNBRACED
+        self.beta_a_table = BETA_A_TABLE
+        self.beta_table = BIAXIAL_BETA_TABLE
         self.bar_areas = {6:28.3, 8:50.3, 10:78.5, 12:113, 16:201, 20:314, 25:491, 32:804, 40:1257}
         self.bar_areas_multi = {dia: {n: n * area for n in range(1,11)} for dia, area in self.bar_areas.items()}
         self.anch_lap_table = {'25/30':(36,54), '28/35':(34,51), '30/37':(32,48), '32/40':(31,46)}
         self.fire_min_dim = {0.5:150, 1:200, 1.5:250, 2:300, 3:400, 4:450}  # fully exposed
+        self.fire_cover = FIRE_COVER
         self.dur_cover = {'xc1':30, 'xc3':35}  # internal/external
         
         # 3. Derived properties
@@ -52,6 +63,7 @@ class ColumnDesignBS8110:
         self.max_lap_rho = 0.08
         self.min_bars = 6 if shape=='circular' else 4
         self.min_bar_dia = 16 if max(self.b,self.h)>200 else 8
+        self.capacity_ok = True
         
         # 4. Calculations
         self.calc_le()
@@ -75,7 +87,7 @@ class ColumnDesignBS8110:
         return self.dur_cover['xc1']  # assume internal
 
     def get_fire_cover(self, period):
-        return self.fire_min_dim.get(period, 250)  # min dim, but for cover approx 25-55
+        return self.fire_cover.get(period, 25)
 
     def calc_le(self):
         key = tuple(sorted([self.end_top, self.end_bottom]))
@@ -124,43 +136,42 @@ class ColumnDesignBS8110:
     def check_plain(self):
         return self.N <= 0.45 * self.fcu * self.Ac + 0.1 * self.fcu * self.Ac  # approx no reinf
 
+    def _surface(self, depth, bar_dia):
+        """Cached normalised interaction surface for bending across `depth`"""
+        d_norm = (depth - self.cover - self.tie_dia - bar_dia / 2) / depth
+        dp_norm = (self.cover + self.tie_dia + bar_dia / 2) / depth
+        return interaction_surface(self.fcu, self.fy, d_norm, dp_norm)
+
+    def design_axis(self):
+        """
+        (M, width, depth) of the uniaxial design case. Biaxial bending is
+        reduced to an enhanced moment about the governing axis (Clause 3.8.4.5).
+        """
+        if self.is_biaxial:
+            N_norm = self.N / (self.fcu * self.Ac)
+            beta = np.interp(N_norm, list(self.beta_table.keys()), list(self.beta_table.values()))
+            if self.M_x / self.h >= self.M_y / self.b:
+                return self.M_x + beta * (self.h / self.b) * self.M_y, self.b, self.h
+            return self.M_y + beta * (self.b / self.h) * self.M_x, self.h, self.b
+        if self.M_x >= self.M_y:
+            return self.M_x, self.b, self.h
+        return self.M_y, self.h, self.b
+
     def calc_rho(self):
-        d = self.h - self.cover - self.tie_dia - 16 / 2  # assume dia
-        d_prime = self.cover + self.tie_dia + 16 / 2
+        """
+        Total steel ratio Asc/Ac from the tabulated interaction surface
+        (16 mm bars assumed for the effective depth). capacity_ok is cleared
+        when the section cannot carry (N, M) within the maximum ratio.
+        """
         if self.is_axial:
             return self.min_rho
-        elif self.is_uniaxial:
-            M = self.M_x if self.M_x > self.M_y else self.M_y
-            h_dim = self.h if self.M_x > self.M_y else self.b
-            def eq(rho):
-                self.Asc = rho * self.Ac
-                self.Asc_prime = self.Asc / 2
-                def find_x(x):
-                    eps_s_prime = self.epscu * (x - d_prime) / x
-                    eps_s = self.epscu * (d - x) / x
-                    fs_prime = np.clip(self.Es * eps_s_prime, -self.alpha_s * self.fy, self.alpha_s * self.fy)
-                    fs = np.clip(self.Es * eps_s, -self.alpha_s * self.fy, self.alpha_s * self.fy)
-                    Cc = self.alpha_c * self.fcu * self.b * 0.9 * x if x < h_dim else self.alpha_c * self.fcu * self.b * h_dim
-                    return Cc + fs_prime * self.Asc_prime - fs * self.Asc - self.N
-                x = fsolve(find_x, h_dim / 2)[0]
-                zc = h_dim / 2 - 0.45 * min(x, h_dim)
-                Mc = Cc * zc + fs_prime * self.Asc_prime * (h_dim / 2 - d_prime) + fs * self.Asc * (d - h_dim / 2)
-                return Mc - M
-            rho = fsolve(eq, 0.01)[0]
-            return min(self.max_rho, max(self.min_rho, rho))
-        elif self.is_biaxial:
-            N_norm = self.N / (self.fcu * self.Ac)
-            beta = np.interp(N_norm, list(self.beta_table.keys()), list(self.beta_table.values()))
-            if self.M_x / self.h > self.M_y / self.b:
-                Mx_prime = self.M_x + beta * (self.h / self.b) * self.M_y
-                My_prime = 0
-            else:
-                My_prime = self.M_y + beta * (self.b / self.h) * self.M_x
-                Mx_prime = 0
-            # Design as uniaxial with max(Mx_prime, My_prime)
-            M_eq = max(Mx_prime, My_prime)
-            # Call uniaxial calc with M_eq, h
-            return self.calc_rho()  # recursive, but adjust
+        M, width, depth = self.design_axis()
+        surface = self._surface(depth, 16)
+        rho_half = surface.required_steel(self.N / (width * depth), M / (width * depth**2))[0]
+        if np.isnan(rho_half) or 2 * rho_half > self.max_rho:
+            self.capacity_ok = False
+            return self.max_rho
+        return min(self.max_rho, max(self.min_rho, 2 * rho_half))
 
     def select_bars_links(self):
         # 1. Main Reinforcement
@@ -218,32 +229,9 @@ class ColumnDesignBS8110:
 
     def get_capacity(self, rho_half):
         """Calculates M capacity for current N and given steel ratio per face."""
-        def eq(M_val):
-            # Using find_x logic but for fixed rho
-            def find_x(x):
-                eps_sp = self.epscu * (x - (self.cover + self.tie_dia + self.bar_dia/2)) / x if x > 0 else 0
-                eps_s = self.epscu * ((self.h - self.cover - self.tie_dia - self.bar_dia/2) - x) / x if x > 0 else 0
-                fs_limit = self.alpha_s * self.fy
-                fsp = np.clip(self.Es * eps_sp, -fs_limit, fs_limit)
-                fs = np.clip(self.Es * eps_s, -fs_limit, fs_limit)
-                # Concrete force
-                depth_c = min(0.9 * x, self.h)
-                Cc = self.alpha_c * self.fcu * self.b * depth_c
-                # Equilibrium: N = Cc + Fs' - Fs
-                return Cc + (fsp - fs) * (rho_half * self.b * self.h) - self.N
-            x_sol = fsolve(find_x, self.h/2)[0]
-            depth_c = min(0.9 * x_sol, self.h)
-            Cc = self.alpha_c * self.fcu * self.b * depth_c
-            eps_sp = self.epscu * (x_sol - (self.cover + self.tie_dia + self.bar_dia/2)) / x_sol if x_sol > 0 else 0
-            eps_s = self.epscu * ((self.h - self.cover - self.tie_dia - self.bar_dia/2) - x_sol) / x_sol if x_sol > 0 else 0
-            fsp = np.clip(self.Es * eps_sp, -self.alpha_s * self.fy, self.alpha_s * self.fy)
-            fs = np.clip(self.Es * eps_s, -self.alpha_s * self.fy, self.alpha_s * self.fy)
-            zc = self.h/2 - depth_c/2
-            M_cap = (Cc * zc + 
-                     fsp * (rho_half * self.b * self.h) * (self.h/2 - (self.cover + self.tie_dia + self.bar_dia/2)) + 
-                     fs * (rho_half * self.b * self.h) * ((self.h - self.cover - self.tie_dia - self.bar_dia/2) - self.h/2))
-            return M_cap
-        return eq(0)
+        surface = self._surface(self.h, self.bar_dia)
+        m = surface.moment_capacity(self.N / (self.b * self.h), rho_half)
+        return float(np.nan_to_num(m, nan=0.0)) * self.b * self.h**2
 
     def get_interaction(self):
         """
@@ -253,52 +241,19 @@ class ColumnDesignBS8110:
         if self.is_axial:
             return []
             
-        curves = []
         # Target percentages for curves
         percentages = [0.4, 0.8, 1.0, 2.0, 3.0, 4.0]
         
-        # Symmetrical reinforcement assumptions
-        d_norm = (self.h - self.cover - self.tie_dia - self.bar_dia/2) / self.h
-        dp_norm = (self.cover + self.tie_dia + self.bar_dia/2) / self.h
-        
-        # Capture the whole curve from tension to compression
-        x_values = np.linspace(0.01, 10.0, 200)
+        # Whole curve from tension to compression for every percentage at once (N/bh, M/bh^2),
+        # symmetrical reinforcement
+        surface = self._surface(self.h, self.bar_dia)
+        N_all, M_all = surface.curves(percentages)
         
-        for p in percentages:
-            points = []
-            rho_half = (p / 2.0) / 100.0 # Ratio per face
-            
-            for x_norm in x_values:
-                # 1. Concrete (Simplified BS 8110 block)
-                if x_norm <= 1.1111: # 0.9 * x_norm <= 1.0
-                    a_norm = 0.9 * x_norm
-                    Cc_norm = self.alpha_c * self.fcu * a_norm
-                    x_bar_norm = a_norm / 2.0
-                else:
-                    Cc_norm = self.alpha_c * self.fcu * 1.0
-                    x_bar_norm = 0.5
-                
-                # 2. Steel Strains
-                eps_sp = self.epscu * (x_norm - dp_norm) / x_norm if x_norm > 0 else 0
-                eps_s = self.epscu * (d_norm - x_norm) / x_norm if x_norm > 0 else 0
-                
-                # 3. Steel Stresses (alpha_s = 0.87)
-                fs_limit = self.alpha_s * self.fy
-                fsp = np.clip(self.Es * eps_sp, -fs_limit, fs_limit)
-                fs = np.clip(self.Es * eps_s, -fs_limit, fs_limit)
-                
-                # 4. Normalized N and M (N/bh and M/bh^2)
-                N_norm = Cc_norm + fsp * rho_half - fs * rho_half
-                M_norm = (Cc_norm * (0.5 - x_bar_norm) + 
-                          fsp * rho_half * (0.5 - dp_norm) + 
-                          fs * rho_half * (d_norm - 0.5))
-                
-                if N_norm >= 0:
-                    points.append({
-                        'M': round(float(M_norm), 3),
-                        'N': round(float(N_norm), 3)
-                    })
-            
+        curves = []
+        for p, N_norm, M_norm in zip(percentages, N_all, M_all):
+            # Filter on the exact N, then round and order by the rounded N
+            keep = N_norm >= 0
+            points = [{'M': round(m, 3), 'N': round(n, 3)} for m, n in zip(M_norm[keep].tolist(), N_norm[keep].tolist())]
             curves.append({
                 'steelPercentage': p,
                 'points': sorted(points, key=lambda p: p['N'])
@@ -310,79 +265,124 @@ class ColumnDesignBS8110:
 
 router = APIRouter()
 
-@router.post("/design-column")
-async def calculate_column(data: dict):
-    try:
-        col = ColumnDesignBS8110(
-            b=data['b'], h=data['h'], fcu=data.get('fcu', 30), fy=data.get('fy', 460),
-            cover=data.get('cover', 40), tie_dia=data.get('tie_dia', 8),
-            max_agg=data.get('max_agg', 20), N=data['N'] * 1000,
-            Mx=data.get('Mx', 0) * 1e6 if data.get('mode') == 'biaxial' else data.get('M', 0) * 1e6,
-            My=data.get('My', 0) * 1e6, inclination=data.get('inclination', 0),
-            braced=data.get('braced', True), end_top=data.get('end_top', 1),
-            end_bottom=data.get('end_bottom', 1), lo=data.get('lo', 4750),
-            shape=data.get('shape', 'rectangular'), fire_res=data.get('fire_res', 1.5),
-            bar_dia_pref=data.get('bar_diameter', 16)
-        )
+def design_column(data: dict, include_chart: bool = True) -> dict:
+    """Design one column from the /design-column payload (kN, kNm, mm)"""
+    col = ColumnDesignBS8110(
+        b=data['b'], h=data['h'], fcu=data.get('fcu', 30), fy=data.get('fy', 460),
+        cover=data.get('cover', 40), tie_dia=data.get('tie_dia', 8),
+        max_agg=data.get('max_agg', 20), N=data['N'] * 1000,
+        Mx=data.get('Mx', 0) * 1e6 if data.get('mode') == 'biaxial' else data.get('M', 0) * 1e6,
+        My=data.get('My', 0) * 1e6, inclination=data.get('inclination', 0),
+        braced=data.get('braced', True), end_top=data.get('end_top', 1),
+        end_bottom=data.get('end_bottom', 1), lo=data.get('lo', 4750),
+        shape=data.get('shape', 'rectangular'), fire_res=data.get('fire_res', 1.5),
+        bar_dia_pref=data.get('bar_diameter', 16)
+    )
 
-        if data.get('mode') == 'axial':
-            col.is_axial = True
-            col.is_uniaxial = False
-            col.is_biaxial = False
-            col.M_x = col.N * 0.05 * col.h
-            col.M_y = col.N * 0.05 * col.b
-            col.rho = col.min_rho
-            col.Asc_req = col.rho * col.Ac
-            col.select_bars_links()
-            col.calc_laps_anch()
-        
-        def clean(val):
-            if isinstance(val, (int, float)):
-                if math.isnan(val) or math.isinf(val): return 0
-                return round(float(val), 2)
-            return val
+    if data.get('mode') == 'axial':
+        col.is_axial = True
+        col.is_uniaxial = False
+        col.is_biaxial = False
+        col.M_x = col.N * 0.05 * col.h
+        col.M_y = col.N * 0.05 * col.b
+        col.rho = col.min_rho
+        col.Asc_req = col.rho * col.Ac
+        col.select_bars_links()
+        col.calc_laps_anch()
+    
+    def clean(val):
+        if isinstance(val, (int, float)):
+            if math.isnan(val) or math.isinf(val): return 0
+            return round(float(val), 2)
+        return val
 
-        return {
-            "status": "success",
-            "classification": col.classification,
-            "is_inclined": col.is_inclined,
-            "mode": data.get('mode', 'uniaxial'),
-            "dimensions": {"b": col.b, "h": col.h},
-            "loads": {"N": clean(col.N / 1000), "Mx": clean(col.M_x / 1e6), "My": clean(col.M_y / 1e6)},
-            "slenderness": {
-                "le_x": clean(col.le_x), "le_y": clean(col.le_y),
-                "slend_x": clean(col.slend_x), "slend_y": clean(col.slend_y),
-                "is_slender": col.is_slender,
-                "Madd_x": clean(col.Madd_x / 1e6), "Madd_y": clean(col.Madd_y / 1e6)
-            },
-            "steel_area": clean(col.Asc_req),
-            "steel_percentage": clean(col.rho * 100),
-            "bar_selection": {
-                "num_bars": col.num_bars,
-                "bar_dia": col.bar_dia,
-                "total_area": clean(col.provided_area),
-                "links_dia": col.links_dia,
-                "links_spacing": col.links_spacing
-            },
-            "achorage": {
-                "anch_len": clean(col.anch_len),
-                "lap_len": clean(col.lap_len)
-            },
-            "chart_data": col.get_interaction(),
-            "design_point": {
-                "N": clean(col.N / (col.b * col.h)),
-                "M": clean(max(col.M_x, col.M_y) / (col.b * col.h**2)),
-                "Mx": clean(col.M_x / (col.b * col.h**2)),
-                "My": clean(col.M_y / (col.b * col.h**2))
-            },
-            "chart_point": {
-                "N": clean(col.N / (col.b * col.h)),
-                "M": clean(col.get_capacity(col.provided_area / (2 * col.b * col.h)) / (col.b * col.h**2)),
-                "Mux": clean(col.get_capacity(col.provided_area / (2 * col.b * col.h)) / (col.b * col.h**2)),
-                "Muy": clean(col.get_capacity(col.provided_area / (2 * col.b * col.h)) / (col.b * col.h**2))
-            }
+    capacity = col.get_capacity(col.provided_area / (2 * col.b * col.h)) / (col.b * col.h**2)
+    return {
+        "status": "success",
+        "classification": col.classification,
+        "is_inclined": col.is_inclined,
+        "mode": data.get('mode', 'uniaxial'),
+        "dimensions": {"b": col.b, "h": col.h},
+        "loads": {"N": clean(col.N / 1000), "Mx": clean(col.M_x / 1e6), "My": clean(col.M_y / 1e6)},
+        "slenderness": {
+            "le_x": clean(col.le_x), "le_y": clean(col.le_y),
+            "slend_x": clean(col.slend_x), "slend_y": clean(col.slend_y),
+            "is_slender": col.is_slender,
+            "Madd_x": clean(col.Madd_x / 1e6), "Madd_y": clean(col.Madd_y / 1e6)
+        },
+        "capacity_ok": col.capacity_ok,
+        "steel_area": clean(col.Asc_req),
+        "steel_percentage": clean(col.rho * 100),
+        "bar_selection": {
+            "num_bars": col.num_bars,
+            "bar_dia": col.bar_dia,
+            "total_area": clean(col.provided_area),
+            "links_dia": col.links_dia,
+            "links_spacing": col.links_spacing
+        },
+        "achorage": {
+            "anch_len": clean(col.anch_len),
+            "lap_len": clean(col.lap_len)
+        },
+        "chart_data": col.get_interaction() if include_chart else [],
+        "design_point": {
+            "N": clean(col.N / (col.b * col.h)),
+            "M": clean(max(col.M_x, col.M_y) / (col.b * col.h**2)),
+            "Mx": clean(col.M_x / (col.b * col.h**2)),
+            "My": clean(col.M_y / (col.b * col.h**2))
+        },
+        "chart_point": {
+            "N": clean(col.N / (col.b * col.h)),
+            "M": clean(capacity),
+            "Mux": clean(capacity),
+            "Muy": clean(capacity)
         }
+    }
+
+
+def design_columns(items: List[dict], include_chart: bool = False) -> List[dict]:
+    """
+    Design a list of columns (e.g. a whole floor) in one call. Columns of the
+    same section share one cached interaction surface and capacity table, so
+    each further column costs a table lookup. Failures are reported per item.
+    """
+    results = []
+    for index, data in enumerate(items):
+        try:
+            result = design_column(data, include_chart)
+        except Exception as e:
+            result = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+        result["index"] = index
+        result["id"] = data.get("id")
+        results.append(result)
+    return results
+
+@router.post("/design-column")
+async def calculate_column(data: dict):
+    try:
+        return design_column(data)
     except Exception as e:
         import traceback
         traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/design-columns")
+async def calculate_columns(data: dict):
+    """Batch design: {"columns": [design-column payloads], "include_chart": false}"""
+    columns = data.get("columns")
+    if not isinstance(columns, list):
+        raise HTTPException(status_code=400, detail="'columns' must be a list of column payloads")
+    results = design_columns(columns, data.get("include_chart", False))
+    failed = sum(r["status"] != "success" for r in results)
+    return {
+        "status": "success" if not failed else "partial",
+        "total": len(results),
+        "failed": failed,
+        "results": results,
+        "cache": INTERACTION_CACHE.stats(),
+    }
+
+@router.get("/interaction-cache")
+async def get_interaction_cache_stats():
+    """Hit/miss counters of the shared interaction surface cache"""
+    return INTERACTION_CACHE.stats()
\ No newline at end of file
@@ -0,0 +1,296 @@
+"""
+Column Schedule
+Designs every column-storey of an analysed frame for every load combination
+in one array pass, following ColumnDesignBS8110 (slenderness, additional
+moments, biaxial enhancement, tabulated interaction lookup and bar/link
+selection), and reports the governing combination of each column-storey.
+Columns are grouped into stacks (same plan position) and identical designs
+share a schedule mark.
+"""
+
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+
+from ..datasets import data_table_3_10
+from .Interactio import BETA_A_TABLE, BETA_BRACED, BETA_UNBRACED, BIAXIAL_BETA_TABLE, FIRE_COVER
+from .interaction_surface import ALPHA_C, ALPHA_S, INTERACTION_CACHE, interaction_surface
+
+router = APIRouter()
+
+# Plan positions are matched to this many decimals (m) when forming stacks
+STACK_DECIMALS = 3
+
+MAX_RHO = 0.04
+LINK_DIAMETERS = (6, 8, 10, 12)
+
+
+class ColumnScheduleRequest(BaseModel):
+    analyses: List[Dict[str, Any]] = Field(
+        ..., description="Frame analysis outputs (nodes, members with endForces), one per load combination"
+    )
+    cover: float = Field(40.0, description="Nominal cover (mm)")
+    tie_dia: float = Field(8.0, description="Link diameter (mm)")
+    bar_dia_pref: int = Field(16, description="Preferred main bar diameter (mm)")
+    fire_res: float = Field(1.5, description="Fire resistance period (hours)")
+    braced: bool = True
+    end_top: int = Field(1, ge=1, le=4)
+    end_bottom: int = Field(1, ge=1, le=4)
+
+
+def _bar_candidates(bar_dia_pref: int, min_bars: int = 4):
+    """(diameters, counts, areas) in ColumnDesignBS8110.select_bars_links search order"""
+    dias, counts, areas = [], [], []
+    for dia in [bar_dia_pref] + [d for d in (20, 25, 32, 40) if d > bar_dia_pref]:
+        for n, area in data_table_3_10.get(dia, []):
+            if n >= min_bars:
+                dias.append(dia)
+                counts.append(n)
+                areas.append(area)
+    return np.array(dias), np.array(counts), np.array(areas, dtype=float)
+
+
+def _collect_columns(analyses: List[Dict]) -> Dict[str, Any]:
+    """
+    Column members of the first analysis (vertical Y, as the frame viewer) and
+    their end forces in every analysis: arrays (n_col, n_combo), with Mx about
+    the major axis of the section.
+    """
+    frames = [a.get("analysis", a) for a in analyses]
+    base = frames[0]
+    nodes = {n["id"]: n for n in base["nodes"]}
+
+    ids, bottoms, props = [], [], []
+    for member in base["members"]:
+        start, end = nodes[member["startNode"]], nodes[member["endNode"]]
+        dx, dy, dz = (abs(end[k] - start[k]) for k in ("x", "y", "z"))
+        if dy <= max(dx, dz) * 2:
+            continue
+        low = start if start["y"] <= end["y"] else end
+        ids.append(member["id"])
+        bottoms.append((low["x"], low["y"], low["z"]))
+        section, material = member["section"], member.get("material", {})
+        props.append((
+            section["width"], section["depth"], material.get("fcu", 30), material.get("fy", 460),
+            member.get("length", dy),
+        ))
+
+    n_col, n_combo = len(ids), len(frames)
+    N = np.zeros((n_col, n_combo))
+    Mx = np.zeros((n_col, n_combo))
+    My = np.zeros((n_col, n_combo))
+    names = []
+    for c, frame in enumerate(frames):
+        names.append(frame.get("combination") or f"Combination {c + 1}")
+        forces = {m["id"]: m.get("endForces") for m in frame["members"]}
+        for i, member_id in enumerate(ids):
+            ends = forces.get(member_id)
+            if not ends:
+                raise ValueError(f"Member {member_id} has no end forces in '{names[-1]}'")
+            start, end = ends["start"], ends["end"]
+            N[i, c] = max(abs(start["N"]), abs(end["N"]))
+            Mx[i, c] = max(abs(start["Mz"]), abs(end["Mz"]))
+            My[i, c] = max(abs(start["My"]), abs(end["My"]))
+
+    props = np.array(props, dtype=float).reshape(n_col, 5)
+    # The frame's Mz bends across the depth (Iz = width * depth^3 / 12): it is
+    # the major-axis moment only when depth is the larger dimension
+    wide = props[:, 0] > props[:, 1]
+    Mx[wide], My[wide] = My[wide], Mx[wide].copy()
+    return {
+        "ids": ids,
+        "bottoms": np.array(bottoms, dtype=float).reshape(n_col, 3),
+        "width": props[:, 0], "depth": props[:, 1], "fcu": props[:, 2], "fy": props[:, 3],
+        "length": props[:, 4],
+        "combinations": names,
+        "N": N * 1e3, "Mx": Mx * 1e6, "My": My * 1e6,  # N, Nmm
+    }
+
+
+def _stacks(bottoms: np.ndarray):
+    """Stack index (plan position) and storey number (1 = lowest) of every column"""
+    plan = np.round(bottoms[:, [0, 2]], STACK_DECIMALS)
+    _, stack = np.unique(plan, axis=0, return_inverse=True)
+    stack = stack.ravel()
+    order = np.lexsort((bottoms[:, 1], stack))
+    storey = np.empty(len(stack), dtype=int)
+    first = np.r_[True, stack[order][1:] != stack[order][:-1]]
+    run_start = np.maximum.accumulate(np.where(first, np.arange(len(order)), 0))
+    storey[order] = np.arange(len(order)) - run_start + 1
+    return stack, storey
+
+
+def design_schedule(request: ColumnScheduleRequest) -> Dict[str, Any]:
+    start_time = time.perf_counter()
+    cols = _collect_columns(request.analyses)
+    n_col = len(cols["ids"])
+    if n_col == 0:
+        raise ValueError("No column members found in the analysis output")
+
+    # Section (b minor, h major) and member properties, (n_col, 1) for broadcasting
+    b = np.minimum(cols["width"], cols["depth"])[:, None]
+    h = np.maximum(cols["width"], cols["depth"])[:, None]
+    fcu, fy = cols["fcu"][:, None], cols["fy"][:, None]
+    Ac = b * h
+    cover = max(request.cover, 30, FIRE_COVER.get(request.fire_res, 25))
+    N, Mi_x, Mi_y = cols["N"], cols["Mx"], cols["My"]
+
+    # Effective length and slenderness (Clause 3.8.1)
+    key = tuple(sorted([request.end_top, request.end_bottom]))
+    beta = BETA_BRACED.get(key, 1.0) if request.braced else BETA_UNBRACED.get(key, 2.2)
+    lo = cols["length"][:, None] * 1000
+    le = beta * lo
+    limit = 15 if request.braced else 10
+    slender = (le / h >= limit) | (le / b >= limit)
+    too_slender = (lo > 60 * b).ravel()
+
+    # Additional moments of slender columns (Clause 3.8.3)
+    table_x, table_y = list(BETA_A_TABLE.keys()), list(BETA_A_TABLE.values())
+    Nuz = ALPHA_C * fcu * Ac + ALPHA_S * fy * MAX_RHO * Ac
+    Nbal = 0.25 * fcu * b * 0.9 * h
+    K = np.minimum(1, (Nuz - N) / (Nuz - Nbal))
+    Madd_x = np.where(slender, N * np.interp(le / h, table_x, table_y) * h * K, 0.0)
+    Madd_y = np.where(slender, N * np.interp(le / b, table_x, table_y) * b * K, 0.0)
+
+    def design_moment(Mi, Madd, dim):
+        M1, M2 = np.minimum(Mi, Mi + Madd), np.maximum(Mi, Mi + Madd)
+        return np.maximum.reduce([M2, N * 0.05 * dim, np.where(slender, M1 + 0.5 * Madd, Mi)])
+
+    M_x = design_moment(Mi_x, Madd_x, h)
+    M_y = design_moment(Mi_y, Madd_y, b)
+
+    # Biaxial bending as an enhanced uniaxial moment (Clause 3.8.4.5)
+    beta_bi = np.interp(N / (fcu * Ac), list(BIAXIAL_BETA_TABLE.keys()), list(BIAXIAL_BETA_TABLE.values()))
+    major = M_x / h >= M_y / b
+    M = np.where(major, M_x + beta_bi * (h / b) * M_y, M_y + beta_bi * (b / h) * M_x)
+    width = np.where(major, b, h)
+    depth = np.where(major, h, b)
+
+    # Steel ratio from the interaction tables, one lookup per distinct surface
+    min_rho = np.maximum(0.002, 0.1 * N / (fy * Ac)) / 100
+    plain = N <= 0.45 * fcu * Ac + 0.1 * fcu * Ac
+    axial = (M_x == 0) & (M_y == 0)
+    needs_design = ~(plain | axial)
+    rho_half = np.zeros_like(N)
+    d_norm = (depth - cover - request.tie_dia - 8) / depth
+    dp_norm = (cover + request.tie_dia + 8) / depth
+    keys = np.stack(np.broadcast_arrays(fcu, fy, d_norm, dp_norm), axis=-1)[needs_design]
+    if len(keys):
+        unique, group = np.unique(keys, axis=0, return_inverse=True)
+        n_norm = (N / (width * depth))[needs_design]
+        m_norm = (M / (width * depth**2))[needs_design]
+        solved = np.empty(len(keys))
+        for g, (g_fcu, g_fy, g_d, g_dp) in enumerate(unique):
+            rows = group.ravel() == g
+            solved[rows] = interaction_surface(g_fcu, g_fy, g_d, g_dp).required_steel(n_norm[rows], m_norm[rows])
+        rho_half[needs_design] = solved
+
+    adequate = ~np.isnan(rho_half) & (2 * rho_half <= MAX_RHO)
+    rho = np.where(needs_design, np.clip(np.nan_to_num(2 * rho_half, nan=MAX_RHO), min_rho, MAX_RHO), min_rho)
+    As_req = np.where(plain, 0.0, rho * Ac)
+
+    # Governing combination: most steel, then the largest axial load
+    rows = np.arange(n_col)
+    governing = np.argmax(As_req, axis=1)
+    level = As_req.max(axis=1) == As_req.min(axis=1)
+    governing[level] = np.argmax(N[level], axis=1)
+    pick = lambda a: np.broadcast_to(a, As_req.shape)[rows, governing]
+
+    # Bars: first candidate in select_bars_links order providing the area
+    dias, counts, areas = _bar_candidates(request.bar_dia_pref)
+    target = pick(As_req)
+    fits = areas[None, :] >= target[:, None]
+    choice = fits.argmax(axis=1)
+    found = fits[rows, choice]
+    bar_dia = np.where(found, dias[choice], request.bar_dia_pref)
+    num_bars = np.where(found, counts[choice], 0)
+    As_prov = np.where(found, areas[choice], 0.0)
+
+    links_min = np.maximum(np.where(bar_dia > 25, 8, 6), bar_dia / 4)
+    link_options = np.array(LINK_DIAMETERS)
+    links_dia = link_options[np.minimum(np.searchsorted(link_options, links_min), len(link_options) - 1)]
+    links_spacing = np.clip(np.floor(np.minimum(12 * bar_dia, b.ravel()) / 25) * 25, 75, 300).astype(int)
+
+    capacity_ok = pick(adequate | ~needs_design) & found & ~too_slender
+
+    # Stacks, storeys and marks (identical designs share a mark, numbered by first use)
+    stack, storey = _stacks(cols["bottoms"])
+    order = np.lexsort((storey, stack))
+    design_rows = np.column_stack([b.ravel(), h.ravel(), cols["fcu"], cols["fy"], num_bars, bar_dia, links_dia, links_spacing])
+    _, mark_id = np.unique(design_rows[order], axis=0, return_inverse=True)
+    mark_id = mark_id.ravel()
+    _, first_use = np.unique(mark_id, return_index=True)
+    renumber = np.empty(len(first_use), dtype=int)
+    renumber[np.argsort(first_use)] = np.arange(len(first_use))
+    mark = np.empty(n_col, dtype=int)
+    mark[order] = renumber[mark_id]
+
+    combination_names = np.array(cols["combinations"], dtype=object)
+    schedule = {
+        "member_id": [cols["ids"][i] for i in order],
+        "stack": (stack[order] + 1).tolist(),
+        "storey": storey[order].tolist(),
+        "level": np.round(cols["bottoms"][order, 1], 3).tolist(),
+        "mark": [f"C{m + 1}" for m in mark[order]],
+        "b": b.ravel()[order].tolist(),
+        "h": h.ravel()[order].tolist(),
+        "governing_combination": combination_names[governing[order]].tolist(),
+        "N": np.round(pick(N)[order] / 1e3, 2).tolist(),
+        "Mx": np.round(pick(M_x)[order] / 1e6, 2).tolist(),
+        "My": np.round(pick(M_y)[order] / 1e6, 2).tolist(),
+        "M_design": np.round(pick(M)[order] / 1e6, 2).tolist(),
+        "slender": pick(slender)[order].tolist(),
+        "steel_percentage": np.round(pick(rho)[order] * 100, 3).tolist(),
+        "As_req": np.round(target[order], 1).tolist(),
+        "num_bars": num_bars[order].tolist(),
+        "bar_dia": bar_dia[order].tolist(),
+        "As_prov": As_prov[order].tolist(),
+        "links_dia": links_dia[order].tolist(),
+        "links_spacing": links_spacing[order].tolist(),
+        "capacity_ok": capacity_ok[order].tolist(),
+    }
+
+    marks = []
+    for m in range(len(first_use)):
+        i = order[np.argmax(mark[order] == m)]
+        marks.append({
+            "mark": f"C{m + 1}",
+            "b": float(b[i, 0]), "h": float(h[i, 0]),
+            "bars": f"{num_bars[i]}T{bar_dia[i]}",
+            "links": f"R{links_dia[i]}@{links_spacing[i]}",
+            "count": int(np.count_nonzero(mark == m)),
+        })
+
+    governing_counts = np.bincount(governing, minlength=len(combination_names))
+    return {
+        "schedule": schedule,
+        "marks": marks,
+        "summary": {
+            "column_storeys": n_col,
+            "stacks": int(stack.max()) + 1,
+            "combinations": len(combination_names),
+            "governing_counts": dict(zip(cols["combinations"], governing_counts.tolist())),
+            "marks": len(marks),
+            "failed": int(np.count_nonzero(~capacity_ok)),
+            "cover": cover,
+            "elapsed": round(time.perf_counter() - start_time, 4),
+        },
+        "cache": INTERACTION_CACHE.stats(),
+    }
+
+
+@router.post("/column-schedule")
+async def column_schedule(request: ColumnScheduleRequest):
+    """
+    Column schedule from frame analysis output: every column-storey designed
+    for every combination, grouped by stack, with the governing combination.
+    """
+    if not request.analyses:
+        raise HTTPException(status_code=400, detail="At least one analysis result is required")
+    try:
+        return design_schedule(request)
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid analysis output: {e}")
@@ -0,0 +1,219 @@
+"""
+Column Interaction Surfaces
+Normalised BS 8110 M-N interaction data for symmetrically reinforced
+rectangular sections (N/bh against M/bh^2), evaluated for every neutral-axis
+depth at once. For a given neutral axis both N and M are linear in the steel
+ratio, so a surface stores the concrete and per-unit-steel parts and any set
+of steel percentages is one broadcast product. The surfaces depend only on
+(fcu, fy, d/h, d'/h) and are memoised, so a schedule of hundreds of columns
+of a few section types builds a handful of them. The same surfaces back the
+bracketed neutral-axis solve and the tabulated steel-ratio lookup used for
+column design.
+"""
+
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+from scipy.optimize import brentq
+
+from ..Beams.section_cache import SectionDesignCache
+
+# Material constants as used by ColumnDesignBS8110
+ES = 200e3
+EPS_CU = 0.0035
+ALPHA_C = 0.45
+ALPHA_S = 0.87
+
+# Neutral-axis depths x/h from deep tension to full compression
+X_GRID = np.linspace(0.01, 10.0, 200)
+
+# Neutral-axis bracket (x/h) and geometric bisection steps of the equilibrium solve
+X_MIN, X_MAX = 1e-4, 1e4
+BISECTION_STEPS = 64
+
+# Capacity table: face steel ratios up to 4% per face (8% total, the lap limit)
+# against axial loads from zero to squash
+RHO_HALF_GRID = np.linspace(0.0, 0.04, 161)
+N_TABLE_POINTS = 401
+INFEASIBLE = -1e30
+
+
+@dataclass(frozen=True)
+class InteractionSurface:
+    """
+    Normalised section response over the neutral-axis grid x (x/h).
+    N = concrete_N + rho_half * steel_N and M = concrete_M + rho_half * steel_M,
+    where rho_half is the steel ratio of each face (As / bh per face).
+    """
+    fcu: float
+    fy: float
+    d_norm: float
+    dp_norm: float
+    x: np.ndarray
+    concrete_N: np.ndarray
+    concrete_M: np.ndarray
+    steel_N: np.ndarray
+    steel_M: np.ndarray
+
+    def curves(self, percentages: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """(N, M) arrays of shape (n_percentages, n_x) for total steel percentages"""
+        rho_half = (np.asarray(percentages, dtype=float) / 2.0 / 100.0)[:, None]
+        # Evaluated term by term, in the same order as the per-point equilibrium,
+        # so the rounded curves match it exactly
+        fsp, fs = _steel_stresses(self.x, self.fy, self.d_norm, self.dp_norm)
+        return (self.concrete_N + fsp * rho_half - fs * rho_half,
+                self.concrete_M + fsp * rho_half * (0.5 - self.dp_norm) + fs * rho_half * (self.d_norm - 0.5))
+
+    def neutral_axis(self, n, rho_half) -> np.ndarray:
+        """
+        Neutral-axis depth x/h in equilibrium with the normalised axial load n
+        (N/bh) for face steel ratios rho_half, broadcast over both. N(x) is
+        monotonic, so a bracketed solve on [X_MIN, X_MAX] always converges:
+        Brent for a single point, a vectorized geometric bisection for arrays.
+        NaN where n lies outside the section's tension/squash range.
+        """
+        n, rho_half = np.broadcast_arrays(np.asarray(n, dtype=float), np.asarray(rho_half, dtype=float))
+        if n.size == 1:
+            return np.full(n.shape, self._neutral_axis_scalar(float(n.flat[0]), float(rho_half.flat[0])))
+        lo = np.full(n.shape, X_MIN)
+        hi = np.full(n.shape, X_MAX)
+        for _ in range(BISECTION_STEPS):
+            mid = np.sqrt(lo * hi)
+            concrete_N, _, steel_N, _ = _section_parts(mid, self.fcu, self.fy, self.d_norm, self.dp_norm)
+            below = concrete_N + rho_half * steel_N < n
+            lo = np.where(below, mid, lo)
+            hi = np.where(below, hi, mid)
+        x = np.sqrt(lo * hi)
+
+        n_min, n_max = (
+            c + rho_half * s for c, _, s, _ in (
+                _section_parts(np.float64(X_MIN), self.fcu, self.fy, self.d_norm, self.dp_norm),
+                _section_parts(np.float64(X_MAX), self.fcu, self.fy, self.d_norm, self.dp_norm),
+            )
+        )
+        return np.where((n >= n_min) & (n <= n_max), x, np.nan)
+
+    def _neutral_axis_scalar(self, n: float, rho_half: float) -> float:
+        fs_limit = ALPHA_S * self.fy
+        strain = ES * EPS_CU
+
+        def residual(x):
+            fsp = min(max(strain * (x - self.dp_norm) / x, -fs_limit), fs_limit)
+            fs = min(max(strain * (self.d_norm - x) / x, -fs_limit), fs_limit)
+            return ALPHA_C * self.fcu * min(0.9 * x, 1.0) + rho_half * (fsp - fs) - n
+
+        if residual(X_MIN) > 0 or residual(X_MAX) < 0:
+            return np.nan
+        return brentq(residual, X_MIN, X_MAX, xtol=1e-12, rtol=1e-12)
+
+    def moment_capacity(self, n, rho_half) -> np.ndarray:
+        """Normalised moment capacity M/bh^2 at axial load n (NaN beyond squash)"""
+        x = self.neutral_axis(n, rho_half)
+        concrete_N, concrete_M, steel_N, steel_M = _section_parts(
+            np.where(np.isnan(x), 1.0, x), self.fcu, self.fy, self.d_norm, self.dp_norm
+        )
+        return np.where(np.isnan(x), np.nan, concrete_M + np.asarray(rho_half) * steel_M)
+
+    def capacity_table(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Cached (n_grid, rho_half_grid, M capacity (n_n, n_rho)) over the design
+        range; infeasible entries (n above squash) are set to INFEASIBLE and
+        capacities are made non-decreasing in the steel ratio.
+        """
+        key = (self.fcu, self.fy, self.d_norm, self.dp_norm)
+        return INTERACTION_CACHE.get_or_compute("capacity_table", key, self._build_capacity_table)
+
+    def _build_capacity_table(self):
+        rho_half = RHO_HALF_GRID
+        n_squash = ALPHA_C * self.fcu + 2 * ALPHA_S * self.fy * rho_half[-1]
+        n_grid = np.linspace(0.0, n_squash, N_TABLE_POINTS)
+        table = self.moment_capacity(n_grid[:, None], rho_half[None, :])
+        table = np.maximum.accumulate(np.nan_to_num(table, nan=INFEASIBLE), axis=1)
+        for a in (n_grid, table):
+            a.setflags(write=False)
+        return n_grid, rho_half, table
+
+    def required_steel(self, n, m) -> np.ndarray:
+        """
+        Face steel ratio rho_half needed to resist (n, m), interpolated from the
+        capacity table: linear in n between table rows, then inverse-linear in
+        the steel ratio. NaN where even the largest tabulated ratio is too small.
+        """
+        n = np.atleast_1d(np.asarray(n, dtype=float))
+        m = np.atleast_1d(np.asarray(m, dtype=float))
+        n_grid, rho_half, table = self.capacity_table()
+
+        position = np.interp(n, n_grid, np.arange(len(n_grid)))
+        i0 = np.clip(np.floor(position).astype(int), 0, len(n_grid) - 2)
+        w = (position - i0)[:, None]
+        curve = (1 - w) * table[i0] + w * table[i0 + 1]
+        curve[(n > n_grid[-1]), :] = INFEASIBLE
+
+        enough = curve >= m[:, None]
+        k = enough.argmax(axis=1)
+        rows = np.arange(len(n))
+        found = enough[rows, k]
+
+        prev = np.maximum(k - 1, 0)
+        m_hi, m_lo = curve[rows, k], curve[rows, prev]
+        # Below the first feasible ratio the section is at squash, where the
+        # symmetric section's moment capacity is zero
+        squash_rho = np.clip((n - ALPHA_C * self.fcu) / (2 * ALPHA_S * self.fy), 0.0, None)
+        lo_feasible = m_lo > INFEASIBLE / 2
+        rho_lo = np.where(lo_feasible, rho_half[prev], np.maximum(squash_rho, rho_half[prev]))
+        m_lo = np.where(lo_feasible, m_lo, 0.0)
+        span = np.where(m_hi > m_lo, m_hi - m_lo, 1.0)
+        t = np.clip((m - m_lo) / span, 0.0, 1.0)
+        rho = np.where(k == 0, rho_half[0], rho_lo + t * (rho_half[k] - rho_lo))
+
+        # One secant correction against the exact capacity at the interpolated
+        # ratio, kept inside the table bracket
+        step = k > 0
+        if step.any():
+            exact = np.nan_to_num(self.moment_capacity(n[step], rho[step]), nan=0.0)
+            slope = span[step] / np.where(rho_half[k[step]] > rho_lo[step], rho_half[k[step]] - rho_lo[step], 1.0)
+            corrected = rho[step] + (m[step] - exact) / np.where(slope > 0, slope, np.inf)
+            rho[step] = np.clip(corrected, rho_lo[step], rho_half[k[step]])
+        return np.where(found, rho, np.nan)
+
+
+def _steel_stresses(x, fy: float, d_norm: float, dp_norm: float):
+    """Compression and tension face steel stresses at neutral-axis depths x (x/h)"""
+    fs_limit = ALPHA_S * fy
+    fsp = np.clip(ES * (EPS_CU * (x - dp_norm) / x), -fs_limit, fs_limit)
+    fs = np.clip(ES * (EPS_CU * (d_norm - x) / x), -fs_limit, fs_limit)
+    return fsp, fs
+
+
+def _section_parts(x, fcu: float, fy: float, d_norm: float, dp_norm: float):
+    """Concrete and per-unit-steel (N, M) contributions at neutral-axis depths x (x/h)"""
+    # Rectangular stress block 0.9x, capped at the full section depth
+    a = np.minimum(0.9 * x, 1.0)
+    concrete_N = ALPHA_C * fcu * a
+    concrete_M = concrete_N * (0.5 - a / 2.0)
+
+    fsp, fs = _steel_stresses(x, fy, d_norm, dp_norm)
+    steel_N = fsp - fs
+    steel_M = fsp * (0.5 - dp_norm) + fs * (d_norm - 0.5)
+    return concrete_N, concrete_M, steel_N, steel_M
+
+
+def _build_surface(fcu: float, fy: float, d_norm: float, dp_norm: float, x: np.ndarray) -> InteractionSurface:
+    parts = _section_parts(x, fcu, fy, d_norm, dp_norm)
+    for a in (x,) + parts:
+        a.setflags(write=False)
+    return InteractionSurface(fcu, fy, d_norm, dp_norm, x, *parts)
+
+
+def interaction_surface(fcu: float, fy: float, d_norm: float, dp_norm: float,
+                        x: np.ndarray = X_GRID) -> InteractionSurface:
+    """Cached surface for the exact section parameters; arrays are read-only"""
+    key = (float(fcu), float(fy), float(d_norm), float(dp_norm), len(x), float(x[0]), float(x[-1]))
+    return INTERACTION_CACHE.get_or_compute(
+        "surface", key, lambda: _build_surface(key[0], key[1], key[2], key[3], np.array(x, dtype=float))
+    )
+
+
+# Shared by every column designer in the process
+INTERACTION_CACHE = SectionDesignCache(max_entries=256)
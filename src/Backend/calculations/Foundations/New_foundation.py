@@ -10,6 +10,14 @@ from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 
 import math
+import time
+
+import numpy as np
+from scipy import sparse
+from scipy.spatial import cKDTree
+
+from ..Slabs.plate_fe import DOF_PER_NODE, PlateModel, mesh_polygon, wood_armer
+from ..tall_framed.sparse_linalg import SingularStiffnessError
 
 router = APIRouter()
 
@@ -85,6 +93,53 @@ class FoundationOutput(BaseModel):
     calculations: Dict
 
 
+class RaftColumn(BaseModel):
+    x: float = Field(..., description="Column centre from the raft corner (mm)")
+    y: float = Field(..., description="Column centre from the raft corner (mm)")
+    column_width: float = Field(default=450, gt=0, description="Size along x (mm)")
+    column_depth: float = Field(default=450, gt=0, description="Size along y (mm)")
+    dead_load: float = Field(..., ge=0, description="Characteristic permanent load (kN)")
+    live_load: float = Field(default=0, ge=0, description="Characteristic variable load (kN)")
+
+
+class RaftLoadCase(BaseModel):
+    name: str
+    dead_factor: float = Field(..., ge=0)
+    live_factor: float = Field(..., ge=0)
+    limit_state: str = Field(default="ULS", description="ULS or SLS")
+
+
+class FlexibleRaftInput(BaseModel):
+    # Raft geometry (mm)
+    foundation_length: float = Field(..., gt=0, description="Raft size along x (mm)")
+    foundation_width: float = Field(..., gt=0, description="Raft size along y (mm)")
+    foundation_depth: float = Field(..., gt=0, description="Raft thickness (mm)")
+    columns: List[RaftColumn] = Field(..., min_items=1)
+
+    # Subgrade
+    subgrade_modulus: float = Field(..., gt=0, description="Winkler modulus of subgrade reaction (kN/m³)")
+    subgrade_shear: float = Field(default=0, ge=0, description="Pasternak shear parameter (kN/m), 0 for Winkler")
+    soil_bearing: float = Field(..., gt=0, description="Allowable bearing capacity (kN/m²)")
+
+    # Material Properties
+    concrete_fck: float = Field(default=30, description="Concrete strength (MPa)")
+    steel_fyk: float = Field(default=500, description="Steel yield strength (MPa)")
+    cover: float = Field(default=50, description="Concrete cover (mm)")
+    density: float = Field(default=24, description="Concrete density (kN/m³)")
+    poisson: float = Field(default=0.2, ge=0, lt=0.5)
+
+    # Analysis
+    mesh_size: float = Field(default=500, gt=0, description="Target element size (mm)")
+    load_cases: List[RaftLoadCase] = Field(
+        default=[
+            RaftLoadCase(name="ULS", dead_factor=1.4, live_factor=1.6, limit_state="ULS"),
+            RaftLoadCase(name="SLS", dead_factor=1.0, live_factor=1.0, limit_state="SLS"),
+        ],
+        min_items=1,
+    )
+    include_fields: bool = Field(default=True, description="Return nodal settlement, pressure and moment fields")
+
+
 # ==================== DESIGN CLASSES ====================
 
 
@@ -942,6 +997,229 @@ class BSFoundationDesigner:
         )
 
 
+class FlexibleRaftDesigner(BSFoundationDesigner):
+    """
+    Flexible raft on an elastic subgrade - BS 8004:2015, BS EN 1992-1-1:2004
+
+    The raft is meshed with DKT plate elements on Winkler springs (with an
+    optional Pasternak shear layer), each column load is spread over its
+    footprint, and all load cases are solved with a single factorization.
+    """
+
+    def __init__(self, inputs: FlexibleRaftInput):
+        super().__init__(inputs)
+
+    def elastic_modulus(self):
+        """BS EN 1992-1-1: Table 3.1 - Ecm (kN/m²)"""
+        return 22 * ((self.inputs.concrete_fck + 8) / 10) ** 0.3 * 1e6
+
+    def column_footprints(self):
+        """Column centres and footprints clipped to the raft (m)"""
+        L = self.inputs.foundation_length / 1000
+        B = self.inputs.foundation_width / 1000
+        columns = np.array(
+            [(c.x, c.y, c.column_width, c.column_depth) for c in self.inputs.columns], dtype=float
+        ) / 1000
+        centres = columns[:, :2]
+        if ((centres < 0) | (centres > (L, B))).any():
+            raise ValueError("Column centres must lie within the raft")
+        lo = np.maximum(centres - columns[:, 2:] / 2, 0.0)
+        hi = np.minimum(centres + columns[:, 2:] / 2, (L, B))
+        return centres, lo, hi
+
+    def build_model(self, centres, lo, hi):
+        """Mesh the raft with nodes at every column centre and footprint corner"""
+        L = self.inputs.foundation_length / 1000
+        B = self.inputs.foundation_width / 1000
+        corners = np.concatenate([lo, hi, np.column_stack([lo[:, 0], hi[:, 1]]), np.column_stack([hi[:, 0], lo[:, 1]])])
+        nodes, triangles = mesh_polygon(
+            [(0, 0), (L, 0), (L, B), (0, B)], self.inputs.mesh_size / 1000,
+            fixed_points=np.concatenate([centres, corners]),
+        )
+        model = PlateModel(nodes, triangles, self.inputs.foundation_depth / 1000, self.elastic_modulus(), self.inputs.poisson)
+        model.add_subgrade(self.inputs.subgrade_modulus, self.inputs.subgrade_shear)
+        return model
+
+    def column_distribution(self, model, centres, lo, hi):
+        """Sparse (n_nodes, n_columns) matrix spreading each column load over its footprint nodes by tributary area"""
+        tol = 1e-6 * max(self.inputs.foundation_length, self.inputs.foundation_width) / 1000
+        nodes = model.nodes
+        rows, cols = [], []
+        candidates = cKDTree(nodes).query_ball_point((lo + hi) / 2, r=(hi - lo).max(axis=1) / 2 + tol, p=np.inf)
+        for i, near in enumerate(candidates):
+            near = np.asarray(near, dtype=int)
+            inside = near[((nodes[near] >= lo[i] - tol) & (nodes[near] <= hi[i] + tol)).all(axis=1)]
+            if len(inside) == 0:
+                inside = model.nearest_nodes(centres[i])
+            rows.append(inside)
+            cols.append(np.full(len(inside), i))
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        weights = model.node_areas[rows]
+        weights = weights / np.bincount(cols, weights=weights)[cols]
+        return sparse.csr_matrix((weights, (rows, cols)), shape=(len(nodes), len(centres)))
+
+    def flexural_steel(self, M, d):
+        """Required area (mm²/m) for a design moment M (kNm/m) - BS EN 1992-1-1, 9.2.1.1 / 9.3"""
+        mat = self.get_material_properties()
+        K = min(M * 1e6 / (1000 * d**2 * 1e6 * mat["fck"]), 0.167)
+        z = min(d * (0.5 + math.sqrt(0.25 - K / 1.134)), 0.95 * d)
+        As_req = M * 1e6 / (z * 1000 * mat["fyd"])  # mm²/m
+        d_mm = d * 1000
+        As_min = max(
+            0.26 * mat["fctm"] / mat["fyk"] * 1000 * d_mm,
+            0.0013 * 1000 * d_mm,
+        )
+        return max(As_req, As_min)
+
+    def design_flexible_raft(self):
+        """Flexible raft analysis and design - BS 8004:2015"""
+        cases = self.inputs.load_cases
+        if any(lc.limit_state not in ("ULS", "SLS") for lc in cases):
+            raise ValueError("Load case limit_state must be ULS or SLS")
+        timings = {}
+
+        start = time.perf_counter()
+        centres, lo, hi = self.column_footprints()
+        model = self.build_model(centres, lo, hi)
+        distribution = self.column_distribution(model, centres, lo, hi)
+        timings["mesh_and_assemble"] = time.perf_counter() - start
+
+        # Column loads (n_columns, 2) x factors (2, n_cases); self-weight carries the dead factor
+        factors = np.array([(lc.dead_factor, lc.live_factor) for lc in cases])
+        column_loads = np.array([(c.dead_load, c.live_load) for c in self.inputs.columns]) @ factors.T
+        self_weight = self.inputs.density * self.inputs.foundation_depth / 1000  # kN/m²
+        F = np.zeros((model.n_dof, len(cases)))
+        F[0::DOF_PER_NODE] = distribution @ column_loads + np.outer(model.node_areas * self_weight, factors[:, 0])
+
+        try:
+            U = model.solve(F)
+        except SingularStiffnessError as e:
+            raise ValueError(f"Raft analysis failed: {e}")
+        timings.update(model.timings)
+
+        start = time.perf_counter()
+        w = U[0::DOF_PER_NODE] * 1000  # mm, positive = settlement
+        pressure = model.subgrade_pressure(U)
+        Mx, My, Mxy = model.moments(U)
+        design = wood_armer(Mx, My, Mxy)
+        timings["post_process"] = time.perf_counter() - start
+
+        uls = np.array([lc.limit_state == "ULS" for lc in cases])
+        sls = ~uls
+        uls = uls if uls.any() else ~uls
+        sls = sls if sls.any() else ~sls
+
+        # Reinforcement for the ULS envelope of the Wood-Armer moments
+        d = (self.inputs.foundation_depth - self.inputs.cover - 16) / 1000  # Assuming H16 bars
+        reinforcement = {}
+        for face, key in (("bottom_x", "Mx_bottom"), ("bottom_y", "My_bottom"), ("top_x", "Mx_top"), ("top_y", "My_top")):
+            M = float(np.abs(design[key][:, uls]).max())
+            As_req = self.flexural_steel(M, d)
+            bar, spacing, As_prov = self.select_reinforcement(As_req, self.inputs.foundation_length)
+            reinforcement[face] = {
+                "moment": M, "As_req": As_req, "As_prov": As_prov, "bar": bar, "spacing": spacing,
+            }
+
+        p_max = float(pressure[:, sls].max())
+        p_min = float(pressure.min())
+
+        checks = [
+            DesignCheck(
+                description="Bearing Pressure (peak contact)",
+                value=f"{p_max:.2f} kN/m²",
+                limit=f"{self.inputs.soil_bearing:.2f} kN/m²",
+                status="PASS" if p_max <= self.inputs.soil_bearing else "FAIL",
+                ratio=p_max / self.inputs.soil_bearing,
+            ),
+        ]
+        for face, r in reinforcement.items():
+            checks.append(
+                DesignCheck(
+                    description=f"Flexural Reinforcement ({face.replace('_', ' ').title()})",
+                    value=f"{r['As_prov']:.0f} mm²/m",
+                    limit=f"{r['As_req']:.0f} mm²/m required",
+                    status="PASS" if r["As_prov"] >= r["As_req"] else "FAIL",
+                    ratio=r["As_req"] / r["As_prov"],
+                )
+            )
+
+        load_cases = []
+        for c, lc in enumerate(cases):
+            result = {
+                "name": lc.name,
+                "limit_state": lc.limit_state,
+                "total_load": float(F[0::DOF_PER_NODE, c].sum()),
+                "total_soil_reaction": float(pressure[:, c] @ model.node_areas),
+                "max_settlement": float(w[:, c].max()),
+                "min_settlement": float(w[:, c].min()),
+                "max_pressure": float(pressure[:, c].max()),
+                "min_pressure": float(pressure[:, c].min()),
+                "max_moments": {k: float(v[:, c].max()) for k, v in (("Mx", Mx), ("My", My), ("Mxy", Mxy))},
+                "min_moments": {k: float(v[:, c].min()) for k, v in (("Mx", Mx), ("My", My), ("Mxy", Mxy))},
+                "design_moments": {k: float(np.abs(v[:, c]).max()) for k, v in design.items()},
+            }
+            if self.inputs.include_fields:
+                result["fields"] = {
+                    "settlement": np.round(w[:, c], 4).tolist(),
+                    "contact_pressure": np.round(pressure[:, c], 3).tolist(),
+                    "Mx": np.round(Mx[:, c], 3).tolist(),
+                    "My": np.round(My[:, c], 3).tolist(),
+                    "Mxy": np.round(Mxy[:, c], 3).tolist(),
+                    **{k: np.round(v[:, c], 3).tolist() for k, v in design.items()},
+                }
+            load_cases.append(result)
+
+        sls_case = int(np.flatnonzero(sls)[0])
+        uls_case = int(np.flatnonzero(uls)[0])
+        governing = max(reinforcement.values(), key=lambda r: r["As_req"])
+        bx, by, tx, ty = (reinforcement[f] for f in ("bottom_x", "bottom_y", "top_x", "top_y"))
+
+        return FoundationOutput(
+            design_summary={
+                "status": "PASS" if all(c.status == "PASS" for c in checks) else "FAIL",
+                "utilization_ratio": max(c.ratio for c in checks),
+                "foundation_size": f"{self.inputs.foundation_length:.0f} x {self.inputs.foundation_width:.0f} x {self.inputs.foundation_depth:.0f}mm",
+                "type": "Flexible Raft Foundation",
+                "subgrade_model": "Pasternak" if self.inputs.subgrade_shear > 0 else "Winkler",
+                "uplift": p_min < 0,
+            },
+            load_analysis={
+                "total_vertical_load": load_cases[sls_case]["total_load"],
+                "design_load": load_cases[uls_case]["total_load"],
+                "bearing_pressure": p_max,
+                "allowable_pressure": self.inputs.soil_bearing,
+                "max_settlement": float(w[:, sls].max()),
+                "differential_settlement": float((w[:, sls].max(axis=0) - w[:, sls].min(axis=0)).max()),
+            },
+            reinforcement=ReinforcementDetails(
+                main_bars_x=f"H{bx['bar']}@{bx['spacing']} bottom, H{tx['bar']}@{tx['spacing']} top",
+                main_bars_y=f"H{by['bar']}@{by['spacing']} bottom, H{ty['bar']}@{ty['spacing']} top",
+                area=governing["As_prov"],
+                area_required=governing["As_req"],
+            ),
+            checks=checks,
+            bs_references=[
+                "BS EN 1992-1-1:2004 - Design of concrete structures",
+                "BS 8004:2015 - Code of practice for foundations",
+                "BS EN 1997-1:2004 - Geotechnical design",
+            ],
+            calculations={
+                "mesh": {
+                    "nodes": len(model.nodes),
+                    "elements": len(model.triangles),
+                    "dof": model.n_dof,
+                    "coordinates": np.round(model.nodes * 1000, 1).tolist() if self.inputs.include_fields else None,
+                    "triangles": model.triangles.tolist() if self.inputs.include_fields else None,
+                },
+                "load_cases": load_cases,
+                "reinforcement": reinforcement,
+                "effective_depth": d * 1000,
+                "solver": model._factor.method,
+                "timings": {k: round(v, 4) for k, v in timings.items()},
+            },
+        )
+
+
 # ==================== API ENDPOINTS ====================
 
 
@@ -1031,6 +1309,17 @@ def design_pile_cap(inputs: FoundationInput):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/design/flexible-raft", response_model=FoundationOutput)
+def design_flexible_raft(inputs: FlexibleRaftInput):
+    """Flexible raft on a Winkler / Pasternak subgrade - BS 8004:2015"""
+    try:
+        designer = FlexibleRaftDesigner(inputs)
+        result = designer.design_flexible_raft()
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.post("/design/raft-foundation", response_model=FoundationOutput)
 def design_raft_foundation(inputs: FoundationInput):
     """Design raft foundation - BS 8004:2015"""
@@ -40,7 +40,7 @@ def get_spacing(diameter, asv_s):
 ###########################################
 #######Spcing of Bars
 # Dataset stored as a list of dictionaries
-data = [
+bar_spacing_data = [
     {"Bar Diameter (mm)": d, "Spacing (mm)": s, "Area of Steel (mm²/m)": a}
     for d, row in {
         6: [566, 377, 283, 226, 189, 162, 142, 113, 94.3],
@@ -60,7 +60,7 @@ data = [
 def get_bar_spacing(required_area, bar_diameter):
     
     # Filter for matching bar diameter
-    matches = [row for row in data if row["Bar Diameter (mm)"] == bar_diameter]
+    matches = [row for row in bar_spacing_data if row["Bar Diameter (mm)"] == bar_diameter]
     if not matches:
         return f"Error: Bar diameter {bar_diameter} mm not found in dataset."
     # Filter for area ≥ required_area
@@ -313,6 +313,9 @@ coefficients = {
     }
 }
 
+# Table 3.14 data under its own name; the shear table above reuses these names
+moment_coefficients = coefficients
+
 # Populate the data dictionary
 for panel in panel_types:
     for moment in moment_types:
@@ -18,17 +18,75 @@ import math
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Import datasets for BS code tables
 from .datasets import (
     get_bar_spacing,
     get_number_of_bars,
     get_shear_coefficients,
-    get_bending_moment_coefficient
+    get_bending_moment_coefficient,
+    bar_spacing_data,
+    moment_coefficients,
+    ly_lx_values,
 )
 
 router = APIRouter()
 
 
+# ============= FLOOR DESIGN TABLES =============
+
+# Table 3.14 as one array: (panel case, moment type, ly/lx), NaN where a
+# moment does not arise (no continuous edge in that direction)
+TABLE_3_14_MOMENTS = (
+    "Negative moment at continuous edge, β_sx",
+    "Positive moment at mid-span, β_sx",
+    "Negative moment at continuous edge, β_sy",
+    "Positive moment at mid-span, β_sy",
+)
+TABLE_3_14_CASES = tuple(moment_coefficients)
+TABLE_3_14_RATIOS = np.array(ly_lx_values, dtype=float)
+TABLE_3_14 = np.array(
+    [[moment_coefficients[case][m] for m in TABLE_3_14_MOMENTS] for case in TABLE_3_14_CASES],
+    dtype=float,
+)
+
+# Table 3.14 case index by (discontinuous short edges, discontinuous long
+# edges). The dataset's last row, "Three edges discontinuous", carries the
+# four-edges-discontinuous coefficients.
+PANEL_CASE = np.array([
+    [TABLE_3_14_CASES.index(c) for c in row] for row in (
+        ("Interior panels", "One long edge discontinuous", "Two long edges discontinuous"),
+        ("One short edge discontinuous", "Two adjacent edges discontinuous",
+         "Three edges discontinuous - one short edge continuous"),
+        ("Two short edges discontinuous", "Three edges discontinuous - one long edge continuous",
+         "Three edges discontinuous"),
+    )
+])
+
+# Bar spacing table as arrays: (bar diameter, spacing) -> mm²/m
+BAR_DIAMETERS = np.array([10, 12, 16, 20, 25, 32])
+BAR_SPACINGS = np.array(sorted({row["Spacing (mm)"] for row in bar_spacing_data}))
+BAR_AREAS = np.array([
+    [next(row["Area of Steel (mm²/m)"] for row in bar_spacing_data
+          if row["Bar Diameter (mm)"] == dia and row["Spacing (mm)"] == sp) for sp in BAR_SPACINGS]
+    for dia in BAR_DIAMETERS
+])
+
+EDGE_SIDES = ("left", "right", "bottom", "top")
+
+# Panels with ly/lx > 2 span one way across their long edges. BS 8110
+# Table 3.12 coefficients (negative, positive) by number of discontinuous
+# long edges: interior span, end span, single simply supported span.
+ONE_WAY_LIMIT = 2.0
+ONE_WAY_CASES = (
+    "One-way interior span",
+    "One-way end span",
+    "One-way simply supported",
+)
+ONE_WAY_COEFFICIENTS = np.array([[0.063, 0.063], [0.086, 0.086], [np.nan, 0.125]])
+
+
 # ============= DATA MODELS =============
 
 class ExposureClass(str):
@@ -84,6 +142,34 @@ class SlabDesignRequest(BaseModel):
     dropDepth: Optional[float] = Field(default=0, description="Drop panel depth (mm)")
 
 
+class FloorDesignRequest(BaseModel):
+    """Slab floor on a rectangular grid of supporting beams/walls"""
+
+    xSpans: List[float] = Field(..., min_items=1, description="Bay widths along x (m)")
+    ySpans: List[float] = Field(..., min_items=1, description="Bay widths along y (m)")
+    voids: List[Tuple[int, int]] = Field(default=[], description="(column, row) bays with no slab")
+    discontinuousEdges: List[Tuple[int, int, str]] = Field(
+        default=[], description="Extra discontinuous edges as (column, row, left/right/bottom/top)"
+    )
+
+    fck: float = Field(default=30, description="Concrete strength (N/mm²)")
+    fy: float = Field(default=500, description="Steel yield strength (N/mm²)")
+    exposureClass: str = Field(default="XC1", description="XC1 (internal) or XC3 (external)")
+    maxAggregate: float = Field(default=20, description="Maximum aggregate size (mm)")
+    fireResistance: float = Field(default=1.0, description="Fire resistance duration (hours)")
+    surfaceFalls: float = Field(default=0, description="Surface falls/channels (mm)")
+    finishThickness: float = Field(default=0, description="Finish thickness (mm)")
+
+    deadLoad: float = Field(..., description="Dead load (kN/m²)")
+    liveLoad: float = Field(..., description="Live load (kN/m²)")
+
+    @validator("xSpans", "ySpans")
+    def positive_spans(cls, v):
+        if any(span <= 0 for span in v):
+            raise ValueError("Spans must be positive")
+        return v
+
+
 class DetailingResults(BaseModel):
     """Comprehensive detailing results"""
     
@@ -877,6 +963,114 @@ class EnhancedSlabDesigner:
             }
         )
     
+    def select_reinforcement_array(self, As_req: np.ndarray, min_dia: float = 10):
+        """
+        select_reinforcement for an array of required areas (mm²/m): the first
+        bar size whose smallest adequate area falls at an allowed spacing.
+        Returns (bar diameter, spacing, area provided) arrays, with the
+        H12 @ 200 fallback where no bar size works.
+        """
+        min_spacing, max_spacing = self.calculate_bar_spacing_limits(200)
+        bars = BAR_DIAMETERS >= min_dia
+        dias, areas = BAR_DIAMETERS[bars], BAR_AREAS[bars]
+
+        # Areas fall with spacing, so the smallest adequate area is at the
+        # widest adequate spacing
+        count = (areas[None, :, :] >= np.asarray(As_req, dtype=float)[:, None, None]).sum(axis=2)
+        spacing = BAR_SPACINGS[np.maximum(count - 1, 0)]
+        ok = (count > 0) & (spacing >= min_spacing) & (spacing <= max_spacing)
+
+        found = ok.any(axis=1)
+        k = ok.argmax(axis=1)
+        rows = np.arange(len(k))
+        area = areas[k, np.maximum(count[rows, k] - 1, 0)]
+        return (
+            np.where(found, dias[k], 12),
+            np.where(found, spacing[rows, k], 200),
+            np.where(found, area, 565.0),
+        )
+
+    def design_panels(self, lx_dim, ly_dim, discontinuous) -> Dict[str, np.ndarray]:
+        """
+        Design many floor panels in one array pass, as design_two_way_slab
+        but with each panel's own Table 3.14 case.
+
+        lx_dim, ly_dim: panel dimensions along x and y (m)
+        discontinuous: (n, 4) bool, edges left, right, bottom, top
+
+        Coefficients are linearly interpolated in ly/lx over the table range
+        1.0-2.0. Panels with ly/lx > 2 are designed one-way across the short
+        span (Table 3.12) with minimum steel along the long span. Bottom steel
+        resists the mid-span moments and top steel the negative moments at
+        continuous edges.
+        """
+        dx = np.asarray(lx_dim, dtype=float)
+        dy = np.asarray(ly_dim, dtype=float)
+        disc = np.asarray(discontinuous, dtype=bool).reshape(-1, 4)
+
+        lx = np.minimum(dx, dy)
+        ratio = np.maximum(dx, dy) / lx
+        # Short edges have length lx: bottom/top when the short span runs along x
+        x_short = dx <= dy
+        n_short = np.where(x_short, disc[:, 2].astype(int) + disc[:, 3], disc[:, 0].astype(int) + disc[:, 1])
+        n_long = disc.sum(axis=1) - n_short
+        case = PANEL_CASE[n_short, n_long]
+
+        position = np.interp(ratio, TABLE_3_14_RATIOS, np.arange(len(TABLE_3_14_RATIOS)))
+        i0 = np.clip(np.floor(position).astype(int), 0, len(TABLE_3_14_RATIOS) - 2)
+        t = (position - i0)[:, None]
+        coeffs = (1 - t) * TABLE_3_14[case, :, i0] + t * TABLE_3_14[case, :, i0 + 1]
+
+        one_way = ratio > ONE_WAY_LIMIT
+        one_way_coeffs = np.column_stack([
+            ONE_WAY_COEFFICIENTS[n_long], np.full(len(n_long), np.nan), np.zeros(len(n_long)),
+        ])
+        coeffs = np.where(one_way[:, None], one_way_coeffs, coeffs)
+
+        w = 1.4 * self.req.deadLoad + 1.6 * self.req.liveLoad
+        moments = coeffs * (w * lx**2)[:, None]  # kNm/m, NaN where not applicable
+        neg_x, pos_x, neg_y, pos_y = moments.T
+
+        nominal_cover, actual_cover = self.calculate_nominal_cover()
+        continuous = np.where(one_way, n_long < 2, n_short + n_long < 4)
+        basic_ratio = np.where(one_way, np.where(continuous, 26, 20), np.where(continuous, 28, 24))
+        d = np.maximum((lx * 1000) / basic_ratio, 125)
+
+        bar_dia_x = bar_dia_y = 12
+        h = np.ceil((d + actual_cover + bar_dia_x + bar_dia_y / 2) / 25) * 25
+        d_x = h - actual_cover - bar_dia_x / 2
+        d_y = h - actual_cover - bar_dia_x - bar_dia_y / 2
+
+        out = {
+            "lx": lx, "ly": lx * ratio, "ly_lx": ratio, "case": case, "one_way": one_way, "n_long": n_long,
+            "short_span_along_x": x_short, "totalDepth": h, "d_x": d_x, "d_y": d_y,
+            "nominalCover": np.full(len(lx), nominal_cover), "actualCover": np.full(len(lx), actual_cover),
+        }
+        for key, M, depth in (
+            ("bottom_x", pos_x, d_x), ("bottom_y", pos_y, d_y),
+            ("top_x", neg_x, d_x), ("top_y", neg_y, d_y),
+        ):
+            applies = ~np.isnan(M)
+            M = np.nan_to_num(M)
+            As_req = (M * 1e6) / (0.87 * self.req.fy * 0.95 * depth)
+            As_min = self.calculate_min_reinforcement(1000, depth)
+            As_prov = np.maximum(As_req, As_min)
+            dia, spacing, area = self.select_reinforcement_array(As_prov)
+            out.update({
+                f"M_{key}": M, f"As_req_{key}": As_req, f"As_{key}": As_prov,
+                f"bar_dia_{key}": np.where(applies, dia, 0), f"spacing_{key}": np.where(applies, spacing, 0),
+                f"area_{key}": np.where(applies, area, 0.0), f"applies_{key}": applies,
+            })
+
+        # check_deflection on the short span
+        basic_sd = np.where(continuous, 26, 20)
+        fs = (5 / 8) * self.req.fy * out["As_req_bottom_x"] / out["area_bottom_x"]
+        modification = np.minimum(0.55 + (477 - fs) / (120 * 0.9), 2.0)
+        out["allowable_span_depth"] = basic_sd * modification
+        out["actual_span_depth"] = lx * 1000 / d_x
+        out["deflection_ok"] = out["actual_span_depth"] <= out["allowable_span_depth"]
+        return out
+
     def design(self) -> DetailingResults:
         """Main design method with routing to specific slab types"""
         
@@ -893,6 +1087,98 @@ class EnhancedSlabDesigner:
             raise HTTPException(status_code=400, detail=f"Invalid slab type: {self.req.slabType}")
 
 
+# ============= FLOOR DESIGN =============
+
+def panel_grid(x_spans, y_spans, voids=(), discontinuous_edges=()):
+    """
+    Panels of a rectangular grid with their edge conditions. An edge is
+    continuous where a slab panel lies beyond it and discontinuous at the
+    floor perimeter, at voids, or where listed in discontinuous_edges.
+    Returns (column, row, dx, dy, discontinuous (n, 4)) in panel order.
+    """
+    n_cols, n_rows = len(x_spans), len(y_spans)
+    if min(min(x_spans), min(y_spans)) <= 0:
+        raise ValueError("Spans must be positive")
+    slab = np.ones((n_cols + 2, n_rows + 2), dtype=bool)
+    slab[[0, -1], :] = False
+    slab[:, [0, -1]] = False
+    for col, row in voids:
+        if not (0 <= col < n_cols and 0 <= row < n_rows):
+            raise ValueError(f"Void ({col}, {row}) is outside the grid")
+        slab[col + 1, row + 1] = False
+
+    cols, rows = np.nonzero(slab[1:-1, 1:-1])
+    c, r = cols + 1, rows + 1
+    disc = np.stack([~slab[c - 1, r], ~slab[c + 1, r], ~slab[c, r - 1], ~slab[c, r + 1]], axis=1)
+
+    index = {(int(cc), int(rr)): i for i, (cc, rr) in enumerate(zip(cols, rows))}
+    for col, row, side in discontinuous_edges:
+        if (col, row) not in index or side not in EDGE_SIDES:
+            raise ValueError(f"Invalid edge ({col}, {row}, {side})")
+        disc[index[col, row], EDGE_SIDES.index(side)] = True
+
+    return cols, rows, np.asarray(x_spans, dtype=float)[cols], np.asarray(y_spans, dtype=float)[rows], disc
+
+
+def design_floor(request: FloorDesignRequest) -> Dict:
+    """Design every panel of a floor and return a columnar panel schedule"""
+    cols, rows, dx, dy, disc = panel_grid(
+        request.xSpans, request.ySpans, request.voids, request.discontinuousEdges
+    )
+    if not len(cols):
+        raise ValueError("Floor has no slab panels")
+
+    panel_request = SlabDesignRequest(
+        slabType="two-way", support="continuous",
+        **{k: getattr(request, k) for k in (
+            "fck", "fy", "exposureClass", "maxAggregate", "fireResistance",
+            "surfaceFalls", "finishThickness", "deadLoad", "liveLoad",
+        )},
+    )
+    designer = EnhancedSlabDesigner(panel_request)
+    out = designer.design_panels(dx, dy, disc)
+
+    def bars(key):
+        return [
+            f"H{d} @ {s}mm c/c" if a else None
+            for d, s, a in zip(out[f"bar_dia_{key}"], out[f"spacing_{key}"], out[f"applies_{key}"])
+        ]
+
+    schedule = {
+        "panel": [f"P{c + 1}-{r + 1}" for c, r in zip(cols, rows)],
+        "column": cols.tolist(),
+        "row": rows.tolist(),
+        "lx": np.round(out["lx"], 3).tolist(),
+        "ly": np.round(out["ly"], 3).tolist(),
+        "ly_lx": np.round(out["ly_lx"], 3).tolist(),
+        "edgeCondition": [
+            ONE_WAY_CASES[n] if one_way else TABLE_3_14_CASES[k]
+            for k, n, one_way in zip(out["case"], out["n_long"], out["one_way"])
+        ],
+        "oneWay": out["one_way"].tolist(),
+        "discontinuousEdges": [[s for s, d in zip(EDGE_SIDES, row) if d] for row in disc],
+        "shortSpanAlongX": out["short_span_along_x"].tolist(),
+        "totalDepth": out["totalDepth"].tolist(),
+        "effectiveDepthX": out["d_x"].tolist(),
+        "effectiveDepthY": out["d_y"].tolist(),
+    }
+    for key, label in (("bottom_x", "BottomX"), ("bottom_y", "BottomY"), ("top_x", "TopX"), ("top_y", "TopY")):
+        schedule[f"moment{label}"] = np.round(out[f"M_{key}"], 2).tolist()
+        schedule[f"steelArea{label}"] = np.round(out[f"As_{key}"], 0).tolist()
+        schedule[f"reinforcement{label}"] = bars(key)
+    schedule["deflectionOk"] = out["deflection_ok"].tolist()
+
+    return {
+        "panels": len(cols),
+        "nominalCover": float(out["nominalCover"][0]),
+        "ultimateLoad": round(1.4 * request.deadLoad + 1.6 * request.liveLoad, 2),
+        "oneWayPanels": int(out["one_way"].sum()),
+        "maxTotalDepth": float(out["totalDepth"].max()),
+        "deflectionFailures": int((~out["deflection_ok"]).sum()),
+        "schedule": schedule,
+    }
+
+
 # ============= API ENDPOINTS =============
 
 @router.get("/")
@@ -929,6 +1215,17 @@ async def calculate_slab_design(request: SlabDesignRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/api/floor-design")
+async def calculate_floor_design(request: FloorDesignRequest):
+    """
+    Design all panels of a floor grid in one pass (BS 8110 Tables 3.12 and 3.14)
+    """
+    try:
+        return design_floor(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/api/exposure-classes")
 async def get_exposure_classes():
     """Get exposure class information"""
@@ -0,0 +1,493 @@
+"""
+Plate Finite Element Analysis
+Linear elastic analysis of slabs of any plan shape with DKT (discrete
+Kirchhoff triangle) elements: three nodes with (w, theta_x, theta_y) each.
+The outline (with openings) is meshed with a near-equilateral triangular
+lattice, element stiffness matrices are integrated for all elements at once
+with a 3-point rule, and the reduced system is assembled sparsely and
+factorized once for every load case. Moments (Mx, My, Mxy, sagging positive)
+are averaged to the nodes and converted to Wood-Armer design moments for
+bottom and top reinforcement.
+
+Units: coordinates m, thickness m, E kN/m², loads kN/m² and kN,
+deflections m, moments kNm/m.
+"""
+
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+from scipy.spatial import Delaunay, cKDTree
+
+from ..tall_framed.sparse_linalg import SingularStiffnessError, assemble_csr, factorize
+
+router = APIRouter()
+
+DOF_PER_NODE = 3  # w, theta_x, theta_y
+
+# 3-point rule in area coordinates, weights sum to 1/2 (reference triangle)
+GAUSS_POINTS = np.array([[1 / 6, 1 / 6], [2 / 3, 1 / 6], [1 / 6, 2 / 3]])
+GAUSS_WEIGHTS = np.array([1 / 6, 1 / 6, 1 / 6])
+
+# Lattice points closer than this fraction of the mesh size to the boundary
+# or to an inserted point are dropped to avoid slivers
+CLEARANCE = 0.45
+
+EDGE_CONDITIONS = ("free", "simple", "fixed")
+
+
+# ============= MESHING =============
+
+def _inside(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """Even-odd ray casting for many points against one polygon"""
+    x, y = points[:, 0:1], points[:, 1:2]
+    xi, yi = polygon[:, 0], polygon[:, 1]
+    xj, yj = np.roll(xi, -1), np.roll(yi, -1)
+    crosses = (yi > y) != (yj > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = (xj - xi) * (y - yi) / (yj - yi) + xi
+    return (crosses & (x < x_cross)).sum(axis=1) % 2 == 1
+
+
+def _segment_distance(points: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Distance (n_points, n_segments) from points to segments a-b"""
+    ab = b - a
+    ap = points[:, None, :] - a[None, :, :]
+    t = np.clip((ap * ab).sum(axis=2) / np.maximum((ab**2).sum(axis=1), 1e-300), 0.0, 1.0)
+    return np.linalg.norm(ap - t[..., None] * ab, axis=2)
+
+
+def _loop_edges(loop: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    return loop, np.roll(loop, -1, axis=0)
+
+
+def _divide_segment(p: np.ndarray, q: np.ndarray, size: float, endpoint: bool = False) -> np.ndarray:
+    n = max(int(np.ceil(np.linalg.norm(q - p) / size)), 1)
+    return p + (q - p) * (np.arange(n + endpoint) / n)[:, None]
+
+
+def mesh_polygon(outline, size: float, openings: Sequence = (), fixed_points: Sequence = (), lines: Sequence = ()):
+    """
+    Triangulate a polygon (with openings) at roughly the given element size.
+
+    Boundary edges and internal lines (x1, y1, x2, y2, e.g. walls) are
+    divided at spacing <= size, the interior is filled with an equilateral
+    lattice, fixed_points (columns, point loads) become nodes, and Delaunay
+    triangles whose centroid lies outside the slab are dropped. Returns
+    (nodes (n, 2), triangles (n_el, 3), counter-clockwise).
+    """
+    outline = np.asarray(outline, dtype=float)
+    loops = [outline] + [np.asarray(o, dtype=float) for o in openings]
+    if len(outline) < 3 or size <= 0:
+        raise ValueError("Outline needs at least 3 vertices and a positive mesh size")
+
+    boundary = []
+    for loop in loops:
+        a, b = _loop_edges(loop)
+        for p, q in zip(a, b):
+            boundary.append(_divide_segment(p, q, size))
+    lines = np.asarray(lines, dtype=float).reshape(-1, 4)
+    for x1, y1, x2, y2 in lines:
+        boundary.append(_divide_segment(np.array([x1, y1]), np.array([x2, y2]), size, endpoint=True))
+    boundary = np.concatenate(boundary)
+    fixed = np.asarray(fixed_points, dtype=float).reshape(-1, 2)
+
+    lo, hi = outline.min(axis=0), outline.max(axis=0)
+    dy = size * np.sqrt(3) / 2
+    ys = np.arange(lo[1] + dy / 2, hi[1], dy)
+    xs = np.arange(lo[0], hi[0] + size, size)
+    gx = xs[None, :] + (np.arange(len(ys)) % 2)[:, None] * size / 2
+    lattice = np.column_stack([gx.ravel(), np.repeat(ys, len(xs))])
+
+    keep = _inside(lattice, outline)
+    for opening in loops[1:]:
+        keep &= ~_inside(lattice, opening)
+    lattice = lattice[keep]
+    edges_a = np.concatenate([_loop_edges(l)[0] for l in loops] + [lines[:, :2]])
+    edges_b = np.concatenate([_loop_edges(l)[1] for l in loops] + [lines[:, 2:]])
+    far = np.ones(len(lattice), dtype=bool)
+    for chunk in range(0, len(lattice), 4096):
+        block = lattice[chunk:chunk + 4096]
+        far[chunk:chunk + 4096] = _segment_distance(block, edges_a, edges_b).min(axis=1) > CLEARANCE * size
+    lattice = lattice[far]
+    if len(fixed):
+        near, _ = cKDTree(fixed).query(lattice)
+        lattice = lattice[near > CLEARANCE * size]
+
+    nodes = np.concatenate([boundary, fixed, lattice])
+    # Merge duplicates (fixed points on the boundary, repeated vertices)
+    _, first = np.unique(np.round(nodes / (1e-6 * size)).astype(np.int64), axis=0, return_index=True)
+    nodes = nodes[np.sort(first)]
+
+    triangles = Delaunay(nodes).simplices
+    centroid = nodes[triangles].mean(axis=1)
+    keep = _inside(centroid, outline)
+    for opening in loops[1:]:
+        keep &= ~_inside(centroid, opening)
+    triangles = triangles[keep]
+
+    p = nodes[triangles]
+    area2 = (p[:, 1, 0] - p[:, 0, 0]) * (p[:, 2, 1] - p[:, 0, 1]) - (p[:, 2, 0] - p[:, 0, 0]) * (p[:, 1, 1] - p[:, 0, 1])
+    triangles = triangles[np.abs(area2) > 1e-10 * size**2]
+    area2 = area2[np.abs(area2) > 1e-10 * size**2]
+    triangles[area2 < 0] = triangles[area2 < 0][:, [0, 2, 1]]
+
+    # Drop nodes not used by any triangle and renumber
+    used = np.unique(triangles)
+    renumber = np.full(len(nodes), -1)
+    renumber[used] = np.arange(len(used))
+    return nodes[used], renumber[triangles]
+
+
+# ============= DKT ELEMENT =============
+
+def _edge_terms(xy: np.ndarray):
+    """Batoz P, q, t, r edge terms for edges 4 (2-3), 5 (3-1) and 6 (1-2)"""
+    i, j = np.array([1, 2, 0]), np.array([2, 0, 1])
+    x_ij = xy[:, i, 0] - xy[:, j, 0]
+    y_ij = xy[:, i, 1] - xy[:, j, 1]
+    l2 = x_ij**2 + y_ij**2
+    P = -6 * x_ij / l2
+    q = 3 * x_ij * y_ij / l2
+    t = -6 * y_ij / l2
+    r = 3 * y_ij**2 / l2
+    return P, q, t, r
+
+
+def dkt_curvature_matrix(xy: np.ndarray, xi: float, eta: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Curvature-displacement matrices B (n_el, 3, 9) at area coordinates
+    (xi, eta) for triangles xy (n_el, 3, 2), and twice the element areas.
+    Element DOFs are (w, theta_x, theta_y) at nodes 1, 2, 3.
+    """
+    P, q, t, r = _edge_terms(xy)
+    P4, P5, P6 = P.T
+    q4, q5, q6 = q.T
+    t4, t5, t6 = t.T
+    r4, r5, r6 = r.T
+    a, b = 1 - 2 * xi, 1 - 2 * eta
+    z = np.zeros_like(P4)
+
+    Hx_xi = [P6 * a + (P5 - P6) * eta, q6 * a - (q5 + q6) * eta, -4 + 6 * (xi + eta) + r6 * a - eta * (r5 + r6),
+             -P6 * a + eta * (P4 + P6), q6 * a - eta * (q6 - q4), -2 + 6 * xi + r6 * a + eta * (r4 - r6),
+             -eta * (P5 + P4), eta * (q4 - q5), -eta * (r5 - r4)]
+    Hy_xi = [t6 * a + eta * (t5 - t6), 1 + r6 * a - eta * (r5 + r6), -q6 * a + eta * (q5 + q6),
+             -t6 * a + eta * (t4 + t6), -1 + r6 * a + eta * (r4 - r6), -q6 * a - eta * (q4 - q6),
+             -eta * (t4 + t5), eta * (r4 - r5), -eta * (q4 - q5)]
+    Hx_eta = [-P5 * b - xi * (P6 - P5), q5 * b - xi * (q5 + q6), -4 + 6 * (xi + eta) + r5 * b - xi * (r5 + r6),
+              xi * (P4 + P6), xi * (q4 - q6), -xi * (r6 - r4),
+              P5 * b - xi * (P4 + P5), q5 * b + xi * (q4 - q5), -2 + 6 * eta + r5 * b + xi * (r4 - r5)]
+    Hy_eta = [-t5 * b - xi * (t6 - t5), 1 + r5 * b - xi * (r5 + r6), -q5 * b + xi * (q5 + q6),
+              xi * (t4 + t6), xi * (r4 - r6), -xi * (q4 - q6),
+              t5 * b - xi * (t4 + t5), -1 + r5 * b + xi * (r4 - r5), -q5 * b - xi * (q4 - q5)]
+    Hx_xi, Hy_xi, Hx_eta, Hy_eta = (np.stack([h + z for h in H], axis=1) for H in (Hx_xi, Hy_xi, Hx_eta, Hy_eta))
+
+    x31 = xy[:, 2, 0] - xy[:, 0, 0]
+    y31 = xy[:, 2, 1] - xy[:, 0, 1]
+    x12 = xy[:, 0, 0] - xy[:, 1, 0]
+    y12 = xy[:, 0, 1] - xy[:, 1, 1]
+    area2 = x31 * y12 - x12 * y31
+
+    B = np.stack([
+        y31[:, None] * Hx_xi + y12[:, None] * Hx_eta,
+        -x31[:, None] * Hy_xi - x12[:, None] * Hy_eta,
+        -x31[:, None] * Hx_xi - x12[:, None] * Hx_eta + y31[:, None] * Hy_xi + y12[:, None] * Hy_eta,
+    ], axis=1) / area2[:, None, None]
+    return B, area2
+
+
+def plate_rigidity(thickness: float, E: float, nu: float) -> np.ndarray:
+    """Bending rigidity matrix D (kNm) of an isotropic plate"""
+    D = E * thickness**3 / (12 * (1 - nu**2))
+    return D * np.array([[1, nu, 0], [nu, 1, 0], [0, 0, (1 - nu) / 2]])
+
+
+def dkt_stiffness(xy: np.ndarray, D: np.ndarray) -> np.ndarray:
+    """Element stiffness matrices (n_el, 9, 9) by 3-point integration"""
+    K = np.zeros((len(xy), 9, 9))
+    for (xi, eta), w in zip(GAUSS_POINTS, GAUSS_WEIGHTS):
+        B, area2 = dkt_curvature_matrix(xy, xi, eta)
+        K += (w * area2)[:, None, None] * (B.transpose(0, 2, 1) @ (D @ B))
+    return K
+
+
+# ============= MODEL =============
+
+def wood_armer(Mx, My, Mxy) -> Dict[str, np.ndarray]:
+    """
+    Wood-Armer design moments: bottom (sagging, >= 0) and top (hogging,
+    <= 0) reinforcement moments in x and y
+    """
+    Mx, My, Mxy = (np.asarray(a, dtype=float) for a in (Mx, My, Mxy))
+    T = np.abs(Mxy)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bx, by = Mx + T, My + T
+        bx, by = (np.where(bx < 0, 0.0, bx), np.where(bx < 0, My + np.nan_to_num(T**2 / np.abs(Mx)), by))
+        bx, by = (np.where(by < 0, Mx + np.nan_to_num(T**2 / np.abs(My)), bx), np.where(by < 0, 0.0, by))
+
+        tx, ty = Mx - T, My - T
+        tx, ty = (np.where(tx > 0, 0.0, tx), np.where(tx > 0, My - np.nan_to_num(T**2 / np.abs(Mx)), ty))
+        tx, ty = (np.where(ty > 0, Mx - np.nan_to_num(T**2 / np.abs(My)), tx), np.where(ty > 0, 0.0, ty))
+    return {
+        "Mx_bottom": np.maximum(bx, 0.0), "My_bottom": np.maximum(by, 0.0),
+        "Mx_top": np.minimum(tx, 0.0), "My_top": np.minimum(ty, 0.0),
+    }
+
+
+class PlateModel:
+    """
+    Assembled DKT plate: nodes (n, 2), triangles (n_el, 3). Supports and
+    elastic foundations are added before solve(); the reduced stiffness is
+    factorized on the first solve and reused for later load vectors.
+    """
+
+    def __init__(self, nodes: np.ndarray, triangles: np.ndarray, thickness: float, E: float, nu: float = 0.2):
+        self.nodes = np.asarray(nodes, dtype=float)
+        self.triangles = np.asarray(triangles, dtype=int)
+        self.n_dof = DOF_PER_NODE * len(self.nodes)
+        self.D = plate_rigidity(thickness, E, nu)
+
+        self.xy = self.nodes[self.triangles]
+        self.element_dofs = (DOF_PER_NODE * self.triangles[:, :, None] + np.arange(DOF_PER_NODE)).reshape(-1, 9)
+        _, area2 = dkt_curvature_matrix(self.xy, 1 / 3, 1 / 3)
+        self.areas = area2 / 2
+        # Tributary area of every node (a third of each adjacent element)
+        self.node_areas = np.bincount(self.triangles.ravel(), weights=np.repeat(self.areas / 3, 3),
+                                      minlength=len(self.nodes))
+
+        self.K = assemble_csr(dkt_stiffness(self.xy, self.D), self.element_dofs, self.n_dof)
+        self.fixed = np.zeros(self.n_dof, dtype=bool)
+        self.K_subgrade = sp.csr_matrix((self.n_dof, self.n_dof))
+        self._factor = None
+        self._tree = None
+        self.timings: Dict[str, float] = {}
+
+    # ---- boundary conditions and foundations ----
+
+    def fix(self, nodes, components=(0,)):
+        """Restrain DOF components (0 = w, 1 = theta_x, 2 = theta_y) at nodes"""
+        nodes = np.asarray(nodes, dtype=int)
+        for c in components:
+            self.fixed[DOF_PER_NODE * nodes + c] = True
+        self._factor = None
+
+    def add_stiffness(self, K_extra):
+        self.K = (self.K + sp.csr_matrix(K_extra)).tocsr()
+        self._factor = None
+
+    def add_subgrade(self, modulus: float, shear: float = 0.0):
+        """
+        Elastic foundation under the whole plate: Winkler springs of modulus
+        k (kN/m³) lumped to the nodes, plus an optional Pasternak shear layer
+        G (kN/m) coupling the deflections of neighbouring nodes.
+        """
+        w_dofs = DOF_PER_NODE * np.arange(len(self.nodes))
+        K_soil = sp.coo_matrix((modulus * self.node_areas, (w_dofs, w_dofs)), shape=(self.n_dof, self.n_dof))
+        if shear > 0:
+            # Linear shape function gradients: G/(4A) (b_i b_j + c_i c_j)
+            x, y = self.xy[:, :, 0], self.xy[:, :, 1]
+            b = np.roll(y, -1, axis=1) - np.roll(y, -2, axis=1)
+            c = np.roll(x, -2, axis=1) - np.roll(x, -1, axis=1)
+            ke = shear * (b[:, :, None] * b[:, None, :] + c[:, :, None] * c[:, None, :]) / (4 * self.areas)[:, None, None]
+            K_soil = K_soil + assemble_csr(ke, DOF_PER_NODE * self.triangles, self.n_dof)
+        self.K_subgrade = (self.K_subgrade + K_soil).tocsr()
+        self.add_stiffness(K_soil)
+
+    def nodes_on_segment(self, a, b, tol: Optional[float] = None) -> np.ndarray:
+        a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+        tol = tol if tol is not None else 1e-6 * max(np.ptp(self.nodes, axis=0).max(), 1.0)
+        return np.flatnonzero(_segment_distance(self.nodes, a[None], b[None])[:, 0] <= tol)
+
+    def nearest_nodes(self, points) -> np.ndarray:
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        if self._tree is None:
+            self._tree = cKDTree(self.nodes)
+        return self._tree.query(points)[1]
+
+    # ---- loads ----
+
+    def pressure_vector(self, pressure) -> np.ndarray:
+        """Lumped nodal forces (n_dof,) for a uniform or per-element pressure (kN/m², downward)"""
+        per_element = np.broadcast_to(np.asarray(pressure, dtype=float), (len(self.triangles),))
+        F = np.zeros(self.n_dof)
+        np.add.at(F, DOF_PER_NODE * self.triangles.ravel(), np.repeat(per_element * self.areas / 3, 3))
+        return F
+
+    def point_load_vector(self, loads) -> np.ndarray:
+        """Forces (x, y, P kN downward) applied at their nearest nodes"""
+        F = np.zeros(self.n_dof)
+        loads = np.asarray(loads, dtype=float).reshape(-1, 3)
+        if len(loads):
+            np.add.at(F, DOF_PER_NODE * self.nearest_nodes(loads[:, :2]), loads[:, 2])
+        return F
+
+    # ---- solution ----
+
+    def solve(self, F: np.ndarray) -> np.ndarray:
+        """Displacements (n_dof, m) for load vectors F (n_dof,) or (n_dof, m)"""
+        F = np.asarray(F, dtype=float)
+        single = F.ndim == 1
+        F = F.reshape(self.n_dof, -1)
+        free = np.flatnonzero(~self.fixed)
+        if self._factor is None:
+            start = time.perf_counter()
+            K_ff = self.K[free][:, free]
+            self._factor = factorize(K_ff)
+            self.timings["factorize"] = time.perf_counter() - start
+        start = time.perf_counter()
+        U = np.zeros_like(F)
+        U[free] = self._factor.solve(F[free]).reshape(len(free), -1)
+        self.timings["solve"] = time.perf_counter() - start
+        return U[:, 0] if single else U
+
+    def reactions(self, U: np.ndarray, F: np.ndarray) -> np.ndarray:
+        """Support reactions at restrained DOFs, positive upward (zero elsewhere)"""
+        R = F - self.K @ U
+        R[~self.fixed] = 0.0
+        return R
+
+    def subgrade_pressure(self, U: np.ndarray) -> np.ndarray:
+        """Contact pressure of the elastic foundation at the nodes (n, m), kN/m² upward"""
+        U2 = U.reshape(self.n_dof, -1)
+        return (self.K_subgrade @ U2)[0::DOF_PER_NODE] / self.node_areas[:, None]
+
+    def moments(self, U: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Nodal (Mx, My, Mxy), sagging positive, each (n_nodes,) or (n_nodes, m):
+        element corner values averaged with tributary-area weights.
+        """
+        U = np.asarray(U, dtype=float)
+        U2 = U.reshape(self.n_dof, -1)
+        u_el = U2[self.element_dofs]  # (n_el, 9, m)
+        n_el, n_nodes = len(self.triangles), len(self.nodes)
+        totals = np.zeros((3, n_nodes, U2.shape[1]))
+        for corner, (xi, eta) in enumerate(((0.0, 0.0), (1.0, 0.0), (0.0, 1.0))):
+            B, _ = dkt_curvature_matrix(self.xy, xi, eta)
+            M = np.einsum("kl,eli,eic->kec", self.D, B, u_el)  # (3, n_el, m)
+            # Area-weighted scatter of the corner values onto their nodes
+            scatter = sp.csr_matrix((self.areas, (self.triangles[:, corner], np.arange(n_el))), shape=(n_nodes, n_el))
+            for k in range(3):
+                totals[k] += scatter @ M[k]
+        weights = np.bincount(self.triangles.ravel(), weights=np.repeat(self.areas, 3), minlength=n_nodes)
+        totals /= weights[None, :, None]
+        if U.ndim == 1:
+            totals = totals[..., 0]
+        return totals[0], totals[1], totals[2]
+
+
+# ============= SLAB ANALYSIS =============
+
+class PlateLoadCase(BaseModel):
+    name: str = "LC1"
+    pressure: float = Field(default=0.0, description="Uniform load over the slab (kN/m², downward)")
+    pointLoads: List[Tuple[float, float, float]] = Field(default=[], description="(x, y, P kN)")
+
+
+class PlateAnalysisRequest(BaseModel):
+    outline: List[Tuple[float, float]] = Field(..., min_items=3, description="Slab outline vertices (m)")
+    openings: List[List[Tuple[float, float]]] = Field(default=[], description="Opening outlines (m)")
+    edgeSupports: Optional[List[str]] = Field(
+        default=None, description="free, simple or fixed per outline edge (default simple)"
+    )
+    columns: List[Tuple[float, float]] = Field(default=[], description="Point supports (m)")
+    walls: List[Tuple[float, float, float, float]] = Field(default=[], description="Line supports x1, y1, x2, y2 (m)")
+    thickness: float = Field(..., gt=0, description="Slab thickness (mm)")
+    E: float = Field(default=30.0, gt=0, description="Elastic modulus (kN/mm²)")
+    poisson: float = Field(default=0.2, ge=0, lt=0.5)
+    meshSize: float = Field(default=0.5, gt=0, description="Target element size (m)")
+    loadCases: List[PlateLoadCase] = Field(..., min_items=1)
+    includeFields: bool = Field(default=True, description="Return nodal fields, not just peaks")
+
+
+def analyse_plate(request: PlateAnalysisRequest) -> Dict:
+    """Mesh, assemble and solve a slab for all load cases with one factorization"""
+    timings = {}
+    start = time.perf_counter()
+    outline = np.asarray(request.outline, dtype=float)
+    edges = request.edgeSupports or ["simple"] * len(outline)
+    if len(edges) != len(outline) or any(e not in EDGE_CONDITIONS for e in edges):
+        raise ValueError(f"edgeSupports needs one of {EDGE_CONDITIONS} per outline edge")
+
+    fixed_points = list(request.columns) + [p[:2] for lc in request.loadCases for p in lc.pointLoads]
+    nodes, triangles = mesh_polygon(outline, request.meshSize, request.openings, fixed_points, request.walls)
+    timings["mesh"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model = PlateModel(nodes, triangles, request.thickness / 1000, request.E * 1e6, request.poisson)
+    timings["assemble"] = time.perf_counter() - start
+
+    a, b = _loop_edges(outline)
+    for p, q, condition in zip(a, b, edges):
+        if condition != "free":
+            on_edge = model.nodes_on_segment(p, q)
+            model.fix(on_edge, (0, 1, 2) if condition == "fixed" else (0,))
+    for x1, y1, x2, y2 in request.walls:
+        model.fix(model.nodes_on_segment((x1, y1), (x2, y2)), (0,))
+    if request.columns:
+        model.fix(model.nearest_nodes(request.columns), (0,))
+    # Rigid-body modes w = a + bx + cy need three non-collinear supports unless a fixed edge restrains rotation
+    restrained = model.fixed.reshape(-1, DOF_PER_NODE)
+    supports = np.column_stack([np.ones(restrained[:, 0].sum()), nodes[restrained[:, 0]]])
+    if np.linalg.matrix_rank(supports) < (2 if restrained[:, 1:].any() else 3):
+        raise ValueError("Slab is not adequately supported: supports must restrain all rigid-body modes")
+
+    F = np.column_stack([
+        model.pressure_vector(lc.pressure) + model.point_load_vector(lc.pointLoads) for lc in request.loadCases
+    ])
+    try:
+        U = model.solve(F)
+    except SingularStiffnessError as e:
+        raise ValueError(f"Slab is not adequately supported: {e}")
+    timings.update(model.timings)
+
+    Mx, My, Mxy = model.moments(U)
+    design = wood_armer(Mx, My, Mxy)
+    R = model.reactions(U, F)[0::DOF_PER_NODE]
+
+    cases = []
+    for c, lc in enumerate(request.loadCases):
+        w = U[0::DOF_PER_NODE, c]
+        result = {
+            "name": lc.name,
+            "maxDeflection": round(float(np.abs(w).max()) * 1000, 3),
+            "totalLoad": round(float(F[0::DOF_PER_NODE, c].sum()), 3),
+            "totalReaction": round(float(R[:, c].sum()), 3),
+            "max": {k: round(float(v[:, c].max()), 3) for k, v in (("Mx", Mx), ("My", My), ("Mxy", Mxy))},
+            "min": {k: round(float(v[:, c].min()), 3) for k, v in (("Mx", Mx), ("My", My), ("Mxy", Mxy))},
+            "design": {k: round(float(np.abs(v[:, c]).max()), 3) for k, v in design.items()},
+        }
+        if request.includeFields:
+            result["fields"] = {
+                "w": np.round(w * 1000, 4).tolist(),
+                "Mx": np.round(Mx[:, c], 3).tolist(),
+                "My": np.round(My[:, c], 3).tolist(),
+                "Mxy": np.round(Mxy[:, c], 3).tolist(),
+                **{k: np.round(v[:, c], 3).tolist() for k, v in design.items()},
+            }
+        cases.append(result)
+
+    return {
+        "mesh": {
+            "nodes": len(nodes),
+            "elements": len(triangles),
+            "dof": model.n_dof,
+            "free_dof": int((~model.fixed).sum()),
+            "coordinates": np.round(nodes, 4).tolist() if request.includeFields else None,
+            "triangles": triangles.tolist() if request.includeFields else None,
+        },
+        "loadCases": cases,
+        "solver": model._factor.method,
+        "timings": {k: round(v, 4) for k, v in timings.items()},
+    }
+
+
+@router.post("/api/plate-analysis")
+async def plate_analysis(request: PlateAnalysisRequest):
+    """Finite element analysis of an irregular slab (DKT plate elements)"""
+    try:
+        return analyse_plate(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
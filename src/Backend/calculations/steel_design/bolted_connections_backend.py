@@ -4,9 +4,10 @@ Complete implementation for ordinary bolts, HSFG bolts, and bearing connections
 """
 
 from pydantic import BaseModel, Field
-from typing import Literal, Optional, List
+from typing import Literal, Optional, List, Tuple
 from enum import Enum
 import math
+import numpy as np
 
 # Bolt Types and Grades
 class BoltGrade(str, Enum):
@@ -119,6 +120,23 @@ class BoltGroupRequest(BaseModel):
     plate_thickness: float
     plate_grade: str
 
+class BoltGroupConnection(BaseModel):
+    """One bolt group with several load cases, for batch analysis"""
+    id: Optional[str] = None
+    bolt_diameter: int
+    bolt_grade: BoltGrade
+    bolt_positions: List[Tuple[float, float]] = Field(..., min_items=1, description="(x, y) coordinates in mm")
+    load_cases: List[Tuple[float, float, float]] = Field(
+        ..., min_items=1, description="(Fx kN, Fy kN, Mz kNm) per case, moment about the group centroid"
+    )
+    shear_plane: ShearPlane = ShearPlane.SINGLE
+    thread_condition: ThreadCondition
+
+class BoltGroupBatchRequest(BaseModel):
+    """Many bolt groups analysed in one request"""
+    connections: List[BoltGroupConnection] = Field(..., min_items=1)
+    include_bolt_forces: bool = Field(default=False, description="Return every bolt force for every case")
+
 class PryingActionRequest(BaseModel):
     """Bolted connection with prying action"""
     bolt_diameter: int
@@ -333,6 +351,42 @@ def design_hsfg_bolt(request: HsfgBoltRequest) -> HsfgBoltResponse:
         clamping_force=round(P_0, 2)
     )
 
+def bolt_group_forces(positions, loads) -> dict:
+    """
+    Elastic bolt group analysis for all bolts and load cases in one pass.
+
+    positions: (n, 2) bolt coordinates in mm
+    loads: (m, 3) load cases (Fx kN, Fy kN, Mz kNm) with Mz about the centroid
+
+    Each bolt carries F/n directly plus Mz * r / J normal to its radius from
+    the centroid; the components are added as vectors. Returns the centroid,
+    polar moment J (mm²), bolt force components (m, n, 2) and resultants
+    (m, n) in kN, and the critical bolt index and force for every case.
+    """
+    xy = np.asarray(positions, dtype=float).reshape(-1, 2)
+    cases = np.asarray(loads, dtype=float).reshape(-1, 3)
+    n = len(xy)
+
+    centroid = xy.mean(axis=0)
+    d = xy - centroid
+    J = float((d**2).sum())
+
+    # Torsional share per unit moment, zero for a single bolt or coincident bolts
+    k = cases[:, 2:3] * 1000 / J if J > 0 else np.zeros((len(cases), 1))  # kN/mm
+    fx = cases[:, 0:1] / n - k * d[:, 1]
+    fy = cases[:, 1:2] / n + k * d[:, 0]
+    resultant = np.hypot(fx, fy)
+
+    critical = resultant.argmax(axis=1)
+    return {
+        "centroid": centroid,
+        "J": J,
+        "components": np.stack([fx, fy], axis=-1),
+        "resultant": resultant,
+        "critical_bolt": critical,
+        "max_force": resultant[np.arange(len(cases)), critical],
+    }
+
 def analyze_bolt_group(request: BoltGroupRequest) -> BoltGroupResponse:
     """
     Analyze bolt group subjected to eccentric loading
@@ -340,42 +394,25 @@ def analyze_bolt_group(request: BoltGroupRequest) -> BoltGroupResponse:
     """
     positions = request.bolt_positions
     n = len(positions)
+    xy = np.asarray(positions, dtype=float).reshape(n, 2)
     
     # Calculate centroid
-    x_sum = sum(pos[0] for pos in positions)
-    y_sum = sum(pos[1] for pos in positions)
-    x_c = x_sum / n
-    y_c = y_sum / n
+    x_c, y_c = xy.mean(axis=0)
     
     # Applied moment
     M = math.sqrt(request.eccentricity_x**2 + request.eccentricity_y**2) * request.applied_force
     
     # Calculate polar moment of inertia
-    J = sum((pos[0] - x_c)**2 + (pos[1] - y_c)**2 for pos in positions)
-    
-    # Find maximum bolt force
-    max_force = 0
-    critical_pos = (0, 0)
+    r = np.hypot(xy[:, 0] - x_c, xy[:, 1] - y_c)
+    J = float((r**2).sum())
     
-    for pos in positions:
-        # Distance from centroid
-        r = math.sqrt((pos[0] - x_c)**2 + (pos[1] - y_c)**2)
-        
-        # Force from direct shear
-        F_direct = request.applied_force / n
-        
-        # Force from moment (if present)
-        if J > 0 and M > 0:
-            F_moment = (M * r) / J
-        else:
-            F_moment = 0
-        
-        # Resultant force (conservative - add directly)
-        F_total = F_direct + F_moment
-        
-        if F_total > max_force:
-            max_force = F_total
-            critical_pos = pos
+    # Direct shear plus moment shear, added directly (conservative as the
+    # force direction is not given)
+    F_total = request.applied_force / n + ((M * r) / J if J > 0 and M > 0 else 0)
+    F_total = np.broadcast_to(F_total, (n,))
+    critical = int(F_total.argmax())
+    max_force = float(F_total[critical])
+    critical_pos = positions[critical]
     
     # Bolt capacity
     bolt_capacity = calculate_shear_capacity(
@@ -400,6 +437,48 @@ def analyze_bolt_group(request: BoltGroupRequest) -> BoltGroupResponse:
         critical_bolt_position=critical_pos
     )
 
+def analyze_bolt_groups(request: BoltGroupBatchRequest) -> dict:
+    """
+    Analyze many bolt groups, each for all of its load cases in one
+    bolt_group_forces pass, and tabulate the governing case per connection.
+    """
+    results = []
+    for i, conn in enumerate(request.connections):
+        out = bolt_group_forces(conn.bolt_positions, conn.load_cases)
+        capacity = calculate_shear_capacity(
+            conn.bolt_grade, conn.bolt_diameter, conn.shear_plane, conn.thread_condition
+        )
+        governing = int(out["max_force"].argmax())
+        critical = int(out["critical_bolt"][governing])
+        max_force = float(out["max_force"][governing])
+        utilization = max_force / capacity if capacity > 0 else float('inf')
+
+        result = {
+            "id": conn.id if conn.id is not None else str(i + 1),
+            "num_bolts": len(conn.bolt_positions),
+            "centroid_x": round(float(out["centroid"][0]), 2),
+            "centroid_y": round(float(out["centroid"][1]), 2),
+            "polar_moment": round(out["J"], 1),
+            "bolt_capacity": round(capacity, 2),
+            "case_max_force": np.round(out["max_force"], 2).tolist(),
+            "case_critical_bolt": out["critical_bolt"].tolist(),
+            "governing_case": governing,
+            "critical_bolt": critical,
+            "critical_bolt_position": tuple(conn.bolt_positions[critical]),
+            "max_bolt_force": round(max_force, 2),
+            "utilization_ratio": round(utilization * 100, 1),
+            "passed": utilization <= 1.0,
+        }
+        if request.include_bolt_forces:
+            result["bolt_forces"] = np.round(out["resultant"], 3).tolist()
+        results.append(result)
+
+    return {
+        "total": len(results),
+        "failed": sum(not r["passed"] for r in results),
+        "results": results,
+    }
+
 # Spacing and edge distance requirements
 def minimum_bolt_spacing(diameter: int) -> float:
     """Minimum center-to-center spacing (BS 5950 Cl 6.2.1)"""
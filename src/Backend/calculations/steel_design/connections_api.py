@@ -9,6 +9,8 @@ from .welded_joints_backend import (
     ButtWeldRequest,
     LapJointRequest,
     TeeJointRequest,
+    WeldGroupBatchRequest,
+    check_weld_groups,
     design_fillet_weld,
     design_butt_weld,
     design_lap_joint,
@@ -20,9 +22,11 @@ from .bolted_connections_backend import (
     BoltedConnectionRequest,
     HsfgBoltRequest,
     BoltGroupRequest,
+    BoltGroupBatchRequest,
     design_bolted_connection,
     design_hsfg_bolt,
     analyze_bolt_group,
+    analyze_bolt_groups,
     minimum_bolt_spacing,
     minimum_edge_distance,
     maximum_bolt_spacing,
@@ -111,6 +115,22 @@ async def calculate_tee_joint(request: TeeJointRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/weld-group-batch")
+async def calculate_weld_groups(request: WeldGroupBatchRequest):
+    """
+    Check many fillet weld groups, each under several load cases
+
+    Weld lines are treated as unit throat (line method):
+    - Length, centroid and polar moment of every group
+    - Peak force per unit length from direct and torsional shear
+    - Columnar pass/fail table against pw x throat
+    """
+    try:
+        return check_weld_groups(request)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/weld-size-limits/{plate_thickness}")
 async def get_weld_size_limits(plate_thickness: float):
     """
@@ -201,6 +221,22 @@ async def calculate_bolt_group(request: BoltGroupRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/bolt-group-batch")
+async def calculate_bolt_groups(request: BoltGroupBatchRequest):
+    """
+    Analyze many bolt groups, each under several load cases
+
+    Each connection is solved for all of its load cases in one pass:
+    - Resultant force on every bolt (vector sum of direct and torsional shear)
+    - Critical bolt and governing load case
+    - Utilization against single-bolt shear capacity
+    """
+    try:
+        return analyze_bolt_groups(request)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/standard-diameters")
 async def get_standard_bolt_diameters():
     """Get standard bolt diameters"""
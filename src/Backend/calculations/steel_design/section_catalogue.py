@@ -0,0 +1,160 @@
+"""
+Steel Section Catalogue
+Columnar (structure-of-arrays) view of the BS 5950 section tables. Every
+property is one numpy column in consistent mm/N units, derived properties
+(mass per metre, shear area, flange and web slenderness) are computed once
+when the table is built, and rows are sorted lightest first. Beam checks
+then broadcast members against the whole catalogue, so the lightest passing
+section for hundreds of members is one array pass and one argmax.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable
+
+import numpy as np
+
+E_STEEL = 210000.0  # N/mm2
+
+# Simplified BS 5950 Table 11 limits (multiples of epsilon), as classify_section
+CLASS_NAMES = ("Plastic", "Compact", "Semi-compact", "Slender")
+FLANGE_LIMITS = (9.0, 10.0, 15.0)
+WEB_LIMITS = (80.0, 100.0, 120.0)
+
+# Default serviceability limit, span / DEFLECTION_RATIO
+DEFLECTION_RATIO = 360.0
+
+SECTION_DTYPE = np.dtype([
+    ("designation", "U16"),
+    ("series", "U2"),
+    ("mass", "f8"),  # kg/m
+    ("depth", "f8"),  # mm
+    ("width", "f8"),  # mm
+    ("tw", "f8"),  # mm
+    ("tf", "f8"),  # mm
+    ("r", "f8"),  # mm
+    ("area", "f8"),  # mm2
+    ("Ix", "f8"),  # mm4
+    ("Iy", "f8"),  # mm4
+    ("Zx", "f8"),  # mm3
+    ("Zy", "f8"),  # mm3
+    ("rx", "f8"),  # mm
+    ("ry", "f8"),  # mm
+    ("Av", "f8"),  # mm2, D * tw
+    ("b_t", "f8"),  # flange outstand b/T
+    ("d_t", "f8"),  # web d/t
+])
+
+
+@dataclass(frozen=True)
+class SectionTable:
+    """Read-only structured array of sections, sorted by mass then depth"""
+    data: np.ndarray
+
+    @classmethod
+    def from_sections(cls, sections: Iterable, series: str) -> "SectionTable":
+        """
+        Build from SteelSection-like objects (catalogue units: area cm2, I cm4,
+        Z cm3, dimensions mm). Mass is the nominal kg/m in the designation.
+        """
+        rows = []
+        for s in sections:
+            rows.append((
+                s.designation, series, float(s.designation.split("x")[-1]),
+                s.depth, s.width, s.tw, s.tf, s.r,
+                s.area * 1e2, s.Ix * 1e4, s.Iy * 1e4, s.Zx * 1e3, s.Zy * 1e3, s.rx, s.ry,
+                s.depth * s.tw, (s.width / 2) / s.tf, (s.depth - 2 * s.tf) / s.tw,
+            ))
+        return cls._sorted(np.array(rows, dtype=SECTION_DTYPE))
+
+    @classmethod
+    def concat(cls, *tables: "SectionTable") -> "SectionTable":
+        return cls._sorted(np.concatenate([t.data for t in tables]))
+
+    @classmethod
+    def _sorted(cls, data: np.ndarray) -> "SectionTable":
+        data = data[np.lexsort((data["depth"], data["mass"]))]
+        data.setflags(write=False)
+        return cls(data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.data[field]
+
+    def index(self, designation: str) -> int:
+        hits = np.flatnonzero(self.data["designation"] == designation)
+        if not len(hits):
+            raise KeyError(designation)
+        return int(hits[0])
+
+    def classify(self, py: float) -> np.ndarray:
+        """Class index into CLASS_NAMES for every section at design strength py"""
+        epsilon = np.sqrt(275.0 / py)
+        cls = np.full(len(self), len(CLASS_NAMES) - 1)
+        # Tightest limit last so it wins
+        for i in reversed(range(len(FLANGE_LIMITS))):
+            ok = (self.data["b_t"] <= FLANGE_LIMITS[i] * epsilon) & (self.data["d_t"] <= WEB_LIMITS[i] * epsilon)
+            cls = np.where(ok, i, cls)
+        return cls
+
+    def beam_checks(self, span, udl, point_load, point_position, py: float,
+                    E: float = E_STEEL, deflection_ratio: float = DEFLECTION_RATIO) -> Dict[str, np.ndarray]:
+        """
+        Simply supported beam checks of design_beam for members (span m, udl
+        kN/m, point load kN at point_position m) against every section.
+        Member inputs are 1-D of length n; ratios are (n, n_sections).
+        """
+        L = np.atleast_1d(np.asarray(span, dtype=float))[:, None] * 1000.0  # mm
+        w = np.atleast_1d(np.asarray(udl, dtype=float))[:, None]  # kN/m = N/mm
+        P = np.atleast_1d(np.asarray(point_load, dtype=float))[:, None]  # kN
+        a = np.atleast_1d(np.asarray(point_position, dtype=float))[:, None] * 1000.0  # mm
+        has_point = P > 0
+
+        M_max = w * L**2 / 8e6 + np.where(has_point, P * a * (L - a) / (L * 1000.0), 0.0)  # kNm
+        V_max = w * L / 2000.0 + np.where(has_point, np.maximum(P * (L - a) / L, P * a / L), 0.0)  # kN
+
+        Zx, ry, Ix = self.data["Zx"], self.data["ry"], self.data["Ix"]
+        Mc = Zx * py / 1e6  # kNm
+        Pv = 0.6 * py * self.data["Av"] / 1000.0  # kN
+        lambda_LT = (L / ry) * np.sqrt(py / 275.0)
+        pb = py / (1 + 0.0005 * lambda_LT**2)
+        Mb = Zx * pb / 1e6  # kNm
+
+        # Peak point-load deflection (load nearer one support at b from it), added to the UDL peak as a bound
+        b = np.minimum(a, L - a)
+        delta = 5 * w * L**4 / (384 * E * Ix) + np.where(
+            has_point,
+            P * 1000.0 * b * (L**2 - b**2) ** 1.5 / (9 * np.sqrt(3) * E * Ix * L),
+            0.0,
+        )
+        delta_limit = L / deflection_ratio
+
+        return {
+            "M_max": M_max[:, 0], "V_max": V_max[:, 0], "delta_limit": delta_limit[:, 0],
+            "Mc": np.broadcast_to(Mc, Mb.shape), "Mb": Mb, "Pv": np.broadcast_to(Pv, Mb.shape),
+            "delta_max": delta, "lambda_LT": lambda_LT,
+            "bending_ratio": M_max / Mb, "shear_ratio": V_max / Pv, "deflection_ratio": delta / delta_limit,
+        }
+
+    def select_beams(self, span, udl, point_load=0.0, point_position=0.0, py: float = 275.0,
+                     E: float = E_STEEL, deflection_ratio: float = DEFLECTION_RATIO) -> Dict[str, np.ndarray]:
+        """
+        Lightest section passing bending (with LTB), shear and deflection for
+        every member. Where nothing passes, index is the section with the lowest
+        governing ratio and passed is False.
+        """
+        n = len(np.atleast_1d(span))
+        point_load = np.broadcast_to(np.asarray(point_load, dtype=float), (n,))
+        point_position = np.broadcast_to(np.asarray(point_position, dtype=float), (n,))
+        checks = self.beam_checks(span, udl, point_load, point_position, py, E, deflection_ratio)
+        governing = np.maximum.reduce([checks["bending_ratio"], checks["shear_ratio"], checks["deflection_ratio"]])
+        ok = governing <= 1.0
+        passed = ok.any(axis=1)
+        index = np.where(passed, ok.argmax(axis=1), governing.argmin(axis=1))
+        rows = np.arange(n)
+        return dict(
+            {k: v for k, v in checks.items() if v.ndim == 1},
+            **{k: v[rows, index] for k, v in checks.items() if v.ndim == 2},
+            index=index, passed=passed, governing_ratio=governing[rows, index],
+        )
@@ -19,6 +19,7 @@ from calculations.Beams.moment_distribution_backend import (
     JointType,
     EndCondition,
 )
+from .section_catalogue import CLASS_NAMES, SectionTable
 
 router = APIRouter()
 
@@ -578,6 +579,13 @@ STEEL_SECTIONS = {
     "UC": {s.designation: s for s in UC_SECTIONS},
 }
 
+# Columnar catalogues for vectorized section selection, built once at import
+SECTION_TABLES = {
+    "UB": SectionTable.from_sections(UB_SECTIONS, "UB"),
+    "UC": SectionTable.from_sections(UC_SECTIONS, "UC"),
+}
+SECTION_TABLES["ALL"] = SectionTable.concat(SECTION_TABLES["UB"], SECTION_TABLES["UC"])
+
 
 # Material Properties (BS 5950)
 class SteelGrade(str, Enum):
@@ -622,6 +630,25 @@ class ColumnDesignRequest(BaseModel):
     )
 
 
+class BeamMember(BaseModel):
+    id: Optional[str] = None
+    span: float = Field(..., gt=0, description="Span length in meters")
+    udl: float = Field(..., ge=0, description="Uniformly distributed load in kN/m")
+    point_load: float = Field(default=0, ge=0, description="Point load in kN")
+    point_load_position: float = Field(
+        default=0, ge=0, description="Point load position from left in meters"
+    )
+
+
+class BeamSelectRequest(BaseModel):
+    members: List[BeamMember] = Field(..., min_items=1)
+    grade: SteelGrade
+    section_type: str = Field(default="UB", description="UB, UC or ALL")
+    deflection_ratio: float = Field(
+        default=360, gt=0, description="Deflection limit as span / ratio"
+    )
+
+
 class SpanData(BaseModel):
     length: float
     load: float
@@ -740,6 +767,7 @@ async def root():
             "column_design": "/api/column-design",
             "frame_analysis": "/api/frame-analysis",
             "sections": "/api/sections",
+            "beam_select": "/api/beam-select",
         },
     }
 
@@ -770,7 +798,7 @@ async def design_beam(request: BeamDesignRequest):
     a = request.point_load_position * 1000  # mm
 
     # Calculate maximum bending moment (BS 5950 Cl 4.2.5)
-    M_udl = (w * L**2) / 8000  # kNm
+    M_udl = (w * L**2) / 8_000_000  # kNm
     M_point = (P * a * (L - a)) / (L * 1000) if P > 0 else 0  # kNm
     M_max = M_udl + M_point
 
@@ -786,7 +814,7 @@ async def design_beam(request: BeamDesignRequest):
     classification = classify_section(section, py)
 
     # Moment capacity (BS 5950 Cl 4.2.5)
-    Mc = (section.Zx * py) / 1_000_000  # kNm
+    Mc = (section.Zx * 1000 * py) / 1_000_000  # kNm
 
     # Shear capacity (BS 5950 Cl 4.2.3)
     Av = section.depth * section.tw  # mm²
@@ -795,14 +823,16 @@ async def design_beam(request: BeamDesignRequest):
     # Lateral torsional buckling (BS 5950 Cl 4.3)
     lambda_LT = (L / section.ry) * math.sqrt(py / 275)
     pb = py / (1 + 0.0005 * lambda_LT**2)  # Simplified
-    Mb = (section.Zx * pb) / 1_000_000  # kNm
+    Mb = (section.Zx * 1000 * pb) / 1_000_000  # kNm
 
     # Deflection check (serviceability)
     I = section.Ix * 10000  # mm⁴
     delta_udl = (5 * w * L**4) / (384 * material["E"] * I)
+    # Peak point-load deflection (b from the nearer support), added to the UDL peak as a bound
+    b = min(a, L - a)
     delta_point = (
-        (P * a * (L - a) ** 2 * math.sqrt(3 * a * (L - a)))
-        / (27 * material["E"] * I * L)
+        (P * 1000 * b * (L**2 - b**2) ** 1.5)
+        / (9 * math.sqrt(3) * material["E"] * I * L)
         if P > 0
         else 0
     )
@@ -836,6 +866,71 @@ async def design_beam(request: BeamDesignRequest):
     )
 
 
+@router.post("/api/beam-select")
+async def select_beams(request: BeamSelectRequest):
+    """Lightest passing section for every member, all sections checked at once"""
+    if request.section_type not in SECTION_TABLES:
+        raise HTTPException(
+            status_code=400, detail="Invalid section type. Use 'UB', 'UC' or 'ALL'"
+        )
+    table = SECTION_TABLES[request.section_type]
+    material = MATERIAL_PROPERTIES[request.grade]
+    py = material["fy"]
+
+    members = request.members
+    for m in members:
+        if m.point_load > 0 and m.point_load_position > m.span:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Point load position beyond span for member {m.id}",
+            )
+    selection = table.select_beams(
+        [m.span for m in members],
+        [m.udl for m in members],
+        [m.point_load for m in members],
+        [m.point_load_position for m in members],
+        py=py,
+        E=material["E"],
+        deflection_ratio=request.deflection_ratio,
+    )
+    classes = table.classify(py)
+
+    results = []
+    for i, member in enumerate(members):
+        k = selection["index"][i]
+        results.append(
+            {
+                "id": member.id if member.id is not None else str(i + 1),
+                "section": str(table["designation"][k]),
+                "section_type": str(table["series"][k]),
+                "mass": float(table["mass"][k]),
+                "classification": CLASS_NAMES[classes[k]],
+                "M_max": round(float(selection["M_max"][i]), 2),
+                "V_max": round(float(selection["V_max"][i]), 2),
+                "Mb": round(float(selection["Mb"][i]), 2),
+                "Pv": round(float(selection["Pv"][i]), 2),
+                "delta_max": round(float(selection["delta_max"][i]), 2),
+                "delta_limit": round(float(selection["delta_limit"][i]), 2),
+                "bending_ratio": round(float(selection["bending_ratio"][i]) * 100, 1),
+                "shear_ratio": round(float(selection["shear_ratio"][i]) * 100, 1),
+                "deflection_ratio": round(float(selection["deflection_ratio"][i]) * 100, 1),
+                "passed": bool(selection["passed"][i]),
+            }
+        )
+
+    return {
+        "grade": request.grade.value,
+        "section_type": request.section_type,
+        "sections_checked": len(table),
+        "total": len(results),
+        "failed": int((~selection["passed"]).sum()),
+        "total_mass": round(
+            sum(r["mass"] * m.span for r, m in zip(results, members)), 1
+        ),
+        "results": results,
+    }
+
+
 @router.post("/api/column-design", response_model=ColumnDesignResponse)
 async def design_column(request: ColumnDesignRequest):
     """Design steel column according to BS 5950"""
@@ -867,8 +962,8 @@ async def design_column(request: ColumnDesignRequest):
     Pc = (section.area * 100 * pc) / 1000  # kN
 
     # Moment capacities
-    Mcx = (section.Zx * py) / 1_000_000  # kNm
-    Mcy = (section.Zy * py) / 1_000_000  # kNm
+    Mcx = (section.Zx * 1000 * py) / 1_000_000  # kNm
+    Mcy = (section.Zy * 1000 * py) / 1_000_000  # kNm
 
     # Interaction check (BS 5950 Cl 4.8.3.3)
     axial_ratio = P / Pc
@@ -946,7 +1041,7 @@ async def analyze_frame(request: FrameAnalysisRequest):
                 ))
 
             # 2. Run Analysis
-            frame_md = FrameMD(joints=joints, members=members)
+            frame_md = FrameMD(joints=joints, members=members, include_history=True)
             solver = MomentDistributionSolver(frame_md)
             results = solver.solve()
 
@@ -4,9 +4,10 @@ Complete implementation for fillet welds, butt welds, and partial penetration we
 """
 
 from pydantic import BaseModel, Field
-from typing import Literal, Optional, List
+from typing import Literal, Optional, List, Tuple
 from enum import Enum
 import math
+import numpy as np
 
 # Weld Types
 class WeldType(str, Enum):
@@ -65,6 +66,23 @@ class TeeJointRequest(BaseModel):
     electrode_grade: ElectrodeGrade
     parent_steel_grade: str
 
+class WeldGroup(BaseModel):
+    """Fillet weld group made of straight weld lines, for batch checks"""
+    id: Optional[str] = None
+    segments: List[Tuple[float, float, float, float]] = Field(
+        ..., min_items=1, description="Weld lines as (x1, y1, x2, y2) in mm"
+    )
+    throat_size: float = Field(..., gt=0, description="Effective throat thickness (mm)")
+    load_cases: List[Tuple[float, float, float]] = Field(
+        ..., min_items=1, description="(Fx kN, Fy kN, Mz kNm) per case, moment about the weld group centroid"
+    )
+    electrode_grade: ElectrodeGrade = ElectrodeGrade.E42
+    parent_steel_grade: str = "S275"
+
+class WeldGroupBatchRequest(BaseModel):
+    """Many weld groups checked in one request"""
+    welds: List[WeldGroup] = Field(..., min_items=1)
+
 # Response Models
 class WeldDesignResponse(BaseModel):
     """Weld design calculation results"""
@@ -335,6 +353,107 @@ def design_tee_joint(request: TeeJointRequest) -> TeeJointResponse:
         passed=passed
     )
 
+def weld_group_forces(segments, group, loads) -> dict:
+    """
+    Elastic (line method) analysis of many weld groups at once.
+
+    segments: (s, 4) weld lines (x1, y1, x2, y2) in mm, sorted by group
+    group: (s,) group index of each line, 0..G-1 with every group present
+    loads: (G, m, 3) load cases (Fx kN, Fy kN, Mz kNm about the centroid),
+        zero-padded where a group has fewer cases
+
+    Each line is treated as unit throat. Group length, centroid and polar
+    moment J = sum(L^3 / 12 + L * r^2) come from per-line sums, and the
+    force per unit length is checked at both ends of every line, where
+    direct and torsional components peak. Returns per-group properties and
+    the peak resultant (kN/mm) for every case, shape (G, m).
+    """
+    seg = np.asarray(segments, dtype=float).reshape(-1, 4)
+    group = np.asarray(group, dtype=int)
+    loads = np.asarray(loads, dtype=float)
+    n_groups = loads.shape[0]
+
+    start, end = seg[:, :2], seg[:, 2:]
+    length = np.hypot(*(end - start).T)
+    mid = (start + end) / 2
+
+    total = np.bincount(group, weights=length, minlength=n_groups)
+    if np.any(total <= 0):
+        raise ValueError("Every weld group needs a non-zero total length")
+    centroid = np.stack([np.bincount(group, weights=length * mid[:, k], minlength=n_groups) for k in (0, 1)], axis=1)
+    centroid /= total[:, None]
+    offset = mid - centroid[group]
+    J = np.bincount(group, weights=length**3 / 12 + length * (offset**2).sum(axis=1), minlength=n_groups)
+
+    # Both ends of every line, still ordered by group
+    points = np.concatenate([start, end], axis=1).reshape(-1, 2)
+    point_group = np.repeat(group, 2)
+    d = points - centroid[point_group]
+
+    case = loads[point_group]  # (2s, m, 3)
+    torsion = case[..., 2] * 1000 / np.where(J > 0, J, np.inf)[point_group, None]  # kN/mm per mm
+    fx = case[..., 0] / total[point_group, None] - torsion * d[:, 1:2]
+    fy = case[..., 1] / total[point_group, None] + torsion * d[:, 0:1]
+    resultant = np.hypot(fx, fy)
+
+    first = np.flatnonzero(np.r_[True, point_group[1:] != point_group[:-1]])
+    return {
+        "length": total,
+        "centroid": centroid,
+        "J": J,
+        "max_force": np.maximum.reduceat(resultant, first, axis=0),
+    }
+
+def check_weld_groups(request: WeldGroupBatchRequest) -> dict:
+    """
+    Check every weld group of the request for all of its load cases in one
+    weld_group_forces pass. Returns a columnar table, one entry per group.
+    """
+    welds = request.welds
+    n_cases = max(len(w.load_cases) for w in welds)
+    loads = np.zeros((len(welds), n_cases, 3))
+    for i, w in enumerate(welds):
+        loads[i, :len(w.load_cases)] = w.load_cases
+    segments = np.array([s for w in welds for s in w.segments], dtype=float)
+    group = np.repeat(np.arange(len(welds)), [len(w.segments) for w in welds])
+
+    out = weld_group_forces(segments, group, loads)
+
+    # pw looked up once per electrode/parent grade pair
+    strengths = {}
+    for w in welds:
+        key = (w.electrode_grade, w.parent_steel_grade)
+        if key not in strengths:
+            strengths[key] = calculate_design_strength_pw(*key)
+    pw = np.array([strengths[w.electrode_grade, w.parent_steel_grade] for w in welds])
+    throat = np.array([w.throat_size for w in welds])
+    capacity = pw * throat / 1000  # kN/mm
+
+    governing = out["max_force"].argmax(axis=1)
+    max_force = out["max_force"][np.arange(len(welds)), governing]
+    utilization = max_force / capacity
+    passed = utilization <= 1.0
+
+    return {
+        "total": len(welds),
+        "failed": int((~passed).sum()),
+        "table": {
+            "id": [w.id if w.id is not None else str(i + 1) for i, w in enumerate(welds)],
+            "throat_size": throat.tolist(),
+            "weld_length": np.round(out["length"], 1).tolist(),
+            "centroid_x": np.round(out["centroid"][:, 0], 2).tolist(),
+            "centroid_y": np.round(out["centroid"][:, 1], 2).tolist(),
+            "polar_moment": np.round(out["J"], 1).tolist(),
+            "design_strength_pw": np.round(pw, 2).tolist(),
+            "capacity_per_mm": np.round(capacity, 4).tolist(),
+            "governing_case": governing.tolist(),
+            "max_force_per_mm": np.round(max_force, 4).tolist(),
+            "max_stress": np.round(max_force * 1000 / throat, 2).tolist(),
+            "utilization_ratio": np.round(utilization * 100, 1).tolist(),
+            "passed": passed.tolist(),
+        },
+    }
+
 # Minimum weld size recommendations (BS 5950)
 def minimum_fillet_weld_size(plate_thickness: float) -> float:
     """
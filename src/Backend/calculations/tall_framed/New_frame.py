@@ -5,9 +5,10 @@ Generates data for 3D visualization and 2D cross-section views
 """
 
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Tuple
 from scipy.interpolate import interp1d
+from .frame_analysis_core import LoadType
 
 
 @dataclass
@@ -37,6 +38,46 @@ class SectionForces:
     theta_z: float = 0.0  # Rotation about z
 
 
+@dataclass
+class MemberSectionResults:
+    """
+    Columnar section results of one member: every field is an array with
+    one entry per section. SectionForces objects are available as a view.
+    """
+    x: np.ndarray
+    x_ratio: np.ndarray
+    N: np.ndarray
+    Vy: np.ndarray
+    Vz: np.ndarray
+    T: np.ndarray
+    My: np.ndarray
+    Mz: np.ndarray
+    delta_y: np.ndarray  # mm
+    delta_z: np.ndarray  # mm
+
+    FIELDS = ('x', 'x_ratio', 'N', 'Vy', 'Vz', 'T', 'My', 'Mz', 'delta_y', 'delta_z')
+
+    def to_sections(self) -> List[SectionForces]:
+        """Row view as SectionForces objects"""
+        columns = [getattr(self, f).tolist() for f in self.FIELDS]
+        return [SectionForces(*row) for row in zip(*columns)]
+
+    def to_records(self) -> List[Dict]:
+        """Row view in the visualisation JSON layout"""
+        keys = ('position', 'ratio', 'N', 'Vy', 'Vz', 'T', 'My', 'Mz', 'delta_y', 'delta_z')
+        columns = [getattr(self, f).tolist() for f in self.FIELDS]
+        return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def group_loads_by_member(loads: List) -> Dict[int, List]:
+    """Member loads keyed by member_id (nodal loads are skipped)"""
+    grouped: Dict[int, List] = {}
+    for load in loads:
+        if load.member_id is not None:
+            grouped.setdefault(load.member_id, []).append(load)
+    return grouped
+
+
 class DetailedMemberAnalysis:
     """
     Detailed analysis of member internal forces
@@ -57,6 +98,106 @@ class DetailedMemberAnalysis:
         # Section positions
         self.x_positions = np.linspace(0, self.L, n_sections)
         self.x_ratios = self.x_positions / self.L
+
+    def _load_terms(self, loads: List, load_factors: Dict):
+        """
+        Factored member loads in local axes:
+        uniform q (3,), varying w1/dw along local y, point positions a (m,)
+        and point forces P (m, 3)
+        """
+        R = self.member.rotation_matrix(self.nodes)
+        q = np.zeros(3)
+        w1 = dw = 0.0
+        a, P = [], []
+        
+        for load in loads:
+            if load.member_id != self.member.id:
+                continue
+            factor = load_factors.get(load.category, 0.0)
+            if abs(factor) < 1e-10:
+                continue
+            
+            if load.load_type == LoadType.VARYING:
+                w1 += factor * load.start_value
+                dw += factor * (load.end_value - load.start_value)
+                continue
+            
+            v = factor * np.array([load.Fx, load.Fy, load.Fz], dtype=float)
+            if load.coordinate_system == 'global':
+                v = R @ v
+            if load.load_type == LoadType.POINT:
+                a.append(load.start_position * self.L)
+                P.append(v)
+            else:
+                q += v
+        
+        return q, w1, dw, np.array(a, dtype=float), np.array(P, dtype=float).reshape(-1, 3)
+
+    def section_results(
+        self,
+        end_forces: np.ndarray,
+        loads: List,
+        load_factors: Dict,
+        end_displacements: np.ndarray = None
+    ) -> MemberSectionResults:
+        """
+        Internal forces (and deflections) at all sections in one pass
+        
+        end_forces: 12-element array of member end forces in local coords
+                   [Fx1, Fy1, Fz1, Mx1, My1, Mz1, Fx2, Fy2, Fz2, Mx2, My2, Mz2]
+        loads: loads on this member (others are ignored)
+        load_factors: Dict of load category -> factor
+        end_displacements: optional 12-element local end displacements;
+                   deflections are zero when omitted
+        
+        Sign convention: tension and sagging (Mz) positive; the moment
+        recurrence is exact for UDL, point and linearly varying loads.
+        """
+        F = np.asarray(end_forces, dtype=float)
+        x = self.x_positions
+        L = self.L
+        q, w1, dw, a, P = self._load_terms(loads, load_factors)
+        
+        # Point loads as masked terms: step (x > a) and lever arm <x - a>
+        step = (x[:, None] > a[None, :]).astype(float)
+        H = np.maximum(x[:, None] - a[None, :], 0.0)
+        
+        # Resultant of loads between the start and each section
+        Qx = q[0] * x + step @ P[:, 0]
+        Qy = (q[1] + w1) * x + dw * x**2 / (2 * L) + step @ P[:, 1]
+        Qz = q[2] * x + step @ P[:, 2]
+        
+        # First moments of those loads about the section
+        Sy = (q[1] + w1) * x**2 / 2 + dw * x**3 / (6 * L) + H @ P[:, 1]
+        Sz = q[2] * x**2 / 2 + H @ P[:, 2]
+        
+        N = -F[0] - Qx
+        Vy = -F[1] - Qy
+        Vz = -F[2] - Qz
+        T = np.full_like(x, -F[3])
+        Mz = -F[5] + F[1] * x + Sy
+        My = -F[4] - F[2] * x - Sz
+        
+        delta_y = np.zeros_like(x)
+        delta_z = np.zeros_like(x)
+        if end_displacements is not None:
+            d = np.asarray(end_displacements, dtype=float)
+            E = self.member.material.E
+            EIz = E * self.member.section.Iz
+            EIy = E * self.member.section.Iy
+            # Double integrals of the bending moments from the start
+            Dy = (q[1] + w1) * x**4 / 24 + dw * x**5 / (120 * L) + (H**3 / 6) @ P[:, 1]
+            Dz = q[2] * x**4 / 24 + (H**3 / 6) @ P[:, 2]
+            v = d[1] + d[5] * x + (-F[5] * x**2 / 2 + F[1] * x**3 / 6 + Dy) / EIz
+            w = d[2] - d[4] * x + (F[4] * x**2 / 2 + F[2] * x**3 / 6 + Dz) / EIy
+            delta_y = v * 1000
+            delta_z = w * 1000
+        
+        return MemberSectionResults(
+            x=x, x_ratio=self.x_ratios,
+            N=N, Vy=Vy, Vz=Vz, T=T, My=My, Mz=Mz,
+            delta_y=delta_y, delta_z=delta_z
+        )
         
     def calculate_internal_forces(
         self, 
@@ -72,93 +213,9 @@ class DetailedMemberAnalysis:
         loads: List of loads on this member
         load_factors: Dict of load category -> factor
         
-        Returns: List of SectionForces
+        Returns: List of SectionForces (view of section_results)
         """
-        sections = []
-        
-        # Extract end forces
-        N1 = -end_forces[0]  # Axial at start (reversed for internal force)
-        Vy1 = -end_forces[1]  # Shear y at start
-        Vz1 = -end_forces[2]  # Shear z at start
-        T1 = -end_forces[3]  # Torsion at start
-        My1 = -end_forces[4]  # Moment y at start
-        Mz1 = -end_forces[5]  # Moment z at start
-        
-        # Calculate at each section
-        for i, x in enumerate(self.x_positions):
-            x_ratio = self.x_ratios[i]
-            
-            # Initialize with end forces
-            N = N1
-            Vy = Vy1
-            Vz = Vz1
-            T = T1
-            My = My1
-            Mz = Mz1
-            
-            # Add effect of end shear once
-            Mz += Vy1 * x
-            My -= Vz1 * x
-            
-            # Add effects of loads between start and current section
-            for load in loads:
-                if load.member_id != self.member.id:
-                    continue
-                
-                factor = load_factors.get(load.category, 0.0)
-                if abs(factor) < 1e-10:
-                    continue
-                
-                if load.load_type == LoadType.UDL:
-                    # Uniformly distributed load
-                    w = factor * load.Fy  # Assuming vertical load
-                    
-                    # Load from start to current section
-                    if x > 0:
-                        # Shear reduces linearly
-                        Vy -= w * x
-                        # Moment increases parabolically (subtracted from Mz1 + Vy1*x)
-                        Mz -= w * x**2 / 2
-                
-                elif load.load_type == LoadType.POINT:
-                    # Point load
-                    a = load.start_position * self.L
-                    if x > a:  # Load is before current section
-                        P = factor * load.Fy
-                        Vy -= P
-                        Mz -= P * (x - a)
-                
-                elif load.load_type == LoadType.VARYING:
-                    # Linearly varying load
-                    w1 = factor * load.start_value
-                    w2 = factor * load.end_value
-                    
-                    if x > 0:
-                        # Load intensity at x: w(x) = w1 + (w2-w1)*x/L (if x < segment end)
-                        # For simplicity, assuming load covers whole length L for now
-                        # Correct logic should handle partial length varying loads
-                        W = w1 * x + (w2 - w1) * x**2 / (2 * self.L)
-                        Vy -= W
-                        
-                        # Moment integral: ∫w(ξ)*(x-ξ)dξ from 0 to x
-                        M_load = (w1 * x**2 / 2 + 
-                                 (w2 - w1) * x**3 / (6 * self.L))
-                        Mz -= M_load
-            
-            # Create section forces object
-            section = SectionForces(
-                x=x,
-                x_ratio=x_ratio,
-                N=N,
-                Vy=Vy,
-                Vz=Vz,
-                T=T,
-                My=My,
-                Mz=Mz
-            )
-            sections.append(section)
-        
-        return sections
+        return self.section_results(end_forces, loads, load_factors).to_sections()
     
     def calculate_deflections(
         self, 
@@ -222,23 +279,146 @@ class DetailedMemberAnalysis:
         """
         Calculate envelope (max/min) forces from all load combinations
         
+        all_combo_sections: combo -> List[SectionForces] or MemberSectionResults
         Returns: (max_Mz, min_Mz, max_Vy, min_Vy) at each section
         """
-        n_sections = len(next(iter(all_combo_sections.values())))
-        
-        max_Mz = [-1e10] * n_sections
-        min_Mz = [1e10] * n_sections
-        max_Vy = [-1e10] * n_sections
-        min_Vy = [1e10] * n_sections
-        
-        for combo_name, sections in all_combo_sections.items():
-            for i, section in enumerate(sections):
-                max_Mz[i] = max(max_Mz[i], section.Mz)
-                min_Mz[i] = min(min_Mz[i], section.Mz)
-                max_Vy[i] = max(max_Vy[i], section.Vy)
-                min_Vy[i] = min(min_Vy[i], section.Vy)
-        
-        return max_Mz, min_Mz, max_Vy, min_Vy
+        stack = stack_section_results({0: all_combo_sections})[:, 0]
+        Mz = stack[..., FORCE_COMPONENTS.index('Mz')]
+        Vy = stack[..., FORCE_COMPONENTS.index('Vy')]
+        return (Mz.max(axis=0).tolist(), Mz.min(axis=0).tolist(),
+                Vy.max(axis=0).tolist(), Vy.min(axis=0).tolist())
+
+
+# ============================================================================
+# FORCE ENVELOPES
+# ============================================================================
+
+# Component order of the last axis of envelope arrays
+FORCE_COMPONENTS = ('N', 'Vy', 'Vz', 'T', 'My', 'Mz')
+
+
+def _component_columns(sections) -> np.ndarray:
+    """(n_sections, 6) array from MemberSectionResults or a SectionForces list"""
+    if isinstance(sections, MemberSectionResults):
+        return np.stack([getattr(sections, c) for c in FORCE_COMPONENTS], axis=-1)
+    return np.array([[getattr(s, c) for c in FORCE_COMPONENTS] for s in sections], dtype=float)
+
+
+def stack_section_results(results: Dict[int, Dict[str, object]]) -> np.ndarray:
+    """
+    Stack section results into (n_combos, n_members, n_sections, 6).
+    results: member_id -> combo -> MemberSectionResults / List[SectionForces];
+    every member must list the same combinations and section count.
+    """
+    members = list(results.values())
+    combos = list(members[0].keys())
+    return np.stack([
+        np.stack([_component_columns(m[c]) for m in members])
+        for c in combos
+    ])
+
+
+@dataclass
+class ForceEnvelope:
+    """
+    Max/min of all six section force components over the load combinations.
+    max/min: (n_members, n_sections, 6); max_combo/min_combo index
+    combination_names for the combination that governs each value.
+    """
+    combination_names: List[str]
+    member_ids: List[int]
+    x_ratio: np.ndarray
+    max: np.ndarray
+    min: np.ndarray
+    max_combo: np.ndarray
+    min_combo: np.ndarray
+    # Governing values and member index, reduced on first use by member_sections
+    _governing_cache: Tuple = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_stack(cls, stack: np.ndarray, combination_names: List[str], member_ids: List[int], x_ratio: np.ndarray):
+        """Reduce a (n_combos, n_members, n_sections, 6) stack in one pass"""
+        max_combo = stack.argmax(axis=0)
+        min_combo = stack.argmin(axis=0)
+        return cls(
+            combination_names=list(combination_names),
+            member_ids=list(member_ids),
+            x_ratio=np.asarray(x_ratio),
+            max=np.take_along_axis(stack, max_combo[None], axis=0)[0],
+            min=np.take_along_axis(stack, min_combo[None], axis=0)[0],
+            max_combo=max_combo,
+            min_combo=min_combo,
+        )
+
+    def governing(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Signed extreme of larger magnitude and its combination index"""
+        use_max = np.abs(self.max) >= np.abs(self.min)
+        return np.where(use_max, self.max, self.min), np.where(use_max, self.max_combo, self.min_combo)
+
+    def member_sections(self, member_id: int, length: float) -> List[Dict]:
+        """
+        Forces of one member in the visualisation 'sections' layout: the
+        governing (larger magnitude) value of each component at the top
+        level, and both extremes under 'max'/'min' so designs see reversals
+        """
+        # Reduced once and reused: designs query every member in turn
+        if self._governing_cache is None:
+            self._governing_cache = (self.governing(), {mid: e for e, mid in enumerate(self.member_ids)})
+        (values, combos), index = self._governing_cache
+        e = index[member_id]
+
+        def named(indices):
+            return {c: self.combination_names[k] for c, k in zip(FORCE_COMPONENTS, indices.tolist())}
+
+        records = []
+        for i, ratio in enumerate(self.x_ratio.tolist()):
+            record = {'position': ratio * length, 'ratio': ratio}
+            record.update(zip(FORCE_COMPONENTS, values[e, i].tolist()))
+            record['combinations'] = named(combos[e, i])
+            record['max'] = dict(zip(FORCE_COMPONENTS, self.max[e, i].tolist()))
+            record['min'] = dict(zip(FORCE_COMPONENTS, self.min[e, i].tolist()))
+            record['max_combinations'] = named(self.max_combo[e, i])
+            record['min_combinations'] = named(self.min_combo[e, i])
+            records.append(record)
+        return records
+
+
+def compute_force_envelope(analyzer, combinations: List = None, n_sections: int = 21) -> ForceEnvelope:
+    """
+    Envelope of section forces for every member over the load combinations.
+    Section forces are sampled once per unit load case, combined with the
+    factor matrix into (n_combos, n_members, n_sections, 6) and reduced.
+    Uses analyzer.case_results when the analyzer has already been solved.
+    After a second-order analysis superposition does not hold, so sections
+    are sampled from each combination's own end forces instead.
+    """
+    combinations = combinations or analyzer.load_combinations
+    loads_by_member = group_loads_by_member(analyzer.loads)
+    x_ratio = np.linspace(0, 1, n_sections)
+
+    if analyzer.p_delta:
+        member_ids = list(analyzer.members.keys())
+        stack = np.zeros((len(combinations), len(member_ids), n_sections, len(FORCE_COMPONENTS)))
+        for e, mid in enumerate(member_ids):
+            detail = DetailedMemberAnalysis(analyzer.members[mid], analyzer.nodes, n_sections)
+            member_loads = loads_by_member.get(mid, [])
+            for k, combo in enumerate(combinations):
+                result = detail.section_results(analyzer.member_forces[combo.name][mid], member_loads, combo.factors)
+                stack[k, e] = _component_columns(result)
+        return ForceEnvelope.from_stack(stack, [c.name for c in combinations], member_ids, x_ratio)
+
+    cases = analyzer.case_results or analyzer.analyze_load_cases()
+
+    case_stack = np.zeros((len(cases.case_names), len(cases.member_ids), n_sections, len(FORCE_COMPONENTS)))
+    for e, mid in enumerate(cases.member_ids):
+        detail = DetailedMemberAnalysis(analyzer.members[mid], analyzer.nodes, n_sections)
+        member_loads = loads_by_member.get(mid, [])
+        for c, name in enumerate(cases.case_names):
+            result = detail.section_results(cases.end_forces[c, e], member_loads, {name: 1.0})
+            case_stack[c, e] = _component_columns(result)
+
+    stack = np.einsum('kc,cmsj->kmsj', cases.factor_matrix(combinations), case_stack)
+    return ForceEnvelope.from_stack(stack, [c.name for c in combinations], cases.member_ids, x_ratio)
 
 
 # ============================================================================
@@ -468,6 +648,8 @@ from .frame_analysis_core import (
     Load as CoreLoad, LoadType as CoreLoadType, 
     LoadCategory as CoreLoadCategory, LoadCombination as CoreLoadCombination
 )
+from .sparse_linalg import SingularStiffnessError
+from .modal_analysis import MASS_TYPES
 
 router = APIRouter(
     tags=["New Frame Analysis"]
@@ -486,6 +668,13 @@ class FrameAnalysisRequest(BaseModel):
     vertical_load: float = Field(0, description="Vertical load in kN/m")
     concrete_grade: str = Field("C30", description="Concrete grade")
     steel_grade: int = Field(500, description="Steel grade")
+    second_order: bool = Field(False, description="P-Delta (second-order) analysis")
+    parallel_design: bool = Field(False, description="Design members on the process pool")
+
+class ModalRequest(FrameAnalysisRequest):
+    n_modes: int = Field(10, ge=1, description="Number of modes")
+    mass_type: str = Field("lumped", description="lumped or consistent")
+    imposed_mass_factor: float = Field(0.3, description="Share of imposed load taken as seismic mass")
 
 class VisualizationRequest(BaseModel):
     analyzer_data: Dict = Field(..., description="Serialized analyzer data or params")
@@ -496,11 +685,8 @@ class VisualizationRequest(BaseModel):
 # ENDPOINTS
 # ============================================================================
 
-@router.post("/api/analyze", response_model=Dict)
-async def analyze_frame_v2(request: FrameAnalysisRequest):
-    """
-    Perform 3D Frame analysis and return visualization data
-    """
+def _build_frame_model(request: FrameAnalysisRequest) -> Frame3DAnalyzer:
+    """Regular plane frame model for the request (nodes, members and loads)"""
     analyzer = Frame3DAnalyzer()
     
     # Create material
@@ -547,30 +733,81 @@ async def analyze_frame_v2(request: FrameAnalysisRequest):
         for row in range(1, request.floors + 1):
             analyzer.add_load(CoreLoad(CoreLoadCategory.WIND, node_id=node_map[(row, 0)], Fx=request.lateral_load / request.floors))
 
-    # Add combination
-    combo = CoreLoadCombination.ULS_dead_imposed()
-    analyzer.add_load_combination(combo)
+    return analyzer
+
+
+def _build_frame_analyzer(request: FrameAnalysisRequest, combinations: List = None) -> Frame3DAnalyzer:
+    """Regular plane frame model for the request, solved for the combinations"""
+    analyzer = _build_frame_model(request)
+
+    # Add combinations
+    for combo in (combinations or [CoreLoadCombination.ULS_dead_imposed()]):
+        analyzer.add_load_combination(combo)
     
     # Analyze
-    analyzer.analyze_all_combinations()
+    try:
+        analyzer.analyze_all_combinations(second_order=request.second_order)
+    except SingularStiffnessError as e:
+        raise HTTPException(status_code=500, detail=f"Matrix singular - unstable structure: {e}")
+    
+    return analyzer
+
+@router.post("/api/analyze", response_model=Dict)
+async def analyze_frame_v2(request: FrameAnalysisRequest):
+    """
+    Perform 3D Frame analysis and return visualization data
+    """
+    analyzer = _build_frame_analyzer(request)
     
     # Generate Visualization Data
     vis_gen = VisualizationDataGenerator()
-    viz_data = vis_gen.generate_3d_frame_data(analyzer, combo.name)
+    viz_data = vis_gen.generate_3d_frame_data(analyzer, analyzer.load_combinations[0].name)
+    if analyzer.p_delta:
+        viz_data["p_delta"] = {name: result.summary() for name, result in analyzer.p_delta.items()}
     
     return viz_data
 
+@router.post("/api/analyze/modal", response_model=Dict)
+async def analyze_modal_v2(request: ModalRequest):
+    """
+    Modal analysis of the frame: periods, participation factors, effective
+    masses and mode shapes (per node dx, dy, dz)
+    """
+    if request.mass_type not in MASS_TYPES:
+        raise HTTPException(status_code=400, detail=f"mass_type must be one of {MASS_TYPES}")
+
+    analyzer = _build_frame_model(request)
+    try:
+        modal = analyzer.modal_analysis(
+            n_modes=request.n_modes,
+            mass_type=request.mass_type,
+            mass_source={CoreLoadCategory.DEAD: 1.0, CoreLoadCategory.IMPOSED: request.imposed_mass_factor},
+        )
+    except SingularStiffnessError:
+        raise HTTPException(status_code=500, detail="Matrix singular - unstable structure")
+
+    nodes = sorted(analyzer.nodes.values(), key=lambda n: n.index)
+    translations = np.array([[6 * n.index + d for d in range(3)] for n in nodes])
+    return {
+        "modes": modal.summary(),
+        "total_mass": dict(zip(modal.directions, modal.total_mass.tolist())),
+        "node_ids": [n.id for n in nodes],
+        "mode_shapes": np.moveaxis(modal.mode_shapes[translations], 2, 0).tolist(),
+    }
+
 @router.post("/api/design/all", response_model=Dict)
 async def analyze_and_design_all(request: FrameAnalysisRequest):
     """
     Perform 3D Frame analysis AND automatically design all building members
     """
-    # 1. Reuse analysis logic
-    viz_data = await analyze_frame_v2(request)
+    # 1. Analyse all BS 8110 ULS combinations; visualise the first (1.4D + 1.6L)
+    analyzer = _build_frame_analyzer(request, CoreLoadCombination.bs8110_uls())
+    viz_data = VisualizationDataGenerator.generate_3d_frame_data(analyzer, analyzer.load_combinations[0].name)
+    envelope = compute_force_envelope(analyzer)
     
-    # 2. Trigger Design Orchestrator
-    orchestrator = DesignOrchestrator(viz_data)
-    design_results = orchestrator.design_all_members()
+    # 2. Trigger Design Orchestrator on the envelope forces
+    orchestrator = DesignOrchestrator(viz_data, envelope=envelope)
+    design_results = orchestrator.design_all_members(parallel=request.parallel_design)
     
     return {
         "analysis": viz_data,
@@ -637,16 +874,25 @@ class VisualizationDataGenerator:
         # Generate member data with internal forces
         members_data = []
         member_forces = analyzer.member_forces[combination_name]
+        combo = next((c for c in analyzer.load_combinations if c.name == combination_name), analyzer.load_combinations[0])
+        loads_by_member = group_loads_by_member(analyzer.loads)
         
         for member in analyzer.members.values():
             forces = member_forces[member.id]
             
+            # Local end displacements for the deflected shape
+            R = member.rotation_matrix(analyzer.nodes)
+            d_start = U[analyzer.nodes[member.start_node_id].global_dof_indices()].reshape(2, 3)
+            d_end = U[analyzer.nodes[member.end_node_id].global_dof_indices()].reshape(2, 3)
+            end_displacements = np.concatenate([d_start, d_end]) @ R.T
+            
             # Calculate detailed section forces
             detail_analyzer = DetailedMemberAnalysis(member, analyzer.nodes)
-            sections = detail_analyzer.calculate_internal_forces(
+            sections = detail_analyzer.section_results(
                 forces,
-                analyzer.loads,
-                analyzer.load_combinations[0].factors  # Use appropriate combo
+                loads_by_member.get(member.id, []),
+                combo.factors,
+                end_displacements.ravel()
             )
             
             members_data.append({
@@ -681,21 +927,7 @@ class VisualizationDataGenerator:
                         'Mz': forces[11]
                     }
                 },
-                'sections': [
-                    {
-                        'position': s.x,
-                        'ratio': s.x_ratio,
-                        'N': s.N,
-                        'Vy': s.Vy,
-                        'Vz': s.Vz,
-                        'T': s.T,
-                        'My': s.My,
-                        'Mz': s.Mz,
-                        'delta_y': s.delta_y,
-                        'delta_z': s.delta_z
-                    }
-                    for s in sections
-                ]
+                'sections': sections.to_records()
             })
         
         return {
@@ -806,7 +1038,7 @@ def example_continuous_beam():
     
     # Create nodes (4 nodes for 3 spans)
     supports = [
-        {'id': 1, 'support': {'dy': True}},  # Pinned
+        {'id': 1, 'support': {'dx': True, 'dy': True}},  # Pinned
         {'id': 2, 'support': {'dy': True}},  # Roller
         {'id': 3, 'support': {'dy': True}},  # Roller
         {'id': 4, 'support': {'dy': True}}   # Roller
@@ -1,43 +1,222 @@
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures.process import BrokenProcessPool
+import json
 import math
+import time
 
 # Import existing design modules by reference
 from calculations.Beams.rc_beam_design import (
     BS8110Designer, BeamDesignRequest, BeamType, SupportCondition, 
     MaterialProperties, RectangularBeamGeometry, ConcreteGrade, SteelGrade
 )
+from calculations.Beams.beam_batch import get_pool, reset_pool
 from calculations.Columns.Interactio import ColumnDesignBS8110
 from calculations.Foundations.New_foundation import BSFoundationDesigner, FoundationInput
 from calculations.Slabs.enhanced_slab_backend import EnhancedSlabDesigner, SlabDesignRequest
 from calculations.Walls.New_wall import RCWallDesigner, WallInput
 
+# Member types in design order
+DESIGN_KINDS = ('beams', 'columns', 'foundations', 'slabs')
+
+# Forces are compared to this many decimals (kN, kNm) when deduplicating, so
+# members that differ only by round-off share one design
+SIGNATURE_DECIMALS = 3
+
+
+# ============================================================================
+# DESIGN KERNELS (plain-dict payloads so they can run in pool workers)
+# ============================================================================
+
+def design_beam_payload(payload: Dict) -> Dict:
+    """Calls BS8110Designer for beam design"""
+    request = BeamDesignRequest(
+        beam_type=BeamType.RECTANGULAR,
+        support_condition=SupportCondition.CONTINUOUS, # Default for frames
+        span_length=payload['length'],
+        design_moments=payload['moments'],
+        design_shears=payload['shears'],
+        moment_positions=payload['positions'],
+        shear_positions=payload['positions'],
+        materials=MaterialProperties(
+            concrete_grade=ConcreteGrade.C30,
+            steel_grade=SteelGrade.GRADE_460
+        ),
+        rectangular_geometry=RectangularBeamGeometry(
+            width=payload['width'],
+            depth=payload['depth'],
+            cover=25.0
+        )
+    )
+    
+    designer = BS8110Designer()
+    design_res = designer.design_beam(request)
+    return {
+        'status': design_res.summary.all_designs_ok,
+        'details': design_res.dict()
+    }
+
+
+def design_column_payload(payload: Dict) -> Dict:
+    """Calls ColumnDesignBS8110 for column design (forces in N and Nmm)"""
+    max_mz, max_my = payload['Mx'], payload['My']
+
+    # Decide mode based on moments
+    mode = 'axial'
+    if max_mz > 5e6 and max_my > 5e6: # Threshold for significant moment
+        mode = 'biaxial'
+    elif max_mz > 5e6 or max_my > 5e6:
+        mode = 'uniaxial'
+        
+    col_designer = ColumnDesignBS8110(
+        b=payload['width'],
+        h=payload['depth'],
+        N=payload['N'],
+        Mx=max_mz,
+        My=max_my,
+        lo=payload['lo'],
+        braced=True
+    )
+    return {
+        'mode': mode,
+        'status': 'success',
+        'steel_area': col_designer.Asc_req,
+        'steel_percentage': col_designer.rho * 100,
+        'classification': 'Slender' if col_designer.is_slender else 'Short'
+    }
+
+
+def design_foundation_payload(payload: Dict) -> Dict:
+    """Calls BSFoundationDesigner for base reaction nodes"""
+    designer = BSFoundationDesigner(FoundationInput(**payload))
+    return designer.design_pad_foundation().dict()
+
+
+def design_slab_payload(payload: Dict) -> Dict:
+    """Calls EnhancedSlabDesigner for slabs"""
+    designer = EnhancedSlabDesigner(SlabDesignRequest(**payload))
+    return designer.design_two_way_slab().dict()
+
+
+_DESIGNERS = {
+    'beams': design_beam_payload,
+    'columns': design_column_payload,
+    'foundations': design_foundation_payload,
+    'slabs': design_slab_payload,
+}
+
+
+def design_chunk(kind: str, payloads: List[Dict]) -> Tuple[List[Dict], float]:
+    """
+    Design a chunk of unique payloads of one member type.
+    Failures are returned per item, never raised, so one bad member cannot
+    sink its chunk. Returns (results, elapsed seconds).
+    """
+    start = time.perf_counter()
+    designer = _DESIGNERS[kind]
+    results = []
+    for payload in payloads:
+        try:
+            results.append(designer(payload))
+        except Exception as e:
+            results.append({'status': 'error', 'message': f"{type(e).__name__}: {e}"})
+    return results, time.perf_counter() - start
+
+
+def _rounded(value):
+    if isinstance(value, float):
+        return round(value, SIGNATURE_DECIMALS) + 0.0  # + 0.0 folds -0.0 into 0.0
+    if isinstance(value, dict):
+        return {k: _rounded(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_rounded(v) for v in value]
+    return value
+
+
+def design_signature(payload: Dict) -> str:
+    """Key identifying payloads that produce the same design"""
+    return json.dumps(_rounded(payload), sort_keys=True, default=str)
+
+
 class DesignOrchestrator:
     """
     Bridges the results of 3D Frame Analysis with detailed BS Code member design.
     Classifies members and automates the design process based on calculated forces.
     """
     
-    def __init__(self, analyzed_data: Dict):
+    def __init__(self, analyzed_data: Dict, envelope: Optional[Any] = None):
         """
         analyzed_data: The output from VisualizationDataGenerator.generate_3d_frame_data
         Contains nodes, members (with section forces), and combination data.
+        envelope: Optional ForceEnvelope (New_frame.compute_force_envelope); when
+        given, members are designed for the governing forces of all combinations.
         """
         self.data = analyzed_data
         self.members = analyzed_data.get('members', [])
         self.nodes = {n['id']: n for n in analyzed_data.get('nodes', [])}
+        self.envelope = envelope
+
+    def _member_sections(self, member: Dict) -> List[Dict]:
+        """Section forces to design for: envelope if available, else the single combination"""
+        if self.envelope is not None:
+            return self.envelope.member_sections(member['id'], member['length'])
+        return member.get('sections', [])
         
-    def design_all_members(self) -> Dict[str, Any]:
-        """Runs the complete design suite for the building"""
-        results = {
-            'beams': [],
-            'columns': [],
-            'slabs': [],
-            'foundations': [],
-            'walls': []
+    def design_all_members(self, parallel: bool = False, chunk_size: int = 32) -> Dict[str, Any]:
+        """
+        Runs the complete design suite for the building.
+        Members with identical section/force signatures are designed once and
+        the result is shared. parallel=True partitions the unique designs by
+        member type into chunks for the shared process pool.
+        The result also carries per-phase 'timings' (seconds), the
+        'deduplication' counts per member type and whether the designs
+        actually ran on the pool ('parallel').
+        """
+        timings = {}
+        start = time.perf_counter()
+        tasks = self._collect_tasks()
+        timings['classify'] = time.perf_counter() - start
+
+        # Deduplicate: one payload per signature, owners point at it
+        start = time.perf_counter()
+        unique = {kind: [] for kind in DESIGN_KINDS}
+        owners = {kind: [] for kind in DESIGN_KINDS}
+        for kind in DESIGN_KINDS:
+            seen = {}
+            for owner, payload in tasks[kind]:
+                key = design_signature(payload)
+                if key not in seen:
+                    seen[key] = len(unique[kind])
+                    unique[kind].append(payload)
+                owners[kind].append((owner, seen[key]))
+        timings['deduplicate'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        designed, compute, pooled = self._run_designs(unique, parallel, chunk_size)
+        timings['design'] = time.perf_counter() - start
+        for kind in DESIGN_KINDS:
+            timings[f'{kind}_compute'] = compute[kind]
+
+        start = time.perf_counter()
+        results = {kind: [] for kind in DESIGN_KINDS}
+        results['walls'] = []
+        for kind in DESIGN_KINDS:
+            for owner, u in owners[kind]:
+                results[kind].append({**owner, **designed[kind][u]})
+        timings['assemble'] = time.perf_counter() - start
+
+        results['timings'] = {phase: round(t, 4) for phase, t in timings.items()}
+        results['deduplication'] = {
+            kind: {'members': len(tasks[kind]), 'unique_designs': len(unique[kind])} for kind in DESIGN_KINDS
         }
-        
-        # 1. Process Beams and Columns
+        results['parallel'] = pooled
+        return results
+
+    def _collect_tasks(self) -> Dict[str, List[Tuple[Dict, Dict]]]:
+        """Classify members and build their design payloads: kind -> [(owner fields, payload)]"""
+        tasks = {kind: [] for kind in DESIGN_KINDS}
+
+        # 1. Beams and Columns
         for member in self.members:
             # Determine member orientation
             start_node = self.nodes[member['startNode']]
@@ -50,130 +229,113 @@ class DesignOrchestrator:
             # Simple heuristic: vertical = column, horizontal = beam
             # In structural viewer coordinates: Y is up.
             if dy > max(dx, dz) * 2:
-                results['columns'].append(self._design_column(member))
+                tasks['columns'].append(({'member_id': member['id']}, self._column_payload(member)))
             else:
-                results['beams'].append(self._design_beam(member))
+                tasks['beams'].append(({'member_id': member['id']}, self._beam_payload(member)))
                 
-        # 2. Process Foundations (Base nodes at story height 0)
+        # 2. Foundations (Base nodes at story height 0)
         base_nodes = [n for n in self.nodes.values() if abs(n['y']) < 0.001]
         for node in base_nodes:
-            results['foundations'].append(self._design_foundation(node))
+            tasks['foundations'].append(({'node_id': node['id']}, self._foundation_payload(node)))
             
-        # 3. Process Slabs (Inferred from bays - this usually needs explicit slab elements)
+        # 3. Slabs (Inferred from bays - this usually needs explicit slab elements)
         # For now, we look for 'slab' type entries if provided in the source model, 
         # or we generate them based on the 3D grid.
         # Assuming the front-end sends a separate 'slabs' list or they are marked in 'members'.
-        if 'slabs' in self.data:
-            for slab in self.data['slabs']:
-                results['slabs'].append(self._design_slab(slab))
-                
-        return results
+        for slab in self.data.get('slabs', []):
+            tasks['slabs'].append(({}, self._slab_payload(slab)))
 
-    def _design_beam(self, member: Dict) -> Dict:
-        """Calls BS8110Designer for beam design"""
-        # Extract critical forces from sections
-        sections = member.get('sections', [])
-        moments = [s['Mz'] for s in sections]
-        shears = [s['Vy'] for s in sections]
-        
-        # Build request
-        request = BeamDesignRequest(
-            beam_type=BeamType.RECTANGULAR,
-            support_condition=SupportCondition.CONTINUOUS, # Default for frames
-            span_length=member['length'],
-            design_moments=moments,
-            design_shears=shears,
-            moment_positions=[s['position'] for s in sections],
-            shear_positions=[s['position'] for s in sections],
-            materials=MaterialProperties(
-                concrete_grade=ConcreteGrade.C30,
-                steel_grade=SteelGrade.GRADE_460
-            ),
-            rectangular_geometry=RectangularBeamGeometry(
-                width=member['section']['width'],
-                depth=member['section']['depth'],
-                cover=25.0
-            )
-        )
-        
-        designer = BS8110Designer()
-        design_res = designer.design_beam(request)
+        return tasks
+
+    def _run_designs(self, unique: Dict[str, List[Dict]], parallel: bool, chunk_size: int):
+        """
+        Design every unique payload. Returns (kind -> results in payload order,
+        kind -> summed compute seconds, whether the pool was used). A single
+        chunk, or a broken pool, is designed in this process.
+        """
+        chunk_size = max(chunk_size, 1)
+        chunks = [
+            (kind, i, unique[kind][i:i + chunk_size])
+            for kind in DESIGN_KINDS
+            for i in range(0, len(unique[kind]), chunk_size)
+        ]
+        designed = {kind: [None] * len(unique[kind]) for kind in DESIGN_KINDS}
+        compute = {kind: 0.0 for kind in DESIGN_KINDS}
+
+        outputs = None
+        if parallel and len(chunks) > 1:
+            try:
+                pool = get_pool()
+                futures = [pool.submit(design_chunk, kind, payloads) for kind, _, payloads in chunks]
+                outputs = [future.result() for future in futures]
+            except BrokenProcessPool:
+                # A worker died: drop the pool and finish in this process
+                reset_pool()
+                outputs = None
+        pooled = outputs is not None
+        if outputs is None:
+            outputs = [design_chunk(kind, payloads) for kind, _, payloads in chunks]
+
+        for (kind, offset, _), (chunk_results, elapsed) in zip(chunks, outputs):
+            designed[kind][offset:offset + len(chunk_results)] = chunk_results
+            compute[kind] += elapsed
+        return designed, compute, pooled
+
+    def _beam_payload(self, member: Dict) -> Dict:
+        """
+        Design inputs of a beam: critical forces from sections. With an
+        envelope both the max and min of every section are passed, so a
+        section that hogs in one combination and sags in another is designed
+        for both faces.
+        """
+        sections = self._member_sections(member)
+        if sections and 'max' in sections[0]:
+            extremes = [s['max'] for s in sections] + [s['min'] for s in sections]
+            positions = [s['position'] for s in sections] * 2
+        else:
+            extremes = sections
+            positions = [s['position'] for s in sections]
         return {
-            'member_id': member['id'],
-            'status': design_res.summary.all_designs_ok,
-            'details': design_res.dict()
+            'length': member['length'],
+            'width': member['section']['width'],
+            'depth': member['section']['depth'],
+            'moments': [s['Mz'] for s in extremes],
+            'shears': [s['Vy'] for s in extremes],
+            'positions': positions,
         }
 
-    def _design_column(self, member: Dict) -> Dict:
-        """Calls ColumnDesignBS8110 for column design"""
-        # Get maximum axial load and moments
-        sections = member.get('sections', [])
-        max_n = max([abs(s['N']) for s in sections]) * 1000 # kN to N
-        max_mz = max([abs(s['Mz']) for s in sections]) * 1e6 # kNm to Nmm
-        max_my = max([abs(s['My']) for s in sections]) * 1e6 # kNm to Nmm (if 3D)
-        
-        # Decide mode based on moments
-        mode = 'axial'
-        if max_mz > 5e6 and max_my > 5e6: # Threshold for significant moment
-            mode = 'biaxial'
-        elif max_mz > 5e6 or max_my > 5e6:
-            mode = 'uniaxial'
-            
-        col_designer = ColumnDesignBS8110(
-            b=member['section']['width'],
-            h=member['section']['depth'],
-            N=max_n,
-            Mx=max_mz,
-            My=max_my,
-            lo=member['length'] * 1000,
-            braced=True
-        )
-        
-        # Note: The existing Interactio module has some logic errors in provided code 
-        # (missing dict definitions in some snippets), but here we call it as it is.
-        # We wrap in try-except for robustness during integration.
-        try:
-            # We mimic the router behavior
-            return {
-                'member_id': member['id'],
-                'mode': mode,
-                'status': 'success',
-                'steel_area': col_designer.Asc_req,
-                'steel_percentage': col_designer.rho * 100,
-                'classification': 'Slender' if col_designer.is_slender else 'Short'
-            }
-        except Exception as e:
-            return {'member_id': member['id'], 'status': 'error', 'message': str(e)}
+    def _column_payload(self, member: Dict) -> Dict:
+        """Design inputs of a column: maximum axial load and moments"""
+        sections = self._member_sections(member)
+        return {
+            'width': member['section']['width'],
+            'depth': member['section']['depth'],
+            'N': max([abs(s['N']) for s in sections]) * 1000, # kN to N
+            'Mx': max([abs(s['Mz']) for s in sections]) * 1e6, # kNm to Nmm
+            'My': max([abs(s['My']) for s in sections]) * 1e6, # kNm to Nmm (if 3D)
+            'lo': member['length'] * 1000,
+        }
 
-    def _design_foundation(self, node: Dict) -> Dict:
-        """Calls BSFoundationDesigner for base reaction nodes"""
-        disp = node.get('displacement', {})
+    def _foundation_payload(self, node: Dict) -> Dict:
+        """Foundation inputs for a base node"""
         # Node reactions are usually stored in analyzer results 
         # Assuming for now we use nodal loads as reactions if it's a fixed node
         # In a real FEM solver, we'd extract specific reaction values.
-        
-        inputs = FoundationInput(
-            foundation_type='pad',
-            dead_load=150.0, # Dummy values if not in node data
-            live_load=100.0,
-            soil_bearing=200.0,
-            column_width=450.0,
-            column_depth=450.0
-        )
-        
-        designer = BSFoundationDesigner(inputs)
-        return designer.design_pad_foundation().dict()
-
-    def _design_slab(self, slab: Dict) -> Dict:
-        """Calls EnhancedSlabDesigner for slabs"""
-        request = SlabDesignRequest(
-            slabType='two-way',
-            support='continuous',
-            deadLoad=slab.get('deadLoad', 5.0),
-            liveLoad=slab.get('liveLoad', 3.0),
-            lx=slab.get('width', 6.0),
-            ly=slab.get('depth', 6.0)
-        )
-        
-        designer = EnhancedSlabDesigner(request)
-        return designer.design_two_way_slab().dict()
+        return {
+            'foundation_type': 'pad',
+            'dead_load': 150.0, # Dummy values if not in node data
+            'live_load': 100.0,
+            'soil_bearing': 200.0,
+            'column_width': 450.0,
+            'column_depth': 450.0,
+        }
+
+    def _slab_payload(self, slab: Dict) -> Dict:
+        return {
+            'slabType': 'two-way',
+            'support': 'continuous',
+            'deadLoad': slab.get('deadLoad', 5.0),
+            'liveLoad': slab.get('liveLoad', 3.0),
+            'lx': slab.get('width', 6.0),
+            'ly': slab.get('depth', 6.0),
+        }
@@ -1,7 +1,16 @@
 import numpy as np
+import scipy.sparse as sp
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 import copy
+from .sparse_linalg import factorize, assemble_csr, SingularStiffnessError, FACTOR_CACHE
+from .modal_analysis import G_ACC, ModalResults, frame2d_mass_local, solve_modes
+from .response_spectrum import ResponseSpectrumResults, response_spectrum
+from .p_delta import frame2d_geometric_local, solve_p_delta
+from ..Beams.influence_lines import InfluenceLines
+
+# Models with more DOFs than this are assembled sparse when method="auto"
+SPARSE_DOF_THRESHOLD = 300
 
 @dataclass
 class Node:
@@ -13,6 +22,7 @@ class Node:
     disp: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
     # Loads
     load: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0]) # [Fx, Fy, Mz]
+    mass: float = 0.0 # Lumped translational mass (t), modal analysis only
 
 @dataclass
 class Element:
@@ -44,11 +54,39 @@ class FEM2DSolver:
             self.nodes[node_id].load[1] += fy
             self.nodes[node_id].load[2] += mz
 
+    def add_nodal_mass(self, node_id: int, mass: float):
+        if node_id in self.nodes:
+            self.nodes[node_id].mass += mass
+
     def add_udl(self, element_id: int, w: float):
         if element_id in self.elements:
             self.elements[element_id].udl = w
 
-    def solve(self):
+    def solve(
+        self,
+        method: str = "auto",
+        use_cache: bool = True,
+        second_order: bool = False,
+        tolerance: float = 1e-6,
+        max_iterations: int = 20,
+    ):
+        """
+        Solve the frame.
+        method: "dense" (reference path), "sparse" (batched assembly + sparse
+        factorization) or "auto" (sparse above SPARSE_DOF_THRESHOLD DOFs)
+        use_cache: reuse a factorization of the same topology from FACTOR_CACHE
+        second_order: P-Delta analysis (always on the sparse path); the result
+        gains a "p_delta" entry with iteration counts and amplification factors
+        """
+        if method == "auto":
+            method = "sparse" if 3 * len(self.nodes) > SPARSE_DOF_THRESHOLD else "dense"
+        if method == "sparse" or second_order:
+            return self._solve_sparse(use_cache, second_order, tolerance, max_iterations)
+        if method != "dense":
+            raise ValueError(f"Unknown solve method: {method}")
+        return self._solve_dense()
+
+    def _solve_dense(self):
         n_nodes = len(self.nodes)
         dof = n_nodes * 3
         K_global = np.zeros((dof, dof))
@@ -151,6 +189,356 @@ class FEM2DSolver:
             "elements": {eid: e.forces for eid, e in self.elements.items()}
         }
 
+    def _element_arrays(self):
+        """
+        Batched element geometry and matrices.
+        Returns (k_local, T, L, dofs, udl) with k_local/T of shape (n_el, 6, 6)
+        """
+        elements = list(self.elements.values())
+        n_el = len(elements)
+        max_id = max(self.nodes) if self.nodes else 0
+        xs = np.zeros(max_id + 1)
+        ys = np.zeros(max_id + 1)
+        for nid, node in self.nodes.items():
+            xs[nid] = node.x
+            ys[nid] = node.y
+
+        ni = np.array([el.node_i for el in elements], dtype=int)
+        nj = np.array([el.node_j for el in elements], dtype=int)
+        E = np.array([el.E for el in elements], dtype=float)
+        A = np.array([el.A for el in elements], dtype=float)
+        I = np.array([el.I for el in elements], dtype=float)
+        udl = np.array([el.udl for el in elements], dtype=float)
+
+        dx = xs[nj] - xs[ni]
+        dy = ys[nj] - ys[ni]
+        L = np.sqrt(dx**2 + dy**2)
+        c = dx / L
+        s = dy / L
+
+        EA_L = E * A / L
+        EI = E * I
+        k = np.zeros((n_el, 6, 6))
+        k[:, 0, 0] = k[:, 3, 3] = EA_L
+        k[:, 0, 3] = k[:, 3, 0] = -EA_L
+        k[:, 1, 1] = k[:, 4, 4] = 12 * EI / L**3
+        k[:, 1, 4] = k[:, 4, 1] = -12 * EI / L**3
+        k[:, 1, 2] = k[:, 2, 1] = k[:, 1, 5] = k[:, 5, 1] = 6 * EI / L**2
+        k[:, 2, 4] = k[:, 4, 2] = k[:, 4, 5] = k[:, 5, 4] = -6 * EI / L**2
+        k[:, 2, 2] = k[:, 5, 5] = 4 * EI / L
+        k[:, 2, 5] = k[:, 5, 2] = 2 * EI / L
+
+        T = np.zeros((n_el, 6, 6))
+        for o in (0, 3):
+            T[:, o, o] = c
+            T[:, o, o + 1] = s
+            T[:, o + 1, o] = -s
+            T[:, o + 1, o + 1] = c
+            T[:, o + 2, o + 2] = 1.0
+
+        base_i = 3 * (ni - 1)
+        base_j = 3 * (nj - 1)
+        dofs = np.stack([base_i, base_i + 1, base_i + 2, base_j, base_j + 1, base_j + 2], axis=1)
+
+        return k, T, L, dofs, udl
+
+    @staticmethod
+    def _fixed_end_forces(L: np.ndarray, udl: np.ndarray) -> np.ndarray:
+        """Local fixed end forces (n_el, 6) for the element UDLs"""
+        f = np.zeros((len(L), 6))
+        f[:, 1] = f[:, 4] = udl * L / 2
+        f[:, 2] = udl * L**2 / 12
+        f[:, 5] = -udl * L**2 / 12
+        return f
+
+    def topology_key(self) -> str:
+        """Hash of everything that defines the reduced stiffness matrix"""
+        node_ids = sorted(self.nodes)
+        return FACTOR_CACHE.make_key(
+            np.array(node_ids, dtype=np.int64),
+            np.array([[self.nodes[i].x, self.nodes[i].y] for i in node_ids], dtype=float),
+            np.array([self.nodes[i].fixity for i in node_ids], dtype=bool),
+            np.array([[el.node_i, el.node_j] for el in self.elements.values()], dtype=np.int64),
+            np.array([[el.E, el.A, el.I] for el in self.elements.values()], dtype=float),
+        )
+
+    def _solve_sparse(
+        self,
+        use_cache: bool = True,
+        second_order: bool = False,
+        tolerance: float = 1e-6,
+        max_iterations: int = 20,
+    ):
+        dof = 3 * len(self.nodes)
+
+        # 1. Batched element matrices (COO -> CSR assembly only when factorizing)
+        k, T, L, dofs, udl = self._element_arrays()
+
+        F_global = np.zeros(dof)
+        f_fixed_global = np.einsum('eji,ej->ei', T, self._fixed_end_forces(L, udl))
+        np.add.at(F_global, dofs.ravel(), f_fixed_global.ravel())
+
+        fixed = np.zeros(dof, dtype=bool)
+        for node_id, node in self.nodes.items():
+            idx = 3 * (node_id - 1)
+            F_global[idx:idx+3] += node.load
+            fixed[idx:idx+3] = node.fixity
+
+        # 2. Partition and solve
+        free = np.flatnonzero(~fixed)
+
+        p_delta = None
+        try:
+            factor = self._stiffness_factor(k, T, dofs, free, use_cache)
+            u_f = factor.solve(F_global[free])
+            if second_order:
+                p_delta = self._p_delta(factor, F_global[free], u_f, k, T, L, dofs, free, tolerance, max_iterations)
+                u_f = p_delta.u
+        except SingularStiffnessError:
+            print("Singular matrix - Mechanism or Unstable")
+            return None
+
+        u_global = np.zeros(dof)
+        u_global[free] = u_f
+
+        for node_id, node in self.nodes.items():
+            idx = 3 * (node_id - 1)
+            node.disp = u_global[idx:idx+3].tolist()
+
+        # 3. Member forces for all elements at once
+        if p_delta is None:
+            self._calculate_member_forces_batch(u_global, k, T, L, dofs, udl)
+        else:
+            # Second order: end forces include the P-Delta shears, (k + kg) u
+            u_linear = np.zeros(dof)
+            u_linear[free] = p_delta.u_linear
+            M_linear = self._end_moments(u_linear, k, T, L, dofs, udl)
+            k_total = k + frame2d_geometric_local(L, self._axial_forces(u_global, k, T, dofs))
+            self._calculate_member_forces_batch(u_global, k_total, T, L, dofs, udl)
+            M_second = self._end_moments(u_global, k_total, T, L, dofs, udl)
+
+        results = {
+            "max_disp": float(np.max(np.abs(u_global))) if dof else 0.0,
+            "elements": {eid: e.forces for eid, e in self.elements.items()}
+        }
+        if p_delta is not None:
+            peak = np.max(M_linear) if M_linear.size else 0.0
+            results["p_delta"] = dict(
+                p_delta.summary(),
+                moment_amplification=float(np.max(M_second) / peak) if peak > 0 else 1.0,
+            )
+        return results
+
+    def _axial_forces(self, u_global, k, T, dofs) -> np.ndarray:
+        """Member axial forces (tension positive) from the nodal displacements"""
+        u_loc = np.einsum('eij,ej->ei', T, u_global[dofs])
+        return np.einsum('ej,ej->e', k[:, 3, :], u_loc)
+
+    def _end_moments(self, u_global, k, T, L, dofs, udl) -> np.ndarray:
+        """Absolute end moments (n_el, 2)"""
+        u_loc = np.einsum('eij,ej->ei', T, u_global[dofs])
+        f = np.einsum('eij,ej->ei', k, u_loc) - self._fixed_end_forces(L, udl)
+        return np.abs(f[:, [2, 5]])
+
+    def _p_delta(self, factor, F_ff, u_f, k, T, L, dofs, free, tolerance, max_iterations):
+        """Second-order solve preconditioned with the linear factor"""
+        dof = 3 * len(self.nodes)
+
+        def geometric(u_ff):
+            u_global = np.zeros(dof)
+            u_global[free] = u_ff
+            kg = frame2d_geometric_local(L, self._axial_forces(u_global, k, T, dofs))
+            return self._reduced_stiffness(kg, T, dofs, free)
+
+        return solve_p_delta(
+            self._reduced_stiffness(k, T, dofs, free), factor, F_ff, geometric,
+            u_f, tolerance, max_iterations,
+        )
+
+    def _free_dofs(self) -> np.ndarray:
+        fixed = np.zeros(3 * len(self.nodes), dtype=bool)
+        for node_id, node in self.nodes.items():
+            fixed[3 * (node_id - 1):3 * (node_id - 1) + 3] = node.fixity
+        return np.flatnonzero(~fixed)
+
+    def _reduced_stiffness(self, k, T, dofs, free):
+        K_el = np.einsum('eji,ejk,ekl->eil', T, k, T)
+        return assemble_csr(K_el, dofs, 3 * len(self.nodes))[free][:, free]
+
+    def _stiffness_factor(self, k, T, dofs, free, use_cache: bool = True):
+        """Factor of the reduced stiffness, shared through FACTOR_CACHE"""
+        if use_cache:
+            return FACTOR_CACHE.get_or_factorize(
+                self.topology_key(), lambda: self._reduced_stiffness(k, T, dofs, free)
+            )
+        return factorize(self._reduced_stiffness(k, T, dofs, free))
+
+    def mass_matrix(self, mass_type: str = "lumped", density: float = 25.0, udl_as_mass: bool = True):
+        """
+        Global sparse mass matrix (tonnes).
+        Element mass per metre is the self weight density (kN/m3) * A / g,
+        plus |udl| / g when udl_as_mass (floor loads carried by the beams),
+        plus any nodal masses.
+        """
+        dof = 3 * len(self.nodes)
+        _, T, L, dofs, udl = self._element_arrays()
+        A = np.array([el.A for el in self.elements.values()], dtype=float)
+        m = density * A / G_ACC
+        if udl_as_mass:
+            m = m + np.abs(udl) / G_ACC
+
+        M_local = frame2d_mass_local(L, m, mass_type)
+        if mass_type == "lumped":
+            M_el = M_local  # translational lumps are invariant under rotation
+        else:
+            M_el = np.einsum('eji,ejk,ekl->eil', T, M_local, T)
+        M = assemble_csr(M_el, dofs, dof)
+
+        nodal = np.zeros(dof)
+        for node_id, node in self.nodes.items():
+            nodal[3 * (node_id - 1):3 * (node_id - 1) + 2] = node.mass
+        return M + sp.diags(nodal)
+
+    def modal_analysis(
+        self,
+        n_modes: int = 10,
+        mass_type: str = "lumped",
+        density: float = 25.0,
+        udl_as_mass: bool = True,
+        use_cache: bool = True,
+    ) -> ModalResults:
+        """
+        First n_modes natural modes (sparse shift-invert eigsh), with
+        participation factors and effective masses in X and Y.
+        The stiffness factorization is shared with solve() through FACTOR_CACHE.
+        """
+        k, T, L, dofs, _ = self._element_arrays()
+        free = self._free_dofs()
+        factor = self._stiffness_factor(k, T, dofs, free, use_cache)
+        M_ff = self.mass_matrix(mass_type, density, udl_as_mass).tocsr()[free][:, free]
+
+        dof = 3 * len(self.nodes)
+        influence = np.zeros((dof, 2))
+        influence[0::3, 0] = 1.0
+        influence[1::3, 1] = 1.0
+        return solve_modes(
+            self._reduced_stiffness(k, T, dofs, free), M_ff, free, dof,
+            influence, ("X", "Y"), n_modes, factor,
+        )
+
+    def response_spectrum(
+        self,
+        spectrum,
+        direction: str = "X",
+        n_modes: int = 12,
+        method: str = "CQC",
+        damping: float = 0.05,
+        mass_type: str = "lumped",
+        density: float = 25.0,
+        udl_as_mass: bool = True,
+    ) -> ResponseSpectrumResults:
+        """
+        Response-spectrum analysis for ground motion along X or Y.
+        spectrum(T) gives the design spectral acceleration in m/s2.
+        Member end forces are (N_i, V_i, M_i, N_j, V_j, M_j) magnitudes.
+        """
+        modal = self.modal_analysis(n_modes, mass_type, density, udl_as_mass)
+        k, T, _, dofs, _ = self._element_arrays()
+        heights = np.zeros(len(self.nodes))
+        for node_id, node in self.nodes.items():
+            heights[node_id - 1] = node.y
+        return response_spectrum(
+            modal, spectrum, direction,
+            self.mass_matrix(mass_type, density, udl_as_mass),
+            k, T, dofs, list(self.elements.keys()),
+            ("N_i", "V_i", "M_i", "N_j", "V_j", "M_j"),
+            heights, 3, method, damping,
+        )
+
+    def influence_lines(
+        self,
+        path: List[int],
+        n_positions: int = 1001,
+        n_points: int = 21,
+        use_cache: bool = True,
+    ) -> InfluenceLines:
+        """
+        Influence lines for a unit downward (global -Y) load travelling along
+        the chain of elements `path` (e.g. a deck or crane girder, listed in
+        travel order). Responses are the sagging moment and shear at n_points
+        stations per path element and the vertical reaction at every support
+        with restrained Y. All load positions are back-substituted together
+        through one factorization of the stiffness.
+        """
+        dof = 3 * len(self.nodes)
+        k, T, L, dofs, _ = self._element_arrays()
+        position_of = {eid: e for e, eid in enumerate(self.elements)}
+        path_idx = np.array([position_of[eid] for eid in path], dtype=int)
+        L_path = L[path_idx]
+        starts = np.concatenate([[0.0], np.cumsum(L_path)])
+        n_positions = max(n_positions, 2)
+
+        positions = np.linspace(0.0, starts[-1], n_positions)
+        seg = np.clip(np.searchsorted(starts, positions, side="right") - 1, 0, len(path) - 1)
+        a = positions - starts[seg]
+        e_load = path_idx[seg]
+
+        # Unit load in local axes and its fixed end forces, one column per position
+        R = T[e_load, :2, :2]
+        px, py = (R @ np.array([0.0, -1.0])).T
+        Le = L[e_load]
+        b = Le - a
+        fef = np.zeros((n_positions, 6))
+        fef[:, 0] = px * b / Le
+        fef[:, 1] = py * b**2 * (3 * a + b) / Le**3
+        fef[:, 2] = py * a * b**2 / Le**2
+        fef[:, 3] = px * a / Le
+        fef[:, 4] = py * a**2 * (a + 3 * b) / Le**3
+        fef[:, 5] = -py * a**2 * b / Le**2
+
+        columns = np.arange(n_positions)
+        F = np.zeros((dof, n_positions))
+        np.add.at(F, (dofs[e_load], columns[:, None]), np.einsum('pji,pj->pi', T[e_load], fef))
+
+        free = self._free_dofs()
+        factor = self._stiffness_factor(k, T, dofs, free, use_cache)
+        U = np.zeros((dof, n_positions))
+        U[free] = factor.solve(F[free])
+
+        # End forces of the path elements for every position: k T u - fef
+        f = np.einsum('eij,ejk,ekp->eip', k[path_idx], T[path_idx], U[dofs[path_idx]])
+        loaded = path_idx[:, None] == e_load[None, :]
+        f -= loaded[:, None, :] * fef.T[None, :, :]
+
+        # Stations along each path element: M(x) = -M_i + V_i x + py (x - a)
+        x = np.linspace(0.0, 1.0, max(n_points, 2))[None, :] * L_path[:, None]
+        past = (x[:, :, None] > a[None, None, :]) & loaded[:, None, :]
+        V = f[:, None, 1, :] + past * py
+        M = -f[:, None, 2, :] + f[:, None, 1, :] * x[:, :, None] + past * py * (x[:, :, None] - a)
+
+        # Vertical reactions at the supports: (K u - F) on the restrained Y DOFs
+        supports = [nid for nid, node in self.nodes.items() if node.fixity[1]]
+        rows = np.array([3 * (nid - 1) + 1 for nid in supports], dtype=int)
+        K_el = np.einsum('eji,ejk,ekl->eil', T, k, T)
+        K_rows = assemble_csr(K_el, dofs, dof)[rows]
+        reactions = K_rows @ U - F[rows]
+
+        return InfluenceLines(
+            positions=positions,
+            stations=(x + starts[:-1, None]).ravel(),
+            moment=M.reshape(-1, n_positions),
+            shear=V.reshape(-1, n_positions),
+            reactions=np.asarray(reactions),
+            support_labels=supports,
+        )
+
+    def _calculate_member_forces_batch(self, u_global, k, T, L, dofs, udl):
+        u_loc = np.einsum('eij,ej->ei', T, u_global[dofs])
+        f_final = np.einsum('eij,ej->ei', k, u_loc) - self._fixed_end_forces(L, udl)
+        keys = ("N_i", "V_i", "M_i", "N_j", "V_j", "M_j")
+        for el, row in zip(self.elements.values(), f_final.tolist()):
+            el.forces = dict(zip(keys, row))
+
     def _calculate_member_forces(self, u_global):
         for el in self.elements.values():
             ni = self.nodes[el.node_i]
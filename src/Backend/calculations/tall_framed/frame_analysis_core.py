@@ -2,6 +2,14 @@ import numpy as np
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 import json
+import scipy.sparse as sp
+from .sparse_linalg import factorize, assemble_csr, SingularStiffnessError, FACTOR_CACHE
+from .modal_analysis import G_ACC, ModalResults, frame3d_mass_local, solve_modes
+from .response_spectrum import ResponseSpectrumResults, response_spectrum
+from .p_delta import PDeltaResult, frame3d_geometric_local, solve_p_delta
+
+# Order of the 6 DOFs at every node
+DOF_NAMES = ('dx', 'dy', 'dz', 'rx', 'ry', 'rz')
 
 @dataclass
 class Material:
@@ -46,6 +54,27 @@ class Node:
     support: Dict[str, bool] = field(default_factory=lambda: {'dx': False, 'dy': False, 'dz': False, 'rx': False, 'ry': False, 'rz': False})
     # Results
     displacements: Dict[str, List[float]] = field(default_factory=dict) # combo -> [dx, dy, dz, rx, ry, rz]
+    index: int = -1  # Position in the analyzer's node ordering (set by add_node)
+
+    def global_dof_indices(self) -> List[int]:
+        """Global DOF numbers [dx, dy, dz, rx, ry, rz] of this node"""
+        return list(range(6 * self.index, 6 * self.index + 6))
+
+def rotation_matrices(ex: np.ndarray) -> np.ndarray:
+    """
+    Rows are the local x, y, z axes in global coordinates (n_el, 3, 3).
+    Global Y is vertical: local z = x cross Y, so horizontal members bend
+    with local y up. Vertical members take local z = global Z.
+    """
+    up = np.array([0.0, 1.0, 0.0])
+    ez = np.cross(ex, up)
+    norm = np.linalg.norm(ez, axis=1)
+    vertical = norm < 1e-9
+    ez[vertical] = np.array([0.0, 0.0, 1.0])
+    norm[vertical] = 1.0
+    ez /= norm[:, None]
+    ey = np.cross(ez, ex)
+    return np.stack([ex, ey, ez], axis=1)
 
 @dataclass
 class Member:
@@ -60,15 +89,28 @@ class Member:
         n2 = nodes[self.end_node_id]
         return np.sqrt((n2.x - n1.x)**2 + (n2.y - n1.y)**2 + (n2.z - n1.z)**2)
 
+    def rotation_matrix(self, nodes: Dict) -> np.ndarray:
+        """3x3 matrix whose rows are the member's local x, y, z axes"""
+        n1 = nodes[self.start_node_id]
+        n2 = nodes[self.end_node_id]
+        d = np.array([n2.x - n1.x, n2.y - n1.y, n2.z - n1.z], dtype=float)
+        return rotation_matrices((d / np.linalg.norm(d))[None, :])[0]
+
 class LoadType:
     UDL = "UDL"
     POINT = "POINT"
+    VARYING = "VARYING"
 
 class LoadCategory:
     DEAD = "DEAD"
     IMPOSED = "IMPOSED"
     WIND = "WIND"
 
+    @staticmethod
+    def wind(direction: str) -> str:
+        """Category name for wind from one direction, e.g. wind('X+') -> 'WIND_X+'"""
+        return f"{LoadCategory.WIND}_{direction}"
+
 @dataclass
 class Load:
     category: str
@@ -82,6 +124,9 @@ class Load:
     My: float = 0
     Mz: float = 0
     coordinate_system: str = 'global'
+    start_position: float = 0.5  # POINT: position as ratio of member length
+    start_value: float = 0  # VARYING: intensity at start (kN/m, local y)
+    end_value: float = 0  # VARYING: intensity at end (kN/m, local y)
 
 @dataclass
 class LoadCombination:
@@ -92,6 +137,89 @@ class LoadCombination:
     def ULS_dead_imposed():
         return LoadCombination("1.4D + 1.6L", {LoadCategory.DEAD: 1.4, LoadCategory.IMPOSED: 1.6})
 
+    @staticmethod
+    def _label(category: str) -> str:
+        return {LoadCategory.DEAD: "D", LoadCategory.IMPOSED: "L", LoadCategory.WIND: "W"}.get(category, category)
+
+    @staticmethod
+    def bs8110_uls(wind_cases: Optional[List[str]] = None) -> List['LoadCombination']:
+        """
+        BS 8110-1 Table 2.1 ULS combinations.
+        Every wind case (e.g. one per direction) gets its own dead+wind and
+        dead+imposed+wind combinations, with adverse and beneficial dead load.
+        """
+        D, L = LoadCategory.DEAD, LoadCategory.IMPOSED
+        combos = [
+            LoadCombination.ULS_dead_imposed(),
+            LoadCombination("1.0D + 1.6L", {D: 1.0, L: 1.6}),
+        ]
+        for w in (wind_cases if wind_cases is not None else [LoadCategory.WIND]):
+            W = LoadCombination._label(w)
+            combos.append(LoadCombination(f"1.4D + 1.4{W}", {D: 1.4, w: 1.4}))
+            combos.append(LoadCombination(f"1.0D + 1.4{W}", {D: 1.0, w: 1.4}))
+            combos.append(LoadCombination(f"1.2D + 1.2L + 1.2{W}", {D: 1.2, L: 1.2, w: 1.2}))
+        return combos
+
+    @staticmethod
+    def bs8110_sls(wind_cases: Optional[List[str]] = None) -> List['LoadCombination']:
+        """Characteristic (unfactored) SLS combinations"""
+        D, L = LoadCategory.DEAD, LoadCategory.IMPOSED
+        combos = [LoadCombination("1.0D + 1.0L", {D: 1.0, L: 1.0})]
+        for w in (wind_cases if wind_cases is not None else [LoadCategory.WIND]):
+            W = LoadCombination._label(w)
+            combos.append(LoadCombination(f"1.0D + 1.0{W}", {D: 1.0, w: 1.0}))
+            combos.append(LoadCombination(f"1.0D + 0.8L + 0.8{W}", {D: 1.0, L: 0.8, w: 0.8}))
+        return combos
+
+    @staticmethod
+    def ec0_uls(
+        wind_cases: Optional[List[str]] = None,
+        psi0_imposed: float = 0.7,
+        psi0_wind: float = 0.5
+    ) -> List['LoadCombination']:
+        """EN 1990 Eq. 6.10 STR combinations with leading imposed or leading wind"""
+        D, L = LoadCategory.DEAD, LoadCategory.IMPOSED
+        combos = [LoadCombination("1.35D + 1.5L", {D: 1.35, L: 1.5})]
+        for w in (wind_cases if wind_cases is not None else [LoadCategory.WIND]):
+            W = LoadCombination._label(w)
+            fw = round(1.5 * psi0_wind, 3)
+            fq = round(1.5 * psi0_imposed, 3)
+            combos.append(LoadCombination(f"1.35D + 1.5L + {fw}{W}", {D: 1.35, L: 1.5, w: fw}))
+            combos.append(LoadCombination(f"1.35D + 1.5{W} + {fq}L", {D: 1.35, w: 1.5, L: fq}))
+            combos.append(LoadCombination(f"1.0D + 1.5{W}", {D: 1.0, w: 1.5}))
+        return combos
+
+
+@dataclass
+class LoadCaseResults:
+    """
+    Results of the primitive (unit-factor) load cases.
+    displacements: (n_cases, n_dof), end_forces: (n_cases, n_members, 12) local
+    Any combination is a factor-matrix product over the case axis.
+    """
+    case_names: List[str]
+    member_ids: List[int]
+    displacements: np.ndarray
+    end_forces: np.ndarray
+
+    def factor_matrix(self, combinations: List[LoadCombination]) -> np.ndarray:
+        """(n_combos, n_cases) factors; categories without results are ignored"""
+        return np.array(
+            [[c.factors.get(name, 0.0) for name in self.case_names] for c in combinations],
+            dtype=float
+        ).reshape(len(combinations), len(self.case_names))
+
+    def combine(self, combinations: List[LoadCombination]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Superpose the case results.
+        Returns displacements (n_combos, n_dof) and end forces (n_combos, n_members, 12)
+        """
+        C = self.factor_matrix(combinations)
+        return (
+            np.einsum('kc,cd->kd', C, self.displacements),
+            np.einsum('kc,cej->kej', C, self.end_forces),
+        )
+
 class Frame3DAnalyzer:
     def __init__(self):
         self.nodes: Dict[int, Node] = {}
@@ -99,8 +227,15 @@ class Frame3DAnalyzer:
         self.loads: List[Load] = []
         self.load_combinations: List[LoadCombination] = []
         self.member_forces: Dict[str, Dict[int, np.ndarray]] = {} # combo -> member_id -> 12-forces
+        self.displacements: Dict[str, np.ndarray] = {} # combo -> global displacement vector (6 per node)
+        self.case_results: Optional[LoadCaseResults] = None # unit load case results for superposition
+        self.p_delta: Dict[str, PDeltaResult] = {} # combo -> second-order solve summary
         
     def add_node(self, node: Node):
+        if node.id not in self.nodes:
+            node.index = len(self.nodes)
+        else:
+            node.index = self.nodes[node.id].index
         self.nodes[node.id] = node
         
     def add_member(self, member: Member):
@@ -112,20 +247,397 @@ class Frame3DAnalyzer:
     def add_load_combination(self, combo: LoadCombination):
         self.load_combinations.append(combo)
         
-    def analyze_all_combinations(self):
-        # Placeholder for real 3D FEM solver implementation
-        # For now, it will use the logic from fem_solver.py (2D) for simple cases
-        # Or return mock results if 3D is too complex to implement here
-        # But New_frame.py needs results to generate viz.
-        
-        for combo in self.load_combinations:
-            self.member_forces[combo.name] = {}
-            for mid, m in self.members.items():
-                # Default zero forces
-                self.member_forces[combo.name][mid] = np.zeros(12)
-        
-        # In a real scenario, this would solve the stiffness matrix
-        pass
+    def topology_key(self) -> str:
+        """Hash of everything that defines the reduced stiffness matrix"""
+        nodes = sorted(self.nodes.values(), key=lambda n: n.index)
+        members = list(self.members.values())
+        return FACTOR_CACHE.make_key(
+            np.array([[n.x, n.y, n.z] for n in nodes], dtype=float),
+            self._restrained_mask(),
+            np.array([[self.nodes[m.start_node_id].index, self.nodes[m.end_node_id].index] for m in members], dtype=np.int64),
+            np.array([[m.material.E, m.material.G, m.section.A, m.section.Iz, m.section.Iy, m.section.J] for m in members], dtype=float),
+        )
+
+    def analyze_load_cases(self, categories: Optional[List[str]] = None, use_cache: bool = True) -> LoadCaseResults:
+        """
+        Solve every primitive load category once as a unit case.
+        K is assembled sparse and factorized once (or taken from FACTOR_CACHE
+        when the topology was seen before); all cases are back-substituted
+        together as one multi-column right-hand side.
+        Raises SingularStiffnessError if the structure is a mechanism.
+        """
+        if categories is None:
+            categories = list(dict.fromkeys(load.category for load in self.loads))
+
+        n_dof = 6 * len(self.nodes)
+        k_local, T, L, dofs = self._member_arrays()
+        free = np.flatnonzero(~self._restrained_mask())
+
+        # Load vectors per case: nodal loads + equivalent member loads
+        F, fef_local = self._case_loads(categories, T, L, dofs)
+
+        U = np.zeros((n_dof, len(categories)))
+        if categories:
+            factor = self._stiffness_factor(k_local, T, dofs, free, use_cache)
+            U[free] = factor.solve(F[free])
+
+        # Member end forces (local): k (T u) - fixed end forces
+        u_local = np.einsum('eij,ejc->eic', T, U[dofs])
+        end_forces = np.einsum('eij,ejc->eic', k_local, u_local) - fef_local
+
+        self.case_results = LoadCaseResults(
+            case_names=list(categories),
+            member_ids=list(self.members.keys()),
+            displacements=np.ascontiguousarray(U.T),
+            end_forces=np.ascontiguousarray(np.moveaxis(end_forces, 2, 0)),
+        )
+        return self.case_results
+
+    def analyze_all_combinations(
+        self,
+        second_order: bool = False,
+        tolerance: float = 1e-6,
+        max_iterations: int = 20,
+    ):
+        """
+        Linear static analysis of every load combination by superposition
+        of the unit load cases (one factorization, one einsum).
+        second_order: P-Delta analysis of each combination, starting from the
+        superposed linear solution and preconditioned with the same factor;
+        self.p_delta records iterations and amplification per combination.
+        case_results stay first order.
+        """
+        self.member_forces = {}
+        self.displacements = {}
+        self.p_delta = {}
+        if not self.load_combinations:
+            return
+
+        cases = self.analyze_load_cases()
+        U, end_forces = cases.combine(self.load_combinations)
+        if second_order:
+            U, end_forces = self._second_order_combinations(cases, U, tolerance, max_iterations)
+
+        for c, combo in enumerate(self.load_combinations):
+            self.displacements[combo.name] = U[c]
+            self.member_forces[combo.name] = dict(zip(cases.member_ids, end_forces[c]))
+            for node in self.nodes.values():
+                node.displacements[combo.name] = U[c, 6 * node.index:6 * node.index + 6].tolist()
+
+    def _second_order_combinations(self, cases: LoadCaseResults, U_linear: np.ndarray,
+                                   tolerance: float, max_iterations: int):
+        """
+        P-Delta solve of every combination (superposition does not hold).
+        Returns displacements (n_combos, n_dof) and end forces (n_combos, n_members, 12)
+        Raises SingularStiffnessError when a combination exceeds the critical load.
+        """
+        k_local, T, L, dofs = self._member_arrays()
+        free = np.flatnonzero(~self._restrained_mask())
+        r2 = np.array([(m.section.Iy + m.section.Iz) / m.section.A if m.section.A > 0 else 0.0
+                       for m in self.members.values()])
+        K_ff = self._reduced_stiffness(k_local, T, dofs, free)
+        factor = self._stiffness_factor(k_local, T, dofs, free)
+
+        F, fef = self._case_loads(cases.case_names, T, L, dofs)
+        C = cases.factor_matrix(self.load_combinations)
+        F_combo = F @ C.T
+        fef_combo = np.einsum('kc,ejc->kej', C, fef)
+
+        def local_forces(u, kind, c):
+            u_local = np.einsum('eij,ej->ei', T, u[dofs])
+            return np.einsum('eij,ej->ei', kind, u_local) - fef_combo[c]
+
+        U = np.zeros_like(U_linear)
+        end_forces = np.zeros((len(self.load_combinations), len(L), 12))
+        for c, combo in enumerate(self.load_combinations):
+            def geometric(u_ff):
+                u = np.zeros(U.shape[1])
+                u[free] = u_ff
+                P = local_forces(u, k_local, c)[:, 6]
+                return self._reduced_stiffness(frame3d_geometric_local(L, P, r2), T, dofs, free)
+
+            result = solve_p_delta(K_ff, factor, F_combo[free, c], geometric,
+                                   U_linear[c, free], tolerance, max_iterations)
+            self.p_delta[combo.name] = result
+            U[c, free] = result.u
+            P = local_forces(U[c], k_local, c)[:, 6]
+            end_forces[c] = local_forces(U[c], k_local + frame3d_geometric_local(L, P, r2), c)
+        return U, end_forces
+
+    def _reduced_stiffness(self, k_local, T, dofs, free):
+        K = assemble_csr(np.einsum('eji,ejk,ekl->eil', T, k_local, T), dofs, 6 * len(self.nodes))
+        return K[free][:, free]
+
+    def _stiffness_factor(self, k_local, T, dofs, free, use_cache: bool = True):
+        """Factor of the reduced stiffness, shared through FACTOR_CACHE"""
+        if use_cache:
+            return FACTOR_CACHE.get_or_factorize(
+                self.topology_key(), lambda: self._reduced_stiffness(k_local, T, dofs, free)
+            )
+        return factorize(self._reduced_stiffness(k_local, T, dofs, free))
+
+    def mass_matrix(
+        self,
+        mass_type: str = "lumped",
+        mass_source: Optional[Dict[str, float]] = None,
+        include_self_weight: bool = True,
+    ):
+        """
+        Global sparse mass matrix (tonnes).
+        Members carry their self weight (material density * A / g) and the
+        gravity (-global Y) component of the load categories in mass_source,
+        each scaled by its factor, e.g. {DEAD: 1.0, IMPOSED: 0.3}.
+        Nodal and point loads in those categories become nodal masses.
+        """
+        if mass_source is None:
+            mass_source = {LoadCategory.DEAD: 1.0, LoadCategory.IMPOSED: 0.3}
+
+        n_dof = 6 * len(self.nodes)
+        members = list(self.members.values())
+        member_pos = {mid: e for e, mid in enumerate(self.members)}
+        _, T, L, dofs = self._member_arrays()
+
+        A = np.array([m.section.A for m in members], dtype=float)
+        density = np.array([m.material.density for m in members], dtype=float)
+        r2 = np.array([(m.section.Iy + m.section.Iz) / m.section.A if m.section.A > 0 else 0.0 for m in members])
+        m_line = density * A / G_ACC if include_self_weight else np.zeros(len(members))
+        nodal = np.zeros(n_dof)
+
+        for load in self.loads:
+            factor = mass_source.get(load.category, 0.0)
+            if factor == 0.0:
+                continue
+            if load.member_id is not None and load.member_id in member_pos:
+                e = member_pos[load.member_id]
+                if load.load_type == LoadType.VARYING:
+                    # Local y intensities; take the vertical share of local y
+                    w = (load.start_value + load.end_value) / 2 * abs(T[e, 1, 1])
+                    m_line[e] += factor * abs(w) / G_ACC
+                    continue
+                q = np.array([load.Fx, load.Fy, load.Fz], dtype=float)
+                if load.coordinate_system != 'global':
+                    q = T[e, :3, :3].T @ q
+                weight = factor * max(-q[1], 0.0) / G_ACC
+                if load.load_type == LoadType.POINT:
+                    a = load.start_position
+                    nodal[dofs[e, 0:3]] += weight * (1 - a)
+                    nodal[dofs[e, 6:9]] += weight * a
+                else:
+                    m_line[e] += weight
+            elif load.node_id is not None and load.node_id in self.nodes:
+                base = 6 * self.nodes[load.node_id].index
+                nodal[base:base + 3] += factor * max(-load.Fy, 0.0) / G_ACC
+
+        M_local = frame3d_mass_local(L, m_line, r2, mass_type)
+        if mass_type == "lumped":
+            M_el = M_local
+        else:
+            M_el = np.einsum('eji,ejk,ekl->eil', T, M_local, T)
+        return assemble_csr(M_el, dofs, n_dof) + sp.diags(nodal)
+
+    def modal_analysis(
+        self,
+        n_modes: int = 10,
+        mass_type: str = "lumped",
+        mass_source: Optional[Dict[str, float]] = None,
+        include_self_weight: bool = True,
+        use_cache: bool = True,
+    ) -> ModalResults:
+        """
+        First n_modes natural modes (sparse shift-invert eigsh) with
+        participation factors and effective masses in X, Y and Z.
+        The stiffness factorization is shared with the static analysis
+        through FACTOR_CACHE.
+        Raises SingularStiffnessError if the structure is a mechanism.
+        """
+        n_dof = 6 * len(self.nodes)
+        k_local, T, L, dofs = self._member_arrays()
+        free = np.flatnonzero(~self._restrained_mask())
+        factor = self._stiffness_factor(k_local, T, dofs, free, use_cache)
+        M_ff = self.mass_matrix(mass_type, mass_source, include_self_weight).tocsr()[free][:, free]
+
+        influence = np.zeros((n_dof, 3))
+        for d in range(3):
+            influence[d::6, d] = 1.0
+        return solve_modes(
+            self._reduced_stiffness(k_local, T, dofs, free), M_ff, free, n_dof,
+            influence, ("X", "Y", "Z"), n_modes, factor,
+        )
+
+    def response_spectrum(
+        self,
+        spectrum,
+        direction: str = "X",
+        n_modes: int = 12,
+        method: str = "CQC",
+        damping: float = 0.05,
+        mass_type: str = "lumped",
+        mass_source: Optional[Dict[str, float]] = None,
+    ) -> ResponseSpectrumResults:
+        """
+        Response-spectrum analysis for ground motion along X, Y or Z.
+        spectrum(T) gives the design spectral acceleration in m/s2.
+        Member end forces are local 12-component magnitudes (DOF_NAMES at each end).
+        """
+        modal = self.modal_analysis(n_modes, mass_type, mass_source)
+        k_local, T, _, dofs = self._member_arrays()
+        nodes = sorted(self.nodes.values(), key=lambda n: n.index)
+        components = [f"{name}_i" for name in DOF_NAMES] + [f"{name}_j" for name in DOF_NAMES]
+        return response_spectrum(
+            modal, spectrum, direction,
+            self.mass_matrix(mass_type, mass_source),
+            k_local, T, dofs, list(self.members.keys()), components,
+            np.array([n.y for n in nodes]), 6, method, damping,
+        )
+
+    def _restrained_mask(self) -> np.ndarray:
+        """
+        Boolean mask of restrained DOFs.
+        Plane models (all nodes at one z) are analysed in the XY plane, so the
+        out-of-plane DOFs (dz, rx, ry) are restrained at every node.
+        """
+        mask = np.zeros(6 * len(self.nodes), dtype=bool)
+        planar = len({round(n.z, 9) for n in self.nodes.values()}) <= 1
+        for node in self.nodes.values():
+            base = 6 * node.index
+            for i, name in enumerate(DOF_NAMES):
+                if node.support.get(name, False):
+                    mask[base + i] = True
+            if planar:
+                mask[base + 2:base + 5] = True
+        return mask
+
+    def _member_arrays(self):
+        """
+        Batched member geometry and matrices.
+        Returns (k_local, T, L, dofs): (n_el, 12, 12) local stiffness and
+        transformation matrices, lengths and (n_el, 12) global DOF numbers.
+        """
+        members = list(self.members.values())
+        n_el = len(members)
+        p1 = np.array([[self.nodes[m.start_node_id].x, self.nodes[m.start_node_id].y, self.nodes[m.start_node_id].z] for m in members], dtype=float).reshape(n_el, 3)
+        p2 = np.array([[self.nodes[m.end_node_id].x, self.nodes[m.end_node_id].y, self.nodes[m.end_node_id].z] for m in members], dtype=float).reshape(n_el, 3)
+        E = np.array([m.material.E for m in members], dtype=float)
+        G = np.array([m.material.G for m in members], dtype=float)
+        A = np.array([m.section.A for m in members], dtype=float)
+        Iz = np.array([m.section.Iz for m in members], dtype=float)
+        Iy = np.array([m.section.Iy for m in members], dtype=float)
+        J = np.array([m.section.J for m in members], dtype=float)
+
+        d = p2 - p1
+        L = np.linalg.norm(d, axis=1)
+        R = rotation_matrices(d / L[:, None])
+
+        T = np.zeros((n_el, 12, 12))
+        for b in range(4):
+            T[:, 3*b:3*b+3, 3*b:3*b+3] = R
+
+        k = np.zeros((n_el, 12, 12))
+        EA_L = E * A / L
+        GJ_L = G * J / L
+        k[:, 0, 0] = k[:, 6, 6] = EA_L
+        k[:, 0, 6] = -EA_L
+        k[:, 3, 3] = k[:, 9, 9] = GJ_L
+        k[:, 3, 9] = -GJ_L
+        # Bending in the local x-y plane (v, rz)
+        k[:, 1, 1] = k[:, 7, 7] = 12 * E * Iz / L**3
+        k[:, 1, 7] = -12 * E * Iz / L**3
+        k[:, 1, 5] = k[:, 1, 11] = 6 * E * Iz / L**2
+        k[:, 5, 7] = k[:, 7, 11] = -6 * E * Iz / L**2
+        k[:, 5, 5] = k[:, 11, 11] = 4 * E * Iz / L
+        k[:, 5, 11] = 2 * E * Iz / L
+        # Bending in the local x-z plane (w, ry)
+        k[:, 2, 2] = k[:, 8, 8] = 12 * E * Iy / L**3
+        k[:, 2, 8] = -12 * E * Iy / L**3
+        k[:, 2, 4] = k[:, 2, 10] = -6 * E * Iy / L**2
+        k[:, 4, 8] = k[:, 8, 10] = 6 * E * Iy / L**2
+        k[:, 4, 4] = k[:, 10, 10] = 4 * E * Iy / L
+        k[:, 4, 10] = 2 * E * Iy / L
+        # Mirror the upper triangle
+        k = np.triu(k) + np.transpose(np.triu(k, 1), (0, 2, 1))
+
+        i1 = np.array([self.nodes[m.start_node_id].index for m in members], dtype=int)
+        i2 = np.array([self.nodes[m.end_node_id].index for m in members], dtype=int)
+        offsets = np.arange(6)
+        dofs = np.concatenate([6 * i1[:, None] + offsets, 6 * i2[:, None] + offsets], axis=1)
+
+        return k, T, L, dofs
+
+    def _case_loads(self, categories: List[str], T: np.ndarray, L: np.ndarray, dofs: np.ndarray):
+        """
+        Global load matrix F (n_dof, n_cases) and local fixed end forces
+        (n_el, 12, n_cases) with every category at unit factor.
+        """
+        n_dof = 6 * len(self.nodes)
+        n_case = len(categories)
+        case_pos = {name: c for c, name in enumerate(categories)}
+        member_pos = {mid: e for e, mid in enumerate(self.members)}
+
+        F = np.zeros((n_dof, n_case))
+        fef = np.zeros((len(L), 12, n_case))
+
+        for load in self.loads:
+            c = case_pos.get(load.category)
+            if c is None:
+                continue
+
+            if load.member_id is not None and load.member_id in member_pos:
+                e = member_pos[load.member_id]
+                fef[e, :, c] += self._member_fixed_end_forces(load, T[e, :3, :3], L[e])
+            elif load.node_id is not None and load.node_id in self.nodes:
+                base = 6 * self.nodes[load.node_id].index
+                F[base:base + 6, c] += [load.Fx, load.Fy, load.Fz, load.Mx, load.My, load.Mz]
+
+        # Equivalent nodal loads: T^T f_fixed scattered to the global vector
+        f_global = np.einsum('eji,ejc->eic', T, fef)
+        np.add.at(F, dofs.ravel(), f_global.reshape(-1, n_case))
+        return F, fef
+
+    @staticmethod
+    def _member_fixed_end_forces(load: Load, R: np.ndarray, L: float) -> np.ndarray:
+        """
+        Local fixed end forces (12,) of a single member load.
+        UDL/POINT components Fx, Fy, Fz are in load.coordinate_system;
+        VARYING intensities act along local y over the full length.
+        """
+        f = np.zeros(12)
+
+        if load.load_type == LoadType.VARYING:
+            w1 = load.start_value
+            dw = load.end_value - load.start_value
+            f[1] = w1 * L / 2 + 3 * dw * L / 20
+            f[7] = w1 * L / 2 + 7 * dw * L / 20
+            f[5] = w1 * L**2 / 12 + dw * L**2 / 30
+            f[11] = -(w1 * L**2 / 12 + dw * L**2 / 20)
+            return f
+
+        q = np.array([load.Fx, load.Fy, load.Fz], dtype=float)
+        if load.coordinate_system == 'global':
+            q = R @ q
+        qx, qy, qz = q
+
+        if load.load_type == LoadType.POINT:
+            a = load.start_position * L
+            b = L - a
+            f[0] = qx * b / L
+            f[6] = qx * a / L
+            f[1] = qy * b**2 * (3*a + b) / L**3
+            f[7] = qy * a**2 * (a + 3*b) / L**3
+            f[5] = qy * a * b**2 / L**2
+            f[11] = -qy * a**2 * b / L**2
+            f[2] = qz * b**2 * (3*a + b) / L**3
+            f[8] = qz * a**2 * (a + 3*b) / L**3
+            f[4] = -qz * a * b**2 / L**2
+            f[10] = qz * a**2 * b / L**2
+        else:
+            f[0] = f[6] = qx * L / 2
+            f[1] = f[7] = qy * L / 2
+            f[5] = qy * L**2 / 12
+            f[11] = -qy * L**2 / 12
+            f[2] = f[8] = qz * L / 2
+            f[4] = -qz * L**2 / 12
+            f[10] = qz * L**2 / 12
+        return f
 
     def export_to_json(self, filename: str):
         # Simplified export
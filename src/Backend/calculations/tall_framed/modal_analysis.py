@@ -0,0 +1,194 @@
+"""
+Modal analysis for the frame solvers.
+Lumped or consistent mass matrices for 2D and 3D frame elements and a
+shift-invert sparse eigen solve (eigsh about sigma = 0) that reuses the
+factorized stiffness matrix, so only the first k modes are ever computed.
+Units follow the solvers: kN, m and tonnes, giving omega in rad/s.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, eigsh
+
+from .sparse_linalg import SparseFactor, factorize
+
+# Gravitational acceleration, converts weights (kN) to mass (tonnes)
+G_ACC = 9.81
+
+MASS_TYPES = ("lumped", "consistent")
+
+
+def _bending_mass(L: np.ndarray, m: np.ndarray) -> np.ndarray:
+    """Consistent bending mass (n_el, 4, 4) for DOFs [v_i, rot_i, v_j, rot_j]"""
+    c = (m * L / 420.0)[:, None, None]
+    Lc = L[:, None, None]
+    base = np.array([
+        [156, 22, 54, -13],
+        [22, 4, 13, -3],
+        [54, 13, 156, -22],
+        [-13, -3, -22, 4],
+    ], dtype=float)
+    powers = np.array([
+        [0, 1, 0, 1],
+        [1, 2, 1, 2],
+        [0, 1, 0, 1],
+        [1, 2, 1, 2],
+    ])
+    return c * base * Lc**powers
+
+
+def frame2d_mass_local(L: np.ndarray, m: np.ndarray, mass_type: str = "lumped") -> np.ndarray:
+    """
+    Local element mass matrices (n_el, 6, 6) for DOFs [u, v, rz] at each end.
+    m is the mass per unit length (t/m).
+    """
+    n_el = len(L)
+    M = np.zeros((n_el, 6, 6))
+    if mass_type == "lumped":
+        half = m * L / 2
+        for d in (0, 1, 3, 4):
+            M[:, d, d] = half
+        return M
+
+    axial = (m * L / 6)[:, None, None] * np.array([[2.0, 1.0], [1.0, 2.0]])
+    M[np.ix_(np.arange(n_el), [0, 3], [0, 3])] = axial
+    M[np.ix_(np.arange(n_el), [1, 2, 4, 5], [1, 2, 4, 5])] = _bending_mass(L, m)
+    return M
+
+
+def frame3d_mass_local(
+    L: np.ndarray, m: np.ndarray, r2: np.ndarray, mass_type: str = "lumped"
+) -> np.ndarray:
+    """
+    Local element mass matrices (n_el, 12, 12), DOF order as the 3D stiffness.
+    m is the mass per unit length (t/m), r2 the polar radius of gyration
+    squared (Iy + Iz) / A used for the torsional inertia.
+    """
+    n_el = len(L)
+    M = np.zeros((n_el, 12, 12))
+    if mass_type == "lumped":
+        half = m * L / 2
+        for d in (0, 1, 2, 6, 7, 8):
+            M[:, d, d] = half
+        return M
+
+    rows = np.arange(n_el)
+    pair = np.array([[2.0, 1.0], [1.0, 2.0]])
+    M[np.ix_(rows, [0, 6], [0, 6])] = (m * L / 6)[:, None, None] * pair
+    M[np.ix_(rows, [3, 9], [3, 9])] = (m * r2 * L / 6)[:, None, None] * pair
+    bending = _bending_mass(L, m)
+    M[np.ix_(rows, [1, 5, 7, 11], [1, 5, 7, 11])] = bending
+    # x-z plane: rotations ry are positive the other way round (as in the stiffness)
+    flip = np.array([1.0, -1.0, 1.0, -1.0])
+    M[np.ix_(rows, [2, 4, 8, 10], [2, 4, 8, 10])] = bending * flip[:, None] * flip[None, :]
+    return M
+
+
+@dataclass
+class ModalResults:
+    """
+    First k modes, ordered by increasing frequency.
+    mode_shapes: (n_dof, k) mass-normalised, zero at restrained DOFs
+    participation: (k, n_dir) factors Gamma = phi^T M r
+    effective_mass: (k, n_dir) Gamma^2 (tonnes)
+    total_mass: (n_dir,) r^T M r over the free DOFs
+    """
+    omega: np.ndarray
+    mode_shapes: np.ndarray
+    participation: np.ndarray
+    effective_mass: np.ndarray
+    total_mass: np.ndarray
+    directions: Sequence[str]
+
+    @property
+    def periods(self) -> np.ndarray:
+        return 2 * np.pi / self.omega
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        return self.omega / (2 * np.pi)
+
+    @property
+    def mass_ratios(self) -> np.ndarray:
+        """(k, n_dir) effective mass as a fraction of the total"""
+        total = np.where(self.total_mass > 0, self.total_mass, 1.0)
+        return self.effective_mass / total
+
+    def summary(self) -> List[Dict]:
+        """One row per mode for API responses"""
+        ratios = self.mass_ratios
+        cumulative = np.cumsum(ratios, axis=0)
+        rows = []
+        for n in range(len(self.omega)):
+            row = {
+                "mode": n + 1,
+                "period": float(self.periods[n]),
+                "frequency": float(self.frequencies[n]),
+            }
+            for d, name in enumerate(self.directions):
+                row[f"participation_{name}"] = float(self.participation[n, d])
+                row[f"effective_mass_{name}"] = float(self.effective_mass[n, d])
+                row[f"mass_ratio_{name}"] = float(ratios[n, d])
+                row[f"cumulative_ratio_{name}"] = float(cumulative[n, d])
+            rows.append(row)
+        return rows
+
+
+def solve_modes(
+    K_ff: sp.spmatrix,
+    M_ff: sp.spmatrix,
+    free: np.ndarray,
+    n_dof: int,
+    influence: np.ndarray,
+    directions: Sequence[str],
+    n_modes: int = 10,
+    factor: Optional[SparseFactor] = None,
+) -> ModalResults:
+    """
+    Lowest n_modes of K phi = omega^2 M phi on the free DOFs.
+
+    K_ff, M_ff: reduced stiffness and mass; free: their global DOF numbers
+    influence: (n_dof, n_dir) ground-motion influence vectors
+    factor: factorization of K_ff (e.g. from FACTOR_CACHE) used as the
+    shift-invert operator; computed here when not given.
+    """
+    K_ff = sp.csc_matrix(K_ff)
+    M_ff = sp.csc_matrix(M_ff)
+    n = K_ff.shape[0]
+    # Massless DOFs (rotations with a lumped mass) only carry infinite modes
+    n_massed = int(np.count_nonzero(M_ff.diagonal() > 0))
+    k = min(n_modes, n_massed, n - 1)
+    if k < 1:
+        raise ValueError("Model has no dynamic degrees of freedom")
+
+    if factor is None:
+        factor = factorize(K_ff)
+    OPinv = LinearOperator((n, n), matvec=factor.solve, dtype=float)
+
+    eigvals, phi = eigsh(K_ff, k=k, M=M_ff, sigma=0.0, which="LM", OPinv=OPinv)
+    order = np.argsort(eigvals)
+    eigvals = np.clip(eigvals[order], 0.0, None)
+    phi = phi[:, order]
+
+    # Mass-normalise and fix the sign (largest component positive)
+    phi /= np.sqrt(np.einsum("ik,ik->k", phi, M_ff @ phi))
+    peak = phi[np.abs(phi).argmax(axis=0), np.arange(k)]
+    phi *= np.sign(peak)
+
+    r = influence[free]
+    Mr = M_ff @ r
+    gamma = phi.T @ Mr
+
+    shapes = np.zeros((n_dof, k))
+    shapes[free] = phi
+    return ModalResults(
+        omega=np.sqrt(eigvals),
+        mode_shapes=shapes,
+        participation=gamma,
+        effective_mass=gamma**2,
+        total_mass=np.einsum("id,id->d", r, Mr),
+        directions=tuple(directions),
+    )
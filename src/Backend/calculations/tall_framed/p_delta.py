@@ -0,0 +1,167 @@
+"""
+P-Delta (second-order) analysis for the frame solvers.
+The geometric stiffness of the current axial forces is added to the linear
+stiffness and K + Kg(P) u = F is re-solved until the displacements settle.
+Every solve is a conjugate-gradient iteration preconditioned with the linear
+factorization of K, so the stiffness is factorized once (or taken from
+FACTOR_CACHE) and never re-factorized inside the loop.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, cg, eigsh
+
+from .sparse_linalg import SingularStiffnessError, SparseFactor
+
+
+def _bending_geometric(L: np.ndarray, P: np.ndarray) -> np.ndarray:
+    """Consistent geometric stiffness (n_el, 4, 4) for DOFs [v_i, rot_i, v_j, rot_j]"""
+    c = (P / L)[:, None, None]
+    Lc = L[:, None, None]
+    base = np.array([
+        [6 / 5, 1 / 10, -6 / 5, 1 / 10],
+        [1 / 10, 2 / 15, -1 / 10, -1 / 30],
+        [-6 / 5, -1 / 10, 6 / 5, -1 / 10],
+        [1 / 10, -1 / 30, -1 / 10, 2 / 15],
+    ])
+    powers = np.array([
+        [0, 1, 0, 1],
+        [1, 2, 1, 2],
+        [0, 1, 0, 1],
+        [1, 2, 1, 2],
+    ])
+    return c * base * Lc**powers
+
+
+def frame2d_geometric_local(L: np.ndarray, P: np.ndarray) -> np.ndarray:
+    """
+    Local geometric stiffness (n_el, 6, 6) for DOFs [u, v, rz] at each end.
+    P is the member axial force, tension positive (kN).
+    """
+    n_el = len(L)
+    kg = np.zeros((n_el, 6, 6))
+    kg[np.ix_(np.arange(n_el), [1, 2, 4, 5], [1, 2, 4, 5])] = _bending_geometric(L, P)
+    return kg
+
+
+def frame3d_geometric_local(L: np.ndarray, P: np.ndarray, r2: np.ndarray) -> np.ndarray:
+    """
+    Local geometric stiffness (n_el, 12, 12), DOF order as the 3D stiffness.
+    P is tension positive; r2 = (Iy + Iz) / A gives the torsional term.
+    """
+    n_el = len(L)
+    rows = np.arange(n_el)
+    kg = np.zeros((n_el, 12, 12))
+    bending = _bending_geometric(L, P)
+    kg[np.ix_(rows, [1, 5, 7, 11], [1, 5, 7, 11])] = bending
+    # x-z plane: rotations ry are positive the other way round (as in the stiffness)
+    flip = np.array([1.0, -1.0, 1.0, -1.0])
+    kg[np.ix_(rows, [2, 4, 8, 10], [2, 4, 8, 10])] = bending * flip[:, None] * flip[None, :]
+    kg[np.ix_(rows, [3, 9], [3, 9])] = (P * r2 / L)[:, None, None] * np.array([[1.0, -1.0], [-1.0, 1.0]])
+    return kg
+
+
+@dataclass
+class PDeltaResult:
+    """
+    Converged second-order displacements on the free DOFs.
+    iterations: outer updates of the axial forces
+    krylov_iterations: total preconditioned CG steps over all updates
+    critical_load_factor: elastic critical load factor alpha_cr of the final
+    axial forces (inf when no member is in compression)
+    amplification: max |u| second order / max |u| first order
+    """
+    u: np.ndarray
+    u_linear: np.ndarray
+    iterations: int
+    krylov_iterations: int
+    converged: bool
+    critical_load_factor: float = np.inf
+
+    @property
+    def amplification(self) -> float:
+        linear = np.max(np.abs(self.u_linear)) if self.u_linear.size else 0.0
+        return float(np.max(np.abs(self.u)) / linear) if linear > 0 else 1.0
+
+    def summary(self) -> Dict:
+        return {
+            "iterations": self.iterations,
+            "krylov_iterations": self.krylov_iterations,
+            "converged": self.converged,
+            "amplification_factor": self.amplification,
+            "critical_load_factor": self.critical_load_factor,
+        }
+
+
+def critical_load_factor(K_ff: sp.spmatrix, Kg_ff: sp.spmatrix, factor: SparseFactor) -> float:
+    """
+    Smallest alpha with (K + alpha Kg) singular, from the largest eigenvalue
+    mu of -Kg phi = mu K phi (alpha = 1 / mu), using the factor of K for K^-1.
+    """
+    n = K_ff.shape[0]
+    if n == 0 or Kg_ff.nnz == 0:
+        return np.inf
+    if n < 3:
+        mu = np.linalg.eigvals(factor.solve(-Kg_ff.toarray())).real.max()
+    else:
+        Minv = LinearOperator((n, n), matvec=factor.solve, dtype=float)
+        mu = eigsh(-Kg_ff, k=1, M=K_ff, Minv=Minv, which="LA", return_eigenvectors=False)[0]
+    return float(1.0 / mu) if mu > 0 else np.inf
+
+
+def solve_p_delta(
+    K_ff: sp.spmatrix,
+    factor: SparseFactor,
+    F_ff: np.ndarray,
+    geometric_stiffness: Callable[[np.ndarray], sp.spmatrix],
+    u_linear: Optional[np.ndarray] = None,
+    tolerance: float = 1e-6,
+    max_iterations: int = 20,
+) -> PDeltaResult:
+    """
+    Iterate (K + Kg(u)) u = F to convergence.
+
+    K_ff, factor: reduced linear stiffness and its factorization
+    geometric_stiffness(u_ff): reduced Kg for the axial forces implied by u_ff
+    tolerance: relative change of u between updates
+    Raises SingularStiffnessError when the axial loads reach the elastic
+    critical load (K + Kg no longer positive definite).
+    """
+    K_ff = sp.csr_matrix(K_ff)
+    n = K_ff.shape[0]
+    if u_linear is None:
+        u_linear = factor.solve(F_ff)
+    if n == 0 or not np.any(F_ff):
+        return PDeltaResult(u_linear, u_linear, 0, 0, True)
+
+    preconditioner = LinearOperator((n, n), matvec=factor.solve, dtype=float)
+    steps = [0]
+
+    def count(_):
+        steps[0] += 1
+
+    unstable = SingularStiffnessError(
+        "P-Delta: K + Kg is not positive definite - axial loads exceed the elastic critical load"
+    )
+    u = u_linear
+    converged = False
+    iterations = 0
+    for iterations in range(1, max_iterations + 1):
+        Kg = geometric_stiffness(u)
+        u_new, info = cg(K_ff + Kg, F_ff, x0=u, rtol=tolerance * 1e-3, atol=0.0, M=preconditioner, callback=count)
+        if info != 0 or F_ff @ u_new <= 0:
+            raise unstable
+        change = np.linalg.norm(u_new - u) / max(np.linalg.norm(u_new), 1e-300)
+        u = u_new
+        if change < tolerance:
+            converged = True
+            break
+
+    # CG can return a stationary point of an indefinite system, so check alpha_cr
+    alpha_cr = critical_load_factor(K_ff, sp.csr_matrix(Kg), factor)
+    if alpha_cr <= 1.0:
+        raise unstable
+    return PDeltaResult(u, u_linear, iterations, steps[0], converged, alpha_cr)
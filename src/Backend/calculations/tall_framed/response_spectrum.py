@@ -0,0 +1,165 @@
+"""
+Response-spectrum analysis on top of the modal solution.
+Peak modal responses are formed for all modes at once and combined with
+SRSS or CQC (Der Kiureghian correlation) as array products over the mode
+axis, so the cost is one (n_responses x k) @ (k x k) product.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+import scipy.sparse as sp
+
+from .modal_analysis import ModalResults
+
+COMBINATION_METHODS = ("SRSS", "CQC")
+
+
+def cqc_correlation(omega: np.ndarray, damping: float = 0.05) -> np.ndarray:
+    """Modal correlation coefficients rho_ij (k, k) for equal modal damping"""
+    r = omega[None, :] / omega[:, None]
+    z = damping
+    return (8 * z**2 * (1 + r) * r**1.5) / ((1 - r**2) ** 2 + 4 * z**2 * r * (1 + r) ** 2)
+
+
+def combine_modes(R: np.ndarray, method: str = "CQC", rho: np.ndarray = None) -> np.ndarray:
+    """
+    Combine peak modal responses R (..., k) over the last axis.
+    SRSS: sqrt(sum R_i^2); CQC: sqrt(sum_ij R_i rho_ij R_j).
+    """
+    if method == "SRSS" or rho is None:
+        return np.sqrt(np.sum(R**2, axis=-1))
+    flat = R.reshape(-1, R.shape[-1])
+    quad = np.einsum("nk,nk->n", flat @ rho, flat)
+    return np.sqrt(np.clip(quad, 0.0, None)).reshape(R.shape[:-1])
+
+
+@dataclass
+class ResponseSpectrumResults:
+    """
+    Combined peak responses (all positive magnitudes).
+    end_forces: (n_el, n_comp) local member end forces
+    Storey arrays are ordered bottom to top; storey i spans levels i-1 -> i.
+    """
+    direction: str
+    method: str
+    periods: np.ndarray
+    spectral_accelerations: np.ndarray
+    modal_base_shear: np.ndarray
+    base_shear: float
+    member_ids: List
+    force_components: Sequence[str]
+    end_forces: np.ndarray
+    level_heights: np.ndarray
+    floor_displacement: np.ndarray
+    storey_shear: np.ndarray
+    storey_drift: np.ndarray
+
+    @property
+    def drift_ratio(self) -> np.ndarray:
+        h = np.diff(np.concatenate([[0.0], self.level_heights]))
+        return self.storey_drift / np.where(h > 0, h, 1.0)
+
+    def member_columns(self) -> Dict[str, list]:
+        columns = {"member_id": list(self.member_ids)}
+        for c, name in enumerate(self.force_components):
+            columns[name] = self.end_forces[:, c].tolist()
+        return columns
+
+    def storey_columns(self) -> Dict[str, list]:
+        return {
+            "storey": list(range(1, len(self.level_heights) + 1)),
+            "height": self.level_heights.tolist(),
+            "displacement": self.floor_displacement.tolist(),
+            "shear": self.storey_shear.tolist(),
+            "drift": self.storey_drift.tolist(),
+            "drift_ratio": self.drift_ratio.tolist(),
+        }
+
+    def mode_columns(self) -> Dict[str, list]:
+        return {
+            "mode": list(range(1, len(self.periods) + 1)),
+            "period": self.periods.tolist(),
+            "spectral_acceleration": self.spectral_accelerations.tolist(),
+            "base_shear": self.modal_base_shear.tolist(),
+        }
+
+
+def response_spectrum(
+    modal: ModalResults,
+    spectrum: Callable[[np.ndarray], np.ndarray],
+    direction: str,
+    M: sp.spmatrix,
+    k_local: np.ndarray,
+    T: np.ndarray,
+    dofs: np.ndarray,
+    member_ids: List,
+    force_components: Sequence[str],
+    node_heights: np.ndarray,
+    dofs_per_node: int,
+    method: str = "CQC",
+    damping: float = 0.05,
+) -> ResponseSpectrumResults:
+    """
+    Peak response to ground motion along `direction` (one of modal.directions).
+
+    spectrum: design spectral acceleration Sa(T) in m/s2, vectorized over T
+    M: full (n_dof, n_dof) mass matrix in tonnes, so inertia forces are kN
+    k_local, T, dofs: batched element stiffness/transformation and DOF numbers
+    node_heights: (n_nodes,) vertical coordinate of each node in DOF order;
+    levels above the base are the distinct heights of free nodes.
+    """
+    if method not in COMBINATION_METHODS:
+        raise ValueError(f"method must be one of {COMBINATION_METHODS}")
+    d = list(modal.directions).index(direction)
+
+    omega = modal.omega
+    Sa = np.asarray(spectrum(modal.periods), dtype=float)
+    gamma = modal.participation[:, d]
+
+    # Peak modal displacements and inertia forces, one column per mode
+    U = modal.mode_shapes * (gamma * Sa / omega**2)[None, :]
+    F = M @ (modal.mode_shapes * (gamma * Sa)[None, :])
+
+    # Member end forces for every member and mode: k T u
+    f_modal = np.einsum("eij,ejk,ekm->eim", k_local, T, U[dofs])
+
+    # Storey quantities in the excitation direction
+    n_nodes = len(node_heights)
+    direction_dofs = dofs_per_node * np.arange(n_nodes) + d
+    free_nodes = np.any(modal.mode_shapes.reshape(n_nodes, dofs_per_node, -1) != 0, axis=(1, 2))
+    heights = np.round(np.asarray(node_heights, dtype=float), 6)
+    levels = np.unique(heights[free_nodes]) if free_nodes.any() else np.zeros(0)
+    levels = levels[levels > heights.min()]
+    level_of_node = np.searchsorted(levels, heights)
+    on_level = free_nodes & np.isin(heights, levels)
+
+    n_levels, k = len(levels), len(omega)
+    level_force = np.zeros((n_levels, k))
+    np.add.at(level_force, level_of_node[on_level], F[direction_dofs[on_level]])
+    counts = np.bincount(level_of_node[on_level], minlength=n_levels).astype(float)
+    level_disp = np.zeros((n_levels, k))
+    np.add.at(level_disp, level_of_node[on_level], U[direction_dofs[on_level]])
+    level_disp /= np.where(counts > 0, counts, 1.0)[:, None]
+
+    storey_shear = np.cumsum(level_force[::-1], axis=0)[::-1]
+    storey_drift = np.diff(np.vstack([np.zeros((1, k)), level_disp]), axis=0)
+    modal_base_shear = storey_shear[0] if n_levels else np.zeros(k)
+
+    rho = cqc_correlation(omega, damping) if method == "CQC" else None
+    return ResponseSpectrumResults(
+        direction=direction,
+        method=method,
+        periods=modal.periods,
+        spectral_accelerations=Sa,
+        modal_base_shear=np.abs(modal_base_shear),
+        base_shear=float(combine_modes(modal_base_shear, method, rho)),
+        member_ids=list(member_ids),
+        force_components=tuple(force_components),
+        end_forces=combine_modes(f_modal, method, rho),
+        level_heights=levels,
+        floor_displacement=combine_modes(level_disp, method, rho),
+        storey_shear=combine_modes(storey_shear, method, rho),
+        storey_drift=combine_modes(storey_drift, method, rho),
+    )
@@ -0,0 +1,193 @@
+"""
+Sparse linear algebra helpers for the frame solvers.
+Wraps sparse Cholesky (CHOLMOD, when scikit-sparse is installed) with a
+SuperLU fallback so callers can factorize once and back-substitute many times.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+try:
+    from sksparse.cholmod import cholesky as cholmod_cholesky, CholmodError
+    CHOLMOD_AVAILABLE = True
+except ImportError:
+    CHOLMOD_AVAILABLE = False
+
+
+class SingularStiffnessError(Exception):
+    """Raised when the reduced stiffness matrix cannot be factorized (mechanism)"""
+    pass
+
+
+class SparseFactor:
+    """
+    Factorization of a symmetric stiffness matrix.
+    solve() accepts a vector (n,) or a multi-column right-hand side (n, m).
+    """
+
+    def __init__(self, K):
+        K = sp.csc_matrix(K)
+        self.shape = K.shape
+        self.method = None
+        self._factor = None
+
+        if K.shape[0] == 0:
+            self.method = "empty"
+            return
+
+        if CHOLMOD_AVAILABLE:
+            try:
+                self._factor = cholmod_cholesky(K)
+                self.method = "cholmod"
+                return
+            except CholmodError:
+                # Not positive definite - let LU decide whether it is singular
+                pass
+
+        try:
+            self._factor = splu(
+                K,
+                permc_spec="MMD_AT_PLUS_A",
+                diag_pivot_thresh=0.0,
+                options={"SymmetricMode": True},
+            )
+            self.method = "superlu"
+        except RuntimeError as e:
+            raise SingularStiffnessError(str(e))
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored factor entries (memory proxy)"""
+        if self.method == "cholmod":
+            return int(self._factor.L().nnz)
+        if self.method == "superlu":
+            return int(self._factor.L.nnz + self._factor.U.nnz)
+        return 0
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the factor (values + indices)"""
+        return self.nnz * 12 + self.shape[0] * 8
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        b = np.asarray(b, dtype=float)
+        if self.method == "empty":
+            return np.zeros_like(b)
+        if self.method == "cholmod":
+            u = self._factor(b)
+        else:
+            u = self._factor.solve(b)
+        if not np.all(np.isfinite(u)):
+            raise SingularStiffnessError("Non-finite displacements - mechanism or unstable")
+        return u
+
+
+def factorize(K) -> SparseFactor:
+    """Factorize a sparse symmetric stiffness matrix"""
+    return SparseFactor(K)
+
+
+def assemble_csr(element_matrices: np.ndarray, element_dofs: np.ndarray, n_dof: int) -> sp.csr_matrix:
+    """
+    Scatter a batch of element matrices into a global CSR matrix.
+
+    element_matrices: (n_el, k, k) element matrices in global axes
+    element_dofs: (n_el, k) global DOF index of each element row/column
+    Duplicate (row, col) triplets are summed by the COO -> CSR conversion.
+    """
+    n_el, k, _ = element_matrices.shape
+    rows = np.repeat(element_dofs, k, axis=1).ravel()
+    cols = np.tile(element_dofs, (1, k)).ravel()
+    K = sp.coo_matrix((element_matrices.ravel(), (rows, cols)), shape=(n_dof, n_dof))
+    return K.tocsr()
+
+
+class FactorizationCache:
+    """
+    Process-level LRU cache of factorized reduced stiffness matrices.
+    Keys hash the model topology (coordinates, fixities, connectivity and
+    section properties), so a load-only change reuses the factor and costs
+    one back-substitution. Entries are evicted least-recently-used first
+    once max_bytes or max_entries is exceeded.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024**2, max_entries: int = 64):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, SparseFactor]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(*arrays) -> str:
+        """Hash of the given arrays (dtype, shape and contents)"""
+        h = hashlib.blake2b(digest_size=20)
+        for a in arrays:
+            a = np.ascontiguousarray(a)
+            h.update(str((a.dtype.str, a.shape)).encode())
+            h.update(a.tobytes())
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[SparseFactor]:
+        with self._lock:
+            factor = self._entries.get(key)
+            if factor is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return factor
+
+    def put(self, key: str, factor: SparseFactor):
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key).nbytes
+            if factor.nbytes > self.max_bytes:
+                return
+            self._entries[key] = factor
+            self._bytes += factor.nbytes
+            while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                _, old = self._entries.popitem(last=False)
+                self._bytes -= old.nbytes
+                self.evictions += 1
+
+    def get_or_factorize(self, key: str, build_matrix: Callable[[], sp.spmatrix]) -> SparseFactor:
+        """Cached factor for key, assembling and factorizing on a miss"""
+        factor = self.get(key)
+        if factor is None:
+            factor = factorize(build_matrix())
+            self.put(key, factor)
+        return factor
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+            }
+
+
+# Shared by every frame solver in the process
+FACTOR_CACHE = FactorizationCache()
@@ -4,8 +4,12 @@ from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import math
+import time
 import numpy as np
 from .fem_solver import FEM2DSolver
+from .sparse_linalg import FACTOR_CACHE, SingularStiffnessError
+from .modal_analysis import MASS_TYPES
+from .response_spectrum import COMBINATION_METHODS
 from .load_standards import BS6399
 
 router = APIRouter(
@@ -54,6 +58,7 @@ class FrameAnalysisRequest(BaseModel):
     bay_width: float = Field(..., description="Bay width in meters")
     lateral_load: float = Field(..., description="Lateral load in kN")
     vertical_load: Optional[float] = Field(None, description="Vertical load in kN")
+    second_order: bool = Field(False, description="P-Delta (second-order) analysis")
 
 class FrameAnalysisResponse(BaseModel):
     method_used: str
@@ -63,6 +68,19 @@ class FrameAnalysisResponse(BaseModel):
     inflectionPoint: List[float]
     max_drift: float
     base_shear: float
+    p_delta: Optional[Dict[str, Any]] = None  # iterations and amplification factors
+
+class ModalAnalysisRequest(FrameAnalysisRequest):
+    n_modes: int = Field(10, ge=1, description="Number of modes")
+    mass_type: str = Field("lumped", description="lumped or consistent")
+    density: float = Field(25.0, description="Self weight density in kN/m3")
+    vertical_load_as_mass: bool = Field(True, description="Treat the beam UDL as seismic mass")
+
+class ModalAnalysisResponse(BaseModel):
+    modes: List[Dict[str, Any]]
+    total_mass: Dict[str, float]
+    floor_mode_shapes: List[List[float]]  # per mode, left column line dx per floor (top = 1)
+    solve_time: float
 
 class StructuralSystemRequest(BaseModel):
     system_type: str = Field(..., description="Type of structural system")
@@ -172,6 +190,21 @@ class BSCodeTables:
         "wind_with_dead": 1.2
     }
     
+    # BS 8110 Table 2.1 combinations as factor rows over [dead, imposed, wind]
+    ULS_COMBINATION_FACTORS = {
+        "combo1": (1.4, 1.6, 0.0),
+        "combo2": (1.2, 1.2, 1.2),
+        "combo3": (1.0, 0.0, 1.4),
+        "combo4": (1.2, 1.2, 1.2),
+    }
+
+    SLS_COMBINATION_FACTORS = {
+        "characteristic": (1.0, 1.0, 0.0),
+        "quasi_permanent": (1.0, 0.3, 0.0),
+        "frequent": (1.0, 0.5, 0.0),
+        "rare": (1.0, 1.0, 0.6),
+    }
+    
     LOAD_FACTORS_SLS = {
         "characteristic": 1.0,
         "quasi_permanent_imposed": 0.3,
@@ -211,21 +244,18 @@ async def calculate_load_combinations(request: LoadCombinationRequest):
     else:
         wk = 0.0
     
+    # Every combination is one row of a factor matrix applied to [gk, qk, wk]
+    loads = np.array([gk, qk, wk], dtype=float)
+    
     # Ultimate Limit State Combinations
-    uls = {
-        "combo1": round(1.4 * gk + 1.6 * qk, 3),
-        "combo2": round(1.2 * gk + 1.2 * qk + 1.2 * wk, 3),
-        "combo3": round(1.0 * gk + 1.4 * wk, 3),
-        "combo4": round(1.2 * gk + 1.2 * qk + 1.2 * wk, 3),
-    }
+    uls_factors = BSCodeTables.ULS_COMBINATION_FACTORS
+    uls_values = np.array(list(uls_factors.values())) @ loads
+    uls = {name: round(float(v), 3) for name, v in zip(uls_factors, uls_values)}
     
     # Serviceability Limit State
-    sls = {
-        "characteristic": round(gk + qk, 3),
-        "quasi_permanent": round(gk + 0.3 * qk, 3),
-        "frequent": round(gk + 0.5 * qk, 3),
-        "rare": round(gk + qk + 0.6 * wk, 3)
-    }
+    sls_factors = BSCodeTables.SLS_COMBINATION_FACTORS
+    sls_values = np.array(list(sls_factors.values())) @ loads
+    sls = {name: round(float(v), 3) for name, v in zip(sls_factors, sls_values)}
     
     # Determine critical combination
     design_load = max(uls.values())
@@ -323,10 +353,8 @@ async def design_ties(request: TieDesignRequest):
 # ============================================================================
 
 
-@router.post("/api/analysis/frame", response_model=FrameAnalysisResponse)
-async def analyze_frame(request: FrameAnalysisRequest):
-    """Analyze frame. Uses FEM Stiffness method for robust results."""
-    
+def build_regular_frame(request: FrameAnalysisRequest) -> FEM2DSolver:
+    """Regular plane frame (fixed bases, UDL on beams, lateral load at the left column line)"""
     floors = request.floors
     bays = request.bays
     h = request.story_height
@@ -386,9 +414,20 @@ async def analyze_frame(request: FrameAnalysisRequest):
         floor_load = lateral / floors
         n_lat = node_map[(row+1, 0)] # Apply at left-most node
         solver.add_nodal_load(n_lat, fx=floor_load)
-        
-    # Solve
-    results = solver.solve()
+
+    return solver
+
+@router.post("/api/analysis/frame", response_model=FrameAnalysisResponse)
+async def analyze_frame(request: FrameAnalysisRequest):
+    """Analyze frame. Uses FEM Stiffness method for robust results."""
+    
+    floors = request.floors
+    bays = request.bays
+    h = request.story_height
+    solver = build_regular_frame(request)
+
+    # Solve (sparse path so load-only changes reuse the cached factorization)
+    results = solver.solve(method="sparse", second_order=request.second_order)
     
     if not results:
          raise HTTPException(status_code=500, detail="Matrix singular - unstable structure")
@@ -441,7 +480,44 @@ async def analyze_frame(request: FrameAnalysisRequest):
         axialForce=[d["exterior"] for d in axial_forces_data],
         inflectionPoint=inflection_points_data,
         max_drift=max_disp,
-        base_shear=base_shear
+        base_shear=base_shear,
+        p_delta=results.get("p_delta"),
+    )
+
+@router.get("/api/analysis/factorization-cache")
+async def get_factorization_cache_stats():
+    """Hit/miss counters and memory use of the shared stiffness factorization cache"""
+    return FACTOR_CACHE.stats()
+
+@router.post("/api/analysis/modal", response_model=ModalAnalysisResponse)
+async def analyze_modal(request: ModalAnalysisRequest):
+    """Natural periods, participation factors and effective modal masses of the frame"""
+    if request.mass_type not in MASS_TYPES:
+        raise HTTPException(status_code=400, detail=f"mass_type must be one of {MASS_TYPES}")
+
+    solver = build_regular_frame(request)
+    start = time.perf_counter()
+    try:
+        modal = solver.modal_analysis(
+            n_modes=request.n_modes,
+            mass_type=request.mass_type,
+            density=request.density,
+            udl_as_mass=request.vertical_load_as_mass,
+        )
+    except (SingularStiffnessError, ValueError) as e:
+        raise HTTPException(status_code=500, detail=f"Modal analysis failed: {e}")
+    solve_time = time.perf_counter() - start
+
+    # Left column line: node (row, 0) has id row * (bays + 1) + 1
+    floor_dofs = 3 * np.arange(1, request.floors + 1) * (request.bays + 1)
+    shapes = modal.mode_shapes[floor_dofs]
+    top = np.where(np.abs(shapes[-1]) > 1e-12, shapes[-1], 1.0)
+
+    return ModalAnalysisResponse(
+        modes=modal.summary(),
+        total_mass={d: float(m) for d, m in zip(modal.directions, modal.total_mass)},
+        floor_mode_shapes=(shapes / top).T.round(4).tolist(),
+        solve_time=round(solve_time, 4),
     )
 
 # ============================================================================
@@ -1526,6 +1602,42 @@ async def calculate_wind_load(request: WindLoadRequest):
 # SEISMIC ANALYSIS (Simplified - BS EN 1998)
 # ============================================================================
 
+# Peak ground acceleration by zone (fraction of g, simplified)
+PGA_VALUES = {
+    "low": 0.05,
+    "medium": 0.15,
+    "high": 0.30,
+}
+
+# Soil factor S (simplified)
+SOIL_FACTORS = {
+    "A": 1.0,   # Rock
+    "B": 1.2,   # Stiff soil
+    "C": 1.15,  # Medium soil
+    "D": 1.35,  # Soft soil
+    "E": 1.4,   # Very soft soil
+}
+
+# Behaviour factor q by structural system
+BEHAVIOUR_FACTORS = {
+    "moment_frame": 5.0,
+    "braced_frame": 4.0,
+    "shear_wall": 3.5,
+    "dual_system": 5.5,
+}
+
+def ec8_design_spectrum(T, ag: float, S: float, q: float,
+                        TB: float = 0.15, TC: float = 0.5, TD: float = 2.0):
+    """Design spectral acceleration Sd(T) in the units of ag, vectorized over T"""
+    T = np.asarray(T, dtype=float)
+    plateau = ag * S * 2.5 / q
+    Tsafe = np.where(T > 0, T, 1.0)
+    return np.select(
+        [T <= TB, T <= TC, T <= TD],
+        [ag * S * (1 + T / TB * (2.5 / q - 1)), np.full_like(T, plateau), plateau * TC / Tsafe],
+        plateau * TC * TD / Tsafe**2,
+    )
+
 class SeismicAnalysisRequest(BaseModel):
     building_height: float = Field(..., description="Building height in meters")
     building_mass: float = Field(..., description="Total building mass in tonnes")
@@ -1549,51 +1661,16 @@ async def analyze_seismic(request: SeismicAnalysisRequest):
     M = request.building_mass * 1000  # Convert to kg
     gamma_I = request.importance_factor
     
-    # Peak ground acceleration based on zone (simplified)
-    pga_values = {
-        "low": 0.05,    # 0.05g
-        "medium": 0.15, # 0.15g
-        "high": 0.30    # 0.30g
-    }
-    ag = pga_values.get(request.seismic_zone, 0.05) * 9.81  # m/s²
-    
-    # Soil factor (simplified)
-    soil_factors = {
-        "A": 1.0,  # Rock
-        "B": 1.2,  # Stiff soil
-        "C": 1.15, # Medium soil
-        "D": 1.35, # Soft soil
-        "E": 1.4   # Very soft soil
-    }
-    S = soil_factors.get(request.soil_type, 1.0)
-    
-    # Behavior factor (q) based on structural system
-    q_values = {
-        "moment_frame": 5.0,
-        "braced_frame": 4.0,
-        "shear_wall": 3.5,
-        "dual_system": 5.5
-    }
-    q = q_values.get(request.structural_system, 4.0)
+    ag = PGA_VALUES.get(request.seismic_zone, 0.05) * 9.81  # m/s²
+    S = SOIL_FACTORS.get(request.soil_type, 1.0)
+    q = BEHAVIOUR_FACTORS.get(request.structural_system, 4.0)
     
     # Fundamental period (simplified Rayleigh method)
     Ct = 0.075  # For RC moment frames
     T1 = Ct * H**0.75  # seconds
     
-    # Design spectrum
-    TB = 0.15  # Short period limit (soil dependent)
-    TC = 0.5   # Long period limit
-    TD = 2.0   # Very long period limit
-    
     # Spectral acceleration
-    if T1 <= TB:
-        Sd_T = ag * S * (1 + T1/TB * (2.5/q - 1))
-    elif T1 <= TC:
-        Sd_T = ag * S * 2.5 / q
-    elif T1 <= TD:
-        Sd_T = ag * S * 2.5 / q * (TC / T1)
-    else:
-        Sd_T = ag * S * 2.5 / q * (TC * TD / T1**2)
+    Sd_T = float(ec8_design_spectrum(T1, ag, S, q))
     
     # Base shear
     lambda_factor = 0.85  # Correction factor for multi-story buildings
@@ -1637,6 +1714,60 @@ async def analyze_seismic(request: SeismicAnalysisRequest):
         design_summary=f"Base shear: {V_base:.1f} kN, Period: {T1:.2f} sec"
     )
 
+class ResponseSpectrumRequest(ModalAnalysisRequest):
+    seismic_zone: str = Field("low", description="low, medium, high")
+    soil_type: str = Field("C", description="A, B, C, D, E")
+    structural_system: str = Field("moment_frame", description="Structural system type")
+    importance_factor: float = Field(1.0, description="Importance factor")
+    combination: str = Field("CQC", description="SRSS or CQC")
+    damping: float = Field(0.05, gt=0, lt=1, description="Modal damping ratio")
+
+class ResponseSpectrumResponse(BaseModel):
+    base_shear: float
+    modes: Dict[str, List[float]]
+    storeys: Dict[str, List[float]]
+    member_forces: Dict[str, List[Any]]
+    max_drift_ratio: float
+    solve_time: float
+
+@router.post("/api/analysis/response-spectrum", response_model=ResponseSpectrumResponse)
+async def analyze_response_spectrum(request: ResponseSpectrumRequest):
+    """Modal response-spectrum analysis of the frame with SRSS or CQC combination"""
+    if request.mass_type not in MASS_TYPES:
+        raise HTTPException(status_code=400, detail=f"mass_type must be one of {MASS_TYPES}")
+    if request.combination not in COMBINATION_METHODS:
+        raise HTTPException(status_code=400, detail=f"combination must be one of {COMBINATION_METHODS}")
+
+    ag = PGA_VALUES.get(request.seismic_zone, 0.05) * 9.81 * request.importance_factor
+    S = SOIL_FACTORS.get(request.soil_type, 1.0)
+    q = BEHAVIOUR_FACTORS.get(request.structural_system, 4.0)
+
+    solver = build_regular_frame(request)
+    start = time.perf_counter()
+    try:
+        result = solver.response_spectrum(
+            lambda T: ec8_design_spectrum(T, ag, S, q),
+            direction="X",
+            n_modes=request.n_modes,
+            method=request.combination,
+            damping=request.damping,
+            mass_type=request.mass_type,
+            density=request.density,
+            udl_as_mass=request.vertical_load_as_mass,
+        )
+    except (SingularStiffnessError, ValueError) as e:
+        raise HTTPException(status_code=500, detail=f"Response spectrum analysis failed: {e}")
+    solve_time = time.perf_counter() - start
+
+    return ResponseSpectrumResponse(
+        base_shear=round(result.base_shear, 2),
+        modes=result.mode_columns(),
+        storeys=result.storey_columns(),
+        member_forces=result.member_columns(),
+        max_drift_ratio=float(result.drift_ratio.max()) if len(result.level_heights) else 0.0,
+        solve_time=round(solve_time, 4),
+    )
+
 # ============================================================================
 # DEFLECTION CALCULATIONS
 # ============================================================================
@@ -267,6 +267,7 @@ from calculations.Beams.main_beam_api import router as beam_analysis_router
 ##columns
 # from calculations.Columns.ColumnDesignAPI import router as column_design_router
 from calculations.Columns.Interactio import router as column_interaction_router
+from calculations.Columns.column_schedule import router as column_schedule_router
 
 ##foundations
 # from calculations.Foundations.FundationsApi import router as foundation_design_router
@@ -277,6 +278,7 @@ from calculations.Foundations.New_foundation import (
 ##slabs
 # from calculations.Slabs.SlabApi import router as slab_design_router
 from calculations.Slabs.enhanced_slab_backend import router as slab_backend_router
+from calculations.Slabs.plate_fe import router as plate_fe_router
 
 
 ##retaining
@@ -426,11 +428,15 @@ app.include_router(
 app.include_router(
     column_interaction_router, prefix="/column_interaction", tags=["Column_interaction"]
 )
+app.include_router(
+    column_schedule_router, prefix="/column_interaction", tags=["Column_interaction"]
+)
 # app.include_router(column_design_router, prefix="/column", tags=["Column_designs"])
 
 ##slabs
 # app.include_router(slab_design_router, prefix="/slabs", tags=["slabs_designs"])
 app.include_router(slab_backend_router, prefix="/slab_backend", tags=["slabs_backend"])
+app.include_router(plate_fe_router, prefix="/slab_backend", tags=["slabs_backend"])
 
 ##################################
 
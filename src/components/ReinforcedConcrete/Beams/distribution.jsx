@@ -242,6 +242,8 @@ const MomentDistributionCalculator = ({ onAnalysisComplete }) => {
         joints,
         members,
         ...convergenceSettings,
+        include_history: true,
+        history_limit: convergenceSettings.max_iterations,
       };
 
       const response = await axios.post(
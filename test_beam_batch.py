@@ -0,0 +1,43 @@
+import asyncio
+import json
+from src.Backend.calculations.Beams.beam_batch import BatchBeamRequest, stream_batch
+from src.Backend.calculations.Beams.threemain import get_examples
+
+
+def collect(request):
+    async def run():
+        return [json.loads(line) async for line in stream_batch(request)]
+    return asyncio.run(run())
+
+
+def beam_items():
+    payload = {k: v for k, v in get_examples()[1].items() if k != "name"}
+    return [
+        {"id": "B1", "method": "three_moment", "payload": payload},
+        {"id": "bad", "method": "three_moment", "payload": {"spans": []}},
+        {"id": "B2", "method": "three_moment", "payload": payload},
+    ]
+
+
+def test_batch_streams_every_item_and_isolates_errors():
+    lines = collect(BatchBeamRequest(items=beam_items()))
+    records, summary = lines[:-1], lines[-1]
+
+    assert sorted(r["id"] for r in records) == ["B1", "B2", "bad"]
+    by_id = {r["id"]: r for r in records}
+    assert by_id["B1"]["status"] == by_id["B2"]["status"] == "ok"
+    assert by_id["B1"]["result"]["support_moments"] == by_id["B2"]["result"]["support_moments"]
+    assert by_id["bad"]["status"] == "error" and by_id["bad"]["error"]
+    assert summary["summary"] and summary["ok"] == 2 and summary["error"] == 1
+
+
+def test_batch_reports_items_past_time_budget():
+    lines = collect(BatchBeamRequest(items=beam_items(), time_budget=1e-9))
+    assert lines[-1]["timeout"] == 3
+    assert all(r["status"] == "timeout" for r in lines[:-1])
+
+
+if __name__ == "__main__":
+    test_batch_streams_every_item_and_isolates_errors()
+    test_batch_reports_items_past_time_budget()
+    print("Batch beam analysis streams isolated results")
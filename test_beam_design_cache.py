@@ -0,0 +1,90 @@
+import numpy as np
+from src.Backend.calculations.Beams.rc_beam_design import (
+    BS8110Designer, integrate_analysis_design, integrate_moment_distribution_design,
+)
+from src.Backend.calculations.Beams.section_cache import SECTION_CACHE, SectionDesignCache
+
+DESIGN_PARAMETERS = {
+    "beam_type": "Rectangular",
+    "support_condition": "Continuous",
+    "fcu": 30,
+    "fy": 460,
+    "width": 300,
+    "depth": 500,
+    "cover": 25,
+}
+
+
+def coefficient_payload(n_spans):
+    span = {
+        "max_moment": 95.0,
+        "support_moment_left": -120.0,
+        "support_moment_right": -110.0,
+        "shear_left": 140.0,
+        "shear_right": -130.0,
+        "span_length": 6.0,
+    }
+    return {"analysis_results": [dict(span, span_index=i) for i in range(n_spans)],
+            "design_parameters": DESIGN_PARAMETERS}
+
+
+def test_repeated_spans_hit_the_memo_and_match_uncached_design():
+    SECTION_CACHE.clear()
+    cached = integrate_analysis_design(coefficient_payload(6))
+    stats = SECTION_CACHE.stats()
+    assert stats["misses"] > 0
+    assert stats["hits"] >= 5 * stats["misses"]
+    assert stats["kernels"]["flexure"]["hit_rate"] > 0.8
+
+    # Memo is shared with the moment distribution endpoint
+    md = {
+        "md_results": {
+            "moment_data": {"AB": [{"x": 0.0, "y": -120.0}, {"x": 3.0, "y": 95.0}, {"x": 6.0, "y": -110.0}]},
+            "shear_force_data": {"AB": [{"x": 0.0, "y": 140.0}, {"x": 6.0, "y": -130.0}]},
+        },
+        "design_parameters": DESIGN_PARAMETERS,
+    }
+    hits = SECTION_CACHE.hits
+    integrate_moment_distribution_design(md)
+    assert SECTION_CACHE.hits > hits
+
+    SECTION_CACHE.enabled = False
+    try:
+        uncached = integrate_analysis_design(coefficient_payload(6))
+    finally:
+        SECTION_CACHE.enabled = True
+    assert cached.dict() == uncached.dict()
+
+
+def test_cached_results_are_not_shared_with_callers():
+    designer = BS8110Designer()
+    first = designer._design_section_flexure(400.0, 250, 400, 30, 460, 250, 0.0, False)
+    first["warnings"].append("mutated")
+    second = designer._design_section_flexure(400.0, 250, 400, 30, 460, 250, 0.0, False)
+    assert "mutated" not in second["warnings"]
+
+
+def test_lru_bound_evicts_oldest():
+    cache = SectionDesignCache(max_entries=2)
+    for key in range(3):
+        cache.get_or_compute("k", (key,), lambda: key)
+    assert cache.stats()["entries"] == 2 and cache.evictions == 1
+    cache.get_or_compute("k", (2,), lambda: None)
+    assert cache.hits == 1
+
+
+def test_vectorized_moments_match_scalar_kernels():
+    designer = BS8110Designer()
+    moments = np.linspace(-450.0, 450.0, 37)
+    b, d, bf = 300.0, 455.0, 900.0
+    batch = designer.design_moments(moments, b, d, 30, 460, bf=bf)
+    for i, M in enumerate(moments):
+        hogging = M < 0
+        flex = designer._flexure_kernel(abs(M), b, d, 30, 460, bf, 150.0, hogging)
+        bars = designer._bars_kernel(flex["As_req"], 460)
+        assert np.isclose(batch["As_req"][i], flex["As_req"])
+        assert np.isclose(batch["As_comp_req"][i], flex["As_comp_req"])
+        assert batch["comp_needed"][i] == flex["comp_needed"]
+        assert (batch["bar_count"][i], batch["bar_dia"][i]) == (bars["count"], bars["dia"])
+        assert np.isclose(batch["As_prov"][i], bars["As_prov"])
+    assert batch["comp_needed"].any() and not batch["comp_needed"].all()
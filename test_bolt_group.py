@@ -0,0 +1,70 @@
+import math
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.Backend.calculations.steel_design.bolted_connections_backend import (
+    BoltGroupRequest, analyze_bolt_group, bolt_group_forces,
+)
+from src.Backend.calculations.steel_design.connections_api import router
+
+
+def grid(rows, cols, pitch=70.0, gauge=90.0):
+    return [(c * gauge, r * pitch) for r in range(rows) for c in range(cols)]
+
+
+def test_kernel_matches_per_bolt_elastic_analysis():
+    positions = grid(20, 6)
+    rng = np.random.default_rng(5)
+    loads = rng.uniform(-300, 300, (8, 3))
+    out = bolt_group_forces(positions, loads)
+    assert out["resultant"].shape == (8, 120)
+
+    xc = sum(p[0] for p in positions) / 120
+    yc = sum(p[1] for p in positions) / 120
+    J = sum((x - xc) ** 2 + (y - yc) ** 2 for x, y in positions)
+    for case, (Fx, Fy, Mz) in enumerate(loads):
+        forces = [
+            math.hypot(Fx / 120 - Mz * 1000 * (y - yc) / J, Fy / 120 + Mz * 1000 * (x - xc) / J)
+            for x, y in positions
+        ]
+        assert np.allclose(out["resultant"][case], forces)
+        assert out["critical_bolt"][case] == int(np.argmax(forces))
+    # Pure moment: bolt forces sum to zero and their moments to Mz
+    f = bolt_group_forces(positions, [(0.0, 0.0, 50.0)])["components"][0]
+    d = np.array(positions) - (xc, yc)
+    assert np.allclose(f.sum(axis=0), 0.0)
+    assert np.isclose((d[:, 0] * f[:, 1] - d[:, 1] * f[:, 0]).sum(), 50.0 * 1000)
+
+
+def test_single_group_analysis_unchanged():
+    positions = grid(4, 2)
+    result = analyze_bolt_group(BoltGroupRequest(
+        bolt_diameter=20, bolt_grade="8.8", bolt_positions=positions, applied_force=150,
+        eccentricity_x=200, thread_condition="threads_in_shear_plane", plate_thickness=12, plate_grade="S275",
+    ))
+    xc, yc = 45.0, 105.0
+    J = sum((x - xc) ** 2 + (y - yc) ** 2 for x, y in positions)
+    r_max = math.hypot(45.0, 105.0)
+    assert result.max_bolt_force == round(150 / 8 + 200 * 150 * r_max / J, 2)
+    assert result.critical_bolt_position == (0.0, 0.0)
+
+
+def test_batch_endpoint():
+    app = FastAPI()
+    app.include_router(router, prefix="/connections_backend")
+    client = TestClient(app)
+    connections = [
+        dict(id=f"BP{i}", bolt_diameter=24, bolt_grade="8.8", bolt_positions=grid(10, 4 + i % 3),
+             load_cases=[(20.0 * i, 100.0, 10.0), (0.0, 50.0 + i, 40.0)], thread_condition="threads_in_shear_plane")
+        for i in range(50)
+    ]
+    response = client.post("/connections_backend/bolt-group-batch", json={"connections": connections})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 50 and len(body["results"]) == 50
+    first = body["results"][0]
+    out = bolt_group_forces(connections[0]["bolt_positions"], connections[0]["load_cases"])
+    assert first["max_bolt_force"] == round(float(out["max_force"].max()), 2)
+    assert first["critical_bolt"] == out["critical_bolt"][first["governing_case"]]
+    assert "bolt_forces" not in first
@@ -0,0 +1,113 @@
+import numpy as np
+from src.Backend.calculations.Columns.Interactio import ColumnDesignBS8110, design_columns
+from src.Backend.calculations.Columns.interaction_surface import (
+    ALPHA_C, ALPHA_S, EPS_CU, ES, INTERACTION_CACHE, X_GRID, interaction_surface,
+)
+
+
+def scalar_point(fcu, fy, d_norm, dp_norm, rho_half, x):
+    """Straight transcription of the BS 8110 section equilibrium at one neutral axis"""
+    a = min(0.9 * x, 1.0)
+    Cc = ALPHA_C * fcu * a
+    limit = ALPHA_S * fy
+    fsp = float(np.clip(ES * EPS_CU * (x - dp_norm) / x, -limit, limit))
+    fs = float(np.clip(ES * EPS_CU * (d_norm - x) / x, -limit, limit))
+    N = Cc + (fsp - fs) * rho_half
+    M = Cc * (0.5 - a / 2) + fsp * rho_half * (0.5 - dp_norm) + fs * rho_half * (d_norm - 0.5)
+    return N, M
+
+
+def test_broadcast_curves_match_scalar_equilibrium():
+    surface = interaction_surface(35, 460, 0.84, 0.16)
+    N, M = surface.curves([0.4, 2.0, 4.0])
+    for i, p in enumerate([0.4, 2.0, 4.0]):
+        for j in (0, 17, 60, 111, 199):
+            n, m = scalar_point(35, 460, 0.84, 0.16, p / 200, X_GRID[j])
+            assert np.isclose(N[i, j], n) and np.isclose(M[i, j], m)
+
+
+def test_schedule_of_identical_sections_reuses_one_surface():
+    INTERACTION_CACHE.clear()
+    columns = [ColumnDesignBS8110(300, 400, N=N * 1e3, Mx=20e6) for N in (600, 800, 1000, 1200)]
+    curves = [c.get_interaction() for c in columns]
+    stats = INTERACTION_CACHE.stats()
+    assert stats["misses"] == 1 and stats["hits"] == 3
+    assert all(c == curves[0] for c in curves)
+    assert [c["steelPercentage"] for c in curves[0]] == [0.4, 0.8, 1.0, 2.0, 3.0, 4.0]
+    points = curves[0][-1]["points"]
+    assert all(p["N"] >= 0 for p in points)
+    assert [p["N"] for p in points] == sorted(p["N"] for p in points)
+
+
+def test_tabulated_steel_ratio_reaches_the_exact_capacity():
+    surface = interaction_surface(30, 460, 0.84, 0.16)
+    rng = np.random.default_rng(3)
+    n, m = rng.uniform(0.0, 20.0, 300), rng.uniform(0.0, 5.0, 300)
+    rho_half = surface.required_steel(n, m)
+    assert not np.isnan(rho_half).any()
+    capacity = surface.moment_capacity(n, rho_half)
+    needs_steel = rho_half > 1e-4
+    assert np.allclose(capacity[needs_steel], m[needs_steel], rtol=2e-3)
+    # Scalar Brent and vectorized bisection agree
+    assert np.isclose(surface.neutral_axis(7.5, 0.01), surface.neutral_axis(np.full(3, 7.5), 0.01)[0])
+
+
+def test_biaxial_column_designs_without_recursion():
+    column = ColumnDesignBS8110(300, 400, N=2400e3, Mx=90e6, My=40e6)
+    assert column.is_biaxial and column.capacity_ok
+    M, width, depth = column.design_axis()
+    assert M > column.M_x
+    capacity = column._surface(depth, 16).moment_capacity(column.N / (width * depth), column.rho / 2)
+    assert capacity * width * depth**2 >= 0.99 * M
+
+    overloaded = ColumnDesignBS8110(300, 400, N=4500e3, Mx=200e6)
+    assert not overloaded.capacity_ok and overloaded.rho == overloaded.max_rho
+
+
+def test_batch_design_reports_failures_per_column():
+    items = [dict(id=f"C{i}", b=300, h=450, N=2200 + 20 * i, M=80, mode="uniaxial") for i in range(12)]
+    items.insert(5, dict(id="bad", b=300, N=1000))
+    INTERACTION_CACHE.clear()
+    results = design_columns(items)
+    assert [r["id"] for r in results] == [item["id"] for item in items]
+    assert results[5]["status"] == "error"
+    good = [r for r in results if r["status"] == "success"]
+    assert len(good) == 12 and all(r["capacity_ok"] for r in good)
+    assert INTERACTION_CACHE.stats()["kernels"]["capacity_table"]["misses"] == 1
+    percentages = [r["steel_percentage"] for r in good]
+    assert percentages == sorted(percentages)
+
+
+def baseline_curves(column):
+    """The original per-point get_interaction loop"""
+    d_norm = (column.h - column.cover - column.tie_dia - column.bar_dia / 2) / column.h
+    dp_norm = (column.cover + column.tie_dia + column.bar_dia / 2) / column.h
+    curves = []
+    for p in [0.4, 0.8, 1.0, 2.0, 3.0, 4.0]:
+        rho_half, points = (p / 2.0) / 100.0, []
+        for x in np.linspace(0.01, 10.0, 200):
+            a = 0.9 * x if x <= 1.1111 else 1.0
+            Cc = ALPHA_C * column.fcu * a
+            limit = ALPHA_S * column.fy
+            fsp = np.clip(ES * (EPS_CU * (x - dp_norm) / x), -limit, limit)
+            fs = np.clip(ES * (EPS_CU * (d_norm - x) / x), -limit, limit)
+            N = Cc + fsp * rho_half - fs * rho_half
+            M = Cc * (0.5 - a / 2.0) + fsp * rho_half * (0.5 - dp_norm) + fs * rho_half * (d_norm - 0.5)
+            if N >= 0:
+                points.append({'M': round(float(M), 3), 'N': round(float(N), 3)})
+        curves.append({'steelPercentage': p, 'points': sorted(points, key=lambda q: q['N'])})
+    return curves
+
+
+def test_curves_match_the_per_point_loop_exactly():
+    INTERACTION_CACHE.clear()
+    for h in (250, 400, 750):
+        for cover in (25, 40, 50):
+            for fcu, fy in ((25, 250), (40, 460)):
+                column = ColumnDesignBS8110(300, h, fcu=fcu, fy=fy, cover=cover, N=800e3, Mx=60e6)
+                assert column.get_interaction() == baseline_curves(column)
+    # Sections whose d/h differ only beyond the 4th decimal get their own surface
+    INTERACTION_CACHE.clear()
+    ColumnDesignBS8110(300, 400, cover=40, N=800e3, Mx=60e6).get_interaction()
+    ColumnDesignBS8110(300, 400.01, cover=40, N=800e3, Mx=60e6).get_interaction()
+    assert INTERACTION_CACHE.stats()["misses"] == 2
@@ -0,0 +1,138 @@
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.Backend.calculations.Columns.Interactio import ColumnDesignBS8110
+from src.Backend.calculations.Columns.column_schedule import ColumnScheduleRequest, design_schedule, router
+from src.Backend.calculations.Columns.interaction_surface import INTERACTION_CACHE
+
+
+def frame_output(n_stacks, n_storeys, combination, scale, storey_height=3.5, seed=0, section=(300.0, 450.0)):
+    """Analysis output in the /api/framed/api/analyze shape: columns plus one beam per level"""
+    rng = np.random.default_rng(seed)
+    nodes, members = [], []
+    node_id = {}
+    for s in range(n_stacks):
+        for level in range(n_storeys + 1):
+            node_id[s, level] = len(nodes) + 1
+            nodes.append({"id": len(nodes) + 1, "x": 6.0 * s, "y": storey_height * level, "z": 0.0})
+
+    def forces(N, Mz, My):
+        end = {"N": N, "Vy": 0.0, "Vz": 0.0, "T": 0.0, "My": My, "Mz": Mz}
+        return {"start": dict(end), "end": dict(end, Mz=-0.6 * Mz, My=-0.6 * My)}
+
+    for s in range(n_stacks):
+        for level in range(n_storeys):
+            N = -scale * 550.0 * (n_storeys - level) * (1 + 0.1 * rng.random())
+            members.append({
+                "id": len(members) + 1,
+                # Some columns are defined top-down
+                "startNode": node_id[s, level + (level % 2)],
+                "endNode": node_id[s, level + 1 - (level % 2)],
+                "section": {"width": section[0], "depth": section[1], "type": "column"},
+                "material": {"fcu": 30, "fy": 460},
+                "length": storey_height,
+                "endForces": forces(N, scale * 40.0 * (1 + rng.random()), scale * 10.0 * rng.random()),
+            })
+    for level in range(1, n_storeys + 1):
+        members.append({
+            "id": len(members) + 1, "startNode": node_id[0, level], "endNode": node_id[1, level],
+            "section": {"width": 300.0, "depth": 500.0, "type": "beam"}, "material": {"fcu": 30, "fy": 460},
+            "length": 6.0, "endForces": forces(0.0, 100.0, 0.0),
+        })
+    return {"nodes": nodes, "members": members, "combination": combination}
+
+
+def test_schedule_matches_single_column_design_for_governing_combination():
+    analyses = [frame_output(3, 6, "1.4D + 1.6L", 1.0, seed=1), frame_output(3, 6, "1.2D + 1.2L + 1.2W", 0.9, seed=2)]
+    # Wind combination: larger moments on the same members
+    for member in analyses[1]["members"]:
+        for end in member["endForces"].values():
+            end["Mz"] *= 2.5
+    out = design_schedule(ColumnScheduleRequest(analyses=analyses))
+    schedule = out["schedule"]
+    assert out["summary"]["column_storeys"] == 18 and out["summary"]["stacks"] == 3
+    assert schedule["storey"][:6] == [1, 2, 3, 4, 5, 6] and schedule["stack"][:7] == [1] * 6 + [2]
+
+    by_combo = {a["combination"]: {m["id"]: m for m in a["members"]} for a in analyses}
+    for i, member_id in enumerate(schedule["member_id"]):
+        steel = []
+        for name, members in by_combo.items():
+            ends = members[member_id]["endForces"]
+            column = ColumnDesignBS8110(
+                300, 450, N=max(abs(e["N"]) for e in ends.values()) * 1e3,
+                Mx=max(abs(e["Mz"]) for e in ends.values()) * 1e6,
+                My=max(abs(e["My"]) for e in ends.values()) * 1e6, lo=3500,
+            )
+            steel.append((column.Asc_req, name, column))
+        most, name, _ = max(steel, key=lambda s: s[0])
+        if most > 0:
+            assert schedule["governing_combination"][i] == name
+        column = next(c for _, n, c in steel if n == schedule["governing_combination"][i])
+        assert np.isclose(schedule["steel_percentage"][i], column.rho * 100, atol=1e-3)
+        assert (schedule["num_bars"][i], schedule["bar_dia"][i]) == (column.num_bars, column.bar_dia)
+        assert (schedule["links_dia"][i], schedule["links_spacing"][i]) == (column.links_dia, column.links_spacing)
+        assert schedule["capacity_ok"][i] == column.capacity_ok
+
+    assert sum(m["count"] for m in out["marks"]) == 18
+    assert out["marks"][0]["mark"] == schedule["mark"][0] == "C1"
+
+
+def test_wide_columns_design_frame_my_about_the_major_axis():
+    # 450 wide x 300 deep: the frame's Mz bends across the 300 depth, My across the 450 width
+    wide = frame_output(2, 3, "ULS", 1.0, seed=3, section=(450.0, 300.0))
+    deep = frame_output(2, 3, "ULS", 1.0, seed=3)
+    for member in deep["members"]:
+        for end in member["endForces"].values():
+            end["Mz"], end["My"] = end["My"], end["Mz"]
+
+    wide_out = design_schedule(ColumnScheduleRequest(analyses=[wide]))["schedule"]
+    deep_out = design_schedule(ColumnScheduleRequest(analyses=[deep]))["schedule"]
+    assert wide_out == deep_out
+    assert wide_out["b"][0] == 300.0 and wide_out["h"][0] == 450.0
+
+    members = {m["id"]: m for m in wide["members"]}
+    for i, member_id in enumerate(wide_out["member_id"]):
+        ends = members[member_id]["endForces"].values()
+        column = ColumnDesignBS8110(
+            300, 450, N=max(abs(e["N"]) for e in ends) * 1e3,
+            Mx=max(abs(e["My"]) for e in ends) * 1e6,
+            My=max(abs(e["Mz"]) for e in ends) * 1e6, lo=3500,
+        )
+        assert np.isclose(wide_out["steel_percentage"][i], column.rho * 100, atol=1e-3)
+        assert (wide_out["num_bars"][i], wide_out["bar_dia"][i]) == (column.num_bars, column.bar_dia)
+
+
+def test_schedule_shares_interaction_surfaces_with_single_column_design():
+    analyses = [frame_output(3, 6, "ULS", 0.9, seed=2)]
+    for member in analyses[0]["members"]:
+        for end in member["endForces"].values():
+            end["Mz"] *= 2.5
+    INTERACTION_CACHE.clear()
+    design_schedule(ColumnScheduleRequest(analyses=analyses))
+    built = INTERACTION_CACHE.stats()["entries"]
+    assert built > 0
+
+    for member in analyses[0]["members"][:18]:
+        ends = member["endForces"].values()
+        ColumnDesignBS8110(
+            300, 450, N=max(abs(e["N"]) for e in ends) * 1e3,
+            Mx=max(abs(e["Mz"]) for e in ends) * 1e6, My=max(abs(e["My"]) for e in ends) * 1e6, lo=3500,
+        )
+    # Same exact section parameters: every surface is a cache hit
+    assert INTERACTION_CACHE.stats()["entries"] == built
+
+
+def test_schedule_endpoint_handles_thousands_of_column_storeys():
+    app = FastAPI()
+    app.include_router(router, prefix="/column_interaction")
+    client = TestClient(app)
+    analyses = [frame_output(50, 40, "ULS", 0.5)]
+    response = client.post("/column_interaction/column-schedule", json={"analyses": analyses})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["summary"]["column_storeys"] == 2000
+    assert len(body["schedule"]["member_id"]) == 2000
+    assert body["summary"]["governing_counts"] == {"ULS": 2000}
+
+    bad = client.post("/column_interaction/column-schedule", json={"analyses": [{"nodes": [], "members": []}]})
+    assert bad.status_code == 400
@@ -0,0 +1,131 @@
+import sys
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+# The tall-frame modules import their siblings as top-level 'calculations'
+sys.path.insert(0, str(Path(__file__).parent / "src" / "Backend"))
+
+from calculations.Beams import beam_batch  # noqa: E402
+from calculations.tall_framed.New_frame import (  # noqa: E402
+    FORCE_COMPONENTS, DetailedMemberAnalysis, ForceEnvelope, FrameAnalysisRequest, _build_frame_analyzer,
+    _component_columns, compute_force_envelope, group_loads_by_member,
+)
+from calculations.tall_framed.frame_analysis_core import LoadCategory, LoadCombination  # noqa: E402
+from calculations.tall_framed import design_orchestrator  # noqa: E402
+from calculations.tall_framed.design_orchestrator import DesignOrchestrator  # noqa: E402
+
+
+def sections(scale, length=6.0, n=5):
+    ratios = np.linspace(0, 1, n)
+    return [
+        dict(position=r * length, N=-10.0 * scale, Vy=40.0 * scale * (1 - 2 * r), Vz=0.0, T=0.0, My=0.0,
+             Mz=scale * (60.0 * 4 * r * (1 - r) - 30.0))
+        for r in ratios
+    ]
+
+
+def frame(beam_scales):
+    nodes = [dict(id=0, x=0.0, y=0.0, z=0.0), dict(id=1, x=0.0, y=3.0, z=0.0)]
+    members = [dict(id=0, startNode=0, endNode=1, length=3.0, section=dict(width=300.0, depth=300.0),
+                    sections=sections(8.0, 3.0))]
+    for i, scale in enumerate(beam_scales):
+        a, b = 2 + 2 * i, 3 + 2 * i
+        nodes += [dict(id=a, x=0.0, y=3.0 + i, z=0.0), dict(id=b, x=6.0, y=3.0 + i, z=0.0)]
+        members.append(dict(id=i + 1, startNode=a, endNode=b, length=6.0, section=dict(width=300.0, depth=500.0),
+                            sections=sections(scale)))
+    return dict(nodes=nodes, members=members)
+
+
+def test_identical_members_share_one_design():
+    out = DesignOrchestrator(frame([1.0, 1.0, 1.0, 2.5])).design_all_members()
+    assert out["deduplication"]["beams"] == {"members": 4, "unique_designs": 2}
+    assert out["deduplication"]["columns"] == {"members": 1, "unique_designs": 1}
+    beams = {b["member_id"]: {k: v for k, v in b.items() if k != "member_id"} for b in out["beams"]}
+    assert beams[1] == beams[2] == beams[3]
+    assert beams[4] != beams[1]
+
+
+def test_parallel_matches_serial():
+    data = frame([1.0, 1.5, 1.0, 2.0, 2.5, 1.5])
+    serial = DesignOrchestrator(data).design_all_members()
+    parallel = DesignOrchestrator(data).design_all_members(parallel=True, chunk_size=1)
+    assert parallel["parallel"] and not serial["parallel"]
+    for kind in ("beams", "columns", "foundations", "slabs"):
+        assert parallel[kind] == serial[kind]
+    assert parallel["deduplication"] == serial["deduplication"]
+    assert beam_batch._POOL is not None
+    assert all(b["status"] != "error" for b in serial["beams"])
+
+
+def test_parallel_reports_serial_fallback():
+    # A lone beam (no column, no base node) is a single chunk: nothing to send to the pool
+    data = frame([1.0])
+    data = dict(nodes=data["nodes"][2:], members=data["members"][1:])
+    out = DesignOrchestrator(data).design_all_members(parallel=True)
+    assert out["deduplication"]["beams"]["unique_designs"] == 1
+    assert out["parallel"] is False
+
+    class BrokenPool:
+        def submit(self, *args):
+            raise BrokenProcessPool()
+
+    with patch.object(design_orchestrator, "get_pool", BrokenPool):
+        out = DesignOrchestrator(frame([1.0, 2.0])).design_all_members(parallel=True, chunk_size=1)
+    assert out["parallel"] is False
+    assert all(b["status"] != "error" for b in out["beams"])
+
+
+def test_beams_are_designed_for_both_envelope_extremes():
+    # Section 0 hogs in combination A and sags in B; the governing value alone loses B
+    stack = np.zeros((2, 1, 3, len(FORCE_COMPONENTS)))
+    mz = FORCE_COMPONENTS.index("Mz")
+    stack[0, 0, :, mz] = [-100.0, 50.0, -20.0]
+    stack[1, 0, :, mz] = [80.0, 60.0, 30.0]
+    envelope = ForceEnvelope.from_stack(stack, ["A", "B"], [7], np.linspace(0, 1, 3))
+
+    records = envelope.member_sections(7, 6.0)
+    assert records[0]["Mz"] == -100.0 and records[0]["combinations"]["Mz"] == "A"
+    assert records[0]["max"]["Mz"] == 80.0 and records[0]["max_combinations"]["Mz"] == "B"
+    assert records[0]["min"]["Mz"] == -100.0 and records[0]["min_combinations"]["Mz"] == "A"
+
+    member = dict(id=7, length=6.0, section=dict(width=300.0, depth=500.0))
+    payload = DesignOrchestrator(dict(nodes=[], members=[]), envelope)._beam_payload(member)
+    assert max(payload["moments"]) == 80.0 and min(payload["moments"]) == -100.0
+    assert payload["positions"] == [0.0, 3.0, 6.0] * 2
+
+
+@pytest.mark.parametrize("second_order", [False, True])
+def test_force_envelope_matches_per_combination_loop(second_order):
+    request = FrameAnalysisRequest(floors=3, bays=2, story_height=3.5, bay_width=6.0, lateral_load=120.0,
+                                   vertical_load=30.0, second_order=second_order)
+    combinations = [
+        LoadCombination("1.4D", {LoadCategory.DEAD: 1.4}),
+        LoadCombination("1.0D + 1.4W", {LoadCategory.DEAD: 1.0, LoadCategory.WIND: 1.4}),
+        LoadCombination("1.0D - 1.4W", {LoadCategory.DEAD: 1.0, LoadCategory.WIND: -1.4}),
+    ]
+    analyzer = _build_frame_analyzer(request, combinations)
+    envelope = compute_force_envelope(analyzer, n_sections=11)
+
+    loads = group_loads_by_member(analyzer.loads)
+    for e, mid in enumerate(envelope.member_ids):
+        detail = DetailedMemberAnalysis(analyzer.members[mid], analyzer.nodes, 11)
+        per_combo = np.stack([
+            _component_columns(detail.section_results(analyzer.member_forces[c.name][mid], loads.get(mid, []), c.factors))
+            for c in combinations
+        ])
+        assert np.allclose(envelope.max[e], per_combo.max(axis=0), atol=1e-6)
+        assert np.allclose(envelope.min[e], per_combo.min(axis=0), atol=1e-6)
+        # Governing combination: compare values, ties may pick either combination
+        chosen_max = np.take_along_axis(per_combo, envelope.max_combo[e][None], axis=0)[0]
+        chosen_min = np.take_along_axis(per_combo, envelope.min_combo[e][None], axis=0)[0]
+        assert np.allclose(chosen_max, per_combo.max(axis=0), atol=1e-6)
+        assert np.allclose(chosen_min, per_combo.min(axis=0), atol=1e-6)
+
+    # Wind reversal governs the sway moments at the column bases
+    base_mz = FORCE_COMPONENTS.index("Mz")
+    names = {envelope.combination_names[k] for k in envelope.max_combo[:, 0, base_mz].tolist()}
+    assert {"1.0D + 1.4W", "1.0D - 1.4W"} & names
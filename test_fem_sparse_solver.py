@@ -0,0 +1,83 @@
+import numpy as np
+from src.Backend.calculations.tall_framed.fem_solver import FEM2DSolver
+from src.Backend.calculations.tall_framed.sparse_linalg import FactorizationCache, FACTOR_CACHE
+
+
+def build_frame(floors, bays, h=3.0, w=6.0, lateral=50.0, vertical=30.0):
+    solver = FEM2DSolver()
+    node_map = {}
+    node_id = 1
+    for row in range(floors + 1):
+        for col in range(bays + 1):
+            fixity = [True, True, True] if row == 0 else [False, False, False]
+            solver.add_node(node_id, col * w, row * h, fixity)
+            node_map[(row, col)] = node_id
+            node_id += 1
+
+    E = 30e6
+    elem_id = 1
+    for row in range(floors):
+        for col in range(bays + 1):
+            solver.add_element(elem_id, node_map[(row, col)], node_map[(row + 1, col)], E, 0.25, 0.5**4 / 12)
+            elem_id += 1
+        for col in range(bays):
+            solver.add_element(elem_id, node_map[(row + 1, col)], node_map[(row + 1, col + 1)], E, 0.24, 0.4 * 0.6**3 / 12)
+            solver.add_udl(elem_id, -vertical)
+            elem_id += 1
+        solver.add_nodal_load(node_map[(row + 1, 0)], fx=lateral / floors)
+    return solver
+
+
+def test_sparse_matches_dense():
+    dense = build_frame(4, 3).solve(method="dense")
+    sparse = build_frame(4, 3).solve(method="sparse")
+
+    assert np.isclose(dense["max_disp"], sparse["max_disp"], rtol=1e-9)
+    for eid, forces in dense["elements"].items():
+        for key, value in forces.items():
+            assert np.isclose(value, sparse["elements"][eid][key], rtol=1e-7, atol=1e-7), (eid, key)
+
+
+def test_sparse_detects_mechanism():
+    solver = FEM2DSolver()
+    solver.add_node(1, 0.0, 0.0, [False, False, False])
+    solver.add_node(2, 5.0, 0.0, [False, False, False])
+    solver.add_element(1, 1, 2, 30e6, 0.1, 0.001)
+    solver.add_nodal_load(2, fy=-10.0)
+    assert solver.solve(method="sparse") is None
+
+
+def test_load_only_change_reuses_factorization():
+    FACTOR_CACHE.clear()
+    first = build_frame(6, 4, vertical=30.0).solve(method="sparse")
+    second = build_frame(6, 4, vertical=45.0).solve(method="sparse")
+    reference = build_frame(6, 4, vertical=45.0).solve(method="sparse", use_cache=False)
+
+    stats = FACTOR_CACHE.stats()
+    assert stats["misses"] == 1 and stats["hits"] == 1
+    assert second["max_disp"] != first["max_disp"]
+    assert np.isclose(second["max_disp"], reference["max_disp"], rtol=1e-12)
+
+    # A section change is a new topology
+    solver = build_frame(6, 4)
+    solver.elements[1].I *= 2
+    solver.solve(method="sparse")
+    assert FACTOR_CACHE.stats()["misses"] == 2
+
+
+def test_cache_evicts_least_recently_used():
+    cache = FactorizationCache(max_bytes=10**9, max_entries=2)
+    for floors in (2, 3, 4):
+        solver = build_frame(floors, 2)
+        cache.get_or_factorize(solver.topology_key(), lambda: np.eye(3 * floors))
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["evictions"] == 1
+    assert cache.get(build_frame(2, 2).topology_key()) is None
+
+
+if __name__ == "__main__":
+    test_sparse_matches_dense()
+    test_sparse_detects_mechanism()
+    test_load_only_change_reuses_factorization()
+    test_cache_evicts_least_recently_used()
+    print("Sparse FEM solver matches dense reference")
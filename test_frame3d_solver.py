@@ -0,0 +1,98 @@
+import numpy as np
+from src.Backend.calculations.tall_framed.frame_analysis_core import (
+    Frame3DAnalyzer, Node, Member, Material, Section, Load, LoadCategory,
+    LoadCombination, DOF_NAMES
+)
+from test_fem_sparse_solver import build_frame
+
+
+def build_3d_from_2d(solver_2d):
+    analyzer = Frame3DAnalyzer()
+    concrete = Material("C30", 30e6, 12.5e6, 25.0)
+    column = Section("Column", 500, 500, 0.25, 0.5**4 / 12, 0.5**4 / 12, 0.01)
+    beam = Section("Beam", 400, 600, 0.24, 0.4 * 0.6**3 / 12, 0.6 * 0.4**3 / 12, 0.01)
+
+    for nid, n in solver_2d.nodes.items():
+        support = {name: True for name in DOF_NAMES} if n.fixity[0] else {}
+        analyzer.add_node(Node(nid, n.x, n.y, 0.0, support=support))
+    for eid, e in solver_2d.elements.items():
+        analyzer.add_member(Member(eid, e.node_i, e.node_j, column if e.A == 0.25 else beam, concrete))
+        if e.udl:
+            analyzer.add_load(Load(LoadCategory.DEAD, member_id=eid, Fy=e.udl))
+    for nid, n in solver_2d.nodes.items():
+        if n.load[0]:
+            analyzer.add_load(Load(LoadCategory.WIND, node_id=nid, Fx=n.load[0]))
+    return analyzer
+
+
+def test_planar_frame_matches_2d_solver():
+    solver_2d = build_frame(3, 2)
+    solver_2d.solve(method="dense")
+
+    analyzer = build_3d_from_2d(solver_2d)
+    analyzer.add_load_combination(LoadCombination("D+W", {LoadCategory.DEAD: 1.0, LoadCategory.WIND: 1.0}))
+    analyzer.add_load_combination(LoadCombination("1.4D", {LoadCategory.DEAD: 1.4}))
+    analyzer.analyze_all_combinations()
+
+    for eid, e in solver_2d.elements.items():
+        in_plane = analyzer.member_forces["D+W"][eid][[0, 1, 5, 6, 7, 11]]
+        expected = [e.forces[k] for k in ("N_i", "V_i", "M_i", "N_j", "V_j", "M_j")]
+        assert np.allclose(in_plane, expected, atol=1e-6)
+
+    top = analyzer.nodes[max(analyzer.nodes)]
+    assert np.allclose(analyzer.displacements["D+W"][top.global_dof_indices()[:3]], top.displacements["D+W"][:3])
+    assert "1.4D" in analyzer.member_forces
+
+
+def test_space_cantilever_tip_deflection():
+    analyzer = Frame3DAnalyzer()
+    concrete = Material("C30", 30e6, 12.5e6, 25.0)
+    section = Section.rectangular("Beam", 300, 500)
+    analyzer.add_node(Node(1, 0.0, 0.0, 0.0, support={name: True for name in DOF_NAMES}))
+    analyzer.add_node(Node(2, 0.0, 0.0, 4.0))
+    analyzer.add_node(Node(3, 3.0, 0.0, 4.0))
+    analyzer.add_member(Member(1, 1, 2, section, concrete))
+    analyzer.add_member(Member(2, 2, 3, section, concrete))
+    analyzer.add_load(Load(LoadCategory.DEAD, node_id=3, Fy=-10.0))
+    analyzer.add_load_combination(LoadCombination("D", {LoadCategory.DEAD: 1.0}))
+    analyzer.analyze_all_combinations()
+
+    # Bending of both legs plus twist of the first leg carried to the tip
+    E, G = concrete.E, concrete.G
+    expected = 10.0 * (3.0**3 + 4.0**3) / (3 * E * section.Iz) + (10.0 * 3.0) * 4.0 / (G * section.J) * 3.0
+    assert np.isclose(-analyzer.nodes[3].displacements["D"][1], expected, rtol=1e-9)
+    assert np.isclose(analyzer.member_forces["D"][1][3], 30.0)
+
+
+def test_superposed_combinations_match_direct_scaling():
+    solver_2d = build_frame(3, 2)
+    analyzer = build_3d_from_2d(solver_2d)
+    # Reverse wind as a second direction
+    for nid, n in solver_2d.nodes.items():
+        if n.load[0]:
+            analyzer.add_load(Load(LoadCategory.wind("X-"), node_id=nid, Fx=-n.load[0]))
+
+    combos = LoadCombination.bs8110_uls([LoadCategory.WIND, LoadCategory.wind("X-")])
+    combos += LoadCombination.ec0_uls([LoadCategory.WIND, LoadCategory.wind("X-")])
+    for combo in combos:
+        analyzer.add_load_combination(combo)
+    analyzer.analyze_all_combinations()
+
+    cases = analyzer.case_results
+    assert cases.end_forces.shape == (3, len(analyzer.members), 12)
+
+    dead = cases.end_forces[cases.case_names.index(LoadCategory.DEAD)]
+    wind = cases.end_forces[cases.case_names.index(LoadCategory.WIND)]
+    reverse = cases.end_forces[cases.case_names.index(LoadCategory.wind("X-"))]
+    assert np.allclose(reverse, -wind)
+
+    mids = list(analyzer.members)
+    combined = np.array([analyzer.member_forces["1.2D + 1.2L + 1.2W"][mid] for mid in mids])
+    assert np.allclose(combined, 1.2 * dead + 1.2 * wind)
+
+
+if __name__ == "__main__":
+    test_planar_frame_matches_2d_solver()
+    test_space_cantilever_tip_deflection()
+    test_superposed_combinations_match_direct_scaling()
+    print("3D frame solver checks passed")
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.Backend.calculations.Beams.influence_lines import AxleTrain
+from src.Backend.calculations.Beams.threemain import (
+    Load, LoadType, Span, Support, SupportType, ThreeMomentSolver, router,
+)
+from src.Backend.calculations.tall_framed.fem_solver import FEM2DSolver
+
+SPANS = [6.0, 8.0, 5.0]
+SUPPORT_X = [0.0, 6.0, 14.0, 19.0]
+
+
+def supports(left=SupportType.PINNED):
+    return [Support(support_type=left if i == 0 else SupportType.PINNED, position=x) for i, x in enumerate(SUPPORT_X)]
+
+
+def test_columns_match_single_point_load_analyses():
+    lines = ThreeMomentSolver([Span(length=L) for L in SPANS], supports(SupportType.FIXED)).influence_lines(191, 11)
+    x = np.linspace(0.0, 1.0, 11)
+    for p in (15, 30, 65, 100, 155, 185):
+        xp = lines.positions[p]
+        span = min(np.searchsorted(SUPPORT_X, xp, side="right") - 1, 2)
+        load = Load(load_type=LoadType.POINT, magnitude=1.0, position=xp - SUPPORT_X[span])
+        solver = ThreeMomentSolver(
+            [Span(length=L, loads=[load] if i == span else []) for i, L in enumerate(SPANS)], supports(SupportType.FIXED)
+        )
+        solver.solve()
+        _, M_loads, M_supports = solver.span_diagrams(np.array([x * L for L in SPANS]))
+        assert np.allclose((M_loads + M_supports).ravel(), lines.moment[:, p], atol=1e-12)
+        assert np.allclose(solver.reactions, lines.reactions[:, p], atol=1e-12)
+        assert lines.reactions[:, p].sum() == pytest.approx(1.0)
+
+
+def test_fem_beam_matches_three_moment():
+    solver = FEM2DSolver()
+    solver.add_node(1, 0.0, 0.0, [True, True, False])
+    node, x, path = 1, 0.0, []
+    for L, n in zip(SPANS, (6, 8, 5)):
+        for j in range(n):
+            x += L / n
+            node += 1
+            solver.add_node(node, x, 0.0, [False, j == n - 1, False])
+            solver.add_element(node - 1, node - 1, node, 2e8, 1.0, 1e-4)
+            path.append(node - 1)
+
+    fem = solver.influence_lines(path, 381, 2)
+    beam = ThreeMomentSolver([Span(length=L) for L in SPANS], supports()).influence_lines(381, 2)
+    fem_moment = fem.moment.reshape(len(path), 2, -1)
+    assert np.allclose(fem_moment[5, 1], beam.moment[1], atol=1e-10)  # first interior support
+    assert np.allclose(fem_moment[6, 0], beam.moment[2], atol=1e-10)
+    assert np.allclose(fem.shear.reshape(len(path), 2, -1)[6, 0], beam.shear[2], atol=1e-10)
+    assert np.allclose(fem.reactions, beam.reactions, atol=1e-10)
+
+
+def test_envelope_of_train_matches_brute_force():
+    lines = ThreeMomentSolver([Span(length=L) for L in SPANS], supports()).influence_lines(191, 11)
+    train = AxleTrain(name="Crane", loads=[80.0, 120.0, 60.0], spacings=[1.5, 3.0])
+    env = lines.envelope(train, both_directions=False)
+
+    offsets = train.offsets()
+    stations = lines.stations
+    best = np.full(len(stations), -np.inf)
+    for lead in np.arange(0.0, 19.0 + offsets[-1] + 1e-9, 0.1):
+        spans = [Span(length=L) for L in SPANS]
+        for P, off in zip(train.loads, offsets):
+            xa = lead - off
+            if 0.0 <= xa <= 19.0:
+                span = min(np.searchsorted(SUPPORT_X, xa, side="right") - 1, 2)
+                spans[span].loads.append(Load(load_type=LoadType.POINT, magnitude=P, position=xa - SUPPORT_X[span]))
+        solver = ThreeMomentSolver(spans, supports())
+        solver.solve()
+        _, M_loads, M_supports = solver.span_diagrams(np.array([np.linspace(0, 1, 11) * L for L in SPANS]))
+        best = np.maximum(best, (M_loads + M_supports).ravel())
+    assert np.allclose(env.moment_max, best, atol=1e-6)
+
+
+def test_moving_load_endpoint():
+    app = FastAPI()
+    app.include_router(router)
+    body = {
+        "spans": [{"length": L} for L in SPANS],
+        "supports": [{"support_type": "Pinned", "position": x} for x in SUPPORT_X],
+        "vehicles": [{"name": "HB", "loads": [100, 100, 200, 200], "spacings": [1.8, 6.0, 1.8]}],
+        "include_influence_lines": True,
+    }
+    data = TestClient(app).post("/moving-load", json=body).json()
+    assert len(data["vehicles"][0]["moment_max"]) == len(data["stations"]) == 3 * 21
+    assert len(data["envelope"]["reaction_max"]) == 4
+    assert data["influence_lines"]["supports"] == SUPPORT_X
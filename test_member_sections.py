@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# The tall-frame modules import their siblings as top-level 'calculations'
+sys.path.insert(0, str(Path(__file__).parent / "src" / "Backend"))
+
+from calculations.tall_framed.frame_analysis_core import (  # noqa: E402
+    Frame3DAnalyzer, Node, Member, Material, Section, Load, LoadCategory, LoadCombination, LoadType, DOF_NAMES
+)
+from calculations.tall_framed.New_frame import DetailedMemberAnalysis, group_loads_by_member  # noqa: E402
+
+CONCRETE = Material("C30", 30e6, 12.5e6, 25.0)
+SECTION = Section.rectangular("Beam", 300, 500)
+COMBO = LoadCombination("D+L", {LoadCategory.DEAD: 1.4, LoadCategory.IMPOSED: 1.6})
+
+MEMBER_LOADS = {
+    "udl": [Load(LoadCategory.DEAD, member_id=2, Fy=-12.0, Fz=4.0)],
+    "point": [Load(LoadCategory.IMPOSED, member_id=2, load_type=LoadType.POINT, Fy=-30.0, Fz=-8.0, start_position=0.3)],
+    "varying": [Load(LoadCategory.DEAD, member_id=2, load_type=LoadType.VARYING, start_value=-5.0, end_value=-20.0)],
+}
+
+
+def solve_l_frame(loads):
+    # Column fixed at the base, beam cantilevering from its top: both members bend and twist
+    analyzer = Frame3DAnalyzer()
+    analyzer.add_node(Node(1, 0.0, 0.0, 0.0, support={name: True for name in DOF_NAMES}))
+    analyzer.add_node(Node(2, 0.0, 4.0, 0.0))
+    analyzer.add_node(Node(3, 5.0, 4.0, 0.0))
+    analyzer.add_member(Member(1, 1, 2, SECTION, CONCRETE))
+    analyzer.add_member(Member(2, 2, 3, SECTION, CONCRETE))
+    analyzer.add_load(Load(LoadCategory.IMPOSED, node_id=3, Fx=3.0, Fz=2.0))
+    for load in loads:
+        analyzer.add_load(load)
+    analyzer.add_load_combination(COMBO)
+    analyzer.analyze_all_combinations()
+    return analyzer
+
+
+def member_sections(analyzer, mid, n_sections=21):
+    member = analyzer.members[mid]
+    U = analyzer.displacements[COMBO.name]
+    R = member.rotation_matrix(analyzer.nodes)
+    d_start = U[analyzer.nodes[member.start_node_id].global_dof_indices()].reshape(2, 3)
+    d_end = U[analyzer.nodes[member.end_node_id].global_dof_indices()].reshape(2, 3)
+    end_displacements = (np.concatenate([d_start, d_end]) @ R.T).ravel()
+
+    detail = DetailedMemberAnalysis(member, analyzer.nodes, n_sections)
+    forces = analyzer.member_forces[COMBO.name][mid]
+    loads = group_loads_by_member(analyzer.loads).get(mid, [])
+    return detail.section_results(forces, loads, COMBO.factors, end_displacements), forces, end_displacements
+
+
+@pytest.mark.parametrize("kind", sorted(MEMBER_LOADS))
+def test_sections_at_far_end_match_end_forces(kind):
+    analyzer = solve_l_frame(MEMBER_LOADS[kind])
+    for mid in analyzer.members:
+        result, forces, _ = member_sections(analyzer, mid)
+        at_end = [result.N[-1], result.Vy[-1], result.Vz[-1], result.T[-1], result.My[-1], result.Mz[-1]]
+        assert np.allclose(at_end, forces[6:], atol=1e-8)
+        at_start = [result.N[0], result.Vy[0], result.Vz[0], result.T[0], result.My[0], result.Mz[0]]
+        assert np.allclose(at_start, -forces[:6], atol=1e-8)
+
+
+@pytest.mark.parametrize("kind", sorted(MEMBER_LOADS))
+def test_deflections_match_nodal_displacements(kind):
+    analyzer = solve_l_frame(MEMBER_LOADS[kind])
+    for mid in analyzer.members:
+        result, _, d = member_sections(analyzer, mid)
+        assert result.delta_y[[0, -1]] == pytest.approx(d[[1, 7]] * 1000, abs=1e-9)
+        assert result.delta_z[[0, -1]] == pytest.approx(d[[2, 8]] * 1000, abs=1e-9)
+
+
+def test_simply_supported_udl_sags_positive():
+    analyzer = Frame3DAnalyzer()
+    analyzer.add_node(Node(1, 0.0, 0.0, 0.0, support={'dx': True, 'dy': True, 'dz': True, 'rx': True}))
+    analyzer.add_node(Node(2, 6.0, 0.0, 0.0, support={'dy': True, 'dz': True}))
+    analyzer.add_member(Member(1, 1, 2, SECTION, CONCRETE))
+    analyzer.add_load(Load(LoadCategory.DEAD, member_id=1, Fy=-10.0))
+    analyzer.add_load_combination(COMBO)
+    analyzer.analyze_all_combinations()
+
+    result, _, _ = member_sections(analyzer, 1)
+    w = 1.4 * 10.0
+    x = result.x
+    assert result.Mz == pytest.approx(w * x * (6.0 - x) / 2, abs=1e-8)
+    assert result.Mz[10] == pytest.approx(w * 6.0**2 / 8)
+    assert result.Vy[0] == pytest.approx(-w * 3.0) and result.Vy[-1] == pytest.approx(w * 3.0)
+    # Sagging deflects down: largest at midspan
+    assert result.delta_y.argmin() == 10 and result.delta_y[10] < 0
@@ -0,0 +1,63 @@
+import numpy as np
+import scipy.linalg as sla
+from src.Backend.calculations.tall_framed.fem_solver import FEM2DSolver
+from test_fem_sparse_solver import build_frame
+from test_frame3d_solver import build_3d_from_2d
+
+
+def test_cantilever_matches_closed_form():
+    # 10 m column, 20 elements, consistent mass, no added mass
+    solver = FEM2DSolver()
+    E, A, I, n = 30e6, 0.25, 0.5**4 / 12, 20
+    for i in range(n + 1):
+        solver.add_node(i + 1, 0.0, 10.0 * i / n, [i == 0] * 3)
+    for i in range(n):
+        solver.add_element(i + 1, i + 1, i + 2, E, A, I)
+
+    modal = solver.modal_analysis(n_modes=2, mass_type="consistent", use_cache=False)
+    m = 25.0 * A / 9.81
+    omega_1 = 1.875104**2 * np.sqrt(E * I / (m * 10.0**4))
+    assert np.isclose(modal.omega[0], omega_1, rtol=1e-4)
+    # Both sway modes of the free column are in X
+    assert modal.mass_ratios[0, 0] > 0.6 and modal.mass_ratios[0, 1] < 1e-8
+
+
+def test_sparse_modes_match_dense_eigensolution():
+    solver = build_frame(5, 2)
+    modal = solver.modal_analysis(n_modes=6, mass_type="consistent", use_cache=False)
+
+    k, T, L, dofs, _ = solver._element_arrays()
+    free = solver._free_dofs()
+    K = solver._reduced_stiffness(k, T, dofs, free).toarray()
+    M = solver.mass_matrix("consistent").toarray()[np.ix_(free, free)]
+    omega = np.sqrt(sla.eigh(K, M, eigvals_only=True)[:6])
+    assert np.allclose(modal.omega, omega, rtol=1e-8)
+
+    phi = modal.mode_shapes[free]
+    assert np.allclose(phi.T @ M @ phi, np.eye(6), atol=1e-8)
+
+
+def test_planar_3d_modes_match_2d():
+    solver_2d = build_frame(6, 3)
+    analyzer = build_3d_from_2d(solver_2d)
+    for mass_type in ("lumped", "consistent"):
+        modes_2d = solver_2d.modal_analysis(n_modes=5, mass_type=mass_type)
+        modes_3d = analyzer.modal_analysis(n_modes=5, mass_type=mass_type, mass_source={"DEAD": 1.0})
+        assert np.allclose(modes_2d.periods, modes_3d.periods, rtol=1e-9)
+        assert np.allclose(modes_2d.effective_mass[:, 0], modes_3d.effective_mass[:, 0], rtol=1e-8)
+
+
+def test_tall_frame_modes():
+    solver = build_frame(50, 10)
+    modal = solver.modal_analysis(n_modes=12, use_cache=False)
+    assert len(modal.periods) == 12
+    assert np.all(np.diff(modal.periods) <= 0)
+    assert modal.mass_ratios[:, 0].sum() > 0.9
+
+
+if __name__ == "__main__":
+    test_cantilever_matches_closed_form()
+    test_sparse_modes_match_dense_eigensolution()
+    test_planar_3d_modes_match_2d()
+    test_tall_frame_modes()
+    print("Modal analysis matches closed form and dense eigensolution")
@@ -0,0 +1,73 @@
+import asyncio
+import numpy as np
+import pytest
+from src.Backend.calculations.Beams.diagram_kernel import LoadArrays, sample_points, simple_span_forces
+from src.Backend.calculations.Beams.moment_distribution_backend import (
+    FrameMD,
+    MomentDistributionSolver,
+    get_moment_distribution_examples,
+)
+
+
+def example_frames():
+    for example in asyncio.run(get_moment_distribution_examples()):
+        data = {k: v for k, v in example.items() if k not in ("name", "description")}
+        yield example["name"], data
+
+
+@pytest.mark.parametrize("name,data", list(example_frames()))
+def test_direct_matches_hardy_cross(name, data):
+    data = dict(data, convergence_tolerance=1e-10, max_iterations=500)
+    iterative = MomentDistributionSolver(FrameMD(**data)).solve()
+    direct = MomentDistributionSolver(FrameMD(**data, method="direct")).solve()
+
+    assert iterative.convergence_achieved and direct.convergence_achieved
+    for member_id, ends in iterative.final_moments.items():
+        for end, value in ends.items():
+            assert direct.final_moments[member_id][end] == pytest.approx(value, abs=1e-8), (name, member_id, end)
+
+
+def test_history_is_opt_in_and_limited():
+    _, data = next(example_frames())
+    assert MomentDistributionSolver(FrameMD(**data)).solve().iteration_history == []
+
+    result = MomentDistributionSolver(FrameMD(**data, include_history=True, history_limit=2)).solve()
+    assert [entry["iteration"] for entry in result.iteration_history] == [0, 1, 2]
+    assert result.iterations_performed > 2
+
+
+def test_diagrams_match_statics():
+    _, data = next(example_frames())  # two equal spans, UDL, pinned ends
+    result = MomentDistributionSolver(FrameMD(**data, diagram_points=41)).solve()
+    w, L = 15.0, 6.0
+
+    moments = [point["y"] for point in result.moment_data["AB"]]
+    shears = [point["y"] for point in result.shear_force_data["AB"]]
+    assert len(moments) == 41
+    assert moments[-1] == pytest.approx(-w * L**2 / 8, abs=1e-2)
+    assert shears[0] == pytest.approx(3 * w * L / 8, abs=1e-2)
+    assert result.support_reactions["B"]["Fy"] == pytest.approx(10 * w * L / 8, abs=1e-2)
+
+
+def test_kernel_patch_load_statics():
+    # Trapezoidal patch 2 -> 6 kN/m over 1..4 m on a 5 m simple span
+    loads = LoadArrays()
+    loads.add_patch(0, 2.0, 6.0, 1.0, 3.0)
+    x = sample_points(np.array([5.0]), 5001)
+    V, M = simple_span_forces(np.array([5.0]), x, loads)
+
+    W = (2.0 + 6.0) / 2 * 3.0
+    centroid = 1.0 + 3.0 * (2.0 + 2 * 6.0) / (3 * (2.0 + 6.0))
+    assert V[0, 0] == pytest.approx(W * (5.0 - centroid) / 5.0)
+    assert V[0, 0] - V[0, -1] == pytest.approx(W)
+    assert M[0, -1] == pytest.approx(0.0, abs=1e-9)
+    assert np.allclose(np.gradient(M[0], x[0])[1:-1], V[0, 1:-1], atol=1e-2)
+
+
+if __name__ == "__main__":
+    for name, data in example_frames():
+        test_direct_matches_hardy_cross(name, data)
+    test_history_is_opt_in_and_limited()
+    test_diagrams_match_statics()
+    test_kernel_patch_load_statics()
+    print("Direct moment distribution matches Hardy Cross")
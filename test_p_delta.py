@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from src.Backend.calculations.tall_framed.fem_solver import FEM2DSolver
+from src.Backend.calculations.tall_framed.frame_analysis_core import LoadCategory, LoadCombination
+from test_fem_sparse_solver import build_frame
+from test_frame3d_solver import build_3d_from_2d
+
+E, A, I, H_COL = 30e6, 0.25, 0.5**4 / 12, 10.0
+P_CR = np.pi**2 * E * I / (4 * H_COL**2)
+
+
+def cantilever(P, H=10.0, n=20):
+    solver = FEM2DSolver()
+    for i in range(n + 1):
+        solver.add_node(i + 1, 0.0, H_COL * i / n, [i == 0] * 3)
+    for i in range(n):
+        solver.add_element(i + 1, i + 1, i + 2, E, A, I)
+    solver.add_nodal_load(n + 1, fx=H, fy=-P)
+    return solver
+
+
+@pytest.mark.parametrize("ratio", [0.1, 0.5])
+def test_cantilever_matches_closed_form(ratio):
+    P, H = ratio * P_CR, 10.0
+    solver = cantilever(P, H)
+    results = solver.solve(second_order=True, tolerance=1e-10)
+
+    k = np.sqrt(P / (E * I))
+    assert solver.nodes[21].disp[0] == pytest.approx(H * (np.tan(k * H_COL) - k * H_COL) / (P * k), rel=1e-6)
+    assert abs(results["elements"][1]["M_i"]) == pytest.approx(H * np.tan(k * H_COL) / k, rel=1e-6)
+
+    p_delta = results["p_delta"]
+    assert p_delta["converged"]
+    assert p_delta["critical_load_factor"] == pytest.approx(1 / ratio, rel=1e-4)
+    assert p_delta["amplification_factor"] > 1.0
+
+
+def test_load_above_critical_is_reported_unstable():
+    assert cantilever(1.2 * P_CR).solve(second_order=True) is None
+
+
+def test_planar_3d_frame_matches_2d():
+    solver_2d = build_frame(8, 2, vertical=80.0)
+    results_2d = solver_2d.solve(second_order=True, tolerance=1e-10)
+
+    analyzer = build_3d_from_2d(solver_2d)
+    analyzer.add_load_combination(LoadCombination("D+W", {LoadCategory.DEAD: 1.0, LoadCategory.WIND: 1.0}))
+    analyzer.analyze_all_combinations(second_order=True, tolerance=1e-10)
+
+    summary = analyzer.p_delta["D+W"].summary()
+    assert summary["amplification_factor"] == pytest.approx(results_2d["p_delta"]["amplification_factor"], rel=1e-6)
+    for eid, e in solver_2d.elements.items():
+        in_plane = analyzer.member_forces["D+W"][eid][[0, 1, 5, 6, 7, 11]]
+        expected = [e.forces[k] for k in ("N_i", "V_i", "M_i", "N_j", "V_j", "M_j")]
+        assert np.allclose(in_plane, expected, atol=1e-5)
@@ -0,0 +1,98 @@
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.Backend.calculations.Slabs.plate_fe import (
+    DOF_PER_NODE, PlateAnalysisRequest, PlateModel, analyse_plate, mesh_polygon, router, wood_armer,
+)
+
+SQUARE = [(0.0, 0.0), (4.0, 0.0), (4.0, 4.0), (0.0, 4.0)]
+
+
+def square_plate(edge, size=0.2, h=0.1, E=30e6, nu=0.3, q=10.0):
+    nodes, triangles = mesh_polygon(SQUARE, size)
+    model = PlateModel(nodes, triangles, h, E, nu)
+    on_edge = np.flatnonzero((np.isclose(nodes, 0.0) | np.isclose(nodes, 4.0)).any(axis=1))
+    model.fix(on_edge, (0, 1, 2) if edge == "fixed" else (0,))
+    F = model.pressure_vector(q)[:, None]
+    U = model.solve(F)
+    centre = model.nearest_nodes([(2.0, 2.0)])[0]
+    D = E * h**3 / (12 * (1 - nu**2))
+    return model, U, F, centre, q * 4.0**4 / D, q * 4.0**2
+
+
+def test_simply_supported_square_matches_navier_solution():
+    model, U, F, centre, w_scale, m_scale = square_plate("simple")
+    # Timoshenko: w = 0.00406 q a^4 / D, Mx = My = 0.0479 q a^2 at the centre (nu = 0.3)
+    assert np.isclose(U[centre * DOF_PER_NODE, 0] / w_scale, 0.00406, rtol=0.02)
+    Mx, My, Mxy = model.moments(U)
+    assert np.isclose(Mx[centre, 0] / m_scale, 0.0479, rtol=0.03)
+    assert np.isclose(My[centre, 0] / m_scale, 0.0479, rtol=0.03)
+    assert np.isclose(model.reactions(U, F)[0::DOF_PER_NODE].sum(), 10.0 * 16.0)
+
+
+def test_clamped_square_matches_series_solution():
+    model, U, F, centre, w_scale, m_scale = square_plate("fixed")
+    # Timoshenko: w = 0.00126 q a^4 / D, Mx = 0.0231 q a^2 at the centre, -0.0513 q a^2 at mid-edge
+    assert np.isclose(U[centre * DOF_PER_NODE, 0] / w_scale, 0.00126, rtol=0.02)
+    Mx, _, _ = model.moments(U)
+    assert np.isclose(Mx[centre, 0] / m_scale, 0.0231, rtol=0.05)
+    edge = model.nearest_nodes([(0.0, 2.0)])[0]
+    assert np.isclose(Mx[edge, 0] / m_scale, -0.0513, rtol=0.1)
+
+
+def test_wood_armer_moments():
+    Mx, My, Mxy = np.array([10.0, -5.0, 2.0]), np.array([4.0, -8.0, 0.0]), np.array([3.0, 1.0, 6.0])
+    out = wood_armer(Mx, My, Mxy)
+    assert (out["Mx_bottom"] >= 0).all() and (out["My_bottom"] >= 0).all()
+    assert (out["Mx_top"] <= 0).all() and (out["My_top"] <= 0).all()
+    # Design moments envelope the normal moment in every direction
+    for theta in np.linspace(0, np.pi, 19):
+        c, s = np.cos(theta), np.sin(theta)
+        Mn = Mx * c**2 + My * s**2 + 2 * Mxy * s * c
+        assert (out["Mx_bottom"] * c**2 + out["My_bottom"] * s**2 >= Mn - 1e-9).all()
+        assert (out["Mx_top"] * c**2 + out["My_top"] * s**2 <= Mn + 1e-9).all()
+
+
+def test_irregular_slab_endpoint():
+    app = FastAPI()
+    app.include_router(router, prefix="/slab_backend")
+    client = TestClient(app)
+    payload = dict(
+        outline=[(0, 0), (12, 0), (12, 6), (6, 6), (6, 10), (0, 10)],
+        openings=[[(2, 2), (3.5, 2), (3.5, 3), (2, 3)]],
+        edgeSupports=["simple", "simple", "free", "free", "simple", "fixed"],
+        columns=[(9, 3)], walls=[(6, 0, 6, 6)], thickness=200, meshSize=0.3,
+        loadCases=[dict(name="ULS", pressure=12.0), dict(name="Point", pointLoads=[(3, 8, 50.0)])],
+    )
+    response = client.post("/slab_backend/api/plate-analysis", json=payload)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["mesh"]["dof"] == 3 * body["mesh"]["nodes"]
+    uls, point = body["loadCases"]
+    assert np.isclose(uls["totalLoad"], 12.0 * (96.0 - 1.5), rtol=1e-6)
+    assert np.isclose(uls["totalReaction"], uls["totalLoad"], rtol=1e-6)
+    assert np.isclose(point["totalReaction"], 50.0, rtol=1e-6)
+    assert len(uls["fields"]["Mx_bottom"]) == body["mesh"]["nodes"]
+
+    summary = analyse_plate(PlateAnalysisRequest(**dict(payload, includeFields=False)))
+    assert "fields" not in summary["loadCases"][0]
+    assert summary["loadCases"][0]["design"] == uls["design"]
+
+    bad = client.post("/slab_backend/api/plate-analysis", json=dict(payload, edgeSupports=["free"] * 6, columns=[], walls=[]))
+    assert bad.status_code == 400
+
+
+def test_wall_is_meshed_as_a_line_support():
+    # One-way strip continuous over an internal wall: M = -q (L1^3 + L2^3) / (8 (L1 + L2)) at the wall
+    out = analyse_plate(PlateAnalysisRequest(
+        outline=[(0, 0), (12, 0), (12, 4), (0, 4)], edgeSupports=["free", "simple", "free", "simple"],
+        walls=[(6.2, 0, 6.2, 4)], thickness=200, poisson=0.0, meshSize=0.5,
+        loadCases=[dict(name="q", pressure=10.0)],
+    ))
+    xy = np.array(out["mesh"]["coordinates"])
+    on_wall = np.isclose(xy[:, 0], 6.2)
+    assert on_wall.sum() == 9 and np.diff(np.sort(xy[on_wall, 1])).max() <= 0.5 + 1e-9
+    # No lattice node is left within the clearance band beside the wall
+    assert (np.abs(xy[:, 0] - 6.2) < 0.2).sum() == on_wall.sum()
+    Mx = np.array(out["loadCases"][0]["fields"]["Mx"])
+    assert np.isclose(Mx[on_wall].mean(), -10.0 * (6.2**3 + 5.8**3) / 96, rtol=0.02)
@@ -0,0 +1,87 @@
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.Backend.calculations.Foundations.New_foundation import (
+    FlexibleRaftDesigner, FlexibleRaftInput, RaftColumn, RaftLoadCase, router,
+)
+
+POINT_CASE = [RaftLoadCase(name="P", dead_factor=1.0, live_factor=0.0, limit_state="SLS")]
+
+
+def test_concentrated_load_matches_infinite_plate_on_winkler_subgrade():
+    inputs = FlexibleRaftInput(
+        foundation_length=20000, foundation_width=20000, foundation_depth=500,
+        columns=[RaftColumn(x=10000, y=10000, column_width=100, column_depth=100, dead_load=1000)],
+        subgrade_modulus=20000, soil_bearing=200, density=0, mesh_size=250, load_cases=POINT_CASE,
+    )
+    designer = FlexibleRaftDesigner(inputs)
+    out = designer.design_flexible_raft()
+    # Hetenyi: w = P l^2 / (8 D) under the load, l = (D / k)^(1/4)
+    D = designer.elastic_modulus() * 0.5**3 / (12 * (1 - 0.2**2))
+    l2 = np.sqrt(D / 20000)
+    assert np.isclose(out.load_analysis["max_settlement"], 1000 * l2 / (8 * D) * 1000, rtol=0.02)
+    case = out.calculations["load_cases"][0]
+    assert np.isclose(case["total_soil_reaction"], 1000.0)
+    # The slab lifts off the springs well away from the load
+    assert out.design_summary["uplift"]
+
+
+def test_uniform_load_settles_rigidly_with_pasternak_layer():
+    inputs = FlexibleRaftInput(
+        foundation_length=12000, foundation_width=8000, foundation_depth=500,
+        columns=[RaftColumn(x=6000, y=4000, dead_load=0)],
+        subgrade_modulus=20000, subgrade_shear=5000, soil_bearing=200, mesh_size=400, load_cases=POINT_CASE,
+    )
+    fields = FlexibleRaftDesigner(inputs).design_flexible_raft().calculations["load_cases"][0]["fields"]
+    # Self-weight only: uniform settlement q / k, contact pressure q and no bending
+    assert np.allclose(fields["settlement"], 24 * 0.5 / 20000 * 1000)
+    assert np.allclose(fields["contact_pressure"], 12.0)
+    assert np.abs(fields["Mx"]).max() < 1e-3 and np.abs(fields["My"]).max() < 1e-3
+
+
+def test_flexible_raft_endpoint_with_hundreds_of_columns():
+    app = FastAPI()
+    app.include_router(router, prefix="/foundation_backend")
+    client = TestClient(app)
+    columns = [dict(x=1500 + 6000 * i, y=1500 + 6000 * j, dead_load=900 + 20 * i, live_load=400)
+               for i in range(10) for j in range(10)]
+    payload = dict(foundation_length=57000, foundation_width=57000, foundation_depth=800, columns=columns,
+                   subgrade_modulus=25000, subgrade_shear=1000, soil_bearing=200, mesh_size=500)
+    response = client.post("/foundation_backend/design/flexible-raft", json=payload)
+    assert response.status_code == 200
+    body = response.json()
+    mesh = body["calculations"]["mesh"]
+    assert mesh["dof"] > 30000 and len(mesh["coordinates"]) == mesh["nodes"]
+
+    uls, sls = body["calculations"]["load_cases"]
+    column_total = sum(c["dead_load"] for c in columns), sum(c["live_load"] for c in columns)
+    self_weight = 24 * 0.8 * 57 * 57
+    assert np.isclose(sls["total_load"], column_total[0] + column_total[1] + self_weight)
+    assert np.isclose(uls["total_load"], 1.4 * (column_total[0] + self_weight) + 1.6 * column_total[1])
+    for case in (uls, sls):
+        assert np.isclose(case["total_soil_reaction"], case["total_load"])
+        assert len(case["fields"]["contact_pressure"]) == mesh["nodes"]
+    assert body["load_analysis"]["bearing_pressure"] == sls["max_pressure"]
+    bottom_x = body["calculations"]["reinforcement"]["bottom_x"]
+    assert bottom_x["moment"] == uls["design_moments"]["Mx_bottom"]
+    assert bottom_x["As_prov"] >= bottom_x["As_req"]
+
+    bad = client.post("/foundation_backend/design/flexible-raft", json=dict(payload, columns=[dict(x=60000, y=0, dead_load=10)]))
+    assert bad.status_code == 400
+
+
+def test_lightly_loaded_faces_get_minimum_steel():
+    inputs = FlexibleRaftInput(
+        foundation_length=12000, foundation_width=12000, foundation_depth=600,
+        columns=[RaftColumn(x=6000, y=6000, dead_load=500, live_load=200)],
+        subgrade_modulus=30000, soil_bearing=200, mesh_size=500,
+    )
+    designer = FlexibleRaftDesigner(inputs)
+    assert np.isclose(designer.flexural_steel(0.0, 0.534), 0.26 * 2.8965 / 500 * 1000 * 534, rtol=1e-3)
+    out = designer.design_flexible_raft()
+    mat = designer.get_material_properties()
+    d_mm = out.calculations["effective_depth"]
+    As_min = max(0.26 * mat["fctm"] / mat["fyk"] * 1000 * d_mm, 0.0013 * 1000 * d_mm)
+    for face in out.calculations["reinforcement"].values():
+        assert face["As_req"] >= As_min - 1e-9
+        assert face["As_prov"] >= face["As_req"]
@@ -0,0 +1,67 @@
+import numpy as np
+from fastapi.testclient import TestClient
+from fastapi import FastAPI
+from src.Backend.calculations.tall_framed.response_spectrum import combine_modes, cqc_correlation
+from src.Backend.calculations.tall_framed.tall_framed_backend import ec8_design_spectrum, router
+from test_fem_sparse_solver import build_frame
+from test_frame3d_solver import build_3d_from_2d
+
+
+def flat_spectrum(T):
+    return np.full_like(T, 2.0)
+
+
+def test_combine_modes_matches_double_sum():
+    rng = np.random.default_rng(0)
+    omega = np.sort(rng.uniform(5, 50, 6))
+    rho = cqc_correlation(omega, 0.05)
+    R = rng.normal(size=(4, 3, 6))
+
+    expected = np.zeros((4, 3))
+    for idx in np.ndindex(4, 3):
+        expected[idx] = np.sqrt(sum(R[idx][i] * rho[i, j] * R[idx][j] for i in range(6) for j in range(6)))
+    assert np.allclose(combine_modes(R, "CQC", rho), expected)
+    assert np.allclose(np.diag(rho), 1.0)
+    # Well separated modes are uncorrelated, so CQC falls back to SRSS
+    rho_far = cqc_correlation(np.array([1.0, 100.0]), 0.05)
+    assert rho_far[0, 1] < 1e-3
+
+
+def test_single_mode_base_shear_is_effective_mass_times_sa():
+    solver = build_frame(6, 2)
+    result = solver.response_spectrum(flat_spectrum, n_modes=1, method="CQC")
+    modal = solver.modal_analysis(n_modes=1)
+    assert np.isclose(result.base_shear, modal.effective_mass[0, 0] * 2.0)
+    assert np.isclose(result.storey_shear[0], result.base_shear)
+    assert np.all(np.diff(result.storey_shear) <= 1e-9)
+
+
+def test_planar_3d_frame_matches_2d():
+    solver = build_frame(5, 2)
+    r2 = solver.response_spectrum(flat_spectrum, n_modes=6, method="SRSS")
+    r3 = build_3d_from_2d(solver).response_spectrum(
+        flat_spectrum, n_modes=6, method="SRSS", mass_source={"DEAD": 1.0}
+    )
+    assert np.isclose(r2.base_shear, r3.base_shear, rtol=1e-8)
+    assert np.allclose(r2.storey_drift, r3.storey_drift, rtol=1e-8)
+    assert np.allclose(r2.end_forces, r3.end_forces[:, [0, 1, 5, 6, 7, 11]], rtol=1e-6, atol=1e-8)
+
+    columns = r2.member_columns()
+    assert len(columns["member_id"]) == len(columns["M_j"]) == len(solver.elements)
+
+
+def test_design_spectrum_branches_are_continuous():
+    T = np.array([0.15, 0.5, 2.0])
+    eps = 1e-9
+    assert np.allclose(ec8_design_spectrum(T - eps, 1.0, 1.2, 4.0), ec8_design_spectrum(T + eps, 1.0, 1.2, 4.0))
+
+
+def test_response_spectrum_endpoint():
+    app = FastAPI()
+    app.include_router(router)
+    body = {"floors": 4, "bays": 2, "story_height": 3.0, "bay_width": 6.0,
+            "lateral_load": 50.0, "vertical_load": 30.0, "n_modes": 6, "seismic_zone": "high"}
+    data = TestClient(app).post("/api/analysis/response-spectrum", json=body).json()
+    assert len(data["storeys"]["shear"]) == 4
+    assert np.isclose(data["storeys"]["shear"][0], data["base_shear"], rtol=1e-3)
+    assert len(data["modes"]["period"]) == 6
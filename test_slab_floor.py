@@ -0,0 +1,99 @@
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.Backend.calculations.Slabs.enhanced_slab_backend import (
+    EnhancedSlabDesigner, FloorDesignRequest, SlabDesignRequest, design_floor, panel_grid, router,
+)
+from src.Backend.calculations.Slabs.datasets import get_bending_moment_coefficient
+
+
+def test_interior_panel_matches_single_panel_design():
+    single = EnhancedSlabDesigner(SlabDesignRequest(
+        slabType="two-way", support="continuous", deadLoad=5, liveLoad=3, lx=4.0, ly=5.2,
+        edgeConditions="Interior panels",
+    )).design()
+    out = design_floor(FloorDesignRequest(xSpans=[4.0] * 3, ySpans=[5.2] * 3, deadLoad=5, liveLoad=3))
+    schedule = out["schedule"]
+    i = schedule["panel"].index("P2-2")
+    assert schedule["edgeCondition"][i] == "Interior panels"
+    assert schedule["momentBottomX"][i] == single.bendingMomentX
+    assert schedule["momentBottomY"][i] == single.bendingMomentY
+    assert schedule["totalDepth"][i] == single.totalDepth
+    assert schedule["steelAreaBottomX"][i] == single.steelAreaX
+    assert schedule["reinforcementBottomX"][i] == single.reinforcementX
+
+
+def test_edge_conditions_and_interpolated_coefficients():
+    cols, rows, dx, dy, disc = panel_grid([5.0, 5.0, 5.0], [4.0, 4.0], voids=[(1, 1)])
+    assert len(cols) == 5
+    out = design_floor(FloorDesignRequest(xSpans=[5.0, 5.0, 5.0], ySpans=[4.0, 4.0], voids=[(1, 1)],
+                                          deadLoad=4, liveLoad=2.5))["schedule"]
+    conditions = dict(zip(out["panel"], out["edgeCondition"]))
+    # Short span runs along y, so the left/right edges are the short edges
+    assert conditions["P1-1"] == "Two adjacent edges discontinuous"
+    assert conditions["P2-1"] == "Two long edges discontinuous"
+    assert out["reinforcementTopX"][out["panel"].index("P2-1")] is None
+
+    # ly/lx = 1.25 lies half-way between the 1.2 and 1.3 table columns
+    w = 1.4 * 4 + 1.6 * 2.5
+    expected = np.mean([get_bending_moment_coefficient("Two long edges discontinuous", "Positive moment at mid-span, β_sx", r)
+                        for r in (1.2, 1.3)]) * w * 16
+    assert np.isclose(out["momentBottomX"][out["panel"].index("P2-1")], expected, atol=0.01)
+
+
+def test_array_bar_selection_matches_scalar():
+    designer = EnhancedSlabDesigner(SlabDesignRequest(slabType="two-way", support="continuous", deadLoad=5, liveLoad=3))
+    As = np.linspace(50, 6000, 120)
+    dia, spacing, area = designer.select_reinforcement_array(As)
+    for i, a in enumerate(As):
+        text, s, provided = designer.select_reinforcement(a, 1000)
+        assert text == f"H{dia[i]} @ {spacing[i]}mm c/c" and provided == area[i]
+
+
+def test_floor_endpoint_designs_hundreds_of_panels():
+    app = FastAPI()
+    app.include_router(router, prefix="/slab_backend")
+    client = TestClient(app)
+    rng = np.random.default_rng(2)
+    payload = dict(xSpans=rng.uniform(3, 8, 20).tolist(), ySpans=rng.uniform(3, 8, 18).tolist(),
+                   voids=[(5, 5), (6, 5)], deadLoad=6, liveLoad=5)
+    response = client.post("/slab_backend/api/floor-design", json=payload)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["panels"] == 358 and len(body["schedule"]["reinforcementBottomX"]) == 358
+
+    bad = client.post("/slab_backend/api/floor-design", json=dict(payload, voids=[(30, 0)]))
+    assert bad.status_code == 400
+
+
+def test_long_panels_are_designed_one_way():
+    w = 1.4 * 5 + 1.6 * 3
+    single = design_floor(FloorDesignRequest(xSpans=[5.0], ySpans=[15.0], deadLoad=5, liveLoad=3))
+    assert single["oneWayPanels"] == 1
+    s = single["schedule"]
+    assert s["oneWay"] == [True] and s["edgeCondition"] == ["One-way simply supported"]
+    assert np.isclose(s["momentBottomX"][0], 0.125 * w * 25, atol=0.01)
+    assert s["reinforcementTopX"] == [None] and s["momentBottomY"] == [0.0]
+    assert s["reinforcementBottomY"][0] is not None
+
+    # Two bays side by side: each is an end span continuous over the shared long edge
+    s = design_floor(FloorDesignRequest(xSpans=[5.0, 5.0], ySpans=[15.0], deadLoad=5, liveLoad=3))["schedule"]
+    assert s["edgeCondition"] == ["One-way end span"] * 2
+    assert np.allclose(s["momentBottomX"], 0.086 * w * 25, atol=0.01)
+    assert np.allclose(s["momentTopX"], 0.086 * w * 25, atol=0.01)
+    # ly/lx = 2 is still two-way
+    assert not design_floor(FloorDesignRequest(xSpans=[5.0], ySpans=[10.0], deadLoad=5, liveLoad=3))["schedule"]["oneWay"][0]
+
+
+def test_non_positive_spans_are_rejected():
+    app = FastAPI()
+    app.include_router(router, prefix="/slab_backend")
+    client = TestClient(app)
+    response = client.post("/slab_backend/api/floor-design", json=dict(xSpans=[0], ySpans=[4.0], deadLoad=5, liveLoad=3))
+    assert response.status_code == 422
+    try:
+        panel_grid([4.0, -1.0], [4.0])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("negative span accepted")
@@ -0,0 +1,79 @@
+import math
+from types import SimpleNamespace
+
+import numpy as np
+from src.Backend.calculations.steel_design.section_catalogue import CLASS_NAMES, SectionTable
+
+SECTIONS = [
+    SimpleNamespace(designation="457x191x98", depth=467.2, width=192.8, tw=11.4, tf=19.6, r=10.2,
+                    area=125.0, Ix=49500, Iy=4050, Zx=2120, Zy=421, rx=199, ry=56.9),
+    SimpleNamespace(designation="305x165x54", depth=310.4, width=166.9, tw=7.9, tf=13.7, r=8.9,
+                    area=68.4, Ix=12400, Iy=1870, Zx=802, Zy=224, rx=135, ry=52.3),
+    SimpleNamespace(designation="356x171x67", depth=363.4, width=173.2, tw=9.1, tf=15.7, r=10.2,
+                    area=85.5, Ix=22200, Iy=2490, Zx=1220, Zy=287, rx=161, ry=53.9),
+    SimpleNamespace(designation="178x102x19", depth=177.8, width=101.2, tw=4.8, tf=7.9, r=7.6,
+                    area=24.3, Ix=1360, Iy=250, Zx=153, Zy=49.4, rx=74.9, ry=32.1),
+]
+
+
+def scalar_ratios(s, span, w, P, a_m, py=275.0, E=210000.0):
+    """design_beam transcription for one section (catalogue units)"""
+    L, a = span * 1000, a_m * 1000
+    M = w * L**2 / 8e6 + (P * a * (L - a) / (L * 1000) if P > 0 else 0)
+    V = w * L / 2000 + (max(P * (L - a) / L, P * a / L) if P > 0 else 0)
+    lam = (L / s.ry) * math.sqrt(py / 275)
+    Mb = s.Zx * 1000 * py / (1 + 0.0005 * lam**2) / 1e6
+    Pv = 0.6 * py * s.depth * s.tw / 1000
+    I = s.Ix * 1e4
+    delta = 5 * w * L**4 / (384 * E * I)
+    if P > 0:
+        b = min(a, L - a)
+        delta += P * 1000 * b * (L**2 - b**2) ** 1.5 / (9 * math.sqrt(3) * E * I * L)
+    return M / Mb, V / Pv, delta / (L / 360)
+
+
+def test_table_is_sorted_with_derived_properties():
+    table = SectionTable.from_sections(SECTIONS, "UB")
+    assert list(table["mass"]) == [19.0, 54.0, 67.0, 98.0]
+    k = table.index("305x165x54")
+    assert np.isclose(table["Zx"][k], 802e3) and np.isclose(table["Av"][k], 310.4 * 7.9)
+    assert np.isclose(table["b_t"][k], 166.9 / 2 / 13.7)
+    assert CLASS_NAMES[table.classify(275.0)[k]] == "Plastic"
+    assert not table.data.flags.writeable
+
+
+def test_point_load_deflection_matches_closed_form():
+    table = SectionTable.from_sections(SECTIONS, "UB")
+    k = table.index("305x165x54")
+    E, I, L, P = 210000.0, 12400e4, 6000.0, 50.0
+    mid = table.beam_checks([6.0], [0.0], [P], [3.0], 275.0)["delta_max"][0, k]
+    assert np.isclose(mid, P * 1000 * L**3 / (48 * E * I))
+
+    # Mirrored load positions deflect equally; peak for b = 1.5 m from x = sqrt((L^2 - b^2) / 3)
+    near, far = table.beam_checks([6.0, 6.0], [0.0, 0.0], [P, P], [1.5, 4.5], 275.0)["delta_max"][:, k]
+    assert np.isclose(near, far)
+    b = 1500.0
+    x = math.sqrt((L**2 - b**2) / 3)
+    assert np.isclose(near, P * 1000 * b * x * (L**2 - b**2 - x**2) / (6 * E * I * L))
+
+
+def test_vectorized_selection_matches_scalar_checks():
+    table = SectionTable.from_sections(SECTIONS, "UB")
+    rng = np.random.default_rng(4)
+    n = 300
+    span, udl = rng.uniform(2.0, 9.0, n), rng.uniform(2.0, 40.0, n)
+    P, a = rng.uniform(0.0, 40.0, n) * (rng.random(n) < 0.5), rng.uniform(0.2, 0.8, n)
+    selection = table.select_beams(span, udl, P, a * span)
+
+    for i in range(n):
+        ratios = [scalar_ratios(s, span[i], udl[i], P[i], a[i] * span[i]) for s in
+                  sorted(SECTIONS, key=lambda s: float(s.designation.split("x")[-1]))]
+        passing = [k for k, r in enumerate(ratios) if max(r) <= 1.0]
+        assert selection["passed"][i] == bool(passing)
+        k = passing[0] if passing else int(np.argmin([max(r) for r in ratios]))
+        assert selection["index"][i] == k
+        assert np.allclose(
+            [selection["bending_ratio"][i], selection["shear_ratio"][i], selection["deflection_ratio"][i]],
+            ratios[k],
+        )
+    assert selection["passed"].any() and not selection["passed"].all()
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from src.Backend.calculations.Beams.threemain import Span, Support, ThreeMomentSolver
+
+
+def udl(w, L):
+    return {"load_type": "Uniformly Distributed Load", "magnitude": w, "length": L}
+
+
+def point(P, a):
+    return {"load_type": "Point Load", "magnitude": P, "position": a}
+
+
+def solve(spans, support_types, method="banded"):
+    positions = np.concatenate([[0.0], np.cumsum([s["length"] for s in spans])])
+    solver = ThreeMomentSolver(
+        [Span(**s) for s in spans],
+        [Support(support_type=t, position=p) for t, p in zip(support_types, positions)],
+    )
+    solver.solve(method)
+    return solver
+
+
+def test_closed_form_cases():
+    two_span = solve([{"length": 6.0, "loads": [udl(10.0, 6.0)]}] * 2, ["Pinned"] * 3)
+    assert two_span.support_moments == pytest.approx([0.0, -45.0, 0.0])
+    assert two_span.reactions == pytest.approx([22.5, 75.0, 22.5])
+
+    fixed = solve([{"length": 6.0, "loads": [point(10.0, 2.0)]}], ["Fixed", "Fixed"])
+    assert fixed.support_moments == pytest.approx([-10 * 2 * 16 / 36, -10 * 4 * 4 / 36])
+
+    propped = solve([{"length": 6.0, "loads": [udl(10.0, 6.0)]}], ["Fixed", "Pinned"])
+    assert propped.support_moments == pytest.approx([-45.0, 0.0])
+    assert propped.reactions == pytest.approx([37.5, 22.5])
+
+
+def test_banded_matches_dense():
+    rng = np.random.default_rng(3)
+    spans = [
+        {
+            "length": L,
+            "I": I,
+            "loads": [udl(w, L), point(P, a * L)],
+        }
+        for L, I, w, P, a in zip(
+            rng.uniform(3, 12, 300), rng.uniform(1e-5, 1e-3, 300), rng.uniform(0, 30, 300),
+            rng.uniform(0, 100, 300), rng.uniform(0.1, 0.9, 300),
+        )
+    ]
+    supports = ["Fixed"] + ["Pinned"] * 300
+    banded = solve(spans, supports, "banded")
+    dense = solve(spans, supports, "dense")
+    assert np.allclose(banded.support_moments, dense.support_moments, rtol=1e-9, atol=1e-9)
+    assert np.allclose(banded.reactions, dense.reactions, rtol=1e-9, atol=1e-9)
+
+
+if __name__ == "__main__":
+    test_closed_form_cases()
+    test_banded_matches_dense()
+    print("Three-moment banded solver matches closed form and dense path")
@@ -0,0 +1,69 @@
+import math
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.Backend.calculations.steel_design.connections_api import router
+from src.Backend.calculations.steel_design.welded_joints_backend import (
+    WeldGroupBatchRequest, calculate_design_strength_pw, check_weld_groups,
+)
+
+
+def c_weld(b, d):
+    """Channel-shaped weld: two flanges of length b and a web of length d"""
+    return [(b, 0.0, 0.0, 0.0), (0.0, 0.0, 0.0, d), (0.0, d, b, d)]
+
+
+def scalar_check(segments, throat, cases, pw):
+    lengths = [math.hypot(x2 - x1, y2 - y1) for x1, y1, x2, y2 in segments]
+    total = sum(lengths)
+    xc = sum(L * (x1 + x2) / 2 for L, (x1, _, x2, _) in zip(lengths, segments)) / total
+    yc = sum(L * (y1 + y2) / 2 for L, (_, y1, _, y2) in zip(lengths, segments)) / total
+    J = sum(L**3 / 12 + L * (((x1 + x2) / 2 - xc) ** 2 + ((y1 + y2) / 2 - yc) ** 2)
+            for L, (x1, y1, x2, y2) in zip(lengths, segments))
+    peaks = []
+    for Fx, Fy, Mz in cases:
+        peaks.append(max(
+            math.hypot(Fx / total - Mz * 1000 * (y - yc) / J, Fy / total + Mz * 1000 * (x - xc) / J)
+            for x1, y1, x2, y2 in segments for x, y in ((x1, y1), (x2, y2))
+        ))
+    governing = int(np.argmax(peaks))
+    return total, (xc, yc), J, governing, peaks[governing] / (pw * throat / 1000)
+
+
+def test_batch_matches_per_group_line_method():
+    rng = np.random.default_rng(6)
+    welds = []
+    for i in range(40):
+        b, d = rng.uniform(50, 150), rng.uniform(100, 400)
+        cases = rng.uniform(-100, 100, (1 + i % 4, 3)).tolist()
+        welds.append(dict(id=f"W{i}", segments=c_weld(b, d), throat_size=float(rng.choice([4.2, 5.6, 7.0])),
+                          load_cases=cases, electrode_grade="E42" if i % 2 else "E35"))
+    table = check_weld_groups(WeldGroupBatchRequest(welds=welds))["table"]
+    assert table["id"] == [w["id"] for w in welds]
+    for i, w in enumerate(welds):
+        pw = calculate_design_strength_pw(w["electrode_grade"], "S275")
+        total, (xc, yc), J, governing, util = scalar_check(w["segments"], w["throat_size"], w["load_cases"], pw)
+        assert np.isclose(table["weld_length"][i], total, atol=0.05)
+        assert np.isclose(table["centroid_x"][i], xc, atol=0.005) and np.isclose(table["centroid_y"][i], yc, atol=0.005)
+        assert np.isclose(table["polar_moment"][i], J, atol=0.05)
+        assert table["governing_case"][i] == governing
+        assert np.isclose(table["utilization_ratio"][i], util * 100, atol=0.05)
+        assert table["passed"][i] == (util <= 1.0)
+
+
+def test_endpoint_checks_thousands_of_welds():
+    app = FastAPI()
+    app.include_router(router, prefix="/connections_backend")
+    client = TestClient(app)
+    welds = [dict(segments=c_weld(100.0, 250.0 + i % 50), throat_size=5.6, load_cases=[(20.0, 80.0, 5.0), (60.0, 0.0, 12.0)])
+             for i in range(5000)]
+    response = client.post("/connections_backend/weld-group-batch", json={"welds": welds})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 5000 and len(body["table"]["passed"]) == 5000
+
+    bad = client.post("/connections_backend/weld-group-batch", json={"welds": [
+        dict(segments=[(0, 0, 0, 0)], throat_size=5.6, load_cases=[(1, 0, 0)])
+    ]})
+    assert bad.status_code == 400